@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright (c) 2016, Yung-Yu Chen <yyc@solvcon.net>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# - Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the SOLVCON nor the names of its contributors may be
+#   used to endorse or promote products derived from this software without
+#   specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Time saving and loading a split domain with each compressor of the intrinsic
+formats.  Usage::
+
+  $ python bench_compress.py [number of cells along an edge] [number of parts]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+from io import BytesIO
+
+from solvcon.io.gmsh import Gmsh
+from solvcon.io.domain import DomainIO
+from solvcon.domain import Collective
+
+from bench_gmsh import make_cube
+
+
+def dirsize(dirname):
+    return sum(os.path.getsize(os.path.join(dirname, fn))
+               for fn in os.listdir(dirname))
+
+
+def main():
+    nx = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    npart = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    gmh = Gmsh(BytesIO(make_cube(nx, with_boundary=False)))
+    gmh.load(close=True)
+    dom = Collective(blk=gmh.toblock())
+    tstart = time.time()
+    dom.split(npart)
+    print('%d cells split into %d parts: %.3f sec' % (
+        dom.blk.ncell, npart, time.time()-tstart))
+    for compressor in ('', 'gz', 'bz2', 'zlib', 'xz'):
+        dirname = tempfile.mkdtemp()
+        try:
+            tstart = time.time()
+            DomainIO(dom=dom, compressor=compressor).save(dirname=dirname)
+            tsave = time.time() - tstart
+            tstart = time.time()
+            DomainIO(dirname=dirname).load(with_split=True)
+            tload = time.time() - tstart
+            size = dirsize(dirname)
+        finally:
+            shutil.rmtree(dirname)
+        print('  %-4s: save %8.3f sec, load %8.3f sec, %7.1f MB' % (
+            compressor or 'raw', tsave, tload, size/1024.**2))
+
+if __name__ == '__main__':
+    main()
+
+# vim: set ff=unix fenc=utf8 ft=python ai et sw=4 ts=4 tw=79:
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright (c) 2016, Yung-Yu Chen <yyc@solvcon.net>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# - Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the SOLVCON nor the names of its contributors may be
+#   used to endorse or promote products derived from this software without
+#   specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Compare the memory and the time of one marching step of the gas-dynamics
+solver with float64 and float32 arrays on a hexahedral cube, and report how
+far the float32 solution drifts from the float64 one.  Usage::
+
+  $ python bench_float32.py [number of cells along an edge]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import sys
+import time
+
+import numpy as np
+
+from solvcon.parcel.gas.solver import GasSolver
+
+from bench_sfmrc import best_of, make_block, array_bytes
+
+
+def make_gas(blk, fpdtype):
+    svr = GasSolver(blk, fpdtype=fpdtype, time_increment=1.e-4)
+    svr.init()
+    svr.amsca.fill(1.4)
+    # no BC sets the ghost geometry.
+    svr.cecnd[:svr.ngstcell] = svr.blk.shclcnd[:svr.ngstcell,None,:]
+    rng = np.random.RandomState(0)
+    nall = svr.ngstcell + svr.ncell
+    svr.sol[:,0] = 1.0 + 0.1*rng.rand(nall)
+    svr.sol[:,1:4] = 0.1*rng.rand(nall, 3)
+    svr.sol[:,4] = 2.5 + 0.1*rng.rand(nall)
+    svr.dsol.fill(0.0)
+    svr.solt.fill(0.0)
+    return svr
+
+
+def step(svr):
+    svr.alg.calc_soln()
+    svr.alg.calc_cfl()
+    svr.alg.calc_dsoln()
+
+
+def main():
+    nx = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    blk = make_block(nx)
+    print('%d cells' % blk.ncell)
+    results = []
+    for fpdtype in ('float64', 'float32'):
+        svr = make_gas(blk, fpdtype)
+        tstep = best_of(lambda: step(svr))
+        results.append(svr.soln[svr.ngstcell:].astype('float64'))
+        print('  %s: step %7.4f sec  arrays %7.2f MB' % (
+            fpdtype, tstep, array_bytes(svr) / 1024.**2))
+    diff = np.abs(results[1] - results[0]).max()
+    print('  max difference of soln: %g' % diff)
+
+if __name__ == '__main__':
+    main()
+
+# vim: set ff=unix fenc=utf8 ft=python ai et sw=4 ts=4 tw=79:
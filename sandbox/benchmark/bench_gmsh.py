@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright (c) 2016, Yung-Yu Chen <yyc@solvcon.net>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# - Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the SOLVCON nor the names of its contributors may be
+#   used to endorse or promote products derived from this software without
+#   specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Compare the line-by-line and the bulk parsers of the Gmsh ASCII format on a
+generated structured hexahedral mesh.  Usage::
+
+  $ python bench_gmsh.py [number of cells along an edge]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import sys
+import time
+from io import BytesIO
+
+import numpy as np
+
+from solvcon.io.gmsh import Gmsh
+
+
+def make_cube(nx, with_boundary=True):
+    """
+    Generate a Gmsh ASCII file of a cube with *nx*\ :sup:`3` hexahedra.  The
+    boundary quadrilaterals on the plane z = 0 are also written when
+    *with_boundary* is True, to make the element section heterogeneous.
+    """
+    npt = nx + 1
+    idx = np.arange(npt**3).reshape((npt, npt, npt)) + 1
+    crd = np.linspace(0.0, 1.0, npt)
+    zz, yy, xx = np.meshgrid(crd, crd, crd, indexing='ij')
+    nodes = np.empty((npt**3, 4))
+    nodes[:,0] = idx.ravel()
+    nodes[:,1] = xx.ravel()
+    nodes[:,2] = yy.ravel()
+    nodes[:,3] = zz.ravel()
+    hexes = np.empty((nx, nx, nx, 8), dtype='int64')
+    hexes[...,0] = idx[:-1,:-1,:-1]
+    hexes[...,1] = idx[:-1,:-1,1:]
+    hexes[...,2] = idx[:-1,1:,1:]
+    hexes[...,3] = idx[:-1,1:,:-1]
+    hexes[...,4] = idx[1:,:-1,:-1]
+    hexes[...,5] = idx[1:,:-1,1:]
+    hexes[...,6] = idx[1:,1:,1:]
+    hexes[...,7] = idx[1:,1:,:-1]
+    hexes = hexes.reshape((-1, 8))
+    quads = hexes[:nx*nx,:4] if with_boundary else hexes[:0,:4]
+    lines = [b'$MeshFormat', b'2.2 0 8', b'$EndMeshFormat', b'$Nodes',
+             str(nodes.shape[0]).encode()]
+    out = BytesIO()
+    out.write(b'\n'.join(lines) + b'\n')
+    np.savetxt(out, nodes, fmt='%d %.16g %.16g %.16g')
+    out.write(b'$EndNodes\n$Elements\n')
+    out.write(('%d\n' % (quads.shape[0] + hexes.shape[0])).encode())
+    iel = np.arange(1, quads.shape[0]+1)
+    body = np.empty((quads.shape[0], 9), dtype='int64')
+    body[:,0] = iel
+    body[:,1:5] = [3, 2, 2, 1]
+    body[:,5:] = quads
+    np.savetxt(out, body, fmt='%d')
+    iel = np.arange(1, hexes.shape[0]+1) + quads.shape[0]
+    body = np.empty((hexes.shape[0], 13), dtype='int64')
+    body[:,0] = iel
+    body[:,1:5] = [5, 2, 1, 1]
+    body[:,5:] = hexes
+    np.savetxt(out, body, fmt='%d')
+    out.write(b'$EndElements\n$PhysicalNames\n2\n'
+              b'2 2 "bottom"\n3 1 "volume"\n$EndPhysicalNames\n')
+    return out.getvalue()
+
+
+def time_load(data, bulk):
+    tstart = time.time()
+    gmh = Gmsh(BytesIO(data), bulk=bulk)
+    gmh.load(close=True)
+    return time.time() - tstart, gmh
+
+
+def main():
+    nx = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    for with_boundary in (False, True):
+        data = make_cube(nx, with_boundary=with_boundary)
+        tline, gline = time_load(data, False)
+        tbulk, gbulk = time_load(data, True)
+        for key in ('nodes', 'elems', 'cltpn', 'elgrp', 'usnds', 'ndmap'):
+            assert (getattr(gline, key) == getattr(gbulk, key)).all(), key
+        print('%s: %d elements, %.1f MB' % (
+            'mixed' if with_boundary else 'homogeneous',
+            gbulk.elems.shape[0], len(data)/1024.**2))
+        print('  line-by-line: %8.3f sec' % tline)
+        print('  bulk:         %8.3f sec (%.1fx)' % (tbulk, tline/tbulk))
+
+if __name__ == '__main__':
+    main()
+
+# vim: set ff=unix fenc=utf8 ft=python ai et sw=4 ts=4 tw=79:
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright (c) 2016, Yung-Yu Chen <yyc@solvcon.net>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# - Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the SOLVCON nor the names of its contributors may be
+#   used to endorse or promote products derived from this software without
+#   specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Time calc_solt and calc_soln of the velocity-stress solver on a hexahedral cube
+of three materials (GaAs, ZnO and beryl slabs along x), with the Jacobian
+matrices calculated on the fly (jacomode None), looked up by material group
+('group'), and stored for each cell ('cell').  Usage::
+
+  $ python bench_jaco.py [number of cells along an edge]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import sys
+import time
+from io import BytesIO
+
+import numpy as np
+
+from solvcon.io.gmsh import Gmsh
+from solvcon.parcel.linear.velstress import material
+from solvcon.parcel.linear.velstress.logic import VslinSolver
+
+from bench_gmsh import make_cube
+
+
+MATERIALS = ('GaAs', 'ZnO', 'Beryl')
+KERNELS = (('calc_solt', 'solt'), ('calc_soln', 'soln'))
+
+
+def best_of(func, nrepeat=5):
+    tmin = None
+    for it in range(nrepeat):
+        tstart = time.time()
+        func()
+        telapsed = time.time() - tstart
+        tmin = telapsed if tmin is None else min(tmin, telapsed)
+    return tmin
+
+
+def make_solver(nx):
+    gmh = Gmsh(BytesIO(make_cube(nx, with_boundary=False)), bulk=True)
+    gmh.load(close=True)
+    blk = gmh.toblock()
+    # slabs of materials along x.
+    blk.grpnames[:] = list(MATERIALS)
+    xcrd = blk.shclcnd[:,0]
+    slab = (xcrd - xcrd.min()) / (xcrd.max() - xcrd.min()) * len(MATERIALS)
+    blk.shclgrp[:] = np.minimum(slab.astype('int32'), len(MATERIALS)-1)
+    mtrldict = dict((name, material.mltregy[name](al=0.0, be=0.0, ga=0.0))
+                    for name in MATERIALS)
+    svr = VslinSolver(blk, mtrldict, time_increment=1.e-9)
+    svr.init()
+    # no BC sets the ghost geometry.
+    svr.cecnd[:svr.ngstcell] = svr.blk.shclcnd[:svr.ngstcell,None,:]
+    svr._make_grpda()
+    rng = np.random.RandomState(0)
+    for name in ('sol', 'solt', 'dsol'):
+        arr = getattr(svr, name)
+        arr[...] = rng.rand(*arr.shape)
+    return svr
+
+
+def main():
+    nx = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    svr = make_solver(nx)
+    print('%d cells, %d materials' % (svr.ncell, svr.ngroup))
+    results = {}
+    for jacomode in (None, 'group', 'cell'):
+        svr.jacomode = jacomode
+        svr._make_jacos()
+        alg = svr.create_alg()
+        times = []
+        for calcname, arrname in KERNELS:
+            times.append(best_of(getattr(alg, calcname)))
+            result = getattr(svr, arrname)[svr.ngstcell:].copy()
+            assert (results.setdefault(arrname, result) == result).all()
+        if jacomode == 'cell':
+            nbyte = svr.jacos.nbytes + svr.jacoidx.nbytes
+        else:
+            nbyte = 0 # the group data and clgrp are used as they are.
+        print('  %-6s' % jacomode + ''.join(
+            '  %s %7.4f sec' % (calcname, tval)
+            for (calcname, arrname), tval in zip(KERNELS, times))
+            + '  extra %7.2f MB' % (nbyte / 1024.**2))
+
+if __name__ == '__main__':
+    main()
+
+# vim: set ff=unix fenc=utf8 ft=python ai et sw=4 ts=4 tw=79:
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright (c) 2016, Yung-Yu Chen <yyc@solvcon.net>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# - Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the SOLVCON nor the names of its contributors may be
+#   used to endorse or promote products derived from this software without
+#   specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Time the mesh kernels run by Block.build_interior, Block.build_ghost and
+Mesh.create_csr on the hexahedral cube from bench_gmsh, with different numbers
+of OpenMP threads.  The kernels run in parallel only when solvcon is built
+with OpenMP (scons --openmp); the threads are set by OMP_NUM_THREADS as for the
+parcel kernels.  Usage::
+
+  $ python bench_mesh.py [number of cells along an edge] [numbers of threads]
+
+e.g., ``python bench_mesh.py 60 1 2 4 8``.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import os
+import sys
+import time
+import subprocess
+from io import BytesIO
+
+from solvcon.io.gmsh import Gmsh
+
+from bench_gmsh import make_cube
+
+
+KERNELS = ('extract_faces', 'calc_metric', 'build_ghost', 'create_csr')
+
+
+def best_of(func, nrepeat=3):
+    tmin = None
+    for it in range(nrepeat):
+        tstart = time.time()
+        func()
+        telapsed = time.time() - tstart
+        tmin = telapsed if tmin is None else min(tmin, telapsed)
+    return tmin
+
+
+def run_kernels(nx):
+    """Time each kernel on a built block in this process."""
+    gmh = Gmsh(BytesIO(make_cube(nx, with_boundary=False)), bulk=True)
+    gmh.load(close=True)
+    blk = gmh.toblock()
+    msh = blk.create_msh()
+    max_nfc = blk.clfcs[:,0].sum() # faces before removing duplication.
+    funcs = {
+        'extract_faces': lambda: msh.extract_faces_from_cells(max_nfc),
+        'calc_metric': lambda: msh.calc_metric(blk.use_incenter),
+        'build_ghost': lambda: msh.build_ghost(blk.bndfcs),
+        'create_csr': lambda: msh.create_csr(),
+    }
+    return blk.ncell, [best_of(funcs[key]) for key in KERNELS]
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--child':
+        ncell, times = run_kernels(int(sys.argv[2]))
+        print(ncell, ' '.join('%g' % val for val in times))
+        return
+    nx = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    nthreads = [int(val) for val in sys.argv[2:]] or [1, 2, 4]
+    # each number of threads needs a fresh OpenMP runtime.
+    results = []
+    for nthread in nthreads:
+        env = dict(os.environ, OMP_NUM_THREADS=str(nthread))
+        out = subprocess.check_output(
+            [sys.executable, __file__, '--child', str(nx)], env=env)
+        tokens = out.split()
+        ncell = int(tokens[0])
+        results.append([float(val) for val in tokens[1:]])
+    print('%d cells, %d CPUs' % (ncell, os.cpu_count() or 1))
+    print('  %-14s' % 'threads' + ''.join('%16d' % val for val in nthreads))
+    for ik, key in enumerate(KERNELS):
+        base = results[0][ik]
+        print('  %-14s' % key + ''.join(
+            '%9.4f (%4.1fx)' % (res[ik], base/res[ik]) for res in results))
+
+if __name__ == '__main__':
+    main()
+
+# vim: set ff=unix fenc=utf8 ft=python ai et sw=4 ts=4 tw=79:
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright (c) 2016, Yung-Yu Chen <yyc@solvcon.net>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# - Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the SOLVCON nor the names of its contributors may be
+#   used to endorse or promote products derived from this software without
+#   specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Time the CESE kernels (calc_solt, calc_soln and calc_dsoln) of the linear
+parcel for the velocity-stress equations (9 equations) and of the vewave parcel
+(45 equations) on the hexahedral cube from bench_gmsh.  The generic kernels,
+which size their arrays by the run-time number of equations, are compared
+against the ones compiled for the fixed number.  Usage::
+
+  $ python bench_neq.py [number of cells along an edge]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import sys
+import time
+from io import BytesIO
+
+import numpy as np
+
+from solvcon.io.gmsh import Gmsh
+from solvcon.parcel.linear.solver import LinearSolver
+from solvcon.parcel.vewave.solver import VewaveSolver
+
+from bench_gmsh import make_cube
+
+
+KERNELS = (('calc_solt', 'solt'), ('calc_soln', 'soln'),
+           ('calc_dsoln', 'dsoln'))
+
+
+class NineSolver(LinearSolver):
+    @property
+    def gdlen(self):
+        return 9 * 9 * self.ndim
+
+
+def best_of(func, nrepeat=5):
+    tmin = None
+    for it in range(nrepeat):
+        tstart = time.time()
+        func()
+        telapsed = time.time() - tstart
+        tmin = telapsed if tmin is None else min(tmin, telapsed)
+    return tmin
+
+
+def fill_solver(svr):
+    svr.init()
+    # no BC sets the ghost geometry.
+    svr.cecnd[:svr.ngstcell] = svr.blk.shclcnd[:svr.ngstcell,None,:]
+    rng = np.random.RandomState(0)
+    svr.grpda[...] = rng.rand(*svr.grpda.shape) - 0.5
+    for name in ('sol', 'solt', 'dsol', 'amsca'):
+        arr = getattr(svr, name)
+        arr[...] = rng.rand(*arr.shape)
+    svr.cfl.fill(0.5)
+    return svr
+
+
+def compare(svr, create_alg):
+    print('%d cells, %d equations' % (svr.ncell, svr.neq))
+    for calcname, arrname in KERNELS:
+        times = []
+        results = []
+        for specialized in (False, True):
+            alg = create_alg()
+            alg.specialized = specialized
+            times.append(best_of(getattr(alg, calcname)))
+            results.append(getattr(svr, arrname)[svr.ngstcell:].copy())
+        assert (results[0] == results[1]).all()
+        print('  %-12s generic %8.4f sec, neq=%d %8.4f sec (%.1fx)' % (
+            calcname, times[0], svr.neq, times[1], times[0]/times[1]))
+
+
+def main():
+    nx = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    gmh = Gmsh(BytesIO(make_cube(nx, with_boundary=False)), bulk=True)
+    gmh.load(close=True)
+    blk = gmh.toblock()
+    svr = fill_solver(NineSolver(blk, neq=9, time_increment=1.e-3))
+    compare(svr, svr.create_alg)
+    svr = fill_solver(VewaveSolver(blk, {}, time_increment=1.e-3))
+    compare(svr, lambda: svr.alg)
+
+if __name__ == '__main__':
+    main()
+
+# vim: set ff=unix fenc=utf8 ft=python ai et sw=4 ts=4 tw=79:
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright (c) 2016, Yung-Yu Chen <yyc@solvcon.net>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# - Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the SOLVCON nor the names of its contributors may be
+#   used to endorse or promote products derived from this software without
+#   specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Time building the index information and the mappers of Collective.partition
+over the number of sub-blocks, against the per-block loops it replaced.  The
+graph partitioning itself is excluded by using a fixed random partition.
+Usage::
+
+  $ python bench_partition.py [number of cells along an edge] [nblk ...]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import sys
+import time
+from io import BytesIO
+
+import numpy as np
+
+from solvcon.io.gmsh import Gmsh
+from solvcon.domain import Collective
+
+from bench_gmsh import make_cube
+
+
+def per_block_partition(blk, part, nblk):
+    """The former per-block index building, kept for comparison."""
+    clidx = np.arange(blk.ncell, dtype='int32')
+    idxinfo = list()
+    for iblk in range(nblk):
+        mycls = clidx[part==iblk]
+        myfcs = np.unique(blk.clfcs[mycls,1:].flatten())
+        myfcs = myfcs[myfcs>-1]
+        mynds = np.unique(blk.clnds[mycls,1:].flatten())
+        mynds = mynds[mynds>-1]
+        idxinfo.append((mynds, myfcs, mycls))
+    ndcnts = np.zeros(blk.nnode, dtype='int32')
+    for mynds, myfcs, mycls in idxinfo:
+        ndcnts[mynds] += 1
+    ndmaps = np.empty((blk.nnode, 1+2*ndcnts.max()), dtype='int32')
+    fcmaps = np.empty((blk.nface, 5), dtype='int32')
+    ndmaps.fill(-1)
+    ndmaps[:,0] = 0
+    fcmaps.fill(-1)
+    fcmaps[:,0] = 0
+    ndmap = np.empty(blk.nnode, dtype='int32')
+    fcmap = np.empty(blk.nface, dtype='int32')
+    for iblk, (mynode, myface, mycell) in enumerate(idxinfo):
+        ndmap.fill(-1)
+        fcmap.fill(-1)
+        ndmap[mynode] = np.arange(len(mynode), dtype='int32')
+        fcmap[myface] = np.arange(len(myface), dtype='int32')
+        for maps, myent, entmap in ((ndmaps, mynode, ndmap),
+                                    (fcmaps, myface, fcmap)):
+            locs = maps[myent,0]
+            maps[myent,1+locs*2] = entmap[myent]
+            maps[myent,1+locs*2+1] = iblk
+            maps[myent,0] += 1
+    return idxinfo, (ndmaps, fcmaps)
+
+
+def main():
+    nx = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    nblks = [int(arg) for arg in sys.argv[2:]] or [4, 16, 64, 256, 1024]
+    gmh = Gmsh(BytesIO(make_cube(nx, with_boundary=False)))
+    gmh.load(close=True)
+    blk = gmh.toblock()
+    print('%d cells, %d faces, %d nodes' % (blk.ncell, blk.nface, blk.nnode))
+    rng = np.random.RandomState(0)
+    for nblk in nblks:
+        # contiguous chunks of cells, like a real partition.
+        part = np.sort(rng.randint(0, nblk, blk.ncell)).astype('int32')
+        blk.partition = lambda npart, **kw: (0, part.copy())
+        dom = Collective(blk=blk)
+        tstart = time.time()
+        dom.partition(nblk)
+        tsort = time.time() - tstart
+        del blk.partition
+        tstart = time.time()
+        idxinfo, (ndmaps, fcmaps) = per_block_partition(blk, part, nblk)
+        tloop = time.time() - tstart
+        for new, old in zip(dom.idxinfo, idxinfo):
+            for newarr, oldarr in zip(new, old):
+                assert (newarr == oldarr).all()
+        assert (dom.mappers[0] == ndmaps).all()
+        assert (dom.mappers[1] == fcmaps).all()
+        print('  nblk %5d: sort-based %7.3f sec, per-block %7.3f sec '
+              '(%.1fx)' % (nblk, tsort, tloop, tloop/tsort))
+
+if __name__ == '__main__':
+    main()
+
+# vim: set ff=unix fenc=utf8 ft=python ai et sw=4 ts=4 tw=79:
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright (c) 2016, Yung-Yu Chen <yyc@solvcon.net>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# - Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the SOLVCON nor the names of its contributors may be
+#   used to endorse or promote products derived from this software without
+#   specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Compare the memory and the time of calc_soln with the sub-face metrics stored
+in sfmrc (storesf=True) and calculated on the fly (storesf=False), for the
+gas-dynamics solver and the velocity-stress solver on a hexahedral cube.  The
+memory column counts sfmrc against all the arrays of the solver.  Usage::
+
+  $ python bench_sfmrc.py [number of cells along an edge]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import sys
+import time
+from io import BytesIO
+
+import numpy as np
+
+from solvcon.io.gmsh import Gmsh
+from solvcon.parcel.gas.solver import GasSolver
+from solvcon.parcel.linear.velstress import material
+from solvcon.parcel.linear.velstress.logic import VslinSolver
+
+from bench_gmsh import make_cube
+
+
+def best_of(func, nrepeat=5):
+    tmin = None
+    for it in range(nrepeat):
+        tstart = time.time()
+        func()
+        telapsed = time.time() - tstart
+        tmin = telapsed if tmin is None else min(tmin, telapsed)
+    return tmin
+
+
+def make_block(nx):
+    gmh = Gmsh(BytesIO(make_cube(nx, with_boundary=False)), bulk=True)
+    gmh.load(close=True)
+    return gmh.toblock()
+
+
+def make_gas(blk, storesf):
+    svr = GasSolver(blk, storesf=storesf, time_increment=1.e-4)
+    svr.amsca.fill(1.4)
+    return svr
+
+
+def make_vslin(blk, storesf):
+    mtrldict = dict((name, material.mltregy['GaAs'](al=0.0, be=0.0, ga=0.0))
+                    for name in blk.grpnames)
+    svr = VslinSolver(blk, mtrldict, storesf=storesf, time_increment=1.e-9)
+    svr._make_grpda()
+    svr._make_jacos()
+    return svr
+
+
+def array_bytes(svr):
+    """Bytes of all the distinct arrays held by the solver."""
+    seen = set()
+    nbyte = 0
+    for val in vars(svr).values():
+        if isinstance(val, np.ndarray):
+            base = val if val.base is None else val.base
+            if id(base) not in seen and isinstance(base, np.ndarray):
+                seen.add(id(base))
+                nbyte += base.nbytes
+    return nbyte
+
+
+def run(title, blk, maker):
+    results = []
+    print(title)
+    for storesf in (True, False):
+        svr = maker(blk, storesf)
+        tstart = time.time()
+        svr.init()
+        tinit = time.time() - tstart
+        # no BC sets the ghost geometry.
+        svr.cecnd[:svr.ngstcell] = svr.blk.shclcnd[:svr.ngstcell,None,:]
+        rng = np.random.RandomState(0)
+        for name in ('sol', 'solt', 'dsol'):
+            arr = getattr(svr, name)
+            arr[...] = 1.0 + 0.1*rng.rand(*arr.shape)
+        tsoln = best_of(svr.alg.calc_soln if hasattr(svr, 'alg')
+                        else svr.create_alg().calc_soln)
+        results.append(svr.soln[svr.ngstcell:].copy())
+        nsf = 0 if svr.sfmrc is None else svr.sfmrc.nbytes
+        print('  storesf=%-5s init %7.4f sec  calc_soln %7.4f sec'
+              '  sfmrc %7.2f MB of %7.2f MB' % (storesf, tinit, tsoln,
+              nsf / 1024.**2, array_bytes(svr) / 1024.**2))
+    assert (results[0] == results[1]).all()
+
+
+def main():
+    nx = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    blk = make_block(nx)
+    print('%d cells' % blk.ncell)
+    run('gas dynamics (5 equations):', blk, make_gas)
+    run('velocity-stress (9 equations):', blk, make_vslin)
+
+if __name__ == '__main__':
+    main()
+
+# vim: set ff=unix fenc=utf8 ft=python ai et sw=4 ts=4 tw=79:
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright (c) 2016, Yung-Yu Chen <yyc@solvcon.net>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# - Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the SOLVCON nor the names of its contributors may be
+#   used to endorse or promote products derived from this software without
+#   specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Time the conversions done by the VTK writers for every output: building the
+connectivity from the padded clnds table and padding/copying vector arrays.
+The vectorized conversions are compared against the former per-cell loops on
+a mixed-element table (tetrahedra, pyramids, prisms and hexahedra) and on the
+hexahedral cube from bench_gmsh.  Usage::
+
+  $ python bench_vtk.py [number of cells along an edge]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import sys
+import time
+from io import BytesIO
+
+import numpy as np
+
+from solvcon.io.gmsh import Gmsh
+from solvcon.io.vtk import VtkLegacyUstGridWriter
+from solvcon.io.vtkxml import VtkXmlUstGridWriter
+
+from bench_gmsh import make_cube
+
+
+def loop_convert_clnds(clnds):
+    """The former per-cell XML connectivity builder, kept for comparison."""
+    arr = np.empty(clnds[:,0].sum(), dtype='int32')
+    ncell = clnds.shape[0]
+    icl = 0
+    it = 0
+    while icl < ncell:
+        ncl = clnds[icl,0]
+        arr[it:it+ncl] = clnds[icl,1:ncl+1]
+        it += ncl
+        icl += 1
+    return arr
+
+
+def loop_pack_clnds(clnds):
+    """The former per-cell legacy CELLS builder, kept for comparison."""
+    ncell = clnds.shape[0]
+    arr = np.empty(clnds[:,0].sum() + ncell, dtype='int32')
+    icl = 0
+    it = 0
+    while icl < ncell:
+        ncl = clnds[icl,0]
+        arr[it] = ncl
+        arr[it+1:it+1+ncl] = clnds[icl,1:ncl+1]
+        it += 1+ncl
+        icl += 1
+    return arr
+
+
+def make_mixed_clnds(ncell, nnode, seed=0):
+    """A padded clnds table of randomly mixed 3D elements."""
+    rng = np.random.RandomState(seed)
+    clnds = np.full((ncell, 9), -1, dtype='int32')
+    clnds[:,0] = rng.choice([4, 5, 6, 8], ncell)
+    mask = np.arange(8) < clnds[:,:1]
+    clnds[:,1:][mask] = rng.randint(0, nnode, mask.sum())
+    return clnds
+
+
+def timeit(func, *args):
+    tstart = time.time()
+    ret = func(*args)
+    return time.time() - tstart, ret
+
+
+def compare(title, loop, vectorized, *args):
+    tloop, old = timeit(loop, *args)
+    tvec, new = timeit(vectorized, *args)
+    assert (old == new).all()
+    print('  %-24s former %8.4f sec, new %8.4f sec (%.0fx)' % (
+        title, tloop, tvec, tloop/tvec))
+
+
+def main():
+    nx = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    gmh = Gmsh(BytesIO(make_cube(nx, with_boundary=False)))
+    gmh.load(close=True)
+    blk = gmh.toblock()
+    for title, clnds in (('cube', blk.clnds),
+                         ('mixed', make_mixed_clnds(blk.ncell, blk.nnode))):
+        print('%s: %d cells' % (title, clnds.shape[0]))
+        compare('XML connectivity:', loop_convert_clnds,
+                VtkXmlUstGridWriter._convert_clnds, clnds)
+        compare('legacy CELLS:', loop_pack_clnds,
+                VtkLegacyUstGridWriter._pack_clnds, clnds)
+    # 3D vectors are no longer copied twice (astype and _convert_varr).
+    wtr = VtkXmlUstGridWriter(blk)
+    vec = np.random.rand(blk.ncell, 3)
+    compare('3D vector conversion:',
+            lambda arr: wtr._convert_varr(arr.astype(wtr.fpdtype)).copy(),
+            lambda arr: wtr._convert_varr(
+                arr.astype(wtr.fpdtype, copy=False)), vec)
+    tstart = time.time()
+    wtr.write(BytesIO())
+    print('full XML write of the cube: %.3f sec' % (time.time() - tstart))
+
+if __name__ == '__main__':
+    main()
+
+# vim: set ff=unix fenc=utf8 ft=python ai et sw=4 ts=4 tw=79:
@@ -64,7 +64,7 @@ __all__ = [
     # boundcond
     'BC', 'bctregy',
     # domain
-    'Domain', 'Collective', 'Distributed',
+    'Domain', 'Collective', 'Distributed', 'CostModel',
     # helper
     'helper', 'Gmsh',
     # parcel
@@ -85,7 +85,7 @@ from .case import MeshCase
 from .anchor import MeshAnchor, MeshAnchorList
 from .hook import MeshHook
 from .boundcond import BC, bctregy
-from .domain import Domain, Collective, Distributed
+from .domain import Domain, Collective, Distributed, CostModel
 from . import helper
 from .helper import Gmsh
 from . import parcel
@@ -80,6 +80,8 @@ class _TableDescriptor(object):
         if self.name not in ins.TABLE_NAMES:
             raise AttributeError('"%s" is not in Block.TABLE_NAME'%self.name)
         collector = self._get_collector(ins)
+        if self.name not in collector:
+            ins._load_table(self.name)
         return collector[self.name]
 
     def __set__(self, ins, val):
@@ -234,6 +236,13 @@ class Block(with_metaclass(BlockMeta)):
     def check_sanity(self):
         self.create_msh()
 
+    def _load_table(self, name):
+        """
+        Hook for a table that is accessed before being set.  All tables of a
+        :py:class:`Block` are allocated at construction, so it is an error.
+        """
+        raise KeyError(name)
+
     def _build_tables(self, ndim, nnode, nface, ncell,
                       ngstnode, ngstface, ngstcell):
         """
@@ -400,6 +409,8 @@ class Block(with_metaclass(BlockMeta)):
                 setattr(self, name, table.B)
                 setattr(self, 'gst'+name, table.G)
                 setattr(self, 'sh'+name, table.F)
+        # the spatial index of the cells is outdated.
+        self._cellbins = None
         # assign extracted data to block.
         self.clfcs[:,:] = clfcs[:,:]
         self.fctpn[:] = fctpn[:]
@@ -516,6 +527,137 @@ class Block(with_metaclass(BlockMeta)):
         # return result.
         return ngstnode, ngstface, ngstcell
 
-    def partition(self, npart):
+    def locate_points(self, crds):
+        """
+        :param crds: Coordinates of the points, of shape (npoint, ndim).
+        :type crds: numpy.ndarray
+        :return: Index of the cell containing each point; -1 for not found.
+        :rtype: numpy.ndarray
+
+        Locate the cells containing the points with
+        :py:meth:`solvcon.mesh.Mesh.locate_points`.  The spatial index of the
+        cells is built by the first call and reused afterward.
+
+        >>> from .testing import create_trivial_2d_blk
+        >>> blk = create_trivial_2d_blk()
+        >>> blk.locate_points([(0, -0.5), (0.2, 0.2), (2, 2)]).tolist()
+        [0, 1, -1]
+        """
+        msh = self.create_msh()
+        if getattr(self, '_cellbins', None) is None:
+            self._cellbins = msh.build_bins()
+        return msh.locate_points(crds, self._cellbins)
+
+    def partition(self, npart, vwgtarr=None, adjwgtarr=None):
+        """
+        :param npart: Number of parts.
+        :type npart: int
+        :keyword vwgtarr: Weight of each cell.
+        :type vwgtarr: numpy.ndarray
+        :keyword adjwgtarr: Weight of each edge of the cell graph.
+        :type adjwgtarr: numpy.ndarray
+        :return: edgecut, part
+
+        Partition the cells with :py:meth:`solvcon.mesh.Mesh.partition`.
+        """
         msh = self.create_msh()
-        return msh.partition(npart)
+        return msh.partition(npart, vwgtarr=vwgtarr, adjwgtarr=adjwgtarr)
+
+
+class LazyBlock(Block):
+    """
+    A :py:class:`Block` whose tables are read on first access.
+
+    >>> calls = []
+    >>> def reader(name):
+    ...     calls.append(name)
+    ...     return mesh.Table(0, 4, 2, dtype='float64', creation='zeros')
+    >>> blk = LazyBlock(reader, ndim=2, nnode=4, nface=6, ncell=3, nbound=0)
+    >>> blk.nnode, calls
+    (4, [])
+    >>> blk.ndcrd.shape, calls
+    ((4, 2), ['ndcrd'])
+    >>> blk.shndcrd.shape, calls
+    ((4, 2), ['ndcrd'])
+    """
+
+    def __init__(self, reader, **kw):
+        """
+        :param reader: callable taking a table name and returning the
+            :py:class:`solvcon.mesh.Table` for it.
+        :keyword ndim: spatial dimension.
+        :type ndim: int
+        :keyword nnode: number of nodes.
+        :type nnode: int
+        :keyword nface: number of faces.
+        :type nface: int
+        :keyword ncell: number of cells.
+        :type ncell: int
+        :keyword nbound: number of BC faces.
+        :type nbound: int
+        :keyword ngstnode: number of ghost nodes.
+        :type ngstnode: int
+        :keyword ngstface: number of ghost faces.
+        :type ngstface: int
+        :keyword ngstcell: number of ghost cells.
+        :type ngstcell: int
+        :keyword use_incenter: specify using incenter or not.
+        :type use_incenter: bool
+
+        Nothing is read at initialization.  The shape keywords are kept so
+        that the counts don't trigger reading.
+        """
+        self._table_reader = reader
+        self._counts = dict()
+        for key in ('ndim', 'nnode', 'nface', 'ncell',
+                    'ngstnode', 'ngstface', 'ngstcell'):
+            self._counts[key] = kw.pop(key, 0)
+        self.use_incenter = kw.pop('use_incenter', False)
+        self.blkn = None
+        self.bclist = list()
+        self.bndfcs = np.empty((kw.pop('nbound', 0), 2), dtype='int32')
+        self.grpnames = list()
+
+    def _load_table(self, name):
+        table = self._table_reader(name)
+        setattr(self, 'tb'+name, table)
+        setattr(self, name, table.B)
+        setattr(self, 'gst'+name, table.G)
+        setattr(self, 'sh'+name, table.F)
+
+    @property
+    def loaded_tables(self):
+        """Names of the tables that have been read."""
+        tables = getattr(self, '_tables', dict())
+        return tuple(name for name in self.TABLE_NAMES if name in tables)
+
+    def load_all(self):
+        """
+        Read all the tables that haven't been read.
+
+        :return: Nothing.
+        """
+        for name in self.TABLE_NAMES:
+            getattr(self, 'tb'+name)
+
+    @property
+    def ndim(self):
+        return self._counts['ndim']
+    @property
+    def nnode(self):
+        return self._counts['nnode']
+    @property
+    def nface(self):
+        return self._counts['nface']
+    @property
+    def ncell(self):
+        return self._counts['ncell']
+    @property
+    def ngstnode(self):
+        return self._counts['ngstnode']
+    @property
+    def ngstface(self):
+        return self._counts['ngstface']
+    @property
+    def ngstcell(self):
+        return self._counts['ngstcell']
@@ -245,6 +245,7 @@ class MeshCase(case_core.CaseInfo):
         # execution related.
         'execution.fpdtype': 'float64',
         'execution.npart': None,    # number of decomposed blocks.
+        'execution.partition_cost': None,   # CostModel or cell weights.
         'execution.stop': False,
         'execution.time': 0.0,
         'execution.time_increment': 0.0,
@@ -260,6 +261,7 @@ class MeshCase(case_core.CaseInfo):
         'io.meshfn': None,
         'io.domain.with_arrs': True,
         'io.domain.with_whole': True,
+        'io.domain.with_mmap': False,   # map uncompressed arrays from files.
         'io.domain.wholefn': None,
         'io.domain.splitfns': None,
         'io.abspath': False,    # flag to use abspath or not.
@@ -274,6 +276,7 @@ class MeshCase(case_core.CaseInfo):
         'condition.mtrllist': list,
         # solver.
         'solver.debug': False,
+        'solver.ibcasync': False,   # post interface exchange at once.
         'solver.use_incenter': False,
         'solver.domaintype': None,
         'solver.domainobj': None,
@@ -467,7 +470,8 @@ class MeshCase(case_core.CaseInfo):
                 self._log_start('split_domain')
                 self.solver.domainobj.split(
                     nblk=self.execution.npart,
-                    interface_type=boundcond.interface)
+                    interface_type=boundcond.interface,
+                    cost=self.execution.partition_cost)
                 self._log_end('split_domain')
             # make dealer and create workers for the dealer.
             self.info('\n')
@@ -518,7 +522,8 @@ class MeshCase(case_core.CaseInfo):
             obj = self.io.mesher(self)
             self._log_end('create_block')
         elif os.path.isdir(meshfn):
-            dof = iodomain.DomainIO(dirname=meshfn)
+            dof = iodomain.DomainIO(dirname=meshfn,
+                                    mmap=self.io.domain.with_mmap)
             obj, whole, split = dof.load(bcmapper=bcmapper,
                 with_arrs=self.io.domain.with_arrs,
                 with_whole=self.io.domain.with_whole, with_split=False,
@@ -606,6 +611,7 @@ class MeshCase(case_core.CaseInfo):
         return dict(
             enable_mesg=self.io.solver_output,
             debug=self.solver.debug,
+            ibcasync=self.solver.ibcasync,
         )
 
     # solver object initialization/loading.
@@ -632,7 +638,8 @@ class MeshCase(case_core.CaseInfo):
             if dom.presplit:
                 dealer[iblk].create_solver(self.condition.bcmap,
                     self.io.meshfn, self.io.domain.splitfn[iblk],
-                    iblk, nblk, solvertype, svrkw)
+                    iblk, nblk, solvertype, svrkw,
+                    mmap=self.io.domain.with_mmap)
                 self.runhooks.drop_anchor(dealer[iblk])
             else:
                 sbk = dom[iblk]
@@ -798,8 +805,9 @@ for node in $nodes; do rsh $node killall %s; done
         @return: nothing
         """
         dealer = self.solver.dealer
-        for arrname in self.solver.solvertype._interface_init_:
-            for sdw in dealer: sdw.cmd.exchangeibc(arrname,
+        arrnames = tuple(self.solver.solvertype._interface_init_)
+        if arrnames:
+            for sdw in dealer: sdw.cmd.exchangeibc(arrnames,
                 with_worker=True)
 
     ############################################################################
@@ -864,9 +872,10 @@ for node in $nodes; do rsh $node killall %s; done
         self.runhooks('preloop')
         if flag_parallel:
             for sdw in dealer: sdw.cmd.preloop()
-            for arrname in self.solver.solvertype._solution_array_:
+            arrnames = tuple(self.solver.solvertype._solution_array_)
+            if arrnames:
                 for sdw in dealer:
-                    sdw.cmd.exchangeibc(arrname, with_worker=True)
+                    sdw.cmd.exchangeibc(arrnames, with_worker=True)
             for sdw in dealer: sdw.cmd.apply_bc()
         else:
             self.solver.solverobj.preloop()
@@ -464,12 +464,17 @@ class mesh(Command):
         )
         opg.add_option('--compressor', action='store', type='string',
             dest='compressor', default='',
-            help='Empty string (no compression), gz or bz2.',
+            help='Empty string (no compression), gz, bz2, zlib or xz.',
         )
         opg.add_option('--split', action='store', type='int',
             dest='split', default=None,
             help='Split the loaded block into given number of parts.',
         )
+        opg.add_option('--nworker', action='store', type='int',
+            dest='nworker', default=None,
+            help='Number of threads for supplementing and saving the split '
+                 'blocks (default is serial).',
+        )
         opg.add_option('--bc-reject', action='store', type='string',
             dest='bc_reject', default='',
             help='The BC (name) to be rejected in conversion.',
@@ -528,14 +533,14 @@ class mesh(Command):
         info('done. (%gs)\n' % (time()-timer))
         info('Split step 5/5: supplement ... ')
         timer = time()
-        dom.supplement()
+        dom.supplement(nworker=ops.nworker)
         info('done. (%gs)\n' % (time()-timer))
         dio = DomainIO(dom=dom, compressor=ops.compressor)
         if not os.path.exists(dirname):
             os.makedirs(dirname)
         info('Save to directory %s/ ... ' % dirname)
         timer = time()
-        dio.save(dirname=dirname)
+        dio.save(dirname=dirname, nworker=ops.nworker)
         info('done. (%gs)\n' % (time()-timer))
     @staticmethod
     def _save_vtklegacy(ops, blk, vtkfn, binary, fpdtype):
@@ -131,13 +131,51 @@ class Credential(object):
         if res != self.SUCCESS:
             raise IOError('digest sent was rejected')
 
+class ThreadRequest(object):
+    """
+    Handle of a non-blocking operation carried out by a background thread of
+    a SocketConnection.
+    """
+    def __init__(self, future):
+        self.future = future
+    def test(self):
+        return self.future.done()
+    def wait(self):
+        self.future.result()
+
 class SocketConnection(object):
+    """
+    Connection over a socket.  The non-blocking isendarr() and irecvarr()
+    are carried out in one background thread for each direction, so that the
+    messages are sent and received in the order of posting.  Do not mix them
+    with the blocking calls before the posted requests are waited.
+
+    Arrays are sent by sendarr() as raw memory following a small header of
+    ARRAY_HEADER, and recvarr() reads the memory right into the target array
+    after checking the header.  Nothing is pickled or copied on the way.
+    """
+    # magic, dtype string, shape[0], number of elements.
+    ARRAY_HEADER = '!4s8sqq'
+    ARRAY_MAGIC = b'SCAR'
+
     def __init__(self, *args, **kw):
         try: # py3k compat.
             from _multiprocessing import Connection
         except ImportError:
             from multiprocessing.connection import Connection
         self.conn = Connection(*args, **kw)
+        self._sender = None
+        self._receiver = None
+        self._socket = None
+    @property
+    def socket(self):
+        """
+        Socket object on the descriptor of the connection for raw transfer.
+        """
+        import os, socket
+        if self._socket is None:
+            self._socket = socket.socket(fileno=os.dup(self.conn.fileno()))
+        return self._socket
     def send_bytes(self, *args, **kw):
         return self.conn.send_bytes(*args, **kw)
     def recv_bytes(self, *args, **kw):
@@ -147,11 +185,108 @@ class SocketConnection(object):
     def recv(self, *args, **kw):
         return self.conn.recv(*args, **kw)
     def close(self, *args, **kw):
+        for pool in self._sender, self._receiver:
+            if pool is not None:
+                pool.shutdown(wait=False)
+        self._sender = self._receiver = None
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
         return self.conn.close(*args, **kw)
     def sendarr(self, arr):
-        self.send(arr)
+        """
+        Send the memory of the array.  A non-contiguous array is copied to a
+        contiguous one first.
+        """
+        import struct
+        import numpy as np
+        arr = np.ascontiguousarray(arr)
+        shape0 = arr.shape[0] if arr.ndim else 1
+        skt = self.socket
+        skt.sendall(struct.pack(self.ARRAY_HEADER, self.ARRAY_MAGIC,
+            arr.dtype.str.encode(), shape0, arr.size))
+        if arr.nbytes:
+            skt.sendall(memoryview(arr.reshape(-1)).cast('B'))
     def recvarr(self, arr):
-        arr[:] = self.recv()[:]
+        """
+        Receive the memory of an array sent by sendarr() right into *arr*.
+        The dtype, the length, and the number of elements have to match.
+        """
+        import struct
+        import numpy as np
+        skt = self.socket
+        head = bytearray(struct.calcsize(self.ARRAY_HEADER))
+        self._recv_into(skt, memoryview(head))
+        magic, dtype, shape0, size = struct.unpack(self.ARRAY_HEADER, head)
+        if magic != self.ARRAY_MAGIC:
+            raise IOError('not an array message: %r' % bytes(head))
+        dtype = np.dtype(dtype.rstrip(b'\0').decode())
+        if (dtype != arr.dtype or size != arr.size
+                or shape0 != (arr.shape[0] if arr.ndim else 1)):
+            # drain the payload to keep the stream in sync.
+            self._recv_into(skt, memoryview(bytearray(size*dtype.itemsize)))
+            raise ValueError('received %s array of %d rows and %d elements '
+                'mismatches %s' % (dtype, shape0, size, arr.shape))
+        # the temporary has to be C-ordered for reshape() to be a view.
+        target = (arr if arr.flags.c_contiguous
+                  else np.empty(arr.shape, dtype=arr.dtype))
+        if target.nbytes:
+            self._recv_into(skt, memoryview(target.reshape(-1)).cast('B'))
+        if target is not arr:
+            arr[...] = target
+    @staticmethod
+    def _recv_into(skt, view):
+        nbytes = len(view)
+        pos = 0
+        while pos < nbytes:
+            nread = skt.recv_into(view[pos:])
+            if not nread:
+                raise EOFError('connection closed while receiving array')
+            pos += nread
+    def isendarr(self, arr):
+        """
+        Post sending the array.  The array must not be changed before the
+        returned request is waited.
+
+        @return: the request to wait.
+        @rtype: ThreadRequest
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        if self._sender is None:
+            self._sender = ThreadPoolExecutor(1)
+        return ThreadRequest(self._sender.submit(self.sendarr, arr))
+    def irecvarr(self, arr):
+        """
+        Post receiving into the array.
+
+        @return: the request to wait.
+        @rtype: ThreadRequest
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        if self._receiver is None:
+            self._receiver = ThreadPoolExecutor(1)
+        return ThreadRequest(self._receiver.submit(self.recvarr, arr))
+
+class MPIRequest(object):
+    """
+    Handle of a non-blocking MPI operation.
+    """
+    def __init__(self, handle, arr):
+        self.handle = handle
+        self.arr = arr  # keep the buffer alive until waited.
+    def test(self):
+        from .conf import env
+        if self.arr is None:
+            return True
+        done = env.mpi.test(self.handle)
+        if done:
+            self.arr = None
+        return done
+    def wait(self):
+        from .conf import env
+        if self.arr is not None:
+            env.mpi.wait(self.handle)
+            self.arr = None
 
 class MPIConnection(object):
     TAG = 1
@@ -170,6 +305,12 @@ class MPIConnection(object):
     def recvarr(self, arr):
         from .conf import env
         env.mpi.recvarr(arr, self.dst, self.TAG)
+    def isendarr(self, arr):
+        from .conf import env
+        return MPIRequest(env.mpi.isendarr(arr, self.dst, self.TAG), arr)
+    def irecvarr(self, arr):
+        from .conf import env
+        return MPIRequest(env.mpi.irecvarr(arr, self.dst, self.TAG), arr)
 
 CLIENT_TIMEOUT = 20.
 def Client(address, family=None, authkey=None):
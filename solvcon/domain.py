@@ -33,7 +33,7 @@ Domain decomposition.
 """
 
 
-__all__ = ['Domain', 'Collective', 'Distributed']
+__all__ = ['Domain', 'Collective', 'Distributed', 'CostModel']
 
 
 class Domain(object):
@@ -110,6 +110,138 @@ class Partitioner(object):
         )
         return edgecut.value, part
 
+class CostModel(object):
+    """
+    Estimate the computing cost of each cell to weight the graph partitioning
+    of a block.  A cell costs according to its type, plus an extra cost for
+    each boundary face it is next to.  When the partition and the per-block
+    timings of an earlier run are given, the modeled costs are scaled block by
+    block to match the timings.  Optionally, the edges of the cell graph are
+    weighted by the faces between the cells, so that the partitioner avoids
+    cutting costly faces.
+
+    @ivar type_cost: cost of each cell type, indexed by cltpn.  The default is
+        the number of faces of the type.
+    @itype type_cost: numpy.ndarray
+    @ivar bc_cost: extra cost per boundary face for each BC, keyed by the name
+        or the type of the BC.  BCs not listed cost default_bc_cost.
+    @itype bc_cost: dict
+    @ivar default_bc_cost: extra cost per boundary face of unlisted BCs.
+    @itype default_bc_cost: float
+    @ivar part: partition of an earlier run.
+    @itype part: numpy.ndarray
+    @ivar times: time spent by each of the blocks in the earlier run, e.g., the
+        'march' entry of the timer of the solvers.
+    @itype times: sequence
+    @ivar face_cost: cost of cutting a face, either a number for all faces or
+        a sequence indexed by fctpn.  None leaves the edges unweighted.
+    @itype face_cost: float or numpy.ndarray
+    """
+
+    RESOLUTION = 100    # integer weight of the cheapest cell.
+
+    def __init__(self, type_cost=None, bc_cost=None, default_bc_cost=1.0,
+                 part=None, times=None, face_cost=None):
+        from numpy import array
+        from .block import elemtype
+        if type_cost is None:
+            type_cost = [tpn[1+tpn[1]] for tpn in elemtype]
+        self.type_cost = array(type_cost, dtype='float64')
+        self.bc_cost = dict() if bc_cost is None else dict(bc_cost)
+        self.default_bc_cost = default_bc_cost
+        self.part = part
+        self.times = times
+        self.face_cost = face_cost
+        super(CostModel, self).__init__()
+
+    def _get_bc_cost(self, bc):
+        if bc.name in self.bc_cost:
+            return self.bc_cost[bc.name]
+        for bctype in type(bc).__mro__:
+            if bctype in self.bc_cost:
+                return self.bc_cost[bctype]
+        return self.default_bc_cost
+
+    def costs(self, blk):
+        """
+        Estimate the cost of each cell.
+
+        @param blk: the block to be partitioned.
+        @type blk: solvcon.block.Block
+        @return: the cost of each cell.
+        @rtype: numpy.ndarray
+        """
+        from numpy import add, asarray, bincount, zeros
+        cost = self.type_cost[blk.cltpn]
+        bccost = zeros(blk.nface, dtype='float64')
+        for bc in blk.bclist:
+            bccost[bc.facn[:,0]] = self._get_bc_cost(bc)
+        # boundary faces belong to only one cell.
+        slct = blk.fccls[:,1] < 0
+        add.at(cost, blk.fccls[slct,0], bccost[slct])
+        # calibrate with the timings of the earlier run.
+        if self.part is not None and self.times is not None:
+            times = asarray(self.times, dtype='float64')
+            modeled = bincount(self.part, weights=cost, minlength=len(times))
+            modeled[modeled == 0] = 1
+            cost *= (times / modeled)[self.part]
+        return cost
+
+    def weights(self, blk):
+        """
+        Convert the estimated costs to integer weights for METIS.
+
+        @param blk: the block to be partitioned.
+        @type blk: solvcon.block.Block
+        @return: the weight of each cell.
+        @rtype: numpy.ndarray
+        """
+        from numpy import rint
+        cost = self.costs(blk)
+        cost = cost * (self.RESOLUTION / cost[cost > 0].min())
+        # keep the total weight representable by METIS int.
+        total = cost.sum()
+        if total > 2**30:
+            cost *= 2**30 / total
+        return rint(cost).clip(1, None).astype('int32')
+
+    def edge_weights(self, blk):
+        """
+        Weight each edge of the cell graph by the cost of the faces between
+        the two cells.  The edges are ordered as the adjacency built by
+        solvcon.mesh.Mesh.create_csr, which lists the interior faces of each
+        cell in the order of clfcs.
+
+        @param blk: the block to be partitioned.
+        @type blk: solvcon.block.Block
+        @return: the integer weight of each edge, or None if face_cost is
+            None.
+        @rtype: numpy.ndarray
+        """
+        from numpy import arange, asarray, broadcast_to, rint, where
+        if self.face_cost is None:
+            return None
+        fccost = asarray(self.face_cost, dtype='float64')
+        if fccost.ndim == 0:
+            fccost = broadcast_to(fccost, (blk.nface,))
+        else:
+            fccost = fccost[blk.fctpn]
+        # the faces of each cell leading to a neighboring cell.
+        clfcs = blk.clfcs[:,1:]
+        icl = arange(blk.ncell)[:,None]
+        fccls = blk.fccls[where(clfcs < 0, 0, clfcs)]
+        slct = (arange(clfcs.shape[1]) < blk.clfcs[:,:1]) & (clfcs >= 0)
+        slct &= ((fccls[...,0] == icl) & (fccls[...,1] >= 0)
+                 & (fccls[...,2] == -1)) | (fccls[...,1] == icl)
+        cost = fccost[clfcs[slct]]
+        positive = cost[cost > 0]
+        if len(positive):
+            cost = cost * (self.RESOLUTION / positive.min())
+        total = cost.sum()
+        if total > 2**30:
+            cost *= 2**30 / total
+        return rint(cost).clip(1, None).astype('int32')
+
 class Collective(Domain, list):
     """
     Domain retaining the relationship between the collective and the decomposed
@@ -163,49 +295,119 @@ class Collective(Domain, list):
         """
         return (len(self) == 0) and (len(self.idxinfo) != 0)
 
-    def partition(self, nblk):
+    def partition(self, nblk, cost=None):
         """
         Partition the whole block into sub-blocks and put information into
         self.edgecut, self.part, self.idxinfo and self.mappers.
 
+        The entities of all sub-blocks are grouped at once: cells are sorted
+        by the part they belong to, and the (part, node) and (part, face)
+        pairs by part and then by entity index.  Each sub-block takes a
+        contiguous segment of the sorted arrays.
+
         @param nblk: number of sub-blocks to be partitioned.
         @type nblk: int
+        @keyword cost: a CostModel or an array of cell weights to balance the
+            sub-blocks by.  None weights all cells the same.  A CostModel also
+            weights the edges of the cell graph if it has face_cost.
+        @type cost: CostModel or numpy.ndarray
         """
-        from numpy import empty, arange, unique, zeros
+        from numpy import empty, arange
         blk = self.blk
         # call partitioner.
         #edgecut, part = Partitioner(blk)(nblk)
-        edgecut, part = blk.partition(nblk)
+        adjwgt = None
+        if isinstance(cost, CostModel):
+            adjwgt = cost.edge_weights(blk)
+            cost = cost.weights(blk)
+        edgecut, part = blk.partition(nblk, vwgtarr=cost, adjwgtarr=adjwgt)
         self.edgecut = edgecut
         self.part = part
         # numbering.
-        clidx = arange(blk.ncell, dtype='int32')
-        idxinfo = list()
-        for iblk in range(nblk):
-            mycls = clidx[part==iblk]
-            myfcs = unique(blk.clfcs[mycls,1:].flatten())
-            myfcs = myfcs[myfcs>-1]
-            myfcs.sort()
-            mynds = unique(blk.clnds[mycls,1:].flatten())
-            mynds = mynds[mynds>-1]
-            mynds.sort()
-            idxinfo.append((mynds, myfcs, mycls))
-        self.idxinfo = tuple(idxinfo)
+        clidx = part.argsort(kind='mergesort').astype('int32')
+        clbnds = part[clidx].searchsorted(arange(nblk+1))
+        ndpart, ndidx = self._pair_with_part(part, blk.clnds, blk.nnode)
+        ndbnds = ndpart.searchsorted(arange(nblk+1))
+        fcpart, fcidx = self._pair_with_part(part, blk.clfcs, blk.nface)
+        fcbnds = fcpart.searchsorted(arange(nblk+1))
+        self.idxinfo = tuple(
+            (ndidx[ndbnds[iblk]:ndbnds[iblk+1]],
+             fcidx[fcbnds[iblk]:fcbnds[iblk+1]],
+             clidx[clbnds[iblk]:clbnds[iblk+1]])
+            for iblk in range(nblk))
         # prepare mappers.
-        ndcnts = zeros(blk.nnode, dtype='int32')
-        for mynds, myfcs, mycls in self.idxinfo:
-            ndcnts[mynds] += 1
-        ndmblk = ndcnts.max()
-        ndmaps = empty((blk.nnode, 1+2*ndmblk), dtype='int32')
-        fcmaps = empty((blk.nface, 5), dtype='int32')
+        ndmaps = self._make_entity_maps(ndidx, ndbnds, blk.nnode)
+        fcmaps = self._make_entity_maps(fcidx, fcbnds, blk.nface, 2)
         clmaps = empty((blk.ncell, 2), dtype='int32')
-        ndmaps.fill(-1)
-        ndmaps[:,0] = 0
-        fcmaps.fill(-1)
-        fcmaps[:,0] = 0
-        clmaps.fill(-1)
+        clmaps[clidx,0] = arange(blk.ncell) - clbnds[part[clidx]]
+        clmaps[:,1] = part
         self.mappers = (ndmaps, fcmaps, clmaps)
 
+    @staticmethod
+    def _pair_with_part(part, conn, nent):
+        """
+        Collect the distinct (part, entity) pairs from a cell connectivity
+        array (clnds or clfcs).
+
+        @param part: part index of each cell.
+        @type part: numpy.ndarray
+        @param conn: cell connectivity array.
+        @type conn: numpy.ndarray
+        @param nent: number of the connected entities.
+        @type nent: int
+        @return: part indices and entity indices of the pairs, sorted by
+            part and then by entity.
+        @rtype: tuple of numpy.ndarray
+        """
+        from numpy import concatenate
+        ent = conn[:,1:]
+        dtype = 'int32' if (part.max()+1) * nent < 2**31 else 'int64'
+        key = part.astype(dtype)[:,None] * nent + ent
+        key = key[ent > -1]
+        key.sort()
+        key = key[concatenate([[True], key[1:] != key[:-1]])]
+        return (key // nent).astype('int32'), (key % nent).astype('int32')
+
+    @staticmethod
+    def _make_entity_maps(eidx, bnds, nent, nmax=None):
+        """
+        Build the global-to-local mapper for nodes or faces.  Row i holds the
+        number of sub-blocks sharing entity i, followed by the (local index,
+        block index) pairs in the ascending order of block index.
+
+        @param eidx: global entity indices of the (block, entity) pairs,
+            sorted by block and then by entity.
+        @type eidx: numpy.ndarray
+        @param bnds: boundaries of the segment of each block in eidx.
+        @type bnds: numpy.ndarray
+        @param nent: number of entities in the whole block.
+        @type nent: int
+        @keyword nmax: number of pairs per row; default to the maximal
+            sharing.
+        @type nmax: int
+        @return: the mapper.
+        @rtype: numpy.ndarray
+        """
+        from numpy import empty, zeros, arange, bincount
+        cnts = bincount(eidx, minlength=nent)
+        if nmax is None:
+            nmax = cnts.max() if nent else 0
+        maps = empty((nent, 1+2*nmax), dtype='int32')
+        maps.fill(-1)
+        maps[:,0] = cnts
+        flat = maps.reshape(-1)
+        # visit the blocks in order, so that the pairs of an entity fill its
+        # row in the ascending order of block index.  Each block touches only
+        # its own entities.
+        seen = zeros(nent, dtype='int32')
+        for iblk in range(len(bnds)-1):
+            myent = eidx[bnds[iblk]:bnds[iblk+1]]
+            slot = myent * maps.shape[1] + 1 + 2 * seen[myent]
+            flat[slot] = arange(len(myent), dtype='int32')
+            flat[slot+1] = iblk
+            seen[myent] += 1
+        return maps
+
     def distribute(self):
         """
         Split step 1: Distribute all data from the whole-block to each
@@ -245,8 +447,11 @@ class Collective(Domain, list):
         """
         from numpy import empty, arange
         part = self.part
+        ndmaps, fcmaps, clmaps = self.mappers
+        # Cell map for whole-indices -> sub-indeces for all sub-blocks.
         clmap = empty(self.blk.ncell+1, dtype='int32')
-        clmap.fill(-1)
+        clmap[:-1] = clmaps[:,0]
+        clmap[-1] = -1
         iblk = 0
         for blk in self:
             belong = blk.fccls[:,0]
@@ -255,8 +460,6 @@ class Collective(Domain, list):
             neibcl = blk.fccls[:,3]
             mynode, myface, mycell = self.idxinfo[iblk]
             myfcidx = arange(blk.nface, dtype='int32')
-            # Set cell map for whole-indices -> sub-indeces for each sub-block.
-            clmap[mycell] = arange(blk.ncell, dtype='int32')
             # Swap belong and neibor for whose neighboring cell is not in the
             # current block.  This action ensures that if the face is connected
             # with a cell in the current block within either belong or neibor
@@ -281,10 +484,6 @@ class Collective(Domain, list):
             neibor[notmine] = -nbnd-1   # it doesn't matter to be how negative.
             # next.
             iblk += 1
-        # Record maps for cells.
-        ndmaps, fcmaps, clmaps = self.mappers
-        clmaps[:,0] = clmap[:-1]
-        clmaps[:,1] = part[:]
         return clmap
 
     @staticmethod
@@ -311,31 +510,22 @@ class Collective(Domain, list):
         Split step 3: Reindex nodes, faces, and cells, and distribute BCs.
         """
         from numpy import empty, arange
-        ndmaps, fcmaps, clmaps = self.mappers
         ndmap = empty(self.blk.nnode+1, dtype='int32')
         fcmap = empty(self.blk.nface+1, dtype='int32')
+        ndmap.fill(-1)
+        fcmap.fill(-1)
         iblk = 0
         for blk in self:
             mynode, myface, mycell = self.idxinfo[iblk]
             # Build mapping. clmap is reused and needs not to be built here,
-            # because there will be no coincident cells.
-            ndmap.fill(-1)
-            fcmap.fill(-1)
+            # because there will be no coincident cells.  The maps were
+            # recorded in self.mappers by partition().
             ndmap[mynode] = arange(blk.nnode, dtype='int32')
             fcmap[myface] = arange(blk.nface, dtype='int32')
             # Reindex nodes and faces.
             self._reindex_conn(blk.fcnds, ndmap)
             self._reindex_conn(blk.clnds, ndmap)
             self._reindex_conn(blk.clfcs, fcmap)
-            # Record maps for nodes and faces.
-            locs = ndmaps[mynode,0]
-            ndmaps[mynode,1+locs*2] = ndmap[mynode]
-            ndmaps[mynode,1+locs*2+1] = iblk
-            ndmaps[mynode,0] += 1
-            locs = fcmaps[myface,0]
-            fcmaps[myface,1+locs*2] = fcmap[myface]
-            fcmaps[myface,1+locs*2+1] = iblk
-            fcmaps[myface,0] += 1
             # Distribute BCs.
             bcs = list()
             for oldbc in self.blk.bclist:    # loop over all old BCs.
@@ -365,6 +555,9 @@ class Collective(Domain, list):
             blk.fccls[want,1] = clmap[neibor][want]
             neibcl = blk.fccls[:,3]
             blk.fccls[:,3] = clmap[neibcl]
+            # Reset only the touched entries of the maps for the next block.
+            ndmap[mynode] = -1
+            fcmap[myface] = -1
             # next.
             iblk += 1
 
@@ -435,16 +628,40 @@ class Collective(Domain, list):
             iblk += 1
         self.ifparr = array(ifplist, dtype='int32')
 
-    def supplement(self):
+    @staticmethod
+    def _supplement_block(blk):
+        """
+        Build metrics, boundary, and ghost information of a sub-block.  It
+        depends on nothing but the sub-block itself.
+        """
+        blk.calc_metric()
+        blk.build_boundary()
+        blk.build_ghost()
+        return blk
+
+    def supplement(self, nworker=None):
         """
         Split step 5: Supplement the rest of the blocks.
+
+        The sub-blocks are independent to each other until the ghost
+        information is copied across interfaces, so that they can be built
+        concurrently.  The mesh kernels release the GIL, and threads sharing
+        the sub-blocks in place are used.
+
+        @keyword nworker: number of threads for building the sub-blocks.
+            None or 1 builds them serially.
+        @type nworker: int
         """
         from numpy import array
         from .boundcond import bctregy
-        for blk in self:
-            blk.calc_metric()
-            blk.build_boundary()
-            blk.build_ghost()
+        if nworker is None or nworker <= 1 or len(self) <= 1:
+            for blk in self:
+                self._supplement_block(blk)
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(min(nworker, len(self))) as executor:
+                # list() re-raises the first exception from the workers.
+                list(executor.map(self._supplement_block, self))
         # copy ghost information between interface.
         for blk in self:
             for bc in blk.bclist:
@@ -468,7 +685,8 @@ class Collective(Domain, list):
             shapes.append(tuple(shape))
         self.shapes = array(shapes, dtype='int32')
 
-    def split(self, nblk=None, interface_type=None):
+    def split(self, nblk=None, interface_type=None, nworker=None,
+              cost=None):
         """
         Split the whole block according to the partitioning information
         (self.idxinfo) and write to self list ad self.ifplist.
@@ -502,12 +720,16 @@ class Collective(Domain, list):
         @type interface_type: solvcon.boundcond.interface
         @keyword do_all: flag to do all steps.
         @type do_all: bool
+        @keyword nworker: number of threads for supplementing the sub-blocks.
+        @type nworker: int
+        @keyword cost: cost model or cell weights for the partitioning.
+        @type cost: CostModel or numpy.ndarray
 
         @return: nothing.
         """
         # Step 0: partition the graph built from mesh.
         if isinstance(nblk, int) and self.part is None:
-            self.partition(nblk)
+            self.partition(nblk, cost=cost)
         # Step 1: Distribute all data from the whole-block to each sub-block.
         self.distribute()
         # Step 2: Compute neighboring block information.
@@ -517,7 +739,7 @@ class Collective(Domain, list):
         # Step 4: Build interface BC objects.
         self.build_interface(interface_type)
         # Step 5: Supplement the rest of the blocks.
-        self.supplement()
+        self.supplement(nworker=nworker)
 
     def make_iflist_per_block(self):
         """
@@ -67,10 +67,14 @@ class BlockFormat(with_metaclass(BlockFormatMeta, Format)):
     @cvar meta_length: length of all META_ entries.
     @ctype meta_length: int
 
-    @ivar compressor: the compression to use: '', 'gz', or 'bz2'
+    @ivar compressor: the compression to use: '', 'gz', 'bz2', 'zlib',
+        or 'xz'
     @itype compressor: str
     @ivar fpdtype: specified fpdtype for I/O.
     @itype fpdtype: numpy.dtype
+    @ivar mmap: map uncompressed tables from the file instead of reading
+        them; the tables are copy-on-write.
+    @itype mmap: bool
     """
 
     FILE_HEADER = '-*- solvcon blk mesh file -*-'
@@ -78,6 +82,7 @@ class BlockFormat(with_metaclass(BlockFormatMeta, Format)):
     def __init__(self, **kw):
         self.compressor = kw.pop('compressor', '')
         self.fpdtype = kw.pop('fpdtype', None)
+        self.mmap = kw.pop('mmap', False)
         super(BlockFormat, self).__init__()
     def save(self, blk, stream):
         """
@@ -95,19 +100,8 @@ class BlockFormat(with_metaclass(BlockFormatMeta, Format)):
         self._save_bclist(blk, stream)
         stream.write(self.BINARY_MARKER + b'\n')
         # binary part.
-        ## connectivity.
-        for key in 'shfcnds', 'shfccls', 'shclnds', 'shclfcs':
-            self._write_array(self.compressor, getattr(blk, key), stream)
-        ## type.
-        for key in 'shfctpn', 'shcltpn', 'shclgrp':
-            self._write_array(self.compressor, getattr(blk, key), stream)
-        ## geometry.
-        for key in ('shndcrd', 'shfccnd', 'shfcnml', 'shfcara',
-            'shclcnd', 'shclvol'):
-            self._write_array(self.compressor, getattr(blk, key), stream)
-        ## boundary conditions.
-        self._save_boundcond(self.compressor, blk, stream)
-    def load(self, stream, bcmapper, only_meta=False):
+        self._save_arrays(blk, stream)
+    def load(self, stream, bcmapper, only_meta=False, lazy=False):
         """
         Load block from stream with BC mapper applied.
         
@@ -117,6 +111,10 @@ class BlockFormat(with_metaclass(BlockFormatMeta, Format)):
         @type bcmapper: dict
         @keyword only_meta: read only meta data and return.
         @type only_meta: bool
+        @keyword lazy: return a solvcon.block.LazyBlock reading each table on
+            first access.  Only formats with a table of contents support it;
+            the others load everything.
+        @type lazy: bool
         @return: the read block object.
         @rtype: solvcon.block.Block
         """
@@ -127,6 +125,7 @@ class BlockFormat(with_metaclass(BlockFormatMeta, Format)):
         meta = self._parse_meta(lines)
         if only_meta:
             return meta
+        meta['mmap'] = self.mmap
         fpdtype = meta.fpdtype if self.fpdtype == None else self.fpdtype
         kw = {'fpdtype': fpdtype}
         if 'use_incenter' in meta and meta['use_incenter'] is not None:
@@ -157,6 +156,38 @@ class BlockFormat(with_metaclass(BlockFormatMeta, Format)):
     ############################################################################
     # Facilities for writing.
     ############################################################################
+    def _save_arrays(self, blk, stream):
+        """
+        Write the binary part.
+
+        @param blk: to-be-written block object.
+        @type blk: solvcon.block.Block
+        @param stream: output stream.
+        @type stream: file
+        @return: offset and length in bytes of each table and of the BC
+            arrays, relative to the beginning of the binary part.
+        @rtype: dict
+        """
+        start = stream.tell()
+        toc = dict()
+        def write(name, arr):
+            offset = stream.tell()
+            self._write_array(self.compressor, arr, stream)
+            toc[name] = (offset - start, stream.tell() - offset)
+        ## connectivity.
+        for name in 'fcnds', 'fccls', 'clnds', 'clfcs':
+            write(name, getattr(blk, 'sh'+name))
+        ## type.
+        for name in 'fctpn', 'cltpn', 'clgrp':
+            write(name, getattr(blk, 'sh'+name))
+        ## geometry.
+        for name in 'ndcrd', 'fccnd', 'fcnml', 'fcara', 'clcnd', 'clvol':
+            write(name, getattr(blk, 'sh'+name))
+        ## boundary conditions.
+        offset = stream.tell()
+        self._save_boundcond(self.compressor, blk, stream)
+        toc['boundcond'] = (offset - start, stream.tell() - offset)
+        return toc
     @classmethod
     def _save_group(cls, blk, stream):
         """
@@ -185,7 +216,8 @@ class BlockFormat(with_metaclass(BlockFormatMeta, Format)):
     @classmethod
     def _save_boundcond(cls, compressor, blk, stream):
         """
-        @param compressor: the compression to use: '', 'gz', or 'bz2'
+        @param compressor: the compression to use: '', 'gz', 'bz2',
+            'zlib', or 'xz'
         @type compressor: str
         @param blk: block object to alter.
         @type blk: solvcon.block.Block
@@ -261,16 +293,20 @@ class BlockFormat(with_metaclass(BlockFormatMeta, Format)):
         """
         blk.tbfcnds = cls._read_table(
             meta.compressor, stream, 'int32',
-            meta.ngstface, meta.nface, meta.FCMND+1)
+            meta.ngstface, meta.nface, meta.FCMND+1,
+            mmap=meta.mmap)
         blk.tbfccls = cls._read_table(
             meta.compressor, stream, 'int32',
-            meta.ngstface, meta.nface, 4)
+            meta.ngstface, meta.nface, 4,
+            mmap=meta.mmap)
         blk.tbclnds = cls._read_table(
             meta.compressor, stream, 'int32',
-            meta.ngstcell, meta.ncell, meta.CLMND+1)
+            meta.ngstcell, meta.ncell, meta.CLMND+1,
+            mmap=meta.mmap)
         blk.tbclfcs = cls._read_table(
             meta.compressor, stream, 'int32',
-            meta.ngstcell, meta.ncell, meta.CLMFC+1)
+            meta.ngstcell, meta.ncell, meta.CLMFC+1,
+            mmap=meta.mmap)
     @classmethod
     def _load_type(cls, meta, stream, blk):
         """
@@ -283,11 +319,14 @@ class BlockFormat(with_metaclass(BlockFormatMeta, Format)):
         @return: nothing.
         """
         blk.tbfctpn = cls._read_table(
-            meta.compressor, stream, 'int32', meta.ngstface, meta.nface)
+            meta.compressor, stream, 'int32', meta.ngstface, meta.nface,
+            mmap=meta.mmap)
         blk.tbcltpn = cls._read_table(
-            meta.compressor, stream, 'int32', meta.ngstcell, meta.ncell)
+            meta.compressor, stream, 'int32', meta.ngstcell, meta.ncell,
+            mmap=meta.mmap)
         blk.tbclgrp = cls._read_table(
-            meta.compressor, stream, 'int32', meta.ngstcell, meta.ncell)
+            meta.compressor, stream, 'int32', meta.ngstcell, meta.ncell,
+            mmap=meta.mmap)
     @classmethod
     def _load_geometry(cls, meta, stream, blk):
         """
@@ -304,22 +343,28 @@ class BlockFormat(with_metaclass(BlockFormatMeta, Format)):
         fpdtype = blk.fpdtype
         blk.tbndcrd = cls._read_table(
             meta.compressor, stream, fpdtype,
-            meta.ngstnode, meta.nnode, meta.ndim)
+            meta.ngstnode, meta.nnode, meta.ndim,
+            mmap=meta.mmap)
         blk.tbfccnd = cls._read_table(
             meta.compressor, stream, fpdtype,
-            meta.ngstface, meta.nface, meta.ndim)
+            meta.ngstface, meta.nface, meta.ndim,
+            mmap=meta.mmap)
         blk.tbfcnml = cls._read_table(
             meta.compressor, stream, fpdtype,
-            meta.ngstface, meta.nface, meta.ndim)
+            meta.ngstface, meta.nface, meta.ndim,
+            mmap=meta.mmap)
         blk.tbfcara = cls._read_table(
             meta.compressor, stream, fpdtype,
-            meta.ngstface, meta.nface)
+            meta.ngstface, meta.nface,
+            mmap=meta.mmap)
         blk.tbclcnd = cls._read_table(
             meta.compressor, stream, fpdtype,
-            meta.ngstcell, meta.ncell, meta.ndim)
+            meta.ngstcell, meta.ncell, meta.ndim,
+            mmap=meta.mmap)
         blk.tbclvol = cls._read_table(
             meta.compressor, stream, fpdtype,
-            meta.ngstcell, meta.ncell)
+            meta.ngstcell, meta.ncell,
+            mmap=meta.mmap)
     @classmethod
     def _load_boundcond(cls, meta, bcsinfo, fpdtype, stream, blk):
         """
@@ -551,7 +596,8 @@ class TrivialBlockFormat(BlockFormat):
     @classmethod
     def _save_boundcond(cls, compressor, blk, stream):
         """
-        @param compressor: the compression to use: '', 'gz', or 'bz2'
+        @param compressor: the compression to use: '', 'gz', 'bz2',
+            'zlib', or 'xz'
         @type compressor: str
         @param blk: block object to alter.
         @type blk: solvcon.block.Block
@@ -702,6 +748,172 @@ class IncenterBlockFormat(TrivialBlockFormat):
         self._write_text('ngroup = %d\n' % len(blk.grpnames), stream)
         self._write_text('nbc = %d\n' % len(blk.bclist), stream)
 
+class IndexedBlockFormat(IncenterBlockFormat):
+    """
+    Block format with a table of contents (TOC) section after the BC list.
+    Each TOC entry records the offset and the length in bytes of a table (or
+    of the BC arrays), relative to the beginning of the binary part, so that a
+    table can be read without reading those before it.
+    """
+    FORMAT_REV = '0.0.8'
+    # FormatMeta only counts META_ entries of the direct parents.
+    META_GLOBAL = TrivialBlockFormat.META_GLOBAL
+    META_DESC = TrivialBlockFormat.META_DESC
+    META_GEOM = TrivialBlockFormat.META_GEOM
+    META_SWITCH = TrivialBlockFormat.META_SWITCH
+    META_ATT = TrivialBlockFormat.META_ATT
+    TOC_NAMES = (
+        'fcnds', 'fccls', 'clnds', 'clfcs', 'fctpn', 'cltpn', 'clgrp',
+        'ndcrd', 'fccnd', 'fcnml', 'fcara', 'clcnd', 'clvol', 'boundcond')
+    # fixed width of the numbers in the TOC, which is rewritten in place.
+    TOC_WIDTH = 20
+
+    def save(self, blk, stream):
+        """
+        Save the block object into a file.  The TOC is first written with
+        fixed-width placeholders and is filled in after the arrays are
+        streamed, so that the binary part is not held in memory.  For a
+        stream that cannot seek, the binary part is encoded into a buffer
+        before the text part is written.
+        
+        @param blk: to-be-written block object.
+        @type blk: solvcon.block.Block
+        @param stream: file object or file name to be read.
+        @type stream: file or str
+        """
+        seekable = getattr(stream, 'seekable', lambda: False)()
+        if seekable:
+            toc = dict((name, (0, 0)) for name in self.TOC_NAMES)
+        else:
+            from io import BytesIO
+            binary = BytesIO()
+            toc = self._save_arrays(blk, binary)
+        # text part.
+        stream.write(self.FILE_HEADER.encode() + b'\n')
+        self._save_meta(blk, stream)
+        self._save_group(blk, stream)
+        self._save_bclist(blk, stream)
+        tocpos = stream.tell() if seekable else None
+        self._save_toc(toc, stream)
+        stream.write(self.BINARY_MARKER + b'\n')
+        # binary part.
+        if seekable:
+            toc = self._save_arrays(blk, stream)
+            end = stream.tell()
+            stream.seek(tocpos)
+            self._save_toc(toc, stream)
+            stream.seek(end)
+        else:
+            stream.write(binary.getvalue())
+    def load(self, stream, bcmapper, only_meta=False, lazy=False):
+        """
+        Load block from stream with BC mapper applied.
+        
+        @param stream: file object or file name to be read.
+        @type stream: file or str
+        @param bcmapper: BC type mapper.
+        @type bcmapper: dict
+        @keyword only_meta: read only meta data and return.
+        @type only_meta: bool
+        @keyword lazy: return a solvcon.block.LazyBlock reading each table on
+            first access from the stream, which is then kept open.  BCs are
+            read at once.
+        @type lazy: bool
+        @return: the read block object.
+        @rtype: solvcon.block.Block
+        """
+        from ..block import LazyBlock
+        if only_meta or not lazy:
+            return super(IndexedBlockFormat, self).load(
+                stream, bcmapper, only_meta=only_meta)
+        lines, textlen = self._get_textpart(stream)
+        meta = self._parse_meta(lines)
+        meta['mmap'] = self.mmap
+        fpdtype = meta.fpdtype if self.fpdtype == None else self.fpdtype
+        toc = self._load_toc(meta, lines)
+        spec = self._table_spec(meta, fpdtype)
+        def reader(name):
+            stream.seek(textlen + toc[name][0])
+            return self._read_table(meta.compressor, stream, *spec[name],
+                                    mmap=meta.mmap)
+        blk = LazyBlock(reader, use_incenter=bool(meta.use_incenter),
+            ndim=meta.ndim, nnode=meta.nnode, nface=meta.nface,
+            ncell=meta.ncell, nbound=meta.nbound, ngstnode=meta.ngstnode,
+            ngstface=meta.ngstface, ngstcell=meta.ngstcell)
+        blk.blkn = meta.blkn
+        self._load_group(meta, lines, blk)
+        bcsinfo = self._load_bclist(meta, lines, blk)
+        stream.seek(textlen + toc['boundcond'][0])
+        self._load_boundcond(meta, bcsinfo, fpdtype, stream, blk)
+        if bcmapper != None:
+            self._convert_bc(bcmapper, blk)
+        return blk
+
+    ############################################################################
+    # Facilities for writing.
+    ############################################################################
+    @classmethod
+    def _save_toc(cls, toc, stream):
+        """
+        @param toc: offset and length of each table.
+        @type toc: dict
+        @param stream: output stream.
+        @type stream: file
+        @return: nothing.
+        """
+        width = cls.TOC_WIDTH
+        for name in cls.TOC_NAMES:
+            offset, length = toc[name]
+            cls._write_text('toc_%s = %*d, %*d\n' % (
+                name, width, offset, width, length), stream)
+
+    ############################################################################
+    # Facilities for reading.
+    ############################################################################
+    @classmethod
+    def _load_toc(cls, meta, lines):
+        """
+        @param meta: meta information dictionary.
+        @type meta: solvcon.gendata.AttributeDict
+        @param lines: text data
+        @type lines: list
+        @return: offset and length of each table.
+        @rtype: dict
+        """
+        begin = cls.meta_length + 1 + meta.ngroup + meta.nbc
+        end = begin + len(cls.TOC_NAMES)
+        toc = dict()
+        for line in lines[begin:end]:
+            key, value = line.split('=')
+            offset, length = [int(tok) for tok in value.split(',')]
+            toc[key.strip()[4:]] = (offset, length)
+        return toc
+    @staticmethod
+    def _table_spec(meta, fpdtype):
+        """
+        @param meta: meta information dictionary.
+        @type meta: solvcon.gendata.AttributeDict
+        @param fpdtype: dtype for floating-point tables.
+        @type fpdtype: numpy.dtype
+        @return: dtype and shape arguments for _read_table of each table.
+        @rtype: dict
+        """
+        return dict(
+            fcnds=('int32', meta.ngstface, meta.nface, meta.FCMND+1),
+            fccls=('int32', meta.ngstface, meta.nface, 4),
+            clnds=('int32', meta.ngstcell, meta.ncell, meta.CLMND+1),
+            clfcs=('int32', meta.ngstcell, meta.ncell, meta.CLMFC+1),
+            fctpn=('int32', meta.ngstface, meta.nface),
+            cltpn=('int32', meta.ngstcell, meta.ncell),
+            clgrp=('int32', meta.ngstcell, meta.ncell),
+            ndcrd=(fpdtype, meta.ngstnode, meta.nnode, meta.ndim),
+            fccnd=(fpdtype, meta.ngstface, meta.nface, meta.ndim),
+            fcnml=(fpdtype, meta.ngstface, meta.nface, meta.ndim),
+            fcara=(fpdtype, meta.ngstface, meta.nface),
+            clcnd=(fpdtype, meta.ngstcell, meta.ncell, meta.ndim),
+            clvol=(fpdtype, meta.ngstcell, meta.ncell),
+        )
+
 class BlockIO(FormatIO):
     """
     Proxy to blk file format.
@@ -716,10 +928,14 @@ class BlockIO(FormatIO):
         revision string.
     @itype fmt: str
 
-    @ivar compressor: the compression to use: '', 'gz', or 'bz2'
+    @ivar compressor: the compression to use: '', 'gz', 'bz2', 'zlib',
+        or 'xz'
     @itype compressor: str
     @ivar fpdtype: specified fpdtype for I/O.
     @itype fpdtype: numpy.dtype
+    @ivar mmap: map uncompressed tables from the file instead of reading
+        them.
+    @itype mmap: bool
     """
     def __init__(self, **kw):
         self.blk = kw.pop('blk', None)
@@ -728,13 +944,15 @@ class BlockIO(FormatIO):
         fmt = kw.pop('fmt', None)
         fpdtype = kw.pop('fpdtype', None)
         compressor = kw.pop('compressor', '')
+        mmap = kw.pop('mmap', False)
         super(BlockIO, self).__init__()
         # create BlockFormat object.
         if fmt == None and self.filename != None:
             fmt = self._peek_revision(self.filename)
         if fmt == None:
-            fmt = 'IncenterBlockFormat'
-        self.blf = blfregy[fmt](compressor=compressor, fpdtype=fpdtype)
+            fmt = 'IndexedBlockFormat'
+        self.blf = blfregy[fmt](compressor=compressor, fpdtype=fpdtype,
+                                mmap=mmap)
     @staticmethod
     def _peek_revision(filename):
         from .core import Format
@@ -785,7 +1003,7 @@ class BlockIO(FormatIO):
         elif isinstance(stream, str):
             stream = open(stream, 'rb')
         return self.blf.read_meta(stream)
-    def load(self, stream=None, bcmapper=None):
+    def load(self, stream=None, bcmapper=None, lazy=False):
         """
         Load block from stream with BC mapper applied.
         
@@ -793,6 +1011,9 @@ class BlockIO(FormatIO):
         @type stream: file or str
         @keyword bcmapper: BC type mapper.
         @type bcmapper: dict
+        @keyword lazy: read each table on first access if the format has a
+            table of contents.
+        @type lazy: bool
         @return: the read block object.
         @rtype: solvcon.block.Block
         """
@@ -806,6 +1027,6 @@ class BlockIO(FormatIO):
             fmt = self._peek_revision(stream)
             if fmt == None:
                 fmt = 'IncenterBlockFormat'
-            blf = blfregy[fmt]()
+            blf = blfregy[fmt](mmap=self.blf.mmap)
             stream = open(stream, 'rb')
-        return blf.load(stream, bcmapper)
+        return blf.load(stream, bcmapper, lazy=lazy)
@@ -35,6 +35,98 @@ Core I/O facilities for SOLVCON intrinsic constructs.
 from ..py3kcompat import with_metaclass, basestring
 from ..gendata import TypeNameRegistry
 
+CHUNK_SIZE = 1 << 20
+"""Number of raw bytes in each chunk of a chunked compressor."""
+
+def _chunk_codec(compressor):
+    """
+    @param compressor: name of a chunked compressor: 'zlib' or 'xz'.
+    @type compressor: str
+    @return: compressing and decompressing functions for a single chunk, or
+        None if the compressor isn't chunked.
+    @rtype: tuple
+    """
+    if compressor == 'zlib':
+        import zlib
+        return (lambda buf: zlib.compress(buf, 1)), zlib.decompress
+    elif compressor == 'xz':
+        import lzma
+        return (lambda buf: lzma.compress(buf, preset=1)), lzma.decompress
+    return None
+
+_chunk_executor = None
+def _get_chunk_executor():
+    """
+    @return: the thread pool shared by chunked compressors.  zlib and lzma
+        release the GIL while working on a chunk.
+    @rtype: concurrent.futures.ThreadPoolExecutor
+    """
+    global _chunk_executor
+    if _chunk_executor is None:
+        import os
+        from concurrent.futures import ThreadPoolExecutor
+        _chunk_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+    return _chunk_executor
+
+def _map_chunks(func, chunks):
+    if len(chunks) > 1:
+        return list(_get_chunk_executor().map(func, chunks))
+    else:
+        return [func(chunk) for chunk in chunks]
+
+def _compress_chunks(compressor, arr):
+    """
+    Compress the array by chunks in parallel.  The result starts with the
+    chunk index: number of chunks, raw bytes per chunk, and the compressed
+    length of each chunk, all in int64, followed by the compressed chunks.
+
+    @param compressor: name of a chunked compressor.
+    @type compressor: str
+    @param arr: the array to be compressed.
+    @type arr: numpy.ndarray
+    @return: the encoded data.
+    @rtype: bytes
+    """
+    import numpy as np
+    compress = _chunk_codec(compressor)[0]
+    raw = np.ascontiguousarray(arr).reshape(-1).view(np.uint8)
+    chunks = [raw[it:it+CHUNK_SIZE] for it in range(0, raw.size, CHUNK_SIZE)]
+    data = _map_chunks(compress, chunks)
+    index = np.array([len(data), CHUNK_SIZE] + [len(it) for it in data],
+                     dtype='int64')
+    return b''.join([index.tobytes()] + data)
+
+def _decompress_chunks(compressor, buf, shape, dtype):
+    """
+    Decompress the data encoded by _compress_chunks in parallel.
+
+    @param compressor: name of a chunked compressor.
+    @type compressor: str
+    @param buf: the encoded data.
+    @type buf: bytes
+    @param shape: ndarray shape.
+    @type shape: tuple
+    @param dtype: ndarray dtype.
+    @type dtype: numpy.dtype
+    @return: resulted array.
+    @rtype: numpy.ndarray
+    """
+    import numpy as np
+    decompress = _chunk_codec(compressor)[1]
+    nchunk, chunksize = np.frombuffer(buf, dtype='int64', count=2)
+    lengths = np.frombuffer(buf, dtype='int64', count=nchunk, offset=16)
+    ends = np.cumsum(lengths) + 8 * (2 + nchunk)
+    view = memoryview(buf)
+    chunks = [view[end-length:end] for end, length in zip(ends, lengths)]
+    arr = np.empty(shape, dtype=dtype)
+    raw = arr.reshape(-1).view(np.uint8)
+    def unpack(ichunk):
+        data = decompress(chunks[ichunk])
+        start = ichunk * chunksize
+        raw[start:start+len(data)] = np.frombuffer(data, dtype=np.uint8)
+    _map_chunks(unpack, list(range(nchunk)))
+    return arr
+
 class FormatRegistry(TypeNameRegistry):
     """
     Registry for a certain class of formats.
@@ -121,6 +213,12 @@ class Format(with_metaclass(FormatMeta)):
     @staticmethod
     def _write_array(compressor, arr, stream):
         """
+        Write the array to the stream.  'bz2' and 'gz' compress the whole
+        array at level 9.  The chunked compressors, 'zlib' (fast level) and
+        'xz', compress CHUNK_SIZE bytes per chunk on a thread pool.  All
+        compressed data are prefixed by their length in bytes, so that
+        skipping an array takes only a seek.
+
         @param compressor: how to compress data arrays.
         @type compressor: str
         @param arr: the array to be written.
@@ -136,6 +234,9 @@ class Format(with_metaclass(FormatMeta)):
         elif compressor == 'gz':
             data = zlib.compress(arr.data, 9)
             stream.write(struct.pack('q', len(data)))
+        elif _chunk_codec(compressor) is not None:
+            data = _compress_chunks(compressor, arr)
+            stream.write(struct.pack('q', len(data)))
         else:
             data = arr.data
         if not isinstance(data, bytes):
@@ -207,11 +308,18 @@ class Format(with_metaclass(FormatMeta)):
                     meta[key] = None
         return meta
     @staticmethod
-    def _read_array(compressor, shape, dtype, stream, seek_only=False):
+    def _read_array(compressor, shape, dtype, stream, seek_only=False,
+                    mmap=False):
         """
         Read data from the input stream and convert it to ndarray with given
         shape and dtype.
 
+        When mmap is set and the data are not compressed, the returned array
+        is a copy-on-write numpy.memmap of the file backing the stream; no
+        data are read until the array is touched.  Streams not backed by a
+        file, and data not starting at a multiple of the item size (which
+        would be misaligned for the C code), fall back to the normal reading.
+
         @param compressor: how to compress data arrays.
         @type compressor: str
         @param shape: ndarray shape.
@@ -222,6 +330,9 @@ class Format(with_metaclass(FormatMeta)):
         @type stream: file
         @keyword seek_only: do not really read, only seek; default False.
         @type seek_only: bool
+        @keyword mmap: map uncompressed data instead of reading; default
+            False.
+        @type mmap: bool
         @return: resulted array.
         @rtype: numpy.ndarray
         """
@@ -248,10 +359,33 @@ class Format(with_metaclass(FormatMeta)):
             else:
                 buf = stream.read(int(buflen))
                 buf = zlib.decompress(buf)
+        elif _chunk_codec(compressor) is not None:
+            buflen = np.frombuffer(stream.read(8), dtype=np.int64)[0]
+            if seek_only:
+                stream.seek(stream.tell() + buflen)
+                return None
+            buf = stream.read(int(buflen))
+            return _decompress_chunks(compressor, buf, shape, dtype)
         else:
             buflen = length * dobj.itemsize
+            offset = stream.tell()
+            if mmap and not seek_only and buflen:
+                try:
+                    stream.fileno()
+                except (AttributeError, IOError, ValueError):
+                    mmap = False
+                # the mapped address has the same alignment as the offset.
+                if offset % dobj.itemsize:
+                    mmap = False
+            else:
+                mmap = False
             if seek_only:
-                stream.seek(stream.tell() + buflen)
+                stream.seek(offset + buflen)
+            elif mmap:
+                arr = np.memmap(stream, dtype=dtype, mode='c', offset=offset,
+                                shape=tuple(shape))
+                stream.seek(offset + buflen)
+                return arr
             else:
                 buf = stream.read(buflen)
         if seek_only:
@@ -260,15 +394,21 @@ class Format(with_metaclass(FormatMeta)):
             arr = np.frombuffer(buf, dtype=dtype).reshape(shape).copy()
         return arr
     @classmethod
-    def _read_table(cls, compressor, stream, dtype, nghost, nbody, *args):
+    def _read_table(cls, compressor, stream, dtype, nghost, nbody, *args,
+                    **kw):
         """
         Read data from the input stream and convert it to
-        :py:mod:`solvcon.mesh.Table` with given shape and dtype.
+        :py:mod:`solvcon.mesh.Table` with given shape and dtype.  With the
+        keyword mmap set, an uncompressed table is backed by the mapped
+        array rather than a copy of it.
         """
         from .. import mesh
-        table = mesh.Table(nghost, nbody, *args, dtype=dtype)
-        table.F = cls._read_array(compressor, table.shape, dtype, stream)
-        return table
+        mmap = kw.pop('mmap', False)
+        shape = [nghost+nbody] + list(args)
+        # The array returned is either mapped or freshly copied, so the table
+        # can adopt it without another copy.
+        arr = cls._read_array(compressor, shape, dtype, stream, mmap=mmap)
+        return mesh.Table(nghost, nbody, *args, buffer=arr)
 
 fioregy = TypeNameRegistry()    # registry singleton.
 class FormatIOMeta(type):
@@ -55,10 +55,14 @@ class DomainFormat(with_metaclass(DomainFormatMeta, Format)):
     @cvar META_SWITCH: optional flags.
     @ctype META_SWITCH: tuple
 
-    @ivar compressor: the compression to use: '', 'gz', or 'bz2'
+    @ivar compressor: the compression to use: '', 'gz', 'bz2', 'zlib',
+        or 'xz'
     @itype compressor: str
     @ivar blk_format_rev: the format (revision) of block to be saved.
     @itype blk_format_rev: str
+    @ivar mmap: map uncompressed arrays and blocks from the files instead of
+        reading them; the mapped arrays are copy-on-write.
+    @itype mmap: bool
     """
 
     FILE_HEADER = '-*- solvcon dom file -*-'
@@ -80,6 +84,7 @@ class DomainFormat(with_metaclass(DomainFormatMeta, Format)):
     def __init__(self, **kw):
         self.compressor = kw.pop('compressor', '')
         self.blk_format_rev = kw.pop('blk_format_rev', self.FORMAT_REV)
+        self.mmap = kw.pop('mmap', False)
         super(DomainFormat, self).__init__()
     def read_meta(self, dirname):
         """
@@ -96,7 +101,7 @@ class DomainFormat(with_metaclass(DomainFormatMeta, Format)):
         meta = self._parse_meta(self._get_textpart(stream)[0])
         stream.close()
         return meta
-    def save(self, dom, dirname):
+    def save(self, dom, dirname, nworker=None):
         """
         Save the dom object into a file.
         
@@ -104,6 +109,9 @@ class DomainFormat(with_metaclass(DomainFormatMeta, Format)):
         @type dom: solvcon.domain.Collective
         @param dirname: the directory to save data.
         @type dirname: str
+        @keyword nworker: number of threads writing the per-block files.  None
+            or 1 writes them serially.
+        @type nworker: int
         """
         import os
         from .block import blfregy
@@ -126,15 +134,24 @@ class DomainFormat(with_metaclass(DomainFormatMeta, Format)):
             self._write_array(self.compressor, mycls, stream)
         stream.close()
         # blocks.
-        blf = blfregy[self.blk_format_rev](compressor=self.compressor)
-        stream = open(os.path.join(dirname, self.WHOLE_FILENAME), 'wb')
-        blf.save(dom.blk, stream)
-        stream.close()
-        for iblk in range(len(dom)):
-            stream = open(
-                os.path.join(dirname, self.SPLIT_FILENAME%iblk), 'wb')
-            blf.save(dom[iblk], stream)
+        def save_block(blk, fname):
+            blf = blfregy[self.blk_format_rev](compressor=self.compressor)
+            stream = open(os.path.join(dirname, fname), 'wb')
+            blf.save(blk, stream)
             stream.close()
+        jobs = [(dom.blk, self.WHOLE_FILENAME)]
+        jobs.extend((dom[iblk], self.SPLIT_FILENAME%iblk)
+            for iblk in range(len(dom)))
+        if nworker is None or nworker <= 1:
+            for blk, fname in jobs:
+                save_block(blk, fname)
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(min(nworker, len(jobs))) as executor:
+                futures = [executor.submit(save_block, blk, fname)
+                    for blk, fname in jobs]
+                for future in futures:
+                    future.result()
     def load(self, dirname, bcmapper, with_arrs, with_whole, with_split,
             return_filenames, domaintype):
         """
@@ -177,32 +194,37 @@ class DomainFormat(with_metaclass(DomainFormatMeta, Format)):
         stream.seek(textlen)
         seek_only = not with_arrs   # if not reading arrays, seek only.
         dom.part = self._read_array(meta.compressor,
-            (meta.ncell,), 'int32', stream, seek_only=seek_only)
+            (meta.ncell,), 'int32', stream, seek_only=seek_only,
+            mmap=self.mmap)
         dom.shapes = self._read_array(meta.compressor,
-            (meta.npart, 7), 'int32', stream, seek_only=seek_only)
+            (meta.npart, 7), 'int32', stream, seek_only=seek_only,
+            mmap=self.mmap)
         dom.ifparr = self._read_array(meta.compressor,
-            (meta.nifp, 2), 'int32', stream)    # this must be read.
+            (meta.nifp, 2), 'int32', stream, mmap=self.mmap)  # must be read.
         ndmaps = self._read_array(meta.compressor,
-            (meta.nnode, 1+2*meta.ndmblk), 'int32', stream, seek_only=seek_only)
+            (meta.nnode, 1+2*meta.ndmblk), 'int32', stream,
+            seek_only=seek_only, mmap=self.mmap)
         fcmaps = self._read_array(meta.compressor,
-            (meta.nface, 5), 'int32', stream, seek_only=seek_only)
+            (meta.nface, 5), 'int32', stream, seek_only=seek_only,
+            mmap=self.mmap)
         clmaps = self._read_array(meta.compressor,
-            (meta.ncell, 2), 'int32', stream, seek_only=seek_only)
+            (meta.ncell, 2), 'int32', stream, seek_only=seek_only,
+            mmap=self.mmap)
         dom.mappers = (ndmaps, fcmaps, clmaps)
         idxinfo = list()
         for nnd, nfc, ncl in idxlens:
             mynds = self._read_array(meta.compressor, (nnd,), 'int32',
-                stream, seek_only=seek_only)
+                stream, seek_only=seek_only, mmap=self.mmap)
             myfcs = self._read_array(meta.compressor, (nfc,), 'int32',
-                stream, seek_only=seek_only)
+                stream, seek_only=seek_only, mmap=self.mmap)
             mycls = self._read_array(meta.compressor, (ncl,), 'int32',
-                stream, seek_only=seek_only)
+                stream, seek_only=seek_only, mmap=self.mmap)
             idxinfo.append((mynds, myfcs, mycls))
         dom.idxinfo = tuple(idxinfo)
         stream.close()
         # load blocks.
         only_meta = not with_whole
-        blf = blfregy[meta.blk_format_rev]()
+        blf = blfregy[meta.blk_format_rev](mmap=self.mmap)
         stream = open(os.path.join(dirname, whole), 'rb')
         dom.blk = blf.load(stream, bcmapper, only_meta=only_meta)
         stream.close()
@@ -264,7 +286,7 @@ class DomainFormat(with_metaclass(DomainFormatMeta, Format)):
             obj = meta
         else:
             obj = self
-        blf = blfregy[obj.blk_format_rev]()
+        blf = blfregy[obj.blk_format_rev](mmap=self.mmap)
         blk = blf.load(stream=stream, bcmapper=bcmapper)
         stream.close()
         return blk
@@ -387,10 +409,14 @@ class DomainIO(FormatIO):
         revision string.
     @itype fmt: str
 
-    @ivar compressor: the compression to use: '', 'gz', or 'bz2'
+    @ivar compressor: the compression to use: '', 'gz', 'bz2', 'zlib',
+        or 'xz'
     @itype compressor: str
     @ivar dmf: the format class for the domain to be read.
     @itype dmf: DomainFormat
+    @ivar mmap: map uncompressed arrays and blocks from the files instead of
+        reading them.
+    @itype mmap: bool
     """
     def __init__(self, **kw):
         import os
@@ -398,13 +424,14 @@ class DomainIO(FormatIO):
         self.dirname = kw.pop('dirname', None)
         fmt = kw.pop('fmt', None)
         compressor = kw.pop('compressor', '')
+        mmap = kw.pop('mmap', False)
         super(DomainIO, self).__init__()
         # create BlockFormat object.
         if fmt == None and self.dirname != None:
             fmt = self._peek_revision(os.path.join(self.dirname, 'domain.dom'))
         if fmt == None:
             fmt = 'IncenterDomainFormat'
-        self.dmf = dmfregy[fmt](compressor=compressor)
+        self.dmf = dmfregy[fmt](compressor=compressor, mmap=mmap)
     @staticmethod
     def _peek_revision(filename):
         from .core import Format
@@ -424,7 +451,7 @@ class DomainIO(FormatIO):
                 rev = line.split('=')[-1].strip()
                 break
         return rev
-    def save(self, dom=None, dirname=None):
+    def save(self, dom=None, dirname=None, nworker=None):
         """
         Save the block object into a file.
         
@@ -432,10 +459,12 @@ class DomainIO(FormatIO):
         @type dom: solvcon.domain.Domain
         @keyword dirname: directory name to be read.
         @type dirname: str
+        @keyword nworker: number of threads writing the block files.
+        @type nworker: int
         """
         dom = self.dom if dom == None else dom
         dirname = self.dirname if dirname == None else dirname
-        self.dmf.save(dom, dirname)
+        self.dmf.save(dom, dirname, nworker=nworker)
     def read_meta(self, dirname=None):
         """
         Read meta-data of dom file from stream.
@@ -192,19 +192,19 @@ class BoundaryCondition(object):
         """
         from numpy import empty
         from ..boundcond import BC
-        clfcs_rmap = self.CLFCS_RMAP
         # process only element/cell type of bc.
         if self.itype != 1:
             return None
         # extrace boundary face list.
+        clfcs_rmap = empty((max(self.CLFCS_RMAP)+1, 6), dtype='int32')
+        clfcs_rmap.fill(-1)
+        for tpn, rmap in self.CLFCS_RMAP.items():
+            clfcs_rmap[tpn,:len(rmap)] = rmap
         facn = empty((self.nentry,3), dtype='int32')
         facn.fill(-1)
-        ibnd = 0
-        for entry in self.elems:
-            icl, nouse, it = entry[:3]
-            tpn = blk.cltpn[icl]
-            facn[ibnd,0] = blk.clfcs[icl, clfcs_rmap[tpn][it-1]]
-            ibnd += 1
+        icl = self.elems[:,0]
+        it = self.elems[:,2]
+        facn[:,0] = blk.clfcs[icl, clfcs_rmap[blk.cltpn[icl], it-1]]
         # craft BC object.
         bc = BC(fpdtype=blk.fpdtype)
         bc.name = self.name
@@ -403,11 +403,7 @@ class GambitNeutralReader(object):
         neuf = self.neuf
         neu = self.neu
         while True:
-            toks = neuf.readline()[:20].strip().lower().split()
-            header = []
-            for tok in toks:
-                header.extend(tok.split('/'))
-            header = '_'.join(header)
+            header = self._section_name(neuf.readline())
             method = getattr(self, '_'+header, None)
             if method != None:
                 method(neuf, neu)
@@ -415,6 +411,17 @@ class GambitNeutralReader(object):
             else:
                 break
     @staticmethod
+    def _section_name(line):
+        """
+        Convert the header line of a section to the name of the method reading
+        it, e.g., "NODAL COORDINATES 1.2.1" to "nodal_coordinates".
+        """
+        toks = line[:20].strip().lower().split()
+        header = []
+        for tok in toks:
+            header.extend(tok.split('/'))
+        return '_'.join(header)
+    @staticmethod
     def _control_info(neuf, neu):
         neu.header = neuf.readline().strip()
         neu.title = neuf.readline().strip()
@@ -563,6 +570,220 @@ class GambitNeutralReader(object):
         assert ival == nval
         return arr
 
+class GambitNeutralBulkReader(GambitNeutralReader):
+    """
+    Read and store information of a Gambit Neutral file section by section.
+    The lines of a whole section are collected first, and then the fixed-width
+    fields are converted by Numpy in bulk.  The result is the same as
+    :py:class:`GambitNeutralReader`.
+
+    Fields are cut by their columns rather than split by white spaces, so that
+    wide values touching each other (e.g., node indices of 8 digits in the
+    "ELEMENTS/CELLS" section) are read correctly.
+    """
+    def read(self):
+        neuf = self.neuf
+        neu = self.neu
+        while True:
+            header = self._section_name(neuf.readline())
+            method = getattr(self, '_'+header, None)
+            if method != None:
+                method(self._read_section(neuf), neu)
+            else:
+                break
+    @staticmethod
+    def _read_section(neuf):
+        """
+        Read all lines till the end of the current section.  The
+        "ENDOFSECTION" line is consumed but not returned.
+
+        @param neuf: neutral file.
+        @type neuf: file
+        @return: lines of the section.
+        @rtype: list
+        """
+        lines = []
+        for line in iter(neuf.readline, ''):
+            if line.startswith('ENDOFSECTION'):
+                return lines
+            lines.append(line)
+        raise ValueError('ENDOFSECTION not found')
+    @staticmethod
+    def _to_chars(lines, width):
+        """
+        Pad or truncate each line to the given width and pack all of them into
+        a 2D array of characters.
+
+        @param lines: lines to be packed.
+        @type lines: list
+        @param width: number of characters per line.
+        @type width: int
+        @return: characters of shape (len(lines), width).
+        @rtype: numpy.ndarray
+        """
+        from numpy import frombuffer
+        buf = ''.join([line.rstrip('\r\n').ljust(width)[:width]
+                       for line in lines]).encode('ascii')
+        return frombuffer(buf, dtype='uint8').reshape((len(lines), width))
+    @staticmethod
+    def _parse_fields(chars, fields, dtype):
+        """
+        Convert fixed-width fields into numbers.  Blank fields result in 0.
+
+        @param chars: characters of shape (number of records, record width).
+        @type chars: numpy.ndarray
+        @param fields: (offset, width) of each field in a record.
+        @type fields: list
+        @param dtype: dtype string of the resulted array.
+        @type dtype: str
+        @return: values of shape (number of records, number of fields).
+        @rtype: numpy.ndarray
+        """
+        from numpy import empty, fromstring
+        nrec = chars.shape[0]
+        mwidth = max(width for offset, width in fields)
+        # right-align each field in a slot followed by a space.
+        slots = empty((nrec, len(fields), mwidth+1), dtype='uint8')
+        slots.fill(ord(' '))
+        for ifd, (offset, width) in enumerate(fields):
+            slots[:,ifd,mwidth-width:mwidth] = chars[:,offset:offset+width]
+        blank = (slots == ord(' ')).all(axis=2)
+        slots[blank,mwidth-1] = ord('0')
+        arr = fromstring(slots.tobytes(), dtype=dtype, sep=' ')
+        if arr.shape[0] != nrec*len(fields):
+            raise ValueError('malformed fixed-width fields')
+        return arr.reshape((nrec, len(fields)))
+    @classmethod
+    def _read_values(cls, lines, width, nval, dtype):
+        """
+        Read homogeneous values from the beginning of the given lines, and
+        remove the consumed lines from the list.
+
+        @param lines: lines of a section.
+        @type lines: list
+        @param width: character width per value.
+        @type width: int
+        @param nval: number of values to read.
+        @type nval: int
+        @param dtype: dtype string to construct ndarray.
+        @type dtype: str
+        @return: read array.
+        @rtype: numpy.ndarray
+        """
+        from numpy import frombuffer
+        if not (dtype.startswith('int') or dtype.startswith('float')):
+            raise TypeError('%s not supported'%dtype)
+        iline = 0
+        ival = 0
+        used = []
+        while ival < nval:
+            line = lines[iline].rstrip()
+            iline += 1
+            if len(line)%width != 0:
+                raise IndexError('not exact chars at line %d'%iline)
+            used.append(line)
+            ival += len(line)//width
+        assert ival == nval
+        del lines[:iline]
+        chars = frombuffer(''.join(used).encode('ascii'), dtype='uint8')
+        chars = chars.reshape((nval, width))
+        return cls._parse_fields(chars, [(0, width)], dtype)[:,0]
+    @staticmethod
+    def _control_info(lines, neu):
+        from io import StringIO
+        GambitNeutralReader._control_info(StringIO(''.join(lines)), neu)
+    @classmethod
+    def _nodal_coordinates(cls, lines, neu):
+        from numpy import empty
+        ndim = neu.ndfcd
+        if len(lines) != neu.numnp:
+            raise ValueError('%d nodes expected but %d lines got' % (
+                neu.numnp, len(lines)))
+        fields = [(0, 10)] + [(10+20*idm, 20) for idm in range(ndim)]
+        chars = cls._to_chars(lines, 10+20*ndim)
+        arr = cls._parse_fields(chars, fields, 'float64')
+        nodeids = arr[:,0].astype('int32')
+        nodes = arr[:,1:]
+        # renumber according to first value of each line.
+        # NOTE: unused number contains garbage.
+        nodeids -= 1
+        neu.nodes = empty((nodeids.max()+1, neu.ndfcd), dtype='float64')
+        neu.nodes[nodeids] = nodes[nodeids]
+    @classmethod
+    def _elements_cells(cls, lines, neu):
+        from numpy import empty, flatnonzero, arange, unique
+        from ..block import MAX_CLNND
+        ncell = neu.nelem
+        # element index, shape, number of nodes, and 7 nodes per line.
+        fields = [(0, 8), (9, 2), (12, 2)] + [(15+8*it, 8) for it in range(7)]
+        arr = cls._parse_fields(cls._to_chars(lines, 15+8*7), fields, 'int32')
+        # a continuation line has blank (0) for the first 3 fields.
+        heads = flatnonzero(arr[:,0] != 0)
+        if heads.shape[0] != ncell:
+            raise ValueError('%d elements expected but %d got' % (
+                ncell, heads.shape[0]))
+        nds = arr[:,3:].ravel()
+        nnds = arr[heads,2]
+        elems = empty((ncell, max(MAX_CLNND, nnds.max())+2), dtype='int32')
+        elems[:,0] = arr[heads,1]
+        elems[:,1] = nnds
+        elems[:,2:] = 0
+        # copy node indices of elements of the same number of nodes together.
+        for nnd in unique(nnds):
+            slct = flatnonzero(nnds == nnd)
+            idx = heads[slct,None]*7 + arange(nnd)
+            elems[slct,2:2+nnd] = nds[idx]
+        elems[:,2:] -= 1    # renumber node indices in elements.
+        neu.elems = elems
+    @classmethod
+    def _element_group(cls, lines, neu):
+        emg = ElementGroup()
+        # group statistics.
+        line = lines.pop(0)
+        emg.ngp = int(line[7:7+10])
+        emg.nelgp = int(line[28:28+10])
+        emg.mtyp = int(line[49:49+10])
+        emg.nflags = int(line[68:68+10])
+        # group name.
+        line = lines.pop(0)
+        emg.elmmat = line.strip()
+        # solver data.
+        emg.solver = cls._read_values(lines, 8, emg.nflags, 'int32')
+        # element data.
+        emg.elems = cls._read_values(lines, 8, emg.nelgp, 'int32')-1
+        # append group.
+        neu.grps.append(emg)
+    @classmethod
+    def _boundary_conditions(cls, lines, neu):
+        bc = BoundaryCondition()
+        # control record.
+        line = lines.pop(0)
+        bc.name = line[:32].strip()
+        bc.itype = int(line[32:32+10])
+        bc.nentry = nbfc = int(line[42:42+10])
+        bc.nvalues = nval = int(line[52:52+10])
+        if len(lines) != nbfc:
+            raise ValueError('%d entries expected but %d lines got' % (
+                nbfc, len(lines)))
+        if bc.itype == 0: # nodes.
+            fields = [(0, 10)] + [(10+20*it, 20) for it in range(nval)]
+            arr = cls._parse_fields(
+                cls._to_chars(lines, 10+20*nval), fields, 'float64')
+            bc.elems = arr[:,0].astype('int32')
+            bc.values = arr[:,1:].copy()
+        elif bc.itype == 1: # elements/cells.
+            fields = [(0, 10), (10, 5), (15, 5)] + [
+                (20+20*it, 20) for it in range(nval)]
+            arr = cls._parse_fields(
+                cls._to_chars(lines, 20+20*nval), fields, 'float64')
+            bc.elems = arr[:,:3].astype('int32')
+            bc.elems[:,0] -= 1
+            bc.values = arr[:,3:].copy()
+        else:
+            raise ValueError('only 0/1 of itype is allowed')
+        # append.
+        neu.bcs.append(bc)
+
 class GambitNeutral(object):
     """
     Represent information in a Gambit Neutral file.
@@ -601,8 +822,12 @@ class GambitNeutral(object):
     @type grps: list
     @ivar bcs: list of BoundaryCondition objects.
     @type bcs: list
+
+    When *data* is a file, it is read by :py:class:`GambitNeutralBulkReader`
+    by default, or by :py:class:`GambitNeutralReader` line by line if *bulk* is
+    False.
     """
-    def __init__(self, data):
+    def __init__(self, data, bulk=True):
         from numpy import empty
         # control info.
         self.header = ''
@@ -624,7 +849,10 @@ class GambitNeutral(object):
         self.bcs = []
         # parse/read.
         if hasattr(data, 'read'):
-            GambitNeutralReader(data, self).read()
+            if bulk:
+                GambitNeutralBulkReader(data, self).read()
+            else:
+                GambitNeutralReader(data, self).read()
         else:
             GambitNeutralParser(data, self).parse()
 
@@ -720,7 +948,7 @@ class GambitNeutral(object):
         @type blk: solvcon.block.Block
         @return: nothing.
         """
-        from numpy import array
+        from numpy import array, unique, flatnonzero
         from ..block import elemtype
 
         cltpn_map = self.CLTPN_MAP
@@ -728,22 +956,22 @@ class GambitNeutral(object):
 
         # copy nodal coordinate data.
         blk.ndcrd[:,:] = self.nodes[:,:]
-        # copy node difinition in cells.
-        cltpn = blk.cltpn
-        clnds = blk.clnds
+        # translate tpn from GambitNeutral to Block.
         ncell = self.ncell
-        icell = 0
-        while icell < ncell:
-            # translate tpn from GambitNeutral to Block.
-            tpn = cltpn_map[self.elems[icell,0]]
-            cltpn[icell] = tpn
-            # translate clnds from GambitNeutral to Block.
-            nnd = elemtype[tpn,2]
-            nnd_self = self.elems[icell,1]
-            clnds[icell,0] = nnd
-            clnds[icell,1:nnd+1] = self.elems[icell,clnds_map[tpn][nnd_self]]
-            # advance cell.
-            icell += 1
+        cltpn = cltpn_map[self.elems[:ncell,0]]
+        blk.cltpn[:] = cltpn
+        # translate clnds from GambitNeutral to Block, by groups of the same
+        # type and number of nodes.
+        clnds = blk.clnds
+        nnd = elemtype[cltpn,2]
+        clnds[:,0] = nnd
+        nnd_self = self.elems[:ncell,1]
+        key = cltpn.astype('int64') * (nnd_self.max()+1) + nnd_self
+        for ikey in unique(key):
+            slct = flatnonzero(key == ikey)
+            tpn = cltpn[slct[0]]
+            idx = array(clnds_map[tpn][nnd_self[slct[0]]], dtype='int64')
+            clnds[slct,1:len(idx)+1] = self.elems[slct[:,None],idx]
 
         # create cell groups for the block.
         clgrp = blk.clgrp
@@ -810,7 +1038,7 @@ class NeutralIO(FormatIO):
                 opener = gzip.open
             else:
                 opener = open
-            stream = opener(stream)
+            stream = opener(stream, 'rt')
         neu = GambitNeutral(stream)
         stream.close()
         # convert loaded neutral object into block object.
@@ -29,8 +29,14 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 """
-This is a loader for Gmsh format.  Currently only the ASCII format is
-supported.
+This is a loader for Gmsh format.  The ASCII format of version 2 and the
+binary format of version 4.1 are supported.  The version is detected from the
+``$MeshFormat`` section.  In the ASCII format, the ``$Nodes`` and
+``$Elements`` sections are by default parsed in bulk with Numpy (see
+:py:meth:`Gmsh._load_nodes_bulk` and :py:meth:`Gmsh._load_elements_bulk`);
+the line-by-line parser is kept for reference and can be selected by
+``bulk=False``.  In the binary format, each entity block of nodes and
+elements is read directly into Numpy arrays.
 
 For more information about Gmsh ASCII file, please refer to 
 http://www.geuz.org/gmsh/doc/texinfo/gmsh.html#MSH-ASCII-file-format
@@ -87,7 +93,7 @@ class Gmsh(object):
         93: (3, 125, 4, [0, 1, 2, 3, 4, 5, 6, 7]), # 125-node hexahedron.
     }
 
-    def __init__(self, stream, load=False):
+    def __init__(self, stream, load=False, bulk=True):
         """
         >>> # sample data.
         >>> from io import BytesIO
@@ -134,9 +140,31 @@ class Gmsh(object):
         2
         >>> gmsh.stream.closed
         True
+
+        The ``$Nodes`` and ``$Elements`` sections are parsed in bulk by
+        default.  Setting *bulk=False* uses the line-by-line parser, which
+        gives the same result:
+
+        >>> gmsh = Gmsh(BytesIO(data), load=True, bulk=False)
+        >>> gmsh.ndim
+        2
         """
         #: Input stream (:py:class:`file`) of the mesh data.
         self.stream = stream
+        #: Parse the ``$Nodes`` and ``$Elements`` sections in bulk
+        #: (:py:class:`bool`).
+        self.bulk = bulk
+        #: Version of the MSH format (:py:class:`float`).  Stored by
+        #: :py:meth:`_check_meta`.
+        self.format_version = None
+        #: Byte order (``'<'`` or ``'>'``) of a binary MSH file, or None for
+        #: an ASCII file.  Stored by :py:meth:`_check_meta`.
+        self.byteorder = None
+        #: Physical group numbers of geometrical entities of a MSH 4 file.  It
+        #: is a :py:class:`dict` keyed by a 2-tuple: (i) dimension and (ii)
+        #: entity tag.  The value is a :py:class:`list` of physical group
+        #: numbers.  Stored by :py:meth:`_load_entities_msh4`.
+        self.entities = dict()
         #: Number of dimension of this mesh (py:class:`int`).  Stored by
         #: :py:meth:`_load_elements`.
         self.ndim = None
@@ -251,19 +279,40 @@ class Gmsh(object):
         >>> gmsh.stream.closed
         True
         """
+        if self.bulk:
+            load_nodes = Gmsh._load_nodes_bulk
+            load_elements = Gmsh._load_elements_bulk
+        else:
+            load_nodes = Gmsh._load_nodes
+            load_elements = Gmsh._load_elements
         loader_map = {
             b'$MeshFormat': lambda: Gmsh._check_meta(self.stream),
-            b'$Nodes': lambda: Gmsh._load_nodes(self.stream),
-            b'$Elements': lambda: Gmsh._load_elements(self.stream, self.nodes),
+            b'$Nodes': lambda: load_nodes(self.stream),
+            b'$Elements': lambda: load_elements(self.stream, self.nodes),
             b'$PhysicalNames': lambda: Gmsh._load_physics(self.stream),
             b'$Periodic': lambda: Gmsh._load_periodic(self.stream),
         }
+        msh4_loader_map = {
+            b'$MeshFormat': lambda: Gmsh._check_meta(self.stream),
+            b'$Entities': lambda: Gmsh._load_entities_msh4(
+                self.stream, self.byteorder),
+            b'$Nodes': lambda: Gmsh._load_nodes_msh4(
+                self.stream, self.byteorder),
+            b'$Elements': lambda: Gmsh._load_elements_msh4(
+                self.stream, self.byteorder, self.nodes, self.entities),
+            b'$PhysicalNames': lambda: Gmsh._load_physics(self.stream),
+        }
         while True:
             key = self.stream.readline().strip()
-            if key:
-                self.__dict__.update(loader_map[key]())
-            else:
+            if not key:
                 break
+            if self.format_version is not None and self.format_version >= 4:
+                if key in msh4_loader_map:
+                    self.__dict__.update(msh4_loader_map[key]())
+                else:
+                    Gmsh._skip_section(self.stream, key)
+            else:
+                self.__dict__.update(loader_map[key]())
         self._parse_physics()
         if close:
             self.stream.close()
@@ -281,20 +330,62 @@ class Gmsh(object):
         >>> stream.readline() == b'$MeshFormat\\n'
         True
         >>> Gmsh._check_meta(stream)
-        {}
+        {'format_version': 2.2, 'byteorder': None}
         >>> stream.readline() == b''
         True
+
+        A binary file of version 4.1 has an integer 1 written in binary to
+        tell the byte order:
+
+        >>> stream = BytesIO(b\"\"\"$MeshFormat
+        ... 4.1 1 8
+        ... \\x01\\x00\\x00\\x00
+        ... $EndMeshFormat\"\"\")
+        >>> stream.readline() == b'$MeshFormat\\n'
+        True
+        >>> Gmsh._check_meta(stream)
+        {'format_version': 4.1, 'byteorder': '<'}
         """
+        import struct
         version_number, file_type, data_size = stream.readline().split()
-        if stream.readline().strip() != b'$EndMeshFormat':
-            return False
         version_number = float(version_number)
         file_type = int(file_type)
         data_size = int(data_size)
+        byteorder = None
+        if file_type == 1:
+            one = stream.read(4)
+            if struct.unpack('<i', one)[0] == 1:
+                byteorder = '<'
+            elif struct.unpack('>i', one)[0] == 1:
+                byteorder = '>'
+            else:
+                raise ValueError('cannot determine byte order of MSH file')
+            stream.readline()
+        if stream.readline().strip() != b'$EndMeshFormat':
+            return False
         assert version_number > 2
-        assert file_type == 0
+        if version_number < 4:
+            assert file_type == 0
+        else:
+            if version_number < 4.1 or file_type != 1:
+                raise ValueError('only binary MSH 4.1 is supported, got '
+                                 'version %g type %d' % (
+                                    version_number, file_type))
         assert data_size == 8
-        return dict()
+        return dict(format_version=version_number, byteorder=byteorder)
+
+    @staticmethod
+    def _skip_section(stream, key):
+        """
+        Skip the section *key* that isn't used by SOLVCON.
+        """
+        endkey = b'$End' + key[1:]
+        while True:
+            line = stream.readline()
+            if not line:
+                raise ValueError('%s not found' % endkey)
+            if line.strip() == endkey:
+                return
 
     @staticmethod
     def _load_nodes(stream):
@@ -399,6 +490,301 @@ class Gmsh(object):
         return dict(ndim=ndim, cltpn=cltpn, elgrp=elgrp, elgeo=elgeo,
                     eldim=eldim, elems=elems, ndmap=ndmap, usnds=usnds)
 
+    @staticmethod
+    def _load_nodes_bulk(stream):
+        """
+        Load node coordinates of the mesh data like :py:meth:`_load_nodes`,
+        but read the whole section into a single buffer and tokenize it with
+        Numpy.
+
+        >>> import io
+        >>> stream = io.BytesIO(b\"\"\"$Nodes
+        ... 3
+        ... 1 -1 0 0
+        ... 2 1 0 0
+        ... 3 0 1 0
+        ... $EndNodes\"\"\") # a triangle.
+        >>> stream.readline() == b'$Nodes\\n'
+        True
+        >>> Gmsh._load_nodes_bulk(stream) # doctest: +NORMALIZE_WHITESPACE
+        {'nodes': array([[-1.,  0.,  0.], [ 1.,  0.,  0.], [ 0.,  1.,  0.]])}
+        >>> stream.readline() == b''
+        True
+        """
+        from itertools import islice
+        from numpy import fromstring
+        nnode = int(stream.readline().strip())
+        buf = b''.join(islice(stream, nnode))
+        nodes = fromstring(buf, dtype='float64', sep=' ')
+        del buf
+        if nodes.shape[0] != nnode*4:
+            raise ValueError('$Nodes section expects %d values but got %d' % (
+                nnode*4, nodes.shape[0]))
+        nodes = nodes.reshape((nnode, 4))[:,1:].copy()
+        # return.
+        assert stream.readline().strip() == b'$EndNodes'
+        return dict(nodes=nodes)
+
+    @classmethod
+    def _make_elmap_arrays(cls):
+        """
+        Flatten :py:attr:`ELMAP` into lookup arrays indexed by Gmsh element
+        type ID.
+
+        :return: Dimension, number of total nodes, SOLVCON cell type ID, and
+            number of SOLVCON cell nodes of each Gmsh element type.  The
+            unknown types have -1.
+        :rtype: tuple of :py:class:`numpy.ndarray`
+        """
+        from numpy import empty
+        ntype = max(cls.ELMAP) + 1
+        maps = [empty(ntype, dtype='int32') for it in range(4)]
+        for arr in maps:
+            arr.fill(-1)
+        for tpn, (dim, nnd, tid, order) in cls.ELMAP.items():
+            maps[0][tpn] = dim
+            maps[1][tpn] = nnd
+            maps[2][tpn] = tid
+            maps[3][tpn] = len(order)
+        return tuple(maps)
+
+    @classmethod
+    def _load_elements_bulk(cls, stream, nodes):
+        """
+        Load element definition of the mesh data like
+        :py:meth:`_load_elements`, but read the whole section into a single
+        buffer and tokenize it with Numpy.  When all elements take the same
+        number of fields (e.g., a mesh of a single element type), the tokens
+        are reshaped in place without locating the line boundaries.
+
+        >>> from numpy import array
+        >>> nodes = array([[-1.,  0.,  0.], [ 1.,  0.,  0.], [ 0.,  1.,  0.]])
+        >>> import io
+        >>> stream = io.BytesIO(b\"\"\"$Elements
+        ... 1
+        ... 1 2 2 1 22 1 2 3
+        ... $EndElements\"\"\") # a triangle.
+        >>> stream.readline() == b'$Elements\\n'
+        True
+        >>> sorted(Gmsh._load_elements_bulk(
+        ...     stream, nodes).items()) # doctest: +NORMALIZE_WHITESPACE
+        [('cltpn', array([3], dtype=int32)),
+         ('eldim', array([2], dtype=int32)),
+         ('elems', array([[ 3,  1,  2,  3, -1, -1, -1, -1, -1]], dtype=int32)),
+         ('elgeo', array([22], dtype=int32)),
+         ('elgrp', array([1], dtype=int32)),
+         ('ndim', 2),
+         ('ndmap', array([0, 1, 2], dtype=int32)),
+         ('usnds', array([0, 1, 2], dtype=int32))]
+        >>> stream.readline() == b''
+        True
+        """
+        from itertools import islice
+        from numpy import (empty, arange, unique, fromstring, frombuffer,
+            flatnonzero, searchsorted, bincount, cumsum, array)
+        from ..block import Block
+        tpdim, tpnnd, tpcl, tpclnnd = cls._make_elmap_arrays()
+        nelem = int(stream.readline().strip())
+        buf = b''.join(islice(stream, nelem))
+        data = fromstring(buf, dtype='int32', sep=' ')
+        # locate the first field of each element.
+        starts = None
+        if nelem and 0 <= data[1] < tpnnd.shape[0] and tpnnd[data[1]] >= 0:
+            width = 3 + data[2] + tpnnd[data[1]]
+            if data.shape[0] == nelem*width:
+                # fast path: the same number of fields for all elements.
+                starts = arange(nelem, dtype='int64') * width
+                eltpn = data[starts+1]
+                valid = (eltpn >= 0) & (eltpn < tpnnd.shape[0])
+                if not valid.all() or \
+                   (3 + data[starts+2] + tpnnd[eltpn] != width).any():
+                    starts = None
+        if starts is None:
+            # count the fields in each line and accumulate for the offsets.
+            chars = frombuffer(buf, dtype='uint8')
+            isspace = (chars == 32) | (chars == 9) | (chars == 10) | \
+                      (chars == 13)
+            isfirst = ~isspace
+            isfirst[1:] &= isspace[:-1]
+            lineno = searchsorted(flatnonzero(chars == 10),
+                                  flatnonzero(isfirst))
+            del chars, isspace, isfirst
+            counts = bincount(lineno, minlength=nelem)
+            del lineno
+            if counts.shape[0] != nelem or counts.sum() != data.shape[0]:
+                raise ValueError('malformed $Elements section')
+            starts = empty(nelem, dtype='int64')
+            starts[:1] = 0
+            starts[1:] = cumsum(counts[:-1])
+        del buf
+        # element types and tags.
+        eltpn = data[starts+1]
+        valid = (eltpn >= 0) & (eltpn < tpnnd.shape[0])
+        valid[valid] = tpnnd[eltpn[valid]] >= 0
+        if not valid.all():
+            raise KeyError(eltpn[~valid][0])
+        elntag = data[starts+2]
+        cltpn = tpcl[eltpn]
+        eldim = tpdim[eltpn]
+        elgrp = data[starts+3]
+        elgeo = data[starts+4]
+        # element nodes, grouped by Gmsh element type and number of tags.
+        elems = empty((nelem, Block.CLMND+1), dtype='int32')
+        elems.fill(-1)
+        elems[:,0] = tpclnnd[eltpn]
+        grpkey = eltpn.astype('int64') * (elntag.max()+1 if nelem else 1) \
+               + elntag
+        for key in unique(grpkey):
+            slct = flatnonzero(grpkey == key)
+            tpn = eltpn[slct[0]]
+            order = array(cls.ELMAP[tpn][3], dtype='int64')
+            first = starts[slct] + 3 + elntag[slct[0]]
+            elems[slct,1:len(order)+1] = data[first[:,None] + order]
+        del data
+        ndim = int(eldim.max()) if nelem else 0
+        usnds = elems[:,1:]
+        usnds = unique(usnds[usnds >= 0]) - 1
+        ndmap = empty(nodes.shape[0], dtype='int32')
+        ndmap.fill(-1)
+        ndmap[usnds] = arange(usnds.shape[0], dtype='int32')
+        # returns.
+        assert stream.readline().strip() == b'$EndElements'
+        return dict(ndim=ndim, cltpn=cltpn, elgrp=elgrp, elgeo=elgeo,
+                    eldim=eldim, elems=elems, ndmap=ndmap, usnds=usnds)
+
+    @staticmethod
+    def _read_binary(stream, byteorder, fmt):
+        """
+        Read and unpack a binary record of the MSH 4 format.
+
+        :param stream: Input stream.
+        :param byteorder: ``'<'`` or ``'>'``.
+        :param fmt: Format string for :py:mod:`struct` without the byte order.
+        :return: Unpacked values.
+        :rtype: tuple
+        """
+        import struct
+        fmt = byteorder + fmt
+        return struct.unpack(fmt, stream.read(struct.calcsize(fmt)))
+
+    @staticmethod
+    def _read_binary_array(stream, byteorder, dtype, count):
+        """
+        Read *count* items of *dtype* from a binary MSH 4 stream into a
+        :py:class:`numpy.ndarray` of native byte order.
+        """
+        import numpy as np
+        dtype = np.dtype(dtype).newbyteorder(byteorder)
+        buf = stream.read(dtype.itemsize * count)
+        if len(buf) != dtype.itemsize * count:
+            raise ValueError('unexpected end of MSH file')
+        return np.frombuffer(buf, dtype=dtype).astype(dtype.newbyteorder('='))
+
+    @staticmethod
+    def _end_binary_section(stream, key):
+        """
+        Consume the line break after binary data and the end mark of the
+        section *key*.
+        """
+        endkey = b'$End' + key[1:]
+        line = stream.readline()
+        while line and not line.strip():
+            line = stream.readline()
+        assert line.strip() == endkey
+
+    @classmethod
+    def _load_entities_msh4(cls, stream, byteorder):
+        """
+        Load the physical group numbers of all geometrical entities of a
+        binary MSH 4.1 file.  Return :py:attr:`entities` for storage.
+        """
+        npnt, ncrv, nsrf, nvol = cls._read_binary(stream, byteorder, '4Q')
+        entities = dict()
+        for dim, nent in enumerate((npnt, ncrv, nsrf, nvol)):
+            for it in range(nent):
+                # tag and coordinates (for points) or bounding box.
+                tag, = cls._read_binary(stream, byteorder, 'i')
+                stream.read(8 * (3 if dim == 0 else 6))
+                nphy, = cls._read_binary(stream, byteorder, 'Q')
+                entities[(dim, tag)] = list(
+                    cls._read_binary(stream, byteorder, '%di' % nphy))
+                if dim > 0:
+                    nbnd, = cls._read_binary(stream, byteorder, 'Q')
+                    stream.read(4 * nbnd)
+        cls._end_binary_section(stream, b'$Entities')
+        return dict(entities=entities)
+
+    @classmethod
+    def _load_nodes_msh4(cls, stream, byteorder):
+        """
+        Load node coordinates from a binary MSH 4.1 file.  Each entity block is
+        read at once.  Nodes are placed at their (0-based) tags, so that the
+        element definition can still refer to them by 1-based tags.
+        """
+        from numpy import zeros
+        nblock, nnode, mintag, maxtag = cls._read_binary(
+            stream, byteorder, '4Q')
+        nodes = zeros((maxtag, 3), dtype='float64')
+        for it in range(nblock):
+            dim, etag, parametric, nbnd = cls._read_binary(
+                stream, byteorder, '3iQ')
+            tags = cls._read_binary_array(stream, byteorder, 'u8', nbnd)
+            ncomp = 3 + (dim if parametric else 0)
+            crds = cls._read_binary_array(
+                stream, byteorder, 'f8', nbnd*ncomp).reshape((nbnd, ncomp))
+            nodes[tags-1,:] = crds[:,:3]
+        cls._end_binary_section(stream, b'$Nodes')
+        return dict(nodes=nodes)
+
+    @classmethod
+    def _load_elements_msh4(cls, stream, byteorder, nodes, entities):
+        """
+        Load element definition from a binary MSH 4.1 file.  Each entity block
+        is read at once.  The returned arrays are the same as those from
+        :py:meth:`_load_elements`.  The physical group number (the first one,
+        if an entity belongs to more than one groups) of the entity is taken
+        as :py:attr:`elgrp`, and the entity tag as :py:attr:`elgeo`.  Elements
+        of entities not belonging to any physical group get 0.
+        """
+        from numpy import empty, arange, unique, array
+        from ..block import Block
+        nblock, nelem, mintag, maxtag = cls._read_binary(
+            stream, byteorder, '4Q')
+        cltpn = empty(nelem, dtype='int32')
+        elgrp = empty(nelem, dtype='int32')
+        elgeo = empty(nelem, dtype='int32')
+        eldim = empty(nelem, dtype='int32')
+        elems = empty((nelem, Block.CLMND+1), dtype='int32')
+        elems.fill(-1)
+        ndim = 0
+        iel = 0
+        for it in range(nblock):
+            dim, etag, tpn, nbel = cls._read_binary(stream, byteorder, '3iQ')
+            elmap = cls.ELMAP[tpn]
+            data = cls._read_binary_array(
+                stream, byteorder, 'u8', nbel*(1+elmap[1]))
+            data = data.reshape((nbel, 1+elmap[1]))
+            order = array(elmap[3], dtype='int64')
+            slc = slice(iel, iel+nbel)
+            cltpn[slc] = elmap[2]
+            elgrp[slc] = (entities.get((dim, etag)) or [0])[0]
+            elgeo[slc] = etag
+            eldim[slc] = elmap[0]
+            elems[slc,0] = len(order)
+            elems[slc,1:len(order)+1] = data[:,1+order]
+            ndim = elmap[0] if elmap[0] > ndim else ndim
+            iel += nbel
+        assert iel == nelem
+        usnds = elems[:,1:]
+        usnds = unique(usnds[usnds >= 0]) - 1
+        ndmap = empty(nodes.shape[0], dtype='int32')
+        ndmap.fill(-1)
+        ndmap[usnds] = arange(usnds.shape[0], dtype='int32')
+        # returns.
+        cls._end_binary_section(stream, b'$Elements')
+        return dict(ndim=ndim, cltpn=cltpn, elgrp=elgrp, elgeo=elgeo,
+                    eldim=eldim, elems=elems, ndmap=ndmap, usnds=usnds)
+
     @staticmethod
     def _load_physics(stream):
         """
@@ -631,13 +1017,13 @@ class GmshIO(FormatIO):
         Load block from stream with BC mapper applied.
         """
         import gzip
-        # load Gmsh file.
+        # load Gmsh file; the format is detected from the $MeshFormat section.
         if isinstance(stream, basestring):
             if stream.endswith('.gz'):
                 opener = gzip.open
             else:
                 opener = open
-            stream = opener(stream)
+            stream = opener(stream, 'rb')
         gmh = Gmsh(stream)
         gmh.load()
         stream.close()
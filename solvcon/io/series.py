@@ -0,0 +1,515 @@
+# -*- coding: UTF-8 -*-
+#
+# Copyright (c) 2008, Yung-Yu Chen <yyc@solvcon.net>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# - Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the SOLVCON nor the names of its contributors may be
+#   used to endorse or promote products derived from this software without
+#   specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Append-only time-series archive of solutions.  An archive file holds the
+geometry of a block once, followed by the arrays of any number of time
+steps.  Data are appended as records; an index of the records is written at
+the end of the file when it is closed, so that any array can be read with a
+seek.  An existing archive is overwritten unless it is explicitly opened for
+appending (e.g., by a restarted run); appending overwrites the index with new
+records, and a new index is written when the archive is closed again.  If an
+archive is not closed (e.g., the run is killed), the reader rebuilds the index
+by walking over the record headers.
+
+The file is laid out as::
+
+  text part (FILE_HEADER, meta data, BINARY_MARKER)
+  record: RECORD_HEADER, description line, data
+  ...
+  index: RECORD_HEADER, index lines
+  trailer: TRAILER, offset of the index
+
+The description line of a record is ``name step time dtype shape``.  The
+geometry is a record named ``geometry`` holding a blk file of step -1.
+"""
+
+import os
+import struct
+
+import numpy as np
+
+from .core import Format
+
+
+class SeriesEntry(object):
+    """
+    Description of a record in an archive.
+
+    @ivar name: name of the array.
+    @itype name: str
+    @ivar step: the time step.
+    @itype step: int
+    @ivar time: the time.
+    @itype time: float
+    @ivar dtype: the name of the dtype of the array.
+    @itype dtype: str
+    @ivar shape: the shape of the array.
+    @itype shape: tuple
+    @ivar offset: offset of the (compressed) data in the file.
+    @itype offset: int
+    """
+    def __init__(self, name, step, time, dtype, shape, offset):
+        self.name = name
+        self.step = step
+        self.time = time
+        self.dtype = dtype
+        self.shape = shape
+        self.offset = offset
+
+    def __repr__(self):
+        return '<SeriesEntry %s step=%d shape=%s at %d>' % (
+            self.name, self.step, self.shape, self.offset)
+
+    def tostring(self, with_offset=True):
+        """
+        @keyword with_offset: append the offset to the line.
+        @type with_offset: bool
+        @return: the description line.
+        @rtype: str
+        """
+        tokens = [self.name, str(self.step), repr(self.time), self.dtype,
+                  ','.join([str(dim) for dim in self.shape])]
+        if with_offset:
+            tokens.append(str(self.offset))
+        return ' '.join(tokens)
+
+    @classmethod
+    def fromstring(cls, line, offset=None):
+        """
+        @param line: the description line.
+        @type line: str
+        @keyword offset: the offset of the data; read from the line if None.
+        @type offset: int
+        @return: the entry.
+        @rtype: SeriesEntry
+        """
+        tokens = line.split()
+        if offset is None:
+            offset = int(tokens[5])
+        shape = tuple(int(dim) for dim in tokens[4].split(',') if dim)
+        return cls(tokens[0], int(tokens[1]), float(tokens[2]), tokens[3],
+                   shape, offset)
+
+class SeriesFormat(Format):
+    """
+    Facilities shared by SeriesWriter and SeriesReader.
+
+    @cvar RECORD_HEADER: struct format of the header of a record: mark,
+        length of the description, and length of the data.
+    @ctype RECORD_HEADER: str
+    @cvar TRAILER: struct format of the trailer: mark and offset of the
+        index record.
+    @ctype TRAILER: str
+    """
+    FILE_HEADER = '-*- solvcon series file -*-'
+    FORMAT_REV = '0.0.1'
+    RECORD_HEADER = '<8sqq'
+    RECORD_MARK = b'SCSERREC'
+    INDEX_MARK = b'SCSERIDX'
+    TRAILER = '<8sq'
+    TRAILER_MARK = b'SCSEREND'
+    GEOMETRY = 'geometry'
+
+class SeriesWriter(SeriesFormat):
+    """
+    Append the solution arrays of time steps to an archive file.
+
+    >>> import tempfile, shutil
+    >>> from solvcon.testing import create_trivial_2d_blk
+    >>> blk = create_trivial_2d_blk()
+    >>> tdir = tempfile.mkdtemp()
+    >>> fn = os.path.join(tdir, 'trivial.scs')
+    >>> with SeriesWriter(fn, blk=blk) as wtr:
+    ...     wtr.write_step(0, 0.0, dict(soln=np.zeros((blk.ncell, 2))))
+    >>> with SeriesWriter(fn, blk=blk, append=True) as wtr:
+    ...     wtr.write_step(10, 0.1, dict(soln=np.ones((blk.ncell, 2))))
+    >>> with SeriesReader(fn) as rdr:
+    ...     rdr.steps, rdr.read(10, 'soln').sum() == blk.ncell*2
+    ([0, 10], True)
+    >>> shutil.rmtree(tdir)
+
+    @ivar filename: the archive file name.
+    @itype filename: str
+    @ivar compressor: the compression of arrays; see
+        solvcon.io.core.Format._write_array.
+    @itype compressor: str
+    @ivar entries: entries of all the records in the file.
+    @itype entries: list
+    """
+    def __init__(self, filename, blk=None, compressor=None, append=False):
+        """
+        @param filename: the archive file name.
+        @type filename: str
+        @keyword blk: the block to be saved as the geometry of a new file.
+            When appending, it must be the geometry in the file.
+        @type blk: solvcon.block.Block
+        @keyword compressor: the compression of arrays.  None means no
+            compression for a new file, and that of the file when appending.
+        @type compressor: str
+        @keyword append: append to an existing file instead of overwriting
+            it.
+        @type append: bool
+        """
+        self.filename = filename
+        if append and os.path.exists(filename):
+            with SeriesReader(filename) as rdr:
+                if compressor is not None and compressor != rdr.compressor:
+                    raise ValueError('%s is compressed by %r, not %r' % (
+                        filename, rdr.compressor, compressor))
+                has_geometry = any(ent.name == self.GEOMETRY
+                                   for ent in rdr.entries)
+                if blk is not None and has_geometry:
+                    self._check_block(blk, rdr.load_block())
+                self.compressor = rdr.compressor
+                self.entries = list(rdr.entries)
+                end = rdr.end
+            self.stream = open(filename, 'r+b')
+            self.stream.truncate(end)
+            self.stream.seek(end)
+            if blk is not None and not has_geometry:
+                self.write_block(blk)
+        else:
+            compressor = '' if compressor is None else compressor
+            self.compressor = compressor
+            self.entries = list()
+            self.stream = open(filename, 'wb')
+            self._write_text('\n'.join([
+                self.FILE_HEADER,
+                'FORMAT_REV = %s' % self.FORMAT_REV,
+                'compressor = %s' % compressor,
+                '',
+            ]), self.stream)
+            self.stream.write(self.BINARY_MARKER + b'\n')
+            if blk is not None:
+                self.write_block(blk)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _check_block(self, blk, saved):
+        """
+        Make sure the block to append for is the geometry in the file.
+
+        @param blk: the block of the writer.
+        @type blk: solvcon.block.Block
+        @param saved: the geometry loaded from the file.
+        @type saved: solvcon.block.Block
+        @return: nothing
+        """
+        for key in 'ndim', 'nnode', 'nface', 'ncell':
+            if getattr(blk, key) != getattr(saved, key):
+                raise ValueError('%s of %s is %d, not %d' % (key,
+                    self.filename, getattr(saved, key), getattr(blk, key)))
+        if not ((blk.clnds == saved.clnds).all()
+                and (blk.ndcrd == saved.ndcrd).all()):
+            raise ValueError('the geometry of %s is different' % self.filename)
+
+    def _write_record(self, entry, arr=None, data=None):
+        """
+        Write a record.
+
+        @param entry: the description of the record.  Its offset is set.
+        @type entry: SeriesEntry
+        @keyword arr: the array to be written with the compressor.
+        @type arr: numpy.ndarray
+        @keyword data: the raw data to be written.
+        @type data: bytes
+        @return: nothing
+        """
+        from io import BytesIO
+        if arr is not None:
+            buf = BytesIO()
+            self._write_array(self.compressor, arr, buf)
+            data = buf.getvalue()
+        desc = entry.tostring(with_offset=False).encode()
+        stream = self.stream
+        stream.write(struct.pack(self.RECORD_HEADER, self.RECORD_MARK,
+                                 len(desc), len(data)))
+        stream.write(desc)
+        entry.offset = stream.tell()
+        stream.write(data)
+        self.entries.append(entry)
+
+    def write_block(self, blk):
+        """
+        Write the geometry.
+
+        @param blk: the block.
+        @type blk: solvcon.block.Block
+        @return: nothing
+        """
+        from io import BytesIO
+        from .block import BlockIO
+        buf = BytesIO()
+        BlockIO(compressor=self.compressor).save(blk=blk, stream=buf)
+        data = buf.getvalue()
+        self._write_record(SeriesEntry(self.GEOMETRY, -1, 0.0, 'uint8',
+            (len(data),), None), data=data)
+
+    def write_step(self, step, time, arrs):
+        """
+        Append the arrays of a time step.
+
+        @param step: the time step.
+        @type step: int
+        @param time: the time.
+        @type time: float
+        @param arrs: the arrays keyed by names (without white spaces).
+        @type arrs: dict
+        @return: nothing
+        """
+        for name in sorted(arrs):
+            arr = np.ascontiguousarray(arrs[name])
+            self._write_record(SeriesEntry(name, step, float(time),
+                arr.dtype.name, arr.shape, None), arr=arr)
+
+    def flush(self):
+        """
+        Flush the written records to the file.
+
+        @return: nothing
+        """
+        self.stream.flush()
+
+    def close(self):
+        """
+        Write the index and close the file.
+
+        @return: nothing
+        """
+        if self.stream.closed:
+            return
+        stream = self.stream
+        data = '\n'.join([ent.tostring() for ent in self.entries]).encode()
+        offset = stream.tell()
+        stream.write(struct.pack(self.RECORD_HEADER, self.INDEX_MARK,
+                                 0, len(data)))
+        stream.write(data)
+        stream.write(struct.pack(self.TRAILER, self.TRAILER_MARK, offset))
+        stream.close()
+
+class SeriesReader(SeriesFormat):
+    """
+    Read the geometry and the arrays of the time steps from an archive file.
+
+    @ivar filename: the archive file name.
+    @itype filename: str
+    @ivar compressor: the compression of arrays.
+    @itype compressor: str
+    @ivar entries: entries of all the records in the file.
+    @itype entries: list
+    @ivar end: the offset after the last record.
+    @itype end: int
+    """
+    def __init__(self, filename):
+        self.filename = filename
+        self.stream = open(filename, 'rb')
+        lines, textlen = self._get_textpart(self.stream)
+        meta = dict([tok.strip() for tok in line.split('=')]
+                    for line in lines[1:] if '=' in line)
+        self.compressor = meta['compressor']
+        self.entries, self.end = self._load_index(textlen)
+        self._lookup = dict(((ent.step, ent.name), ent)
+                            for ent in self.entries)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self.stream.close()
+
+    def _load_index(self, textlen):
+        """
+        Read the index at the end of the file, or rebuild it by walking over
+        the record headers if the file wasn't closed.
+
+        @param textlen: length of the text part.
+        @type textlen: int
+        @return: the entries and the offset after the last record.
+        @rtype: list, int
+        """
+        stream = self.stream
+        stream.seek(0, os.SEEK_END)
+        size = stream.tell()
+        tsize = struct.calcsize(self.TRAILER)
+        hsize = struct.calcsize(self.RECORD_HEADER)
+        if size - tsize >= textlen:
+            stream.seek(size - tsize)
+            mark, offset = struct.unpack(self.TRAILER, stream.read(tsize))
+            if mark == self.TRAILER_MARK:
+                stream.seek(offset)
+                mark, dlen, ilen = struct.unpack(self.RECORD_HEADER,
+                                                 stream.read(hsize))
+                lines = stream.read(ilen).decode().split('\n')
+                return [SeriesEntry.fromstring(line)
+                        for line in lines if line], offset
+        # rebuild.
+        entries = list()
+        offset = textlen
+        while offset + hsize <= size:
+            stream.seek(offset)
+            mark, dlen, ilen = struct.unpack(self.RECORD_HEADER,
+                                             stream.read(hsize))
+            end = offset + hsize + dlen + ilen
+            if mark != self.RECORD_MARK or end > size:
+                break
+            desc = stream.read(dlen).decode()
+            entries.append(SeriesEntry.fromstring(desc, offset+hsize+dlen))
+            offset = end
+        return entries, offset
+
+    @property
+    def steps(self):
+        """
+        The time steps in the archive in ascending order.
+        """
+        return sorted(set(ent.step for ent in self.entries if ent.step >= 0))
+
+    def names(self, step):
+        """
+        @param step: the time step.
+        @type step: int
+        @return: names of the arrays of the time step.
+        @rtype: list
+        """
+        return sorted(ent.name for ent in self.entries if ent.step == step)
+
+    def time(self, step):
+        """
+        @param step: the time step.
+        @type step: int
+        @return: the time of the time step.
+        @rtype: float
+        """
+        for ent in self.entries:
+            if ent.step == step:
+                return ent.time
+        raise KeyError(step)
+
+    def read(self, step, name):
+        """
+        @param step: the time step.
+        @type step: int
+        @param name: the name of the array.
+        @type name: str
+        @return: the array.
+        @rtype: numpy.ndarray
+        """
+        ent = self._lookup[step, name]
+        self.stream.seek(ent.offset)
+        arr = self._read_array(self.compressor, ent.shape,
+                               np.dtype(ent.dtype).type, self.stream)
+        return arr.reshape(ent.shape)
+
+    def load_block(self, bcmapper=None):
+        """
+        @keyword bcmapper: BC type mapper.
+        @type bcmapper: dict
+        @return: the geometry.
+        @rtype: solvcon.block.Block
+        """
+        from io import BytesIO
+        from .block import BlockIO
+        ent = self._lookup[-1, self.GEOMETRY]
+        self.stream.seek(ent.offset)
+        buf = BytesIO(self.stream.read(ent.shape[0]))
+        return BlockIO().load(stream=buf, bcmapper=bcmapper)
+
+def export_vtk(filenames, step, vtkfn, fpdtype=None, compressor='gz'):
+    """
+    Export a time step in archives to VTK XML files for visualization.  A
+    single archive is exported to a .vtu file.  Multiple archives (one for
+    each block of a split domain) are exported to a .pvtu file with a .vtu
+    piece for each archive.
+
+    Arrays of one dimension are written as scalars, those having as many
+    columns as the spatial dimension as vectors, and the others as a scalar
+    for each column.
+
+    @param filenames: archive file names.
+    @type filenames: list
+    @param step: the time step to export.
+    @type step: int
+    @param vtkfn: the output .vtu or .pvtu file name.
+    @type vtkfn: str
+    @keyword fpdtype: floating-point dtype of the output.
+    @type fpdtype: str
+    @keyword compressor: compressor of the VTK data; 'gz' or ''.
+    @type compressor: str
+    @return: names of the written files.
+    @rtype: list
+    """
+    from .vtkxml import VtkXmlUstGridWriter, PVtkXmlUstGridWriter
+    if isinstance(filenames, str):
+        filenames = [filenames]
+    npiece = len(filenames)
+    mainfn = os.path.splitext(vtkfn)[0]
+    pextmpl = '.p%%0%dd.vtu' % len(str(npiece-1)) if npiece > 1 else ''
+    written = list()
+    sdtypes = dict()
+    vdtypes = dict()
+    blk = None
+    for ipiece, filename in enumerate(filenames):
+        with SeriesReader(filename) as rdr:
+            blk = rdr.load_block()
+            sarrs = dict()
+            varrs = dict()
+            for name in rdr.names(step):
+                arr = rdr.read(step, name)
+                if len(arr.shape) == 1:
+                    sarrs[name] = arr
+                elif arr.shape[1] == blk.ndim:
+                    varrs[name] = arr
+                else:
+                    for it in range(arr.shape[1]):
+                        sarrs['%s[%d]' % (name, it)] = arr[:,it]
+        wtr = VtkXmlUstGridWriter(blk, fpdtype=fpdtype, compressor=compressor,
+                                  scalars=sarrs, vectors=varrs)
+        fn = mainfn + pextmpl % ipiece if npiece > 1 else vtkfn
+        wtr.write(fn)
+        written.append(fn)
+        dtname = np.dtype(wtr.fpdtype).name
+        sdtypes.update((key, dtname) for key in sarrs)
+        vdtypes.update((key, dtname) for key in varrs)
+    if npiece > 1:
+        wtr = PVtkXmlUstGridWriter(blk, fpdtype=dtname, scalars=sdtypes,
+            vectors=vdtypes, npiece=npiece, pextmpl=pextmpl)
+        wtr.write(vtkfn)
+        written.insert(0, vtkfn)
+    return written
+
+# vim: set fenc=utf8 ff=unix nobomb ai et sw=4 ts=4 tw=79:
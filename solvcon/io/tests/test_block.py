@@ -267,6 +267,22 @@ class TestReloadIncenter(CheckBlockIO):
     def test_reload3d_bz2(self):
         self._check_reload(get_blk_from_sample_neu(use_incenter=False), 'bz2')
         self._check_reload(get_blk_from_sample_neu(use_incenter=True), 'bz2')
+    def test_reload2d_zlib(self):
+        self._check_reload(get_blk_from_oblique_neu(use_incenter=False), 'zlib')
+    def test_reload3d_zlib(self):
+        self._check_reload(get_blk_from_sample_neu(use_incenter=False), 'zlib')
+        self._check_reload(get_blk_from_sample_neu(use_incenter=True), 'zlib')
+    def test_reload3d_xz(self):
+        self._check_reload(get_blk_from_sample_neu(use_incenter=False), 'xz')
+    def test_reload3d_chunks(self):
+        from .. import core
+        chunk_size = core.CHUNK_SIZE
+        core.CHUNK_SIZE = 100   # force many chunks and partial last ones.
+        try:
+            self._check_reload(get_blk_from_sample_neu(), 'zlib')
+            self._check_reload(get_blk_from_sample_neu(), 'xz')
+        finally:
+            core.CHUNK_SIZE = chunk_size
 class TestLoadIncenter(CheckBlockIO):
     def _check_load(self, blk, stream):
         from ..block import BlockIO
@@ -381,3 +397,158 @@ class TestDetectLoad(CheckBlockIO):
         self._check_group(blk, blkl)
         self._check_bc(blk, blkl)
         self._check_array(blk, blkl)
+
+class TestLoadMmap(CheckBlockIO):
+    def _check_mmap(self, blk, fname):
+        import os
+        from ...conf import env
+        from ..block import BlockIO
+        path = os.path.join(env.datadir, fname)
+        bio = BlockIO(filename=path, mmap=True)
+        blkl = bio.load()
+        self._check_shape(blk, blkl)
+        self._check_group(blk, blkl)
+        self._check_bc(blk, blkl)
+        self._check_array(blk, blkl)
+        return blkl
+    def test_mapped(self):
+        blkl = self._check_mmap(get_blk_from_sample_neu(), 'sample_0.0.7.blk')
+        for name in blkl.TABLE_NAMES:
+            table = getattr(blkl, 'tb'+name)
+            # misaligned sections are copied rather than mapped.
+            self.assertTrue(table._nda.flags.aligned)
+            self.assertEqual(table._bodyaddr,
+                             table._ghostaddr + table.itemsize * table.offset)
+    def test_aligned(self):
+        import os
+        from tempfile import mkstemp
+        import numpy as np
+        from ..core import Format
+        arr = np.arange(10, dtype='float64')
+        fd, path = mkstemp()
+        os.close(fd)
+        try:
+            with open(path, 'wb') as fobj:
+                fobj.write(b'\0'*8 + arr.tobytes() + b'\0'*3 + arr.tobytes())
+            with open(path, 'rb') as fobj:
+                fobj.seek(8)
+                arrl = Format._read_array('', arr.shape, 'float64', fobj,
+                                          mmap=True)
+                self.assertTrue(isinstance(arrl, np.memmap))
+                self.assertTrue(arrl.flags.aligned)
+                self.assertEqual(arr.tolist(), arrl.tolist())
+                del arrl
+                fobj.seek(8 + arr.nbytes + 3)
+                arrl = Format._read_array('', arr.shape, 'float64', fobj,
+                                          mmap=True)
+                self.assertFalse(isinstance(arrl, np.memmap))
+                self.assertTrue(arrl.flags.aligned)
+                self.assertEqual(arr.tolist(), arrl.tolist())
+                self.assertEqual(8 + 2*arr.nbytes + 3, fobj.tell())
+        finally:
+            os.remove(path)
+    def test_copy_on_write(self):
+        blkl = self._check_mmap(get_blk_from_sample_neu(), 'sample_0.0.7.blk')
+        blkl.ndcrd[...] = 0.0
+        blk = get_blk_from_sample_neu()
+        self._check_mmap(blk, 'sample_0.0.7.blk')
+    def test_compressed_fallback(self):
+        import os
+        from tempfile import mkstemp
+        import numpy as np
+        from ..block import BlockIO
+        blk = get_blk_from_sample_neu()
+        fd, path = mkstemp(suffix='.blk')
+        os.close(fd)
+        try:
+            BlockIO(compressor='gz').save(blk=blk, stream=path)
+            blkl = BlockIO(filename=path, mmap=True).load()
+        finally:
+            os.remove(path)
+        self.assertFalse(isinstance(blkl.tbndcrd._nda, np.memmap))
+        self._check_array(blk, blkl)
+    def test_trivial(self):
+        self._check_mmap(get_blk_from_oblique_neu(), 'oblique_0.0.1.blk')
+    def test_stream_fallback(self):
+        import os
+        from io import BytesIO
+        from ...conf import env
+        from ..block import BlockIO
+        with open(os.path.join(env.datadir, 'sample_0.0.7.blk'), 'rb') as fobj:
+            stream = BytesIO(fobj.read())
+        blkl = BlockIO(fmt='IncenterBlockFormat', mmap=True).load(
+            stream=stream)
+        self._check_array(get_blk_from_sample_neu(), blkl)
+
+class TestReloadIndexed(CheckBlockIO):
+    def _save(self, blk, compressor):
+        from io import BytesIO
+        from ..block import BlockIO
+        bio = BlockIO(compressor=compressor, fmt='IndexedBlockFormat')
+        dataio = BytesIO()
+        bio.save(blk=blk, stream=dataio)
+        return dataio.getvalue()
+    def _check_reload(self, blk, compressor):
+        from io import BytesIO
+        from ..block import BlockIO
+        bio = BlockIO(fmt='IndexedBlockFormat')
+        newblk = bio.load(stream=BytesIO(self._save(blk, compressor)))
+        self._check_shape(newblk, blk)
+        self._check_group(newblk, blk)
+        self._check_bc(newblk, blk)
+        self._check_array(newblk, blk)
+        self.assertEqual(newblk.use_incenter, blk.use_incenter)
+    def _check_lazy(self, blk, compressor):
+        from io import BytesIO
+        from ...block import LazyBlock
+        from ..block import BlockIO
+        bio = BlockIO(fmt='IndexedBlockFormat')
+        newblk = bio.load(stream=BytesIO(self._save(blk, compressor)),
+                          lazy=True)
+        self.assertTrue(isinstance(newblk, LazyBlock))
+        self.assertEqual(newblk.loaded_tables, tuple())
+        # counts and BCs don't need tables.
+        self._check_shape(newblk, blk)
+        self._check_group(newblk, blk)
+        self.assertEqual(newblk.loaded_tables, tuple())
+        # tables are read on access, in any order.
+        self.assertTrue((newblk.clnds == blk.clnds).all())
+        self.assertTrue((newblk.gstndcrd == blk.gstndcrd).all())
+        self.assertEqual(newblk.loaded_tables, ('ndcrd', 'clnds'))
+        newblk.load_all()
+        self.assertEqual(newblk.loaded_tables, blk.TABLE_NAMES)
+        self._check_bc(newblk, blk)
+        self._check_array(newblk, blk)
+    def test_unseekable(self):
+        from io import BytesIO
+        from ..block import BlockIO
+        class Unseekable(BytesIO):
+            def seekable(self):
+                return False
+        blk = get_blk_from_sample_neu()
+        dataio = Unseekable()
+        BlockIO(fmt='IndexedBlockFormat').save(blk=blk, stream=dataio)
+        # the TOC filled in place is the same as the one encoded in advance.
+        self.assertEqual(self._save(blk, ''), dataio.getvalue())
+    def test_reload2d_raw(self):
+        self._check_reload(get_blk_from_oblique_neu(use_incenter=True), '')
+    def test_reload3d_raw(self):
+        self._check_reload(get_blk_from_sample_neu(), '')
+    def test_reload3d_gz(self):
+        self._check_reload(get_blk_from_sample_neu(), 'gz')
+    def test_lazy2d_raw(self):
+        self._check_lazy(get_blk_from_oblique_neu(), '')
+    def test_lazy3d_raw(self):
+        self._check_lazy(get_blk_from_sample_neu(), '')
+    def test_lazy3d_bz2(self):
+        self._check_lazy(get_blk_from_sample_neu(), 'bz2')
+    def test_lazy3d_zlib(self):
+        self._check_lazy(get_blk_from_sample_neu(), 'zlib')
+    def test_lazy_fallback(self):
+        from ...block import LazyBlock
+        from ...testing import openfile
+        from ..block import BlockIO
+        bio = BlockIO(fmt='IncenterBlockFormat')
+        blkl = bio.load(stream=openfile('sample_0.0.7.blk', 'rb'), lazy=True)
+        self.assertFalse(isinstance(blkl, LazyBlock))
+        self._check_array(get_blk_from_sample_neu(), blkl)
@@ -341,3 +341,97 @@ class TestReloadIncenter(CheckDomainIO):
         self._check_block_array(don.blk, doo.blk)
         # check split blocks.
         self.assertEqual(len(don), 0)
+
+class TestReloadChunked(CheckDomainIO):
+    def _check_reload(self, compressor):
+        from tempfile import mkdtemp
+        from shutil import rmtree
+        from ...domain import Collective
+        from ..domain import DomainIO
+        npart = 3
+        # create original domain.
+        blk = get_sample_neu()
+        doo = Collective(blk=blk)
+        doo.split(npart)
+        dio = DomainIO(compressor=compressor, fmt='IncenterDomainFormat')
+        # save and reload to new domain.
+        dirname = mkdtemp()
+        dio.save(dom=doo, dirname=dirname)
+        don = dio.load(dirname=dirname, with_split=True)
+        # arrays are skipped by seeking over the chunks.
+        dol = dio.load(dirname=dirname, with_arrs=False, with_whole=False)
+        rmtree(dirname)
+        # check domain.
+        self._check_domain_shape(don, doo)
+        self._check_domain_array(don, doo)
+        self.assertTrue((dol.ifparr == doo.ifparr).all())
+        self.assertEqual(dol.part, None)
+        # check blocks.
+        self._check_block_array(don.blk, doo.blk)
+        for iblk in range(npart):
+            self._check_block_shape(don[iblk], doo[iblk])
+            self._check_block_bc(don[iblk], doo[iblk])
+            self._check_block_array(don[iblk], doo[iblk])
+
+    def test_zlib(self):
+        self._check_reload('zlib')
+
+    def test_xz(self):
+        self._check_reload('xz')
+
+class TestSaveThreaded(CheckDomainIO):
+    def test_reload(self):
+        from tempfile import mkdtemp
+        from shutil import rmtree
+        from ...domain import Collective
+        from ..domain import DomainIO
+        npart = 3
+        # create original domain.
+        blk = get_sample_neu()
+        doo = Collective(blk=blk)
+        doo.split(npart, nworker=2)
+        dio = DomainIO(compressor='zlib', fmt='IncenterDomainFormat')
+        # save with the blocks written concurrently and reload.
+        dirname = mkdtemp()
+        dio.save(dom=doo, dirname=dirname, nworker=npart+1)
+        don = dio.load(dirname=dirname, with_split=True)
+        rmtree(dirname)
+        # check.
+        self._check_domain_shape(don, doo)
+        self._check_domain_array(don, doo)
+        self._check_block_array(don.blk, doo.blk)
+        for iblk in range(npart):
+            self._check_block_shape(don[iblk], doo[iblk])
+            self._check_block_bc(don[iblk], doo[iblk])
+            self._check_block_array(don[iblk], doo[iblk])
+
+class TestLoadMmap(CheckDomainIO):
+    def test_load_block(self):
+        from tempfile import mkdtemp
+        from shutil import rmtree
+        from ...domain import Collective
+        from ..domain import DomainIO
+        npart = 3
+        # create original domain.
+        blk = get_sample_neu()
+        doo = Collective(blk=blk)
+        doo.split(npart)
+        # save uncompressed and reload with mapping.
+        dirname = mkdtemp()
+        DomainIO(fmt='IncenterDomainFormat').save(dom=doo, dirname=dirname)
+        dio = DomainIO(dirname=dirname, mmap=True)
+        for iblk in range(npart):
+            blk = dio.load_block(blkid=iblk, bcmapper=None)
+            for name in blk.TABLE_NAMES:
+                self.assertTrue(getattr(blk, 'tb'+name)._nda.flags.aligned)
+            self._check_block_shape(blk, doo[iblk])
+            self._check_block_group(blk, doo[iblk])
+            self._check_block_bc(blk, doo[iblk])
+            self._check_block_array(blk, doo[iblk])
+        # whole domain.
+        don = dio.load(with_split=True)
+        self._check_domain_shape(don, doo)
+        self._check_domain_array(don, doo)
+        self._check_block_array(don.blk, doo.blk)
+        # finalize.
+        rmtree(dirname)
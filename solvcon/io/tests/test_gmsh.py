@@ -51,6 +51,170 @@ class TestGmshClass(TestCase):
         # Check trailing.
         self.assertEqual(stream.readline(), b'')
 
+class TestGmshBulk(TestCase):
+    KEYS = ('ndim', 'nodes', 'cltpn', 'elgrp', 'elgeo', 'eldim', 'elems',
+            'ndmap', 'usnds', 'intels')
+
+    def _check_same(self, opener, fname):
+        line = gmsh.Gmsh(opener(fname), load=True, bulk=False)
+        bulk = gmsh.Gmsh(opener(fname), load=True, bulk=True)
+        for key in self.KEYS:
+            lval = np.asarray(getattr(line, key))
+            bval = np.asarray(getattr(bulk, key))
+            self.assertEqual(lval.dtype, bval.dtype)
+            self.assertTrue((lval == bval).all(), key)
+
+    def test_square(self):
+        import gzip
+        self._check_same(
+            gzip.open, os.path.join(env.datadir, 'gmsh_square.msh.gz'))
+
+    def test_cube(self):
+        import gzip
+        self._check_same(
+            gzip.open, os.path.join(env.datadir, 'gmsh_cube.msh.gz'))
+
+    def test_homogeneous(self):
+        from io import BytesIO
+        data = b"""$MeshFormat
+2.2 0 8
+$EndMeshFormat
+$Nodes
+4
+1 0 0 0
+2 1 0 0
+3 1 1 0
+4 0 1 0
+$EndNodes
+$Elements
+2
+1 2 2 1 22 1 2 3
+2 2 2 1 22 1 3 4
+$EndElements
+"""
+        self._check_same(BytesIO, data)
+
+    def test_mixed_tags(self):
+        from io import BytesIO
+        data = b"""$MeshFormat
+2.2 0 8
+$EndMeshFormat
+$Nodes
+5
+1 0 0 0
+2 1 0 0
+3 1 1 0
+4 0 1 0
+5 2 0 0
+$EndNodes
+$Elements
+4
+1 1 2 2 1 1 2
+2 3 3 1 22 0 1 2 3 4
+3 2 2 1 22 2 5 3
+4 1 3 2 1 0 4 1
+$EndElements
+"""
+        self._check_same(BytesIO, data)
+
+def make_msh41(gmh, byteorder='<'):
+    """
+    Write the data of a loaded :py:class:`solvcon.io.gmsh.Gmsh` object in the
+    binary MSH 4.1 format.  Each (dimension, geometrical entity) pair becomes
+    an entity, and the element physical group becomes its physical tag.
+    """
+    import struct
+    pack = lambda fmt, *args: struct.pack(byteorder+fmt, *args)
+    usize = np.dtype('u8').newbyteorder(byteorder)
+    fsize = np.dtype('f8').newbyteorder(byteorder)
+    rmap = dict((val[2], (key, val[3])) for key, val in
+                sorted(gmsh.Gmsh.ELMAP.items(), reverse=True))
+    ents = sorted(set(zip(gmh.eldim, gmh.elgeo, gmh.elgrp)))
+    out = [b'$MeshFormat\n4.1 1 8\n', pack('i', 1), b'\n$EndMeshFormat\n']
+    out.append(b'$PhysicalNames\n%d\n' % (len(gmh.physics)))
+    for name, dim, els in gmh.physics:
+        phy = gmh.elgrp[els[0]]
+        out.append(b'%d %d "%s"\n' % (dim, phy, name))
+    out.append(b'$EndPhysicalNames\n$Entities\n')
+    counts = [len([ent for ent in ents if ent[0] == dim]) for dim in range(4)]
+    out.append(pack('4Q', *counts))
+    for dim, tag, grp in ents:
+        nbox = 3 if dim == 0 else 6 # point coordinates or bounding box.
+        out.append(pack('i%dd' % nbox, tag, *([0.0]*nbox)))
+        out.append(pack('Qi', 1, grp))
+        if dim > 0:
+            out.append(pack('Q', 0))
+    out.append(b'\n$EndEntities\n$Nodes\n')
+    nnode = gmh.nodes.shape[0]
+    out.append(pack('4Q', 1, nnode, 1, nnode))
+    out.append(pack('3iQ', 3, 1, 0, nnode))
+    out.append(np.arange(1, nnode+1, dtype=usize).tobytes())
+    out.append(gmh.nodes.astype(fsize).tobytes())
+    out.append(b'\n$EndNodes\n$Elements\n')
+    nelem = gmh.elems.shape[0]
+    out.append(pack('4Q', len(ents), nelem, 1, nelem))
+    for dim, tag, grp in ents:
+        slct = (gmh.eldim == dim) & (gmh.elgeo == tag) & (gmh.elgrp == grp)
+        tpn, order = rmap[gmh.cltpn[slct][0]]
+        body = np.empty((slct.sum(), 1+len(order)), dtype=usize)
+        body[:,0] = np.arange(body.shape[0]) + 1
+        body[:,1+np.array(order)] = gmh.elems[slct,1:1+len(order)]
+        out.append(pack('3iQ', dim, tag, tpn, body.shape[0]))
+        out.append(body.tobytes())
+    out.append(b'\n$EndElements\n$Periodic\n0\n$EndPeriodic\n')
+    return b''.join(out)
+
+class TestGmshMsh41(TestCase):
+    def _check_same(self, fname, byteorder):
+        import gzip
+        from io import BytesIO
+        ascii = gmsh.Gmsh(gzip.open(fname), load=True)
+        binary = gmsh.Gmsh(BytesIO(make_msh41(ascii, byteorder)), load=True)
+        self.assertEqual(binary.format_version, 4.1)
+        self.assertEqual(binary.byteorder, byteorder)
+        for key in TestGmshBulk.KEYS:
+            aval = np.asarray(getattr(ascii, key))
+            bval = np.asarray(getattr(binary, key))
+            self.assertEqual(aval.dtype, bval.dtype)
+            self.assertTrue((aval == bval).all(), key)
+        self.assertEqual([it[:2] for it in ascii.physics],
+                         [it[:2] for it in binary.physics])
+        return binary
+
+    def test_square(self):
+        self._check_same(
+            os.path.join(env.datadir, 'gmsh_square.msh.gz'), '<')
+
+    def test_cube_big_endian(self):
+        self._check_same(
+            os.path.join(env.datadir, 'gmsh_cube.msh.gz'), '>')
+
+    def test_load_block(self):
+        import gzip
+        import shutil
+        import tempfile
+        ascii = gmsh.Gmsh(gzip.open(
+            os.path.join(env.datadir, 'gmsh_cube.msh.gz')), load=True)
+        tdir = tempfile.mkdtemp()
+        try:
+            fname = os.path.join(tdir, 'cube.msh')
+            with open(fname, 'wb') as fobj:
+                fobj.write(make_msh41(ascii))
+            blk = GmshIO().load(fname)
+        finally:
+            shutil.rmtree(tdir)
+        self.assertAlmostEqual(blk.clvol.sum(), 8.0, 12)
+        self.assertEqual(sorted(bc.name for bc in blk.bclist),
+                         sorted(bc.name for bc in cblk.bclist))
+
+    def test_reject_msh40(self):
+        from io import BytesIO
+        import struct
+        stream = BytesIO(b'$MeshFormat\n4 1 8\n' + struct.pack('<i', 1) +
+                         b'\n$EndMeshFormat\n')
+        with self.assertRaises(ValueError):
+            gmsh.Gmsh(stream, load=True)
+
 sblk = GmshIO().load(os.path.join(env.datadir, 'gmsh_square.msh.gz'))
 cblk = GmshIO().load(os.path.join(env.datadir, 'gmsh_cube.msh.gz'))
 
@@ -83,3 +83,49 @@ class TestNeutralReadDouble(NeutralTest):
     neu = gambit.GambitNeutral(openfile('sample.neu'))
     blk = neu.toblock(fpdtype='float64')
     round_to = 15
+
+class TestNeutralReadLineDouble(NeutralTest):
+    __test__ = True
+    neu = gambit.GambitNeutral(openfile('sample.neu'), bulk=False)
+    blk = neu.toblock(fpdtype='float64')
+    round_to = 15
+
+class TestNeutralBulkReader(TestCase):
+    def test_same_as_line_reader(self):
+        import numpy as np
+        line = gambit.GambitNeutral(openfile('sample.neu'), bulk=False)
+        bulk = gambit.GambitNeutral(openfile('sample.neu'), bulk=True)
+        self.assertEqual(str(line), str(bulk))
+        self.assertTrue((line.nodes == bulk.nodes).all())
+        self.assertEqual(line.elems.dtype, bulk.elems.dtype)
+        for lel, bel in zip(line.elems, bulk.elems):
+            self.assertTrue((lel[:2+lel[1]] == bel[:2+bel[1]]).all())
+        for lgrp, bgrp in zip(line.grps, bulk.grps):
+            self.assertEqual(str(lgrp), str(bgrp))
+            self.assertTrue((lgrp.solver == bgrp.solver).all())
+            self.assertTrue((lgrp.elems == bgrp.elems).all())
+        for lbc, bbc in zip(line.bcs, bulk.bcs):
+            self.assertEqual(str(lbc), str(bbc))
+            self.assertTrue((lbc.elems == bbc.elems).all())
+            self.assertTrue((lbc.values == bbc.values).all())
+        lblk = line.toblock()
+        bblk = bulk.toblock()
+        for key in ('ndcrd', 'cltpn', 'clnds', 'clgrp', 'fcnds', 'clvol'):
+            self.assertTrue((getattr(lblk, key) == getattr(bblk, key)).all())
+        for lbc, bbc in zip(lblk.bclist, bblk.bclist):
+            self.assertTrue((lbc.facn[:,:2] == bbc.facn[:,:2]).all())
+
+    def test_touching_fields(self):
+        from ...gendata import AttributeDict
+        lines = [
+            '       1  4  8       1       2       3       4       5       6'
+                '       7\n',
+            '               12345678\n',
+            '       2  6  4 1234567912345680       3       4\n',
+        ]
+        neu = AttributeDict(nelem=2)
+        gambit.GambitNeutralBulkReader._elements_cells(lines, neu)
+        self.assertEqual(list(neu.elems[0,:10]),
+                         [4, 8, 0, 1, 2, 3, 4, 5, 6, 12345677])
+        self.assertEqual(list(neu.elems[1,:6]),
+                         [6, 4, 12345678, 12345679, 2, 3])
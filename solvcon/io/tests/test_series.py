@@ -0,0 +1,130 @@
+# -*- coding: UTF-8 -*-
+
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+
+class TestSeries(TestCase):
+    def setUp(self):
+        from ...testing import loadfile
+        from .. import gambit
+        self.blk = gambit.GambitNeutral(loadfile('sample.neu')).toblock(
+            fpdtype='float64')
+        self.tdir = tempfile.mkdtemp()
+        self.fn = os.path.join(self.tdir, 'sample.scs')
+
+    def tearDown(self):
+        shutil.rmtree(self.tdir)
+
+    def _write(self, steps, **kw):
+        from ..series import SeriesWriter
+        blk = self.blk
+        wtr = SeriesWriter(self.fn, blk=blk, **kw)
+        for step in steps:
+            wtr.write_step(step, step*0.1, dict(
+                soln=np.full((blk.ncell, 5), step, dtype='float64'),
+                cfl=np.arange(blk.ncell, dtype='float64') + step,
+                vel=np.full((blk.ncell, blk.ndim), -step, dtype='float64'),
+            ))
+        return wtr
+
+    def _check(self, rdr, steps):
+        blk = self.blk
+        self.assertEqual(steps, rdr.steps)
+        for step in steps:
+            self.assertEqual(['cfl', 'soln', 'vel'], rdr.names(step))
+            self.assertAlmostEqual(step*0.1, rdr.time(step))
+            soln = rdr.read(step, 'soln')
+            self.assertEqual((blk.ncell, 5), soln.shape)
+            self.assertTrue((soln == step).all())
+            self.assertTrue((rdr.read(step, 'cfl') ==
+                             np.arange(blk.ncell) + step).all())
+
+    def test_roundtrip(self):
+        from ..series import SeriesReader
+        for compressor in '', 'gz', 'zlib':
+            if os.path.exists(self.fn):
+                os.remove(self.fn)
+            self._write([0, 5, 10], compressor=compressor).close()
+            with SeriesReader(self.fn) as rdr:
+                self.assertEqual(compressor, rdr.compressor)
+                self._check(rdr, [0, 5, 10])
+                # read in reversed order.
+                self.assertTrue((rdr.read(0, 'vel') == 0).all())
+                blk = rdr.load_block()
+            self.assertEqual(self.blk.ncell, blk.ncell)
+            self.assertTrue((self.blk.ndcrd == blk.ndcrd).all())
+            self.assertTrue((self.blk.clnds == blk.clnds).all())
+
+    def test_append(self):
+        from ..series import SeriesReader
+        self._write([0, 5]).close()
+        size = os.path.getsize(self.fn)
+        self._write([10], append=True).close()
+        self.assertTrue(os.path.getsize(self.fn) > size)
+        with SeriesReader(self.fn) as rdr:
+            self._check(rdr, [0, 5, 10])
+            # only one geometry.
+            self.assertEqual(1, len([ent for ent in rdr.entries
+                                     if ent.name == 'geometry']))
+
+    def test_overwrite(self):
+        from ..series import SeriesReader
+        self._write([0, 5]).close()
+        self._write([10]).close()
+        with SeriesReader(self.fn) as rdr:
+            self._check(rdr, [10])
+
+    def test_append_mismatch(self):
+        from ...testing import create_trivial_2d_blk
+        from ..series import SeriesWriter
+        self._write([0], compressor='gz').close()
+        size = os.path.getsize(self.fn)
+        self.assertRaises(ValueError, SeriesWriter, self.fn, blk=self.blk,
+                          compressor='', append=True)
+        self.assertRaises(ValueError, SeriesWriter, self.fn,
+                          blk=create_trivial_2d_blk(), append=True)
+        self.assertEqual(size, os.path.getsize(self.fn))
+        # the compressor of the file is taken by default.
+        wtr = SeriesWriter(self.fn, blk=self.blk, append=True)
+        self.assertEqual('gz', wtr.compressor)
+        wtr.close()
+
+    def test_recover(self):
+        from ..series import SeriesReader
+        wtr = self._write([0, 5])
+        # not closed; the index is missing.
+        wtr.flush()
+        with SeriesReader(self.fn) as rdr:
+            self._check(rdr, [0, 5])
+        # a partially written record is ignored.
+        wtr.stream.write(b'SCSERREC')
+        wtr.flush()
+        with SeriesReader(self.fn) as rdr:
+            self._check(rdr, [0, 5])
+        wtr.stream.close()
+
+    def test_export(self):
+        from ..series import export_vtk
+        self._write([0, 5]).close()
+        vtkfn = os.path.join(self.tdir, 'out.vtu')
+        self.assertEqual([vtkfn], export_vtk(self.fn, 5, vtkfn))
+        with open(vtkfn, 'rb') as fobj:
+            dat = fobj.read()
+        for name in b'soln[0]', b'soln[4]', b'cfl', b'vel':
+            self.assertNotEqual(-1, dat.find(b'Name="' + name + b'"'))
+        # two pieces.
+        fn2 = os.path.join(self.tdir, 'sample2.scs')
+        shutil.copy(self.fn, fn2)
+        vtkfn = os.path.join(self.tdir, 'out.pvtu')
+        written = export_vtk([self.fn, fn2], 5, vtkfn)
+        self.assertEqual(3, len(written))
+        with open(vtkfn, 'rb') as fobj:
+            dat = fobj.read()
+        self.assertNotEqual(-1, dat.find(b'Source="out.p0.vtu"'))
+        self.assertNotEqual(-1, dat.find(b'Source="out.p1.vtu"'))
+        for fn in written:
+            self.assertTrue(os.path.exists(fn))
@@ -97,3 +97,81 @@ class VtkXmlTest(TestCase):
         outf.close()
         self.assertEqual(dat.find('binary'), -1)
         self.assertEqual(dat.find('appended'), -1)
+
+    def test_cache_grid(self):
+        from io import BytesIO
+        import numpy as np
+        from ...testing import loadfile
+        from .. import gambit
+        from .. import vtkxml
+        blk = gambit.GambitNeutral(loadfile('sample.neu')).toblock(
+            fpdtype='float64')
+        wtr = vtkxml.VtkXmlUstGridWriter(blk)
+        wtr.scalars['val'] = np.zeros(blk.ncell, dtype='float64')
+        outf = BytesIO()
+        wtr.write(outf)
+        griddata = wtr.griddata
+        self.assertEqual(set(['points', 'connectivity', 'offsets', 'types']),
+                         set(griddata))
+        # the grid is not encoded again; changed data is still written.
+        wtr.scalars['val'] = np.ones(blk.ncell, dtype='float64')
+        outf2 = BytesIO()
+        wtr.write(outf2)
+        self.assertTrue(griddata is wtr.griddata)
+        self.assertNotEqual(outf.getvalue(), outf2.getvalue())
+        # the output is the same as a fresh writer.
+        wtr2 = vtkxml.VtkXmlUstGridWriter(blk, cache_grid=False)
+        wtr2.scalars['val'] = wtr.scalars['val']
+        outf3 = BytesIO()
+        wtr2.write(outf3)
+        self.assertEqual(outf2.getvalue(), outf3.getvalue())
+        self.assertEqual(None, wtr2.griddata)
+
+    def test_async(self):
+        import os
+        import shutil
+        from tempfile import mkdtemp
+        import numpy as np
+        from ...testing import loadfile
+        from .. import gambit
+        from .. import vtkxml
+        blk = gambit.GambitNeutral(loadfile('sample.neu')).toblock(
+            fpdtype='float64')
+        tdir = mkdtemp()
+        try:
+            val = np.zeros(blk.ncell, dtype='float64')
+            awtr = vtkxml.VtkXmlAsyncWriter(
+                vtkxml.VtkXmlUstGridWriter(blk), maxpending=2)
+            awtr.scalars['val'] = val
+            for it in range(5):
+                val.fill(it)
+                awtr.write(os.path.join(tdir, 'async%d.vtu' % it))
+            # the snapshot is not affected by later changes.
+            val.fill(-1)
+            awtr.close()
+            self.assertTrue(awtr._nsnapshot <= 3)
+            for it in range(5):
+                wtr = vtkxml.VtkXmlUstGridWriter(blk)
+                wtr.scalars['val'] = np.full(blk.ncell, it, dtype='float64')
+                fn = os.path.join(tdir, 'sync%d.vtu' % it)
+                wtr.write(fn)
+                with open(fn, 'rb') as fobj:
+                    sync = fobj.read()
+                with open(os.path.join(tdir, 'async%d.vtu' % it), 'rb') as fobj:
+                    self.assertEqual(sync, fobj.read())
+        finally:
+            shutil.rmtree(tdir)
+
+    def test_async_error(self):
+        import os
+        import numpy as np
+        from ...testing import loadfile
+        from .. import gambit
+        from .. import vtkxml
+        blk = gambit.GambitNeutral(loadfile('sample.neu')).toblock(
+            fpdtype='float64')
+        awtr = vtkxml.VtkXmlAsyncWriter(vtkxml.VtkXmlUstGridWriter(blk))
+        awtr.write(os.path.join('nonexist', 'dir', 'file.vtu'))
+        # the error in the background thread is raised in the caller.
+        self.assertRaises(IOError, awtr.flush)
+        awtr.close()
@@ -71,6 +71,19 @@ class VtkLegacyWriter(object):
         """
         arr.byteswap(True)
 
+    @staticmethod
+    def _to_bigendian(arr):
+        """
+        Convert the array to BIG ENDIAN in a single pass.  Unlike
+        _ensure_endian(), the input array is not modified.
+
+        @param arr: array to be converted.
+        @type arr: numpy.ndarray
+        @return: the BIG ENDIAN array.
+        @rtype: numpy.ndarray
+        """
+        return arr.astype(arr.dtype.newbyteorder('>'), copy=False)
+
     @staticmethod
     def _get_dtypestr(arr):
         """
@@ -166,16 +179,13 @@ class VtkLegacyUstGridWriter(VtkLegacyWriter):
         """
         Helper to convert scalar data array from a block.
 
-        @param arr: array to be converted.  It will be copied and remain
-            untouched.
+        @param arr: array to be converted.  It remains untouched.
         @type arr: numpy.ndarray
         @return: converted data string.
         @rtype: str
         """
-        arr = arr.copy()
         if self.binary:
-            self._ensure_endian(arr)
-            return arr.tostring()
+            return self._to_bigendian(arr).tostring()
         else:
             return '\n'.join(['%e'%val for val in arr])
 
@@ -183,24 +193,23 @@ class VtkLegacyUstGridWriter(VtkLegacyWriter):
         """
         Helper to convert vector data array from a block.
 
-        @param arr: array to be converted.  It will be copied and remain
-            untouched.
+        @param arr: array to be converted.  It remains untouched.
         @type arr: numpy.ndarray
         @return: converted data string.
         @rtype: str
         """
         from numpy import empty
-        arr = arr.copy()
         ndim = self.blk.ndim
         nit = arr.shape[0]
         if ndim == 2:
-            arrn = empty((nit, ndim+1), dtype=arr.dtype)
+            # pad and convert the byte order in the same pass.
+            dtype = arr.dtype.newbyteorder('>') if self.binary else arr.dtype
+            arrn = empty((nit, ndim+1), dtype=dtype)
             arrn[:,2] = 0.0
             arrn[:,:2] = arr[:,:]
             arr = arrn
         if self.binary:
-            self._ensure_endian(arr)
-            return arr.tostring()
+            return self._to_bigendian(arr).tostring()
         else:
             tmpl = '%e %e %e'
             return '\n'.join([tmpl%tuple(vec) for vec in arr])
@@ -229,7 +238,6 @@ class VtkLegacyUstGridWriter(VtkLegacyWriter):
         @return: made up cell definition.
         @rtype: str
         """
-        from numpy import empty
         blk = self.blk
         ncell = blk.ncell
         clnds = blk.clnds
@@ -238,19 +246,7 @@ class VtkLegacyUstGridWriter(VtkLegacyWriter):
         size = clnds[:,0].sum() + ncell
         ret.append('CELLS %d %d' % (ncell, size))
         if self.binary:
-            # make data.
-            arr = empty(size, dtype='int32')
-            icl = 0
-            it = 0
-            while icl < ncell:
-                ncl = clnds[icl,0]
-                arr[it] = ncl
-                arr[it+1:it+1+ncl] = clnds[icl,1:ncl+1]
-                it += 1+ncl
-                icl += 1
-            # write.
-            self._ensure_endian(arr)
-            ret.append(arr.tostring())
+            ret.append(self._to_bigendian(self._pack_clnds(clnds)).tostring())
         else:
             for nds in clnds:
                 ncl = nds[0]
@@ -260,12 +256,31 @@ class VtkLegacyUstGridWriter(VtkLegacyWriter):
         ret.append('CELL_TYPES %d' % ncell)
         cltpn = self.cltpn_map[blk.cltpn]
         if self.binary:
-            self._ensure_endian(cltpn)
-            ret.append(cltpn.tostring())
+            ret.append(self._to_bigendian(cltpn).tostring())
         else:
             ret.extend(['%d'%val for val in cltpn])
         return '\n'.join(ret)
 
+    @staticmethod
+    def _pack_clnds(clnds):
+        """
+        Pack the nodes in cells into the VTK legacy CELLS format, i.e., the
+        number of nodes followed by the nodes for each cell.
+
+        @param clnds: the nodes in cells.
+        @type clnds: numpy.ndarray
+        @return: the packed array.
+        @rtype: numpy.ndarray
+
+        >>> import numpy as np
+        >>> clnds = np.array([[3, 0, 1, 2, -1], [4, 1, 3, 4, 2]], dtype='int32')
+        >>> VtkLegacyUstGridWriter._pack_clnds(clnds).tolist()
+        [3, 0, 1, 2, 4, 1, 3, 4, 2]
+        """
+        from numpy import arange
+        mask = arange(clnds.shape[1]) <= clnds[:,:1]
+        return clnds[mask].astype('int32', copy=False)
+
     def _make_value(self):
         """
         @return: made up field value.
@@ -189,7 +189,7 @@ class VtkXmlWriter(object):
         """
         stream.write(binary)
 
-    def _write_darr(self, arr, outf, aplist, attr):
+    def _write_darr(self, arr, outf, aplist, attr, data=None):
         """
         Write data array to a stream.
 
@@ -201,6 +201,9 @@ class VtkXmlWriter(object):
         @type aplist: list
         @param attr: additional attributes to the DataArray tag.
         @type attr: list
+        @keyword data: binary data already created from arr by _create_data.
+            Default None creates it.
+        @type data: bytes
         @return: nothing
         """
         # craft attributes.
@@ -222,7 +225,8 @@ class VtkXmlWriter(object):
         if self.binary:
             self._write_text(self._tag_open('DataArray', attr, close=True),
                              outf)
-            data = self._create_data(arr)
+            if data is None:
+                data = self._create_data(arr)
             if aplist is None:
                 self._write_binary(data, outf)
                 self._write_text('\n', outf)
@@ -264,8 +268,10 @@ class VtkXmlUstGridWriter(VtkXmlWriter):
     @itype scalars: dict
     @ivar vectors: dictionary holding vector data.
     @itype vectors: dict
-    @ivar griddata: cached grid data.
-    @itype griddata: str
+    @ivar griddata: cached grid data, a dict mapping the names of the grid
+        arrays to the converted arrays and their created binary data (None
+        for ASCII).
+    @itype griddata: dict
     """
     def __init__(self, blk, *args, **kw):
         self.cache_grid = kw.pop('cache_grid', True)
@@ -308,27 +314,28 @@ class VtkXmlUstGridWriter(VtkXmlWriter):
         # data.
         self._write_text(self._tag_open('CellData'), outf)
         for key in sorted(self.scalars.keys()):
-            arr = self.scalars[key].astype(self.fpdtype)
+            arr = self.scalars[key].astype(self.fpdtype, copy=False)
             self._write_darr(arr, outf, aplist, [('Name', key)])
         for key in sorted(self.vectors.keys()):
-            arr = self._convert_varr(self.vectors[key].astype(self.fpdtype))
+            arr = self._convert_varr(
+                self.vectors[key].astype(self.fpdtype, copy=False))
             self._write_darr(arr, outf, aplist, [
                 ('Name', key), ('NumberOfComponents', 3)])
         self._write_text(self._tag_close('CellData'), outf)
         # write points.
+        if not self.griddata:
+            self.griddata = self._create_griddata()
+        griddata = self.griddata
         self._write_text(self._tag_open('Points'), outf)
-        arr = self.blk.ndcrd.astype(self.fpdtype)
-        self._write_darr(self._convert_varr(arr), outf, aplist, [
-            ('NumberOfComponents', 3)])
+        arr, data = griddata['points']
+        self._write_darr(arr, outf, aplist, [('NumberOfComponents', 3)],
+                         data=data)
         self._write_text(self._tag_close('Points'), outf)
         # write cells.
         self._write_text(self._tag_open('Cells'), outf)
-        self._write_darr(self._convert_clnds(self.blk.clnds), outf, aplist, [
-            ('Name', 'connectivity')])
-        self._write_darr(self.blk.clnds[:,0].cumsum(dtype='int32'), outf,
-            aplist, [('Name', 'offsets')])
-        self._write_darr(self.cltpn_map[self.blk.cltpn], outf, aplist, [
-            ('Name', 'types')])
+        for key in 'connectivity', 'offsets', 'types':
+            arr, data = griddata[key]
+            self._write_darr(arr, outf, aplist, [('Name', key)], data=data)
         self._write_text(self._tag_close('Cells'), outf)
         # write footer.
         self._write_text(self._tag_close('Piece'), outf)
@@ -342,18 +349,37 @@ class VtkXmlUstGridWriter(VtkXmlWriter):
         if not self.cache_grid:
             self.griddata = None
 
+    def _create_griddata(self):
+        """
+        Convert the grid arrays of the block and create their binary data.
+
+        @return: the converted arrays and binary data keyed by names.
+        @rtype: dict
+        """
+        blk = self.blk
+        griddata = dict()
+        for key, arr in (
+            ('points', self._convert_varr(
+                blk.ndcrd.astype(self.fpdtype, copy=False))),
+            ('connectivity', self._convert_clnds(blk.clnds)),
+            ('offsets', blk.clnds[:,0].cumsum(dtype='int32')),
+            ('types', self.cltpn_map[blk.cltpn]),
+        ):
+            griddata[key] = arr, self._create_data(arr) if self.binary else None
+        return griddata
+
     def _convert_varr(self, arr):
         """
-        Helper to convert vector data array from a block.
+        Helper to convert vector data array from a block.  Two-dimensional
+        vectors are padded with zero into a new array; three-dimensional
+        vectors are returned as is without copying.
 
-        @param arr: array to be converted.  It will be copied and remain
-            untouched.
+        @param arr: array to be converted.  It remains untouched.
         @type arr: numpy.ndarray
         @return: converted array.
         @rtype: numpy.ndarray
         """
         from numpy import empty
-        arr = arr.copy()
         ndim = self.blk.ndim
         nit = arr.shape[0]
         if ndim == 2:
@@ -379,18 +405,17 @@ class VtkXmlUstGridWriter(VtkXmlWriter):
         @type clnds: numpy.ndarray
         @return: the compressed array.
         @rtype: numpy.ndarray
+
+        >>> import numpy as np
+        >>> clnds = np.array([[3, 0, 1, 2, -1], [4, 1, 3, 4, 2]], dtype='int32')
+        >>> VtkXmlUstGridWriter._convert_clnds(clnds).tolist()
+        [0, 1, 2, 1, 3, 4, 2]
         """
-        from numpy import empty
-        arr = empty(clnds[:,0].sum(), dtype='int32')
-        ncell = clnds.shape[0]
-        icl = 0
-        it = 0
-        while icl < ncell:
-            ncl = clnds[icl,0]
-            arr[it:it+ncl] = clnds[icl,1:ncl+1]
-            it += ncl
-            icl += 1
-        return arr
+        from numpy import arange
+        # the mask keeps the first clnds[:,0] nodes of each row, and boolean
+        # indexing walks the rows in order.
+        mask = arange(clnds.shape[1]-1) < clnds[:,:1]
+        return clnds[:,1:][mask].astype('int32', copy=False)
 
 class PVtkXmlUstGridWriter(VtkXmlUstGridWriter):
     """
@@ -422,7 +447,7 @@ class PVtkXmlUstGridWriter(VtkXmlUstGridWriter):
         """
         import os
         mainfn = os.path.splitext(outf)[0]
-        outf = open(outf, 'w')
+        outf = open(outf, 'wb')
         # write header.
         self._write_text('<?xml version="1.0"?>\n', outf)
         attr = [
@@ -498,7 +523,7 @@ class PVtkXmlPolyDataWriter(VtkXmlWriter):
         """
         import os
         mainfn = os.path.splitext(outf)[0]
-        outf = open(outf, 'w')
+        outf = open(outf, 'wb')
         # write header.
         self._write_text('<?xml version="1.0"?>\n', outf)
         attr = [
@@ -538,3 +563,140 @@ class PVtkXmlPolyDataWriter(VtkXmlWriter):
         self._write_text(self._tag_close('PPolyData'), outf)
         self._write_text(self._tag_close('VTKFile'), outf)
         outf.close()
+
+class VtkXmlAsyncWriter(object):
+    """
+    Write the data of a VTK XML unstructured mesh writer in a background
+    thread.  The arrays to be written are copied into snapshot buffers, so
+    that the caller may continue modifying them.  At most maxpending
+    snapshots wait in the queue besides the one being written; write() blocks
+    when the background thread falls further behind.  The snapshot buffers
+    are recycled, so the memory is capped at maxpending+1 copies of the data.
+
+    @ivar wtr: the writer used by the background thread.
+    @itype wtr: VtkXmlUstGridWriter
+    @ivar maxpending: the maximum number of snapshots waiting to be written.
+    @itype maxpending: int
+    @ivar scalars: dictionary holding scalar data for the next write.
+    @itype scalars: dict
+    @ivar vectors: dictionary holding vector data for the next write.
+    @itype vectors: dict
+    """
+    def __init__(self, wtr, maxpending=1):
+        """
+        @param wtr: the writer.  It must not be used by others afterward.
+        @type wtr: VtkXmlUstGridWriter
+        @keyword maxpending: the maximum number of snapshots waiting to be
+            written.  Default 1 (double buffering).
+        @type maxpending: int
+        """
+        import threading
+        try: # py3k compat.
+            from Queue import Queue
+        except ImportError:
+            from queue import Queue
+        if maxpending < 1:
+            raise ValueError('maxpending = %d < 1' % maxpending)
+        self.wtr = wtr
+        self.maxpending = maxpending
+        self.scalars = dict()
+        self.vectors = dict()
+        self._nsnapshot = 0
+        self._free = Queue()
+        self._queue = Queue()
+        self._error = None
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _take_snapshot(self):
+        """
+        Get a free set of snapshot buffers.  Block if all of them are in use.
+
+        @return: the snapshot buffers keyed by ('scalars'|'vectors', name).
+        @rtype: dict
+        """
+        try: # py3k compat.
+            from Queue import Empty
+        except ImportError:
+            from queue import Empty
+        try:
+            return self._free.get_nowait()
+        except Empty:
+            pass
+        if self._nsnapshot <= self.maxpending:
+            self._nsnapshot += 1
+            return dict()
+        return self._free.get()
+
+    def write(self, outf):
+        """
+        Snapshot the scalars and vectors and queue them to be written.
+
+        @param outf: output file name.
+        @type outf: str
+        @return: nothing
+        """
+        from numpy import empty, copyto
+        self._raise_error()
+        snapshot = self._take_snapshot()
+        arrs = (('scalars', self.scalars), ('vectors', self.vectors))
+        for kind, src in arrs:
+            for key, arr in src.items():
+                buf = snapshot.get((kind, key))
+                if buf is None or buf.shape != arr.shape \
+                   or buf.dtype != arr.dtype:
+                    buf = snapshot[kind, key] = empty(arr.shape, arr.dtype)
+                copyto(buf, arr)
+        names = tuple((kind, tuple(src)) for kind, src in arrs)
+        self._queue.put((outf, snapshot, names))
+
+    def _run(self):
+        """
+        Event loop of the background thread.
+        """
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                break
+            outf, snapshot, names = item
+            try:
+                if self._error is None:
+                    for kind, keys in names:
+                        setattr(self.wtr, kind, dict(
+                            (key, snapshot[kind, key]) for key in keys))
+                    self.wtr.write(outf)
+            except Exception as e:
+                self._error = e
+            finally:
+                self._free.put(snapshot)
+                self._queue.task_done()
+
+    def _raise_error(self):
+        """
+        Raise the error occurred in the background thread, if any.
+        """
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def flush(self):
+        """
+        Wait for all the queued snapshots to be written.
+
+        @return: nothing
+        """
+        self._queue.join()
+        self._raise_error()
+
+    def close(self):
+        """
+        Write all the queued snapshots and stop the background thread.
+
+        @return: nothing
+        """
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._raise_error()
@@ -31,6 +31,7 @@ from __future__ import absolute_import, division, print_function
 from .mesh cimport sc_mesh_t, FCMND, CLMND, CLMFC, FCREL, BFREL
 from libc.stdint cimport intptr_t
 from libc.stdlib cimport malloc, free
+from libc.string cimport memcpy
 import numpy as np
 cimport numpy as cnp
 
@@ -38,13 +39,23 @@ cimport numpy as cnp
 cnp.import_array()
 
 
+# The mesh kernels touch only C arrays, so that the GIL is released while they
+# run and sub-blocks can be supplemented in concurrent threads.
 cdef extern:
-    void sc_mesh_build_ghost(sc_mesh_t *msd, int *bndfcs)
-    int sc_mesh_calc_metric(sc_mesh_t *msd, int use_incenter)
+    void sc_mesh_build_ghost(sc_mesh_t *msd, int *bndfcs) nogil
+    int sc_mesh_calc_metric(sc_mesh_t *msd, int use_incenter) nogil
     int sc_mesh_extract_faces_from_cells(sc_mesh_t *msd, int mface,
-            int *pnface, int *clfcs, int *fctpn, int *fcnds, int *fccls)
-    int sc_mesh_build_rcells(sc_mesh_t *msd, int *rcells, int *rcellno)
-    int sc_mesh_build_csr(sc_mesh_t *msd, int *rcells, int *adjncy)
+            int *pnface, int *clfcs, int *fctpn, int *fcnds, int *fccls) nogil
+    int sc_mesh_build_rcells(sc_mesh_t *msd, int *rcells, int *rcellno) nogil
+    int sc_mesh_build_csr(sc_mesh_t *msd, int *rcells, int *xadj,
+            int *adjncy) nogil
+    int sc_mesh_count_bins(sc_mesh_t *msd, int *nbin, double *bbmin,
+            double *binwid, int *binoff) nogil
+    int sc_mesh_fill_bins(sc_mesh_t *msd, int *nbin, double *bbmin,
+            double *binwid, int *binoff, int *binpos, int *bincls) nogil
+    int sc_mesh_locate_points(sc_mesh_t *msd, int *nbin, double *bbmin,
+            double *binwid, int *binoff, int *bincls,
+            int npoint, double *crds, int *icls) nogil
 
     void METIS_PartGraphKway( int *n, int *xadj, int *adjncy, int *vwgt,
         int *adjwgt, int *wgtflag, int *numflag, int *nparts, int *options,
@@ -68,9 +79,21 @@ cdef class Table:
         # Pop all custom keyword arguments.
         dtype = kw.pop("dtype", None)
         creator_name = kw.pop("creation", "empty")
-        # Create the ndarray.
-        create = getattr(np, creator_name)
-        self._nda = create([nghost+nbody]+list(args), dtype=dtype)
+        buf = kw.pop("buffer", None)
+        shape = [nghost+nbody]+list(args)
+        if buf is None:
+            # Create the ndarray.
+            create = getattr(np, creator_name)
+            self._nda = create(shape, dtype=dtype)
+        else:
+            # Adopt the given ndarray (e.g., a numpy.memmap) without copying.
+            if list(buf.shape) != shape:
+                raise ValueError("buffer shape %s mismatches %s" % (
+                    buf.shape, tuple(shape)))
+            if dtype is not None and buf.dtype != np.dtype(dtype):
+                raise ValueError("buffer dtype %s mismatches %s" % (
+                    buf.dtype, np.dtype(dtype)))
+            self._nda = buf
         if not self._nda.flags.c_contiguous:
             raise ValueError("not C Contiguous")
         ndim = len(self._nda.shape)
@@ -239,7 +262,11 @@ cdef class Mesh:
 
         Build data for ghost cells and related information.
         """
-        sc_mesh_build_ghost(self._msd, &bndfcs[0,0])
+        cdef int *pbndfcs = NULL
+        if bndfcs.shape[0] != 0:
+            pbndfcs = &bndfcs[0,0]
+        with nogil:
+            sc_mesh_build_ghost(self._msd, pbndfcs)
 
     def calc_metric(self, use_incenter):
         """
@@ -248,8 +275,9 @@ cdef class Mesh:
         Calculate metrics including normal vector and area of faces, and
         centroid coordinates and volume of cells.
         """
-        cdef use_incenter_val = 1 if use_incenter else 0
-        sc_mesh_calc_metric(self._msd, use_incenter_val)
+        cdef int use_incenter_val = 1 if use_incenter else 0
+        with nogil:
+            sc_mesh_calc_metric(self._msd, use_incenter_val)
 
     def extract_faces_from_cells(self, int max_nfc):
         """
@@ -279,8 +307,16 @@ cdef class Mesh:
             arr.fill(-1)
         # call worker.
         cdef int nface
-        sc_mesh_extract_faces_from_cells(self._msd, max_nfc,
-                &nface, &clfcs[0,0], &fctpn[0], &fcnds[0,0], &fccls[0,0])
+        cdef int *pclfcs = &clfcs[0,0]
+        cdef int *pfctpn = &fctpn[0]
+        cdef int *pfcnds = &fcnds[0,0]
+        cdef int *pfccls = &fccls[0,0]
+        cdef int ret
+        with nogil:
+            ret = sc_mesh_extract_faces_from_cells(self._msd, max_nfc,
+                    &nface, pclfcs, pfctpn, pfcnds, pfccls)
+        if ret != 0:
+            raise MemoryError("failed to allocate buffers for extracting faces")
         # shuffle the result.
         clfcs = clfcs[:nface,:].copy()
         fctpn = fctpn[:nface].copy()
@@ -302,36 +338,151 @@ cdef class Mesh:
             (self._msd.ncell, CLMFC), dtype='int32')
         cdef cnp.ndarray[int, ndim=1, mode="c"] rcellno = np.empty(
             self._msd.ncell, dtype='int32')
-        sc_mesh_build_rcells(self._msd, &rcells[0,0], &rcellno[0])
+        with nogil:
+            sc_mesh_build_rcells(self._msd, &rcells[0,0], &rcellno[0])
         # build xadj: cell boundaries.
-        xadj = np.empty(self._msd.ncell+1, dtype='int32')
+        cdef cnp.ndarray[int, ndim=1, mode="c"] xadj = np.empty(
+            self._msd.ncell+1, dtype='int32')
         xadj[0] = 0
         xadj[1:] = np.add.accumulate(rcellno)
         # build adjncy: edge/relations.
         cdef cnp.ndarray[int, ndim=1, mode="c"] adjncy = np.empty(
             xadj[-1], dtype='int32')
-        sc_mesh_build_csr(self._msd, &rcells[0,0], &adjncy[0])
+        with nogil:
+            sc_mesh_build_csr(self._msd, &rcells[0,0], &xadj[0], &adjncy[0])
         return xadj, adjncy
 
-    def partition(self, int npart, vwgtarr=None):
+    def build_bins(self, nbin=None):
+        """
+        :keyword nbin: Number of bins along each axis.  By default the bins
+          are about the size of an average cell.
+        :type nbin: sequence of int
+        :return: The spatial index to be passed to :py:meth:`locate_points`,
+          i.e., nbin, bbmin, binwid, binoff, and bincls.
+        :rtype: tuple
+
+        Build a spatial index of cells on a uniform grid of bins over the
+        bounding box of the mesh.  Each cell is registered to the bins
+        overlapped by the bounding box of its nodes and centroid, and the
+        cells in the bin ``ibin`` are ``bincls[binoff[ibin]:binoff[ibin+1]]``.
+        """
+        assert self._msd.ncell > 0
+        cdef int ndim = self._msd.ndim
+        cdef int ind, idm
+        cdef double crd
+        cdef cnp.ndarray[double, ndim=1, mode="c"] bbmin = np.empty(
+            ndim, dtype='float64')
+        cdef cnp.ndarray[double, ndim=1, mode="c"] bbmax = np.empty(
+            ndim, dtype='float64')
+        bbmin.fill(np.inf)
+        bbmax.fill(-np.inf)
+        for ind in range(self._msd.nnode):
+            for idm in range(ndim):
+                crd = self._msd.ndcrd[ind*ndim+idm]
+                if crd < bbmin[idm]:
+                    bbmin[idm] = crd
+                if crd > bbmax[idm]:
+                    bbmax[idm] = crd
+        extent = bbmax - bbmin
+        extent[extent <= 0] = 1.0
+        # determine the number of bins.
+        if nbin is None:
+            width = (np.prod(extent) / self._msd.ncell) ** (1.0/ndim)
+            nbin = np.ceil(extent / width)
+        cdef cnp.ndarray[int, ndim=1, mode="c"] _nbin = np.clip(
+            np.asarray(nbin, dtype='int32'), 1, None).astype('int32')
+        assert _nbin.shape[0] == ndim
+        cdef cnp.ndarray[double, ndim=1, mode="c"] binwid = extent / _nbin
+        # count and fill.
+        cdef cnp.ndarray[int, ndim=1, mode="c"] binoff = np.empty(
+            _nbin.prod()+1, dtype='int32')
+        with nogil:
+            sc_mesh_count_bins(self._msd, &_nbin[0], &bbmin[0], &binwid[0],
+                               &binoff[0])
+        cdef cnp.ndarray[int, ndim=1, mode="c"] binpos = np.empty(
+            binoff.shape[0]-1, dtype='int32')
+        cdef cnp.ndarray[int, ndim=1, mode="c"] bincls = np.empty(
+            binoff[binoff.shape[0]-1], dtype='int32')
+        with nogil:
+            sc_mesh_fill_bins(self._msd, &_nbin[0], &bbmin[0], &binwid[0],
+                              &binoff[0], &binpos[0], &bincls[0])
+        return _nbin, bbmin, binwid, binoff, bincls
+
+    def locate_points(self, crds, bins):
+        """
+        :param crds: Coordinates of the points, of shape (npoint, ndim);
+          extra columns are ignored.
+        :type crds: numpy.ndarray
+        :param bins: The spatial index returned by :py:meth:`build_bins`.
+        :type bins: tuple
+        :return: Index of the cell containing each point; -1 for not found.
+        :rtype: numpy.ndarray
+
+        Locate the cells containing the points.  Like the CESE solvers, a
+        cell is taken as the simplices formed by its centroid and its
+        sub-faces, so that warped cells are located consistently.  A point on
+        a face shared by two cells is located in the cell of the smaller
+        index.
+        """
+        cdef int ndim = self._msd.ndim
+        crds = np.asarray(crds, dtype='float64')
+        if crds.ndim == 1:
+            crds = crds.reshape((1, -1))
+        if crds.shape[1] < ndim:
+            raise ValueError("points need %d coordinates" % ndim)
+        cdef cnp.ndarray[double, ndim=2, mode="c"] _crds = np.ascontiguousarray(
+            crds[:,:ndim])
+        cdef int npoint = _crds.shape[0]
+        cdef cnp.ndarray[int, ndim=1, mode="c"] icls = np.empty(
+            npoint, dtype='int32')
+        if npoint == 0:
+            return icls
+        cdef cnp.ndarray[int, ndim=1, mode="c"] nbin = bins[0]
+        cdef cnp.ndarray[double, ndim=1, mode="c"] bbmin = bins[1]
+        cdef cnp.ndarray[double, ndim=1, mode="c"] binwid = bins[2]
+        cdef cnp.ndarray[int, ndim=1, mode="c"] binoff = bins[3]
+        cdef cnp.ndarray[int, ndim=1, mode="c"] bincls = bins[4]
+        if nbin.shape[0] != ndim or binoff.shape[0] != nbin.prod()+1:
+            raise ValueError("bins do not match the mesh")
+        with nogil:
+            sc_mesh_locate_points(self._msd, &nbin[0], &bbmin[0], &binwid[0],
+                &binoff[0], &bincls[0], npoint, &_crds[0,0], &icls[0])
+        return icls
+
+    def partition(self, int npart, vwgtarr=None, adjwgtarr=None):
+        """
+        :param npart: Number of parts to be partitioned.
+        :type npart: int
+        :keyword vwgtarr: Weights of the cells; ignored unless of length
+          ncell.
+        :type vwgtarr: numpy.ndarray
+        :keyword adjwgtarr: Weights of the edges of the CSR graph, i.e., the
+          faces between two cells; ignored unless it matches the adjacency
+          returned by :py:meth:`create_csr`.
+        :type adjwgtarr: numpy.ndarray
+        :return: edgecut, part
+        :rtype: tuple
+
+        Partition the cells by METIS with optional weighting.
+        """
         # obtain CSR.
         ret = self.create_csr()
         cdef cnp.ndarray[int, ndim=1, mode="c"] xadj = ret[0]
         cdef cnp.ndarray[int, ndim=1, mode="c"] adjncy = ret[1]
-        # weighting.
-        if vwgtarr is None:
-            vwgtarr = np.empty(1, dtype='int32')
-        cdef cnp.ndarray[int, ndim=1, mode="c"] vwgt = vwgtarr
-        cdef int wgtflag
-        if len(vwgtarr) == self._msd.ncell:
-            wgtflag = 2
+        # weighting; wgtflag 1 weights edges, 2 vertices, and 3 both.
+        cdef int wgtflag = 0
+        cdef cnp.ndarray[int, ndim=1, mode="c"] vwgt
+        if vwgtarr is not None and len(vwgtarr) == self._msd.ncell:
+            vwgt = np.ascontiguousarray(vwgtarr, dtype='int32')
+            wgtflag += 2
+        else:
+            vwgt = np.zeros(1, dtype='int32')
+        cdef cnp.ndarray[int, ndim=1, mode="c"] adjwgt
+        if adjwgtarr is not None and len(adjwgtarr) == len(adjncy) > 0:
+            adjwgt = np.ascontiguousarray(adjwgtarr, dtype='int32')
+            wgtflag += 1
         else:
-            vwgt.fill(0)
-            wgtflag = 0
-        # FIXME: not consistent when len(vwgt) == ncell.
-        cdef cnp.ndarray[int, ndim=1, mode="c"] adjwgt = np.empty(
-            1, dtype='int32')
-        adjwgt.fill(0)
+            adjwgt = np.zeros(1, dtype='int32')
         # options.
         cdef cnp.ndarray[int, ndim=1, mode="c"] options = np.empty(
             5, dtype='int32')
@@ -358,6 +509,102 @@ cdef class Mesh:
         return edgecut, part
 
 
+cdef Py_ssize_t _check_rows(cnp.ndarray full, cnp.ndarray idx,
+                            cnp.ndarray packed) except -1:
+    """
+    Check the arrays for gather_rows() and scatter_rows() and return the
+    number of bytes in a row.
+    """
+    if not (full.flags.c_contiguous and packed.flags.c_contiguous):
+        raise ValueError("arrays must be C contiguous")
+    if full.dtype != packed.dtype:
+        raise ValueError("dtype %s mismatches %s" % (full.dtype, packed.dtype))
+    if (<object>full).shape[1:] != (<object>packed).shape[1:]:
+        raise ValueError("row shape %s mismatches %s" % (
+            (<object>full).shape[1:], (<object>packed).shape[1:]))
+    if idx.dtype != np.dtype('int32') or idx.ndim != 1 \
+            or not idx.flags.c_contiguous:
+        raise ValueError("index must be contiguous 1D int32")
+    if idx.shape[0] != packed.shape[0]:
+        raise ValueError("%d indices for %d rows" % (
+            idx.shape[0], packed.shape[0]))
+    if full.ndim == 0:
+        raise ValueError("zero dimension is not allowed")
+    return full.itemsize * (full.size // full.shape[0] if full.shape[0] else 0)
+
+def gather_rows(cnp.ndarray full, cnp.ndarray idx, cnp.ndarray packed):
+    """
+    :param full: The array to gather from.
+    :type full: numpy.ndarray
+    :param idx: Row indices (int32) in *full*.
+    :type idx: numpy.ndarray
+    :param packed: The array to gather into; ``len(packed) == len(idx)``.
+    :type packed: numpy.ndarray
+    :return: Nothing.
+
+    Copy ``full[idx]`` into *packed* without temporary and with the GIL
+    released.
+
+    >>> full = np.arange(12, dtype='float64').reshape((6, 2))
+    >>> packed = np.empty((2, 2), dtype='float64')
+    >>> gather_rows(full, np.array([4, 1], dtype='int32'), packed)
+    >>> packed.tolist()
+    [[8.0, 9.0], [2.0, 3.0]]
+    """
+    cdef Py_ssize_t rowbytes = _check_rows(full, idx, packed)
+    cdef Py_ssize_t nrow = full.shape[0]
+    cdef Py_ssize_t nidx = idx.shape[0]
+    cdef char *pfull = full.data
+    cdef char *ppacked = packed.data
+    cdef int *pidx = <int*>idx.data
+    cdef Py_ssize_t it
+    cdef Py_ssize_t bad = -1
+    with nogil:
+        for it in range(nidx):
+            if pidx[it] < 0 or pidx[it] >= nrow:
+                bad = it
+                break
+            memcpy(ppacked + it*rowbytes, pfull + pidx[it]*rowbytes, rowbytes)
+    if bad >= 0:
+        raise IndexError("index %d out of %d rows" % (pidx[bad], nrow))
+
+def scatter_rows(cnp.ndarray packed, cnp.ndarray idx, cnp.ndarray full):
+    """
+    :param packed: The array to scatter from; ``len(packed) == len(idx)``.
+    :type packed: numpy.ndarray
+    :param idx: Row indices (int32) in *full*.
+    :type idx: numpy.ndarray
+    :param full: The array to scatter into.
+    :type full: numpy.ndarray
+    :return: Nothing.
+
+    Copy *packed* into ``full[idx]`` without temporary and with the GIL
+    released.
+
+    >>> full = np.zeros((4, 2), dtype='float64')
+    >>> packed = np.array([[1, 2], [3, 4]], dtype='float64')
+    >>> scatter_rows(packed, np.array([3, 0], dtype='int32'), full)
+    >>> full.tolist()
+    [[3.0, 4.0], [0.0, 0.0], [0.0, 0.0], [1.0, 2.0]]
+    """
+    cdef Py_ssize_t rowbytes = _check_rows(full, idx, packed)
+    cdef Py_ssize_t nrow = full.shape[0]
+    cdef Py_ssize_t nidx = idx.shape[0]
+    cdef char *pfull = full.data
+    cdef char *ppacked = packed.data
+    cdef int *pidx = <int*>idx.data
+    cdef Py_ssize_t it
+    cdef Py_ssize_t bad = -1
+    with nogil:
+        for it in range(nidx):
+            if pidx[it] < 0 or pidx[it] >= nrow:
+                bad = it
+                break
+            memcpy(pfull + pidx[it]*rowbytes, ppacked + it*rowbytes, rowbytes)
+    if bad >= 0:
+        raise IndexError("index %d out of %d rows" % (pidx[bad], nrow))
+
+
 cdef class Bound:
     """
     Data set of boundary-condition treatment.
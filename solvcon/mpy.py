@@ -78,6 +78,9 @@ class MPI(object):
     REQUEST_NULL = 0x2c000000
     ERRHANDLER_NULL = 0x14000000
 
+    # Number of int reserved for MPI_Status (MPICH uses 5).
+    STATUS_SIZE = 8
+
     # Results of the compare operations.
     IDENT = 0
     CONGRUENT = 1
@@ -436,6 +439,39 @@ class MPI(object):
             c_int(arr.nbytes), c_int(self.BYTE),
             c_int(src), c_int(tag), c_int(comm), byref(status))
 
+    def isendarr(self, arr, dst, tag, comm=None):
+        """
+        Post sending the array and return the request handle.
+        """
+        from ctypes import c_int, c_void_p, byref
+        comm = self.COMM_WORLD if comm is None else comm
+        request = c_int(self.REQUEST_NULL)
+        self.Isend(arr.ctypes.data_as(c_void_p),
+            c_int(arr.nbytes), c_int(self.BYTE),
+            c_int(dst), c_int(tag), c_int(comm), byref(request))
+        return request
+    def irecvarr(self, arr, src, tag, comm=None):
+        """
+        Post receiving into the array and return the request handle.
+        """
+        from ctypes import c_int, c_void_p, byref
+        comm = self.COMM_WORLD if comm is None else comm
+        request = c_int(self.REQUEST_NULL)
+        self.Irecv(arr.ctypes.data_as(c_void_p),
+            c_int(arr.nbytes), c_int(self.BYTE),
+            c_int(src), c_int(tag), c_int(comm), byref(request))
+        return request
+    def test(self, request):
+        from ctypes import c_int, byref
+        flag = c_int(0)
+        status = (c_int*self.STATUS_SIZE)()
+        self.Test(byref(request), byref(flag), status)
+        return bool(flag.value)
+    def wait(self, request):
+        from ctypes import c_int, byref
+        status = (c_int*self.STATUS_SIZE)()
+        self.Wait(byref(request), status)
+
 def main():
     import os, sys
     from random import choice, randint
@@ -40,7 +40,7 @@ __all__ = [
     'BulkCase',
     'BulkSolver',
     'MeshInfoHook', 'ProgressHook', 'CflAnchor', 'CflHook',
-    'MarchSaveAnchor', 'PMarchSave',
+    'MarchSaveAnchor', 'PMarchSave', 'MarchArchiveAnchor', 'PMarchArchive',
 ]
 
 
@@ -49,6 +49,7 @@ from .material import BulkFluid, fluids
 from .case import BulkCase
 from .solver import BulkSolver
 from .inout import (MeshInfoHook, ProgressHook, CflAnchor, CflHook,
-                    MarchSaveAnchor, PMarchSave)
+                    MarchSaveAnchor, PMarchSave, MarchArchiveAnchor,
+                    PMarchArchive)
 
 # vim: set ff=unix fenc=utf8 ft=python ai et sw=4 ts=4 tw=79:
@@ -62,9 +62,36 @@ cdef public:
         double *stm
         double *cfl
         double *ocfl
+    # sc_bulk_algorithm_t with single-precision arrays.
+    ctypedef struct sc_bulk_algorithm_float_t:
+        int neq
+        double time, time_increment
+        int alpha, taylor
+        double sigma0, cnbfac, sftfac, taumin, tauscale
+        float *cecnd
+        float *cevol
+        float *sfmrc
+        int ngroup, gdlen
+        float *grpda
+        float *bulk
+        float *dvisco
+        int nvec
+        float *amvec
+        double p0, rho0
+        float *sol
+        float *dsol
+        float *solt
+        float *soln
+        float *dsoln
+        float *stm
+        float *cfl
+        float *ocfl
 
 from solvcon.mesh cimport Mesh
 cdef class BulkAlgorithm(Mesh):
     cdef sc_bulk_algorithm_t *_alg
+    cdef sc_bulk_algorithm_float_t *_falg
+    cdef bint _single
+    cdef readonly object fpdtype
 
 # vim: set fenc=utf8 ft=pyrex ff=unix ai et sw=4 ts=4 tw=79:
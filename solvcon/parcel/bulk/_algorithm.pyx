@@ -27,7 +27,7 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 from solvcon.mesh cimport sc_mesh_t, sc_bound_t, Mesh, Bound
-from ._algorithm cimport sc_bulk_algorithm_t
+from ._algorithm cimport sc_bulk_algorithm_t, sc_bulk_algorithm_float_t
 import numpy as np
 cimport numpy as cnp
 
@@ -70,24 +70,143 @@ cdef extern:
         sc_mesh_t *msd, sc_bound_t *bcd, sc_bulk_algorithm_t *alg)
     void sc_bulk_bound_nonrefl_dsoln_3d(
         sc_mesh_t *msd, sc_bound_t *bcd, sc_bulk_algorithm_t *alg)
+    # single-precision instances.
+    void sc_bulk_prepare_ce_3d_float(
+        sc_mesh_t *msd, sc_bulk_algorithm_float_t *alg)
+    void sc_bulk_prepare_ce_2d_float(
+        sc_mesh_t *msd, sc_bulk_algorithm_float_t *alg)
+    void sc_bulk_prepare_sf_3d_float(
+        sc_mesh_t *msd, sc_bulk_algorithm_float_t *alg)
+    void sc_bulk_prepare_sf_2d_float(
+        sc_mesh_t *msd, sc_bulk_algorithm_float_t *alg)
+    void sc_bulk_process_physics_2d_float(
+        sc_mesh_t *msd, sc_bulk_algorithm_float_t *alg,
+        double gasconst, double *vel, double *vor, double *vorm, double *rho,
+        double *pre, double *sos, double *mac)
+    void sc_bulk_process_physics_3d_float(
+        sc_mesh_t *msd, sc_bulk_algorithm_float_t *alg,
+        double gasconst, double *vel, double *vor, double *vorm, double *rho,
+        double *pre, double *sos, double *mac)
+    void sc_bulk_calc_cfl_2d_float(
+        sc_mesh_t *msd, sc_bulk_algorithm_float_t *alg)
+    void sc_bulk_calc_cfl_3d_float(
+        sc_mesh_t *msd, sc_bulk_algorithm_float_t *alg)
+    void sc_bulk_calc_solt_2d_float(
+        sc_mesh_t *msd, sc_bulk_algorithm_float_t *alg)
+    void sc_bulk_calc_solt_3d_float(
+        sc_mesh_t *msd, sc_bulk_algorithm_float_t *alg)
+    void sc_bulk_calc_soln_2d_float(
+        sc_mesh_t *msd, sc_bulk_algorithm_float_t *alg)
+    void sc_bulk_calc_soln_3d_float(
+        sc_mesh_t *msd, sc_bulk_algorithm_float_t *alg)
+    void sc_bulk_calc_dsoln_2d_float(
+        sc_mesh_t *msd, sc_bulk_algorithm_float_t *alg)
+    void sc_bulk_calc_dsoln_3d_float(
+        sc_mesh_t *msd, sc_bulk_algorithm_float_t *alg)
+    void sc_bulk_ghostgeom_mirror_2d_float(
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_bulk_algorithm_float_t *alg)
+    void sc_bulk_ghostgeom_mirror_3d_float(
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_bulk_algorithm_float_t *alg)
+    void sc_bulk_bound_nonrefl_soln_2d_float(
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_bulk_algorithm_float_t *alg)
+    void sc_bulk_bound_nonrefl_soln_3d_float(
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_bulk_algorithm_float_t *alg)
+    void sc_bulk_bound_nonrefl_dsoln_2d_float(
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_bulk_algorithm_float_t *alg)
+    void sc_bulk_bound_nonrefl_dsoln_3d_float(
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_bulk_algorithm_float_t *alg)
 
 cdef extern from "stdlib.h":
     void* malloc(size_t size)
     void free(void* ptr)
 
+cdef void *_get_bodyaddr(cnp.ndarray arr, int ndim, int nghost=0,
+                         int nelm=-1) except NULL:
+    """
+    Return the address of the row next to the nghost leading (ghost) rows of
+    a C-contiguous array.  The array may be of float64 or float32; see
+    _set_array for assigning the address to the algorithm object.  Like a
+    typed buffer, the number of dimensions is checked against ndim,
+    and the number of rows against nelm unless it is negative.
+    """
+    if arr.ndim != ndim:
+        raise ValueError('array has %d dimensions (expected %d)' % (
+            arr.ndim, ndim))
+    if nelm >= 0 and arr.shape[0] != nelm:
+        raise ValueError('array has %d rows (expected %d)' % (
+            arr.shape[0], nelm))
+    if not arr.flags.c_contiguous:
+        raise ValueError('array is not C-contiguous')
+    return <void*>(arr.data + nghost*arr.strides[0])
+
+cdef inline void _set_array(double **dptr, float **fptr, void *addr,
+                            bint single):
+    """
+    Point the array member of the algorithm object of the precision in use
+    to addr, and clear that of the other precision.
+    """
+    if single:
+        dptr[0] = NULL
+        fptr[0] = <float*>addr
+    else:
+        dptr[0] = <double*>addr
+        fptr[0] = NULL
+
+cdef void _copy_scalars(sc_bulk_algorithm_t *alg,
+                        sc_bulk_algorithm_float_t *falg):
+    """
+    Copy the scalar members of the double-precision algorithm object to the
+    single-precision one.
+    """
+    falg.neq = alg.neq
+    falg.time = alg.time
+    falg.time_increment = alg.time_increment
+    falg.alpha = alg.alpha
+    falg.sigma0 = alg.sigma0
+    falg.taylor = alg.taylor
+    falg.cnbfac = alg.cnbfac
+    falg.sftfac = alg.sftfac
+    falg.taumin = alg.taumin
+    falg.tauscale = alg.tauscale
+    falg.ngroup = alg.ngroup
+    falg.gdlen = alg.gdlen
+    falg.nvec = alg.nvec
+    falg.p0 = alg.p0
+    falg.rho0 = alg.rho0
+
 cdef class BulkAlgorithm(Mesh):
     """
-    An algorithm class that does trivial calculation.
+    An algorithm class that does trivial calculation.  It runs the
+    single-precision instances of the kernels when the arrays of the solver
+    are float32 (see :py:attr:`fpdtype`).
     """
     def __cinit__(self):
         self._alg = <sc_bulk_algorithm_t *>malloc(sizeof(sc_bulk_algorithm_t))
+        self._falg = <sc_bulk_algorithm_float_t *>malloc(
+            sizeof(sc_bulk_algorithm_float_t))
+        self._single = False
 
     def __dealloc__(self):
         if NULL != self._alg:
             free(<void*>self._alg)
             self._alg = NULL
+        if NULL != self._falg:
+            free(<void*>self._falg)
+            self._falg = NULL
 
     def setup_algorithm(self, svr):
+        # floating-point type of the arrays.
+        self.fpdtype = np.dtype(svr.fpdtype)
+        if self.fpdtype == np.float32:
+            self._single = True
+        elif self.fpdtype == np.float64:
+            self._single = False
+        else:
+            raise TypeError('fpdtype %s is not supported' % self.fpdtype)
+        for name in ('cecnd', 'cevol', 'grpda', 'bulk', 'dvisco', 'amvec') \
+                + tuple(svr._solution_array_):
+            if getattr(svr, name).dtype != self.fpdtype:
+                raise TypeError('%s is not of %s' % (name, self.fpdtype))
         # equations number.
         self._alg.neq = svr.neq
         # temporal information.
@@ -105,112 +224,176 @@ cdef class BulkAlgorithm(Mesh):
         self._setup_cese_metrics(svr)
         self._setup_parameters(svr)
         self._setup_solutions(svr)
+        _copy_scalars(self._alg, self._falg)
 
     def _setup_cese_metrics(self, svr):
-        cdef cnp.ndarray[double, ndim=3, mode="c"] cecnd = svr.cecnd
-        self._alg.cecnd = &cecnd[self._msd.ngstcell,0,0]
-        cdef cnp.ndarray[double, ndim=2, mode="c"] cevol = svr.cevol
-        self._alg.cevol = &cevol[self._msd.ngstcell,0]
-        cdef cnp.ndarray[double, ndim=5, mode="c"] sfmrc = svr.sfmrc
-        self._alg.sfmrc = &sfmrc[0,0,0,0,0]
+        cdef void *addr
+        cdef int ngstcell = self._msd.ngstcell
+        cdef int nelm = ngstcell + self._msd.ncell
+        addr = _get_bodyaddr(svr.cecnd, 3, ngstcell, nelm)
+        _set_array(&self._alg.cecnd, &self._falg.cecnd, addr, self._single)
+        addr = _get_bodyaddr(svr.cevol, 2, ngstcell, nelm)
+        _set_array(&self._alg.cevol, &self._falg.cevol, addr, self._single)
+        if svr.sfmrc is not None:
+            addr = _get_bodyaddr(svr.sfmrc, 5, 0, self._msd.ncell)
+        else:
+            addr = NULL
+        _set_array(&self._alg.sfmrc, &self._falg.sfmrc, addr, self._single)
 
     def _setup_parameters(self, svr):
+        cdef void *addr
+        cdef int ngstcell = self._msd.ngstcell
+        cdef int nelm = ngstcell + self._msd.ncell
         # group data.
         self._alg.ngroup = svr.ngroup
         self._alg.gdlen = svr.gdlen
-        cdef cnp.ndarray[double, ndim=2, mode="c"] grpda = svr.grpda
         if 0 != svr.grpda.shape[1]:
-            self._alg.grpda = &grpda[0,0]
+            addr = _get_bodyaddr(svr.grpda, 2, 0, svr.ngroup)
         else:
-            self._alg.grpda = NULL
+            addr = NULL
+        _set_array(&self._alg.grpda, &self._falg.grpda, addr, self._single)
         # scalar parameter arrays.
-        cdef cnp.ndarray[double, ndim=1, mode="c"] bulk = svr.bulk
-        self._alg.bulk = &bulk[self._msd.ngstcell]
-        cdef cnp.ndarray[double, ndim=1, mode="c"] dvisco = svr.dvisco
-        self._alg.dvisco = &dvisco[self._msd.ngstcell]
+        addr = _get_bodyaddr(svr.bulk, 1, ngstcell, nelm)
+        _set_array(&self._alg.bulk, &self._falg.bulk, addr, self._single)
+        addr = _get_bodyaddr(svr.dvisco, 1, ngstcell, nelm)
+        _set_array(&self._alg.dvisco, &self._falg.dvisco, addr, self._single)
         # vector parameter arrays.
         self._alg.nvec = svr.amvec.shape[1]
-        cdef cnp.ndarray[double, ndim=3, mode="c"] amvec = svr.amvec
         if 0 != svr.amvec.shape[1]:
-            self._alg.amvec = &amvec[self._msd.ngstcell,0,0]
+            addr = _get_bodyaddr(svr.amvec, 3, ngstcell, nelm)
         else:
-            self._alg.amvec = NULL
+            addr = NULL
+        _set_array(&self._alg.amvec, &self._falg.amvec, addr, self._single)
         # constant parameters.
         self._alg.p0 = svr.p0
         self._alg.rho0 = svr.rho0
 
     def _setup_solutions(self, svr):
-        cdef cnp.ndarray[double, ndim=2, mode="c"] sol = svr.sol
-        self._alg.sol = &sol[self._msd.ngstcell,0]
-        cdef cnp.ndarray[double, ndim=2, mode="c"] soln = svr.soln
-        self._alg.soln = &soln[self._msd.ngstcell,0]
-        cdef cnp.ndarray[double, ndim=2, mode="c"] solt = svr.solt
-        self._alg.solt = &solt[self._msd.ngstcell,0]
-        cdef cnp.ndarray[double, ndim=3, mode="c"] dsol = svr.dsol
-        self._alg.dsol = &dsol[self._msd.ngstcell,0,0]
-        cdef cnp.ndarray[double, ndim=3, mode="c"] dsoln = svr.dsoln
-        self._alg.dsoln = &dsoln[self._msd.ngstcell,0,0]
-        cdef cnp.ndarray[double, ndim=2, mode="c"] stm = svr.stm
-        self._alg.stm = &stm[self._msd.ngstcell,0]
-        cdef cnp.ndarray[double, ndim=1, mode="c"] cfl = svr.cfl
-        self._alg.cfl = &cfl[self._msd.ngstcell]
-        cdef cnp.ndarray[double, ndim=1, mode="c"] ocfl = svr.ocfl
-        self._alg.ocfl = &ocfl[self._msd.ngstcell]
+        cdef void *addr
+        cdef int ngstcell = self._msd.ngstcell
+        cdef int nelm = ngstcell + self._msd.ncell
+        addr = _get_bodyaddr(svr.sol, 2, ngstcell, nelm)
+        _set_array(&self._alg.sol, &self._falg.sol, addr, self._single)
+        addr = _get_bodyaddr(svr.soln, 2, ngstcell, nelm)
+        _set_array(&self._alg.soln, &self._falg.soln, addr, self._single)
+        addr = _get_bodyaddr(svr.solt, 2, ngstcell, nelm)
+        _set_array(&self._alg.solt, &self._falg.solt, addr, self._single)
+        addr = _get_bodyaddr(svr.dsol, 3, ngstcell, nelm)
+        _set_array(&self._alg.dsol, &self._falg.dsol, addr, self._single)
+        addr = _get_bodyaddr(svr.dsoln, 3, ngstcell, nelm)
+        _set_array(&self._alg.dsoln, &self._falg.dsoln, addr, self._single)
+        addr = _get_bodyaddr(svr.stm, 2, ngstcell, nelm)
+        _set_array(&self._alg.stm, &self._falg.stm, addr, self._single)
+        addr = _get_bodyaddr(svr.cfl, 1, ngstcell, nelm)
+        _set_array(&self._alg.cfl, &self._falg.cfl, addr, self._single)
+        addr = _get_bodyaddr(svr.ocfl, 1, ngstcell, nelm)
+        _set_array(&self._alg.ocfl, &self._falg.ocfl, addr, self._single)
 
     def prepare_ce(self):
-        if self._msd.ndim == 3:
+        if self._single:
+            if self._msd.ndim == 3:
+                sc_bulk_prepare_ce_3d_float(self._msd, self._falg)
+            else:
+                sc_bulk_prepare_ce_2d_float(self._msd, self._falg)
+        elif self._msd.ndim == 3:
             sc_bulk_prepare_ce_3d(self._msd, self._alg)
         else:
             sc_bulk_prepare_ce_2d(self._msd, self._alg)
 
     def prepare_sf(self):
-        if self._msd.ndim == 3:
+        if self._single:
+            if self._msd.ndim == 3:
+                sc_bulk_prepare_sf_3d_float(self._msd, self._falg)
+            else:
+                sc_bulk_prepare_sf_2d_float(self._msd, self._falg)
+        elif self._msd.ndim == 3:
             sc_bulk_prepare_sf_3d(self._msd, self._alg)
         else:
             sc_bulk_prepare_sf_2d(self._msd, self._alg)
 
     def update(self, time, time_increment):
-        self._alg.time = time
-        self._alg.time_increment = time_increment
+        self._alg.time = self._falg.time = time
+        self._alg.time_increment = self._falg.time_increment = time_increment
 
     def calc_cfl(self):
-        if self._msd.ndim == 3:
+        if self._single:
+            if self._msd.ndim == 3:
+                sc_bulk_calc_cfl_3d_float(self._msd, self._falg)
+            else:
+                sc_bulk_calc_cfl_2d_float(self._msd, self._falg)
+        elif self._msd.ndim == 3:
             sc_bulk_calc_cfl_3d(self._msd, self._alg)
         else:
             sc_bulk_calc_cfl_2d(self._msd, self._alg)
 
     def calc_solt(self):
-        if self._msd.ndim == 3:
+        if self._single:
+            if self._msd.ndim == 3:
+                sc_bulk_calc_solt_3d_float(self._msd, self._falg)
+            else:
+                sc_bulk_calc_solt_2d_float(self._msd, self._falg)
+        elif self._msd.ndim == 3:
             sc_bulk_calc_solt_3d(self._msd, self._alg)
         else:
             sc_bulk_calc_solt_2d(self._msd, self._alg)
 
     def calc_soln(self):
-        if self._msd.ndim == 3:
+        if self._single:
+            if self._msd.ndim == 3:
+                sc_bulk_calc_soln_3d_float(self._msd, self._falg)
+            else:
+                sc_bulk_calc_soln_2d_float(self._msd, self._falg)
+        elif self._msd.ndim == 3:
             sc_bulk_calc_soln_3d(self._msd, self._alg)
         else:
             sc_bulk_calc_soln_2d(self._msd, self._alg)
 
     def calc_dsoln(self):
-        if self._msd.ndim == 3:
+        if self._single:
+            if self._msd.ndim == 3:
+                sc_bulk_calc_dsoln_3d_float(self._msd, self._falg)
+            else:
+                sc_bulk_calc_dsoln_2d_float(self._msd, self._falg)
+        elif self._msd.ndim == 3:
             sc_bulk_calc_dsoln_3d(self._msd, self._alg)
         else:
             sc_bulk_calc_dsoln_2d(self._msd, self._alg)
 
     def ghostgeom_mirror(self, Bound bcd):
-        if self._msd.ndim == 3:
+        if self._single:
+            if self._msd.ndim == 3:
+                sc_bulk_ghostgeom_mirror_3d_float(
+                    self._msd, bcd._bcd, self._falg)
+            else:
+                sc_bulk_ghostgeom_mirror_2d_float(
+                    self._msd, bcd._bcd, self._falg)
+        elif self._msd.ndim == 3:
             sc_bulk_ghostgeom_mirror_3d(self._msd, bcd._bcd, self._alg)
         else:
             sc_bulk_ghostgeom_mirror_2d(self._msd, bcd._bcd, self._alg)
 
     def bound_nonrefl_soln(self, Bound bcd):
-        if self._msd.ndim == 3:
+        if self._single:
+            if self._msd.ndim == 3:
+                sc_bulk_bound_nonrefl_soln_3d_float(
+                    self._msd, bcd._bcd, self._falg)
+            else:
+                sc_bulk_bound_nonrefl_soln_2d_float(
+                    self._msd, bcd._bcd, self._falg)
+        elif self._msd.ndim == 3:
             sc_bulk_bound_nonrefl_soln_3d(self._msd, bcd._bcd, self._alg)
         else:
             sc_bulk_bound_nonrefl_soln_2d(self._msd, bcd._bcd, self._alg)
 
     def bound_nonrefl_dsoln(self, Bound bcd):
-        if self._msd.ndim == 3:
+        if self._single:
+            if self._msd.ndim == 3:
+                sc_bulk_bound_nonrefl_dsoln_3d_float(
+                    self._msd, bcd._bcd, self._falg)
+            else:
+                sc_bulk_bound_nonrefl_dsoln_2d_float(
+                    self._msd, bcd._bcd, self._falg)
+        elif self._msd.ndim == 3:
             sc_bulk_bound_nonrefl_dsoln_3d(self._msd, bcd._bcd, self._alg)
         else:
             sc_bulk_bound_nonrefl_dsoln_2d(self._msd, bcd._bcd, self._alg)
@@ -33,22 +33,47 @@
 #include "mesh.h"
 #include "_algorithm.h"
 
+#endif // __SC_BULK__ALGORITHM_SRC_H__
+
+/*
+ * Everything below is read again when SC_BULK_FLOAT is toggled, so that the
+ * kernel bodies can be compiled once for each element type of the arrays in
+ * the algorithm object.  FPTYPE is that element type and SC_BULK_ALG_T the
+ * matching algorithm type; SC_BULK_KERNEL() appends _float to the kernel
+ * names of the single-precision instances.
+ */
+#undef FPTYPE
+#undef SC_BULK_ALG_T
+#undef SC_BULK_KERNEL
+#ifdef SC_BULK_FLOAT
+#define FPTYPE float
+#define SC_BULK_ALG_T sc_bulk_algorithm_float_t
+#define SC_BULK_KERNEL(name) name ## _float
+#else
+#define FPTYPE double
+#define SC_BULK_ALG_T sc_bulk_algorithm_t
+#define SC_BULK_KERNEL(name) name
+#endif
+
 #undef NDIM
 #define NDIM 2
 #undef NEQ
 #define NEQ 3
-void sc_bulk_calc_jaco_2d(sc_mesh_t *msd, sc_bulk_algorithm_t *alg,
+void SC_BULK_KERNEL(sc_bulk_calc_jaco_2d)(sc_mesh_t *msd, SC_BULK_ALG_T *alg,
     int icl, double fcn[NEQ][NDIM], double jacos[NEQ][NEQ][NDIM]);
-void sc_bulk_calc_dif_2d(sc_mesh_t *msd, sc_bulk_algorithm_t *alg,
+void SC_BULK_KERNEL(sc_bulk_calc_dif_2d)(sc_mesh_t *msd, SC_BULK_ALG_T *alg,
     int icl, double difs[NEQ][NDIM]);
+void SC_BULK_KERNEL(sc_bulk_calc_sfmrc_2d)(sc_mesh_t *msd, SC_BULK_ALG_T *alg,
+    int icl, int ifl, FPTYPE sfmrc[FCMND][2][NDIM]);
 #undef NDIM
 #define NDIM 3
 #undef NEQ
 #define NEQ 4
-void sc_bulk_calc_jaco_3d(sc_mesh_t *msd, sc_bulk_algorithm_t *alg,
+void SC_BULK_KERNEL(sc_bulk_calc_jaco_3d)(sc_mesh_t *msd, SC_BULK_ALG_T *alg,
     int icl, double fcn[NEQ][NDIM], double jacos[NEQ][NEQ][NDIM]);
-void sc_bulk_calc_dif_3d(sc_mesh_t *msd, sc_bulk_algorithm_t *alg,
+void SC_BULK_KERNEL(sc_bulk_calc_dif_3d)(sc_mesh_t *msd, SC_BULK_ALG_T *alg,
     int icl, double difs[NEQ][NDIM]);
+void SC_BULK_KERNEL(sc_bulk_calc_sfmrc_3d)(sc_mesh_t *msd, SC_BULK_ALG_T *alg,
+    int icl, int ifl, FPTYPE sfmrc[FCMND][2][NDIM]);
 
 // vim: set ft=c ts=4 et:
-#endif // __SC_BULK__ALGORITHM_SRC_H__
@@ -57,6 +57,10 @@ class BulkCase(case.MeshCase):
         'solver.rho0': None,
         'solver.fluids': None,
         'solver.velocities': None,
+        # Floating-point type of the solver arrays; 'float32' runs the
+        # single-precision kernels.  Independent of execution.fpdtype,
+        # which is the type of the output.
+        'solver.arrdtype': 'float64',
     }
     def make_solver_keywords(self):
         kw = super(BulkCase, self).make_solver_keywords()
@@ -65,6 +69,7 @@ class BulkCase(case.MeshCase):
         kw['neq'] = self.execution.neq = neq
         kw['time'] = self.execution.time
         kw['time_increment'] = self.execution.time_increment
+        kw['fpdtype'] = str(self.solver.arrdtype)
         # c-tau scheme parameters.
         kw['alpha'] = int(self.solver.alpha)
         for key in ('sigma0', 'taylor', 'cnbfac', 'sftfac',
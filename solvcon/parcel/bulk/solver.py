@@ -48,7 +48,7 @@ class BulkSolver(solver.MeshSolver):
     <._algorithm.BulkAlgorithm>`.
     """
 
-    _interface_init_ = ['cecnd', 'cevol', 'sfmrc']
+    _interface_init_ = ['cecnd', 'cevol']
     _solution_array_ = ['solt', 'sol', 'soln', 'dsol', 'dsoln']
 
     def __init__(self, blk, **kw):
@@ -71,7 +71,9 @@ class BulkSolver(solver.MeshSolver):
         ndim = blk.ndim
         ncell = blk.ncell
         ngstcell = blk.ngstcell
-        fpdtype = 'float64'
+        # float64 arrays by default; float32 trades precision for half the
+        # memory traffic.
+        self.fpdtype = fpdtype = np.dtype(kw.pop('fpdtype', 'float64'))
         # scheme parameters.
         self.alpha = int(kw.pop('alpha', 1))
         self.sigma0 = int(kw.pop('sigma0', 3.0))
@@ -80,6 +82,8 @@ class BulkSolver(solver.MeshSolver):
         self.sftfac = float(kw.pop('sftfac', 1.0))  # dirty hack.
         self.taumin = float(kw.pop('taumin', 0.0))
         self.tauscale = float(kw.pop('tauscale', 1.0))
+        # store sub-face metrics, or calculate them on the fly in calc_soln.
+        self.storesf = bool(kw.pop('storesf', True))
         # physical parameters.
         self.p0 = float(kw.pop('p0'))
         self.rho0 = float(kw.pop('rho0'))
@@ -94,8 +98,8 @@ class BulkSolver(solver.MeshSolver):
             (ngstcell+ncell, blk.CLMFC+1, ndim), dtype=fpdtype)
         self.cevol = np.empty(
             (ngstcell+ncell, blk.CLMFC+1), dtype=fpdtype)
-        self.sfmrc = np.empty(
-            (ncell, blk.CLMFC, blk.FCMND, 2, ndim), dtype=fpdtype)
+        self.sfmrc = np.empty((ncell, blk.CLMFC, blk.FCMND, 2, ndim),
+            dtype=fpdtype) if self.storesf else None
         # parameters.
         self.grpda = np.empty((self.ngroup, 0), dtype=fpdtype)
         self.bulk = np.empty(ngstcell+ncell, dtype=fpdtype)
@@ -131,9 +135,10 @@ class BulkSolver(solver.MeshSolver):
         super(BulkSolver, self).init(**kw)
         self._debug_check_array('soln', 'dsoln')
         # prepare sub-face metric data.
-        self.sfmrc.fill(0.0)
-        self.alg.prepare_sf()
-        self._debug_check_array('sfmrc')
+        if self.storesf:
+            self.sfmrc.fill(0.0)
+            self.alg.prepare_sf()
+            self._debug_check_array('sfmrc')
 
     def provide(self):
         """
@@ -189,8 +194,8 @@ class BulkSolver(solver.MeshSolver):
     def update(self, worker=None):
         self._debug_check_array('soln', 'dsoln')
         self.alg.update(self.time, self.time_increment)
-        self.sol[:,:] = self.soln[:,:]
-        self.dsol[:,:,:] = self.dsoln[:,:,:]
+        if self.update_solutions():
+            self.alg._setup_solutions(self)
         self._debug_check_array('sol', 'dsol')
 
     @_MMNAMES.register
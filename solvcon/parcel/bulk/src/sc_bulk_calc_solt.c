@@ -45,4 +45,19 @@
 #define NEQ 4
 #include "sc_bulk_calc_solt.c_body"
 
+// single-precision instances.
+#define SC_BULK_FLOAT
+#include "_algorithm_src.h"
+#undef NDIM
+#define NDIM 2
+#undef NEQ
+#define NEQ 3
+#include "sc_bulk_calc_solt.c_body"
+#undef NDIM
+#define NDIM 3
+#undef NEQ
+#define NEQ 4
+#include "sc_bulk_calc_solt.c_body"
+#undef SC_BULK_FLOAT
+
 // vim: set ts=4 et:
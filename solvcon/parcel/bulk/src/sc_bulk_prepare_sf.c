@@ -43,4 +43,15 @@
 #define NDIM 3
 #include "sc_bulk_prepare_sf.c_body"
 
+// single-precision instances.
+#define SC_BULK_FLOAT
+#include "_algorithm_src.h"
+#undef NDIM
+#define NDIM 2
+#include "sc_bulk_prepare_sf.c_body"
+#undef NDIM
+#define NDIM 3
+#include "sc_bulk_prepare_sf.c_body"
+#undef SC_BULK_FLOAT
+
 // vim: set ft=cuda ts=4 et:
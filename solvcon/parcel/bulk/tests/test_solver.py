@@ -0,0 +1,44 @@
+import unittest
+
+from solvcon import testing
+
+from .. import solver
+
+class TestBulkSolver(unittest.TestCase):
+    @staticmethod
+    def _march(storesf=True, fpdtype='float64'):
+        from .. import material
+        def create(blk):
+            blk.shclgrp.fill(0)
+            return solver.BulkSolver(blk, p0=1.0, rho0=1.0,
+                fluids=[material.fluids.air]*len(blk.grpnames),
+                storesf=storesf, fpdtype=fpdtype)
+        def perturb(svr, rng):
+            svr.provide()
+            svr.soln[:,0] *= 1.0 + 0.01*rng.rand(svr.soln.shape[0])
+            svr.sol[:] = svr.soln
+        return testing.march_oblique_neu(solver.BulkNonrefl, create, perturb,
+                                         1.e-6)
+
+    def test_float32(self):
+        import numpy as np
+        dsvr = self._march()
+        fsvr = self._march(fpdtype='float32')
+        self.assertEqual(np.float32, fsvr.alg.fpdtype)
+        for name in ('cecnd', 'sfmrc', 'bulk', 'sol', 'soln', 'dsoln'):
+            self.assertEqual(np.float32, getattr(fsvr, name).dtype)
+        # the solution only loses the precision of float32.
+        for name in ('sol', 'soln'):
+            self.assertTrue(np.isfinite(getattr(dsvr, name)).all())
+            self.assertTrue(np.allclose(getattr(fsvr, name),
+                                        getattr(dsvr, name), atol=1.e-5))
+
+    def test_shape_check(self):
+        import numpy as np
+        svr = self._march()
+        svr.soln = np.empty(svr.soln.shape[:1], dtype=svr.soln.dtype)
+        self.assertRaises(ValueError, svr.alg.setup_algorithm, svr)
+        svr.soln = np.empty((1, svr.neq), dtype=svr.sol.dtype)
+        self.assertRaises(ValueError, svr.alg.setup_algorithm, svr)
+
+# vim: set ff=unix fenc=utf8 nobomb et sw=4 ts=4 tw=79:
@@ -35,7 +35,7 @@ The following example shows the content of this module:
 
 >>> from solvcon.parcel import gas
 >>> len(gas.__all__)
-16
+17
 >>> [getattr(gas, nm) for nm in gas.__all__] # doctest: +NORMALIZE_WHITESPACE
 [<class 'solvcon.parcel.gas.case.GasCase'>,
  <bound method CaseInfoMeta.register_arrangement of
@@ -53,6 +53,7 @@ The following example shows the content of this module:
  <class 'solvcon.parcel.gas.inout.FillAnchor'>,
  <class 'solvcon.parcel.gas.inout.CflHook'>,
  <class 'solvcon.parcel.gas.inout.PMarchSave'>,
+ <class 'solvcon.parcel.gas.inout.PMarchArchive'>,
  <class 'solvcon.parcel.gas.oblique_shock.ObliqueShockRelation'>]
 """
 
@@ -94,7 +95,7 @@ _include(names=['GasBC', 'GasNonrefl', 'GasWall', 'GasInlet'],
 _include(names=['ProbeHook'], frommod='.probe')
 _include(names=['DensityInitAnchor', 'PhysicsAnchor'], frommod='.physics')
 _include(names=['MeshInfoHook', 'ProgressHook', 'FillAnchor', 'CflHook',
-                'PMarchSave'], frommod='.inout')
+                'PMarchSave', 'PMarchArchive'], frommod='.inout')
 _include(names=['ObliqueShockRelation'], frommod='.oblique_shock')
 
 # vim: set ff=unix fenc=utf8 ft=python ai et sw=4 ts=4 tw=79:
@@ -58,9 +58,35 @@ cdef public:
         double *stm
         double *cfl
         double *ocfl
+    # sc_gas_algorithm_t with arrays of single precision.
+    ctypedef struct sc_gas_algorithm_float_t:
+        int neq
+        double time, time_increment
+        int alpha
+        double sigma0, taylor, cnbfac, sftfac, taumin, tauscale
+        float *cecnd
+        float *cevol
+        float *sfmrc
+        int ngroup, gdlen
+        float *grpda
+        int nsca
+        float *amsca
+        int nvec
+        float *amvec
+        float *sol
+        float *dsol
+        float *solt
+        float *soln
+        float *dsoln
+        float *stm
+        float *cfl
+        float *ocfl
 
 from solvcon.mesh cimport Mesh
 cdef class GasAlgorithm(Mesh):
     cdef sc_gas_algorithm_t *_alg
+    cdef sc_gas_algorithm_float_t *_falg
+    cdef bint _single
+    cdef readonly object fpdtype
 
 # vim: set fenc=utf8 ft=pyrex ff=unix ai et sw=4 ts=4 tw=79:
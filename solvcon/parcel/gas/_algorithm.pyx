@@ -28,7 +28,7 @@
 
 from libc.stdlib cimport malloc, free
 from solvcon.mesh cimport sc_mesh_t, sc_bound_t, Mesh, Bound
-from ._algorithm cimport sc_gas_algorithm_t
+from ._algorithm cimport sc_gas_algorithm_t, sc_gas_algorithm_float_t
 import numpy as np
 cimport numpy as cnp
 
@@ -108,21 +108,148 @@ cdef extern:
         sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_t *alg)
     void sc_gas_bound_inlet_dsoln_3d(
         sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_t *alg)
+    # single-precision instances.
+    void sc_gas_prepare_ce_3d_float(
+        sc_mesh_t *msd, sc_gas_algorithm_float_t *alg)
+    void sc_gas_prepare_ce_2d_float(
+        sc_mesh_t *msd, sc_gas_algorithm_float_t *alg)
+    void sc_gas_prepare_sf_3d_float(
+        sc_mesh_t *msd, sc_gas_algorithm_float_t *alg)
+    void sc_gas_prepare_sf_2d_float(
+        sc_mesh_t *msd, sc_gas_algorithm_float_t *alg)
+    void sc_gas_process_physics_2d_float(
+        sc_mesh_t *msd, sc_gas_algorithm_float_t *alg,
+        double gasconst,
+        double *vel, double *vor, double *vorm, double *rho, double *pre,
+        double *tem, double *ken, double *sos, double *mac)
+    void sc_gas_process_physics_3d_float(
+        sc_mesh_t *msd, sc_gas_algorithm_float_t *alg,
+        double gasconst,
+        double *vel, double *vor, double *vorm, double *rho, double *pre,
+        double *tem, double *ken, double *sos, double *mac)
+    void sc_gas_process_schlieren_rhog_2d_float(
+        sc_mesh_t *msd, sc_gas_algorithm_float_t *alg, double *rhog)
+    void sc_gas_process_schlieren_rhog_3d_float(
+        sc_mesh_t *msd, sc_gas_algorithm_float_t *alg, double *rhog)
+    void sc_gas_process_schlieren_sch_2d_float(
+        sc_mesh_t *msd, sc_gas_algorithm_float_t *alg,
+        double k, double k0, double k1, double rhogmax, double *sch)
+    void sc_gas_process_schlieren_sch_3d_float(
+        sc_mesh_t *msd, sc_gas_algorithm_float_t *alg,
+        double k, double k0, double k1, double rhogmax, double *sch)
+    void sc_gas_calc_cfl_2d_float(
+        sc_mesh_t *msd, sc_gas_algorithm_float_t *alg)
+    void sc_gas_calc_cfl_3d_float(
+        sc_mesh_t *msd, sc_gas_algorithm_float_t *alg)
+    void sc_gas_calc_solt_2d_float(
+        sc_mesh_t *msd, sc_gas_algorithm_float_t *alg)
+    void sc_gas_calc_solt_3d_float(
+        sc_mesh_t *msd, sc_gas_algorithm_float_t *alg)
+    void sc_gas_calc_soln_2d_float(
+        sc_mesh_t *msd, sc_gas_algorithm_float_t *alg)
+    void sc_gas_calc_soln_3d_float(
+        sc_mesh_t *msd, sc_gas_algorithm_float_t *alg)
+    void sc_gas_calc_dsoln_2d_float(
+        sc_mesh_t *msd, sc_gas_algorithm_float_t *alg)
+    void sc_gas_calc_dsoln_3d_float(
+        sc_mesh_t *msd, sc_gas_algorithm_float_t *alg)
+    void sc_gas_ghostgeom_mirror_2d_float(
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_float_t *alg)
+    void sc_gas_ghostgeom_mirror_3d_float(
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_float_t *alg)
+    void sc_gas_bound_nonrefl_soln_2d_float(
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_float_t *alg)
+    void sc_gas_bound_nonrefl_soln_3d_float(
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_float_t *alg)
+    void sc_gas_bound_nonrefl_dsoln_2d_float(
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_float_t *alg)
+    void sc_gas_bound_nonrefl_dsoln_3d_float(
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_float_t *alg)
+    void sc_gas_bound_wall_soln_2d_float(
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_float_t *alg)
+    void sc_gas_bound_wall_soln_3d_float(
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_float_t *alg)
+    void sc_gas_bound_wall_dsoln_2d_float(
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_float_t *alg)
+    void sc_gas_bound_wall_dsoln_3d_float(
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_float_t *alg)
+    void sc_gas_bound_inlet_soln_2d_float(
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_float_t *alg)
+    void sc_gas_bound_inlet_soln_3d_float(
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_float_t *alg)
+    void sc_gas_bound_inlet_dsoln_2d_float(
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_float_t *alg)
+    void sc_gas_bound_inlet_dsoln_3d_float(
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_float_t *alg)
 
 
+cdef inline void _set_array(double **dptr, float **fptr, void *addr,
+                            bint single):
+    """
+    Point the array member of the algorithm object of the precision in use
+    to addr, and clear that of the other precision.
+    """
+    if single:
+        dptr[0] = NULL
+        fptr[0] = <float*>addr
+    else:
+        dptr[0] = <double*>addr
+        fptr[0] = NULL
+
+cdef void _copy_scalars(sc_gas_algorithm_t *alg,
+                        sc_gas_algorithm_float_t *falg):
+    """
+    Copy the scalar members of the double-precision algorithm object to the
+    single-precision one.
+    """
+    falg.neq = alg.neq
+    falg.time = alg.time
+    falg.time_increment = alg.time_increment
+    falg.alpha = alg.alpha
+    falg.sigma0 = alg.sigma0
+    falg.taylor = alg.taylor
+    falg.cnbfac = alg.cnbfac
+    falg.sftfac = alg.sftfac
+    falg.taumin = alg.taumin
+    falg.tauscale = alg.tauscale
+    falg.ngroup = alg.ngroup
+    falg.gdlen = alg.gdlen
+    falg.nsca = alg.nsca
+    falg.nvec = alg.nvec
+
 cdef class GasAlgorithm(Mesh):
     """
-    An algorithm class that does trivial calculation.
+    An algorithm class that does trivial calculation.  The arrays of the
+    solver may be of either float64 or float32 (:py:attr:`fpdtype`), and the
+    latter are processed by the single-precision instances of the kernels.
     """
     def __cinit__(self):
         self._alg = <sc_gas_algorithm_t *>malloc(sizeof(sc_gas_algorithm_t))
+        self._falg = <sc_gas_algorithm_float_t *>malloc(
+            sizeof(sc_gas_algorithm_float_t))
+        self._single = False
 
     def __dealloc__(self):
         if NULL != self._alg:
             free(<void*>self._alg)
             self._alg = NULL
+        if NULL != self._falg:
+            free(<void*>self._falg)
+            self._falg = NULL
 
     def setup_algorithm(self, svr):
+        # floating-point type of the arrays.
+        self.fpdtype = np.dtype(svr.fpdtype)
+        if self.fpdtype == np.float32:
+            self._single = True
+        elif self.fpdtype == np.float64:
+            self._single = False
+        else:
+            raise TypeError('fpdtype %s is not supported' % self.fpdtype)
+        for name in ('cecnd', 'cevol', 'grpda', 'amsca', 'amvec') \
+                + tuple(svr._solution_array_):
+            if getattr(svr, name).dtype != self.fpdtype:
+                raise TypeError('%s is not of %s' % (name, self.fpdtype))
         # equations number.
         self._alg.neq = svr.neq
         # temporal information.
@@ -140,34 +267,57 @@ cdef class GasAlgorithm(Mesh):
         self._setup_cese_metrics(svr)
         self._setup_parameters(svr)
         self._setup_solutions(svr)
+        _copy_scalars(self._alg, self._falg)
 
     def _setup_cese_metrics(self, svr):
-        self._alg.cecnd = <double*>self._get_table_bodyaddr(svr.tbcecnd)
-        self._alg.cevol = <double*>self._get_table_bodyaddr(svr.tbcevol)
-        self._alg.sfmrc = <double*>self._get_table_bodyaddr(svr.tbsfmrc)
+        cdef void *addr
+        addr = self._get_table_bodyaddr(svr.tbcecnd)
+        _set_array(&self._alg.cecnd, &self._falg.cecnd, addr, self._single)
+        addr = self._get_table_bodyaddr(svr.tbcevol)
+        _set_array(&self._alg.cevol, &self._falg.cevol, addr, self._single)
+        if svr.tbsfmrc is not None:
+            addr = self._get_table_bodyaddr(svr.tbsfmrc)
+            _set_array(&self._alg.sfmrc, &self._falg.sfmrc, addr,
+                       self._single)
+        else:
+            _set_array(&self._alg.sfmrc, &self._falg.sfmrc, NULL,
+                       self._single)
 
     def _setup_parameters(self, svr):
+        cdef void *addr
         # group data.
         self._alg.ngroup = svr.ngroup
         self._alg.gdlen = svr.gdlen
         cdef cnp.ndarray grpda = svr.grpda
-        self._alg.grpda = <double*>grpda.data
+        addr = grpda.data
+        _set_array(&self._alg.grpda, &self._falg.grpda, addr, self._single)
         # scalar parameters.
         self._alg.nsca = svr.amsca.shape[1]
-        self._alg.amsca = <double*>self._get_table_bodyaddr(svr.tbamsca)
+        addr = self._get_table_bodyaddr(svr.tbamsca)
+        _set_array(&self._alg.amsca, &self._falg.amsca, addr, self._single)
         # vector parameters.
         self._alg.nvec = svr.amvec.shape[1]
-        self._alg.amvec = <double*>self._get_table_bodyaddr(svr.tbamvec)
+        addr = self._get_table_bodyaddr(svr.tbamvec)
+        _set_array(&self._alg.amvec, &self._falg.amvec, addr, self._single)
 
     def _setup_solutions(self, svr):
-        self._alg.sol = <double*>self._get_table_bodyaddr(svr.tbsol)
-        self._alg.soln = <double*>self._get_table_bodyaddr(svr.tbsoln)
-        self._alg.solt = <double*>self._get_table_bodyaddr(svr.tbsolt)
-        self._alg.dsol = <double*>self._get_table_bodyaddr(svr.tbdsol)
-        self._alg.dsoln = <double*>self._get_table_bodyaddr(svr.tbdsoln)
-        self._alg.stm = <double*>self._get_table_bodyaddr(svr.tbstm)
-        self._alg.cfl = <double*>self._get_table_bodyaddr(svr.tbcfl)
-        self._alg.ocfl = <double*>self._get_table_bodyaddr(svr.tbocfl)
+        cdef void *addr
+        addr = self._get_table_bodyaddr(svr.tbsol)
+        _set_array(&self._alg.sol, &self._falg.sol, addr, self._single)
+        addr = self._get_table_bodyaddr(svr.tbsoln)
+        _set_array(&self._alg.soln, &self._falg.soln, addr, self._single)
+        addr = self._get_table_bodyaddr(svr.tbsolt)
+        _set_array(&self._alg.solt, &self._falg.solt, addr, self._single)
+        addr = self._get_table_bodyaddr(svr.tbdsol)
+        _set_array(&self._alg.dsol, &self._falg.dsol, addr, self._single)
+        addr = self._get_table_bodyaddr(svr.tbdsoln)
+        _set_array(&self._alg.dsoln, &self._falg.dsoln, addr, self._single)
+        addr = self._get_table_bodyaddr(svr.tbstm)
+        _set_array(&self._alg.stm, &self._falg.stm, addr, self._single)
+        addr = self._get_table_bodyaddr(svr.tbcfl)
+        _set_array(&self._alg.cfl, &self._falg.cfl, addr, self._single)
+        addr = self._get_table_bodyaddr(svr.tbocfl)
+        _set_array(&self._alg.ocfl, &self._falg.ocfl, addr, self._single)
 
     def locate_point(self, crd):
         # FIXME: Blindly taking an ndarray object is dangerous.  Use a local C
@@ -206,7 +356,22 @@ cdef class GasAlgorithm(Mesh):
         assert self._msd.ncell + self._msd.ngstcell == _a.shape[0]
         cdef cnp.ndarray[double, ndim=1, mode="c"] _M = M
         assert self._msd.ncell + self._msd.ngstcell == _M.shape[0]
-        if self._msd.ndim == 3:
+        if self._single:
+            if self._msd.ndim == 3:
+                assert 3 == _v.shape[1]
+                assert 3 == _w.shape[1]
+                sc_gas_process_physics_3d_float(
+                    self._msd, self._falg, _gasconst, &_v[0,0], &_w[0,0],
+                    &_wm[0], &_rho[0], &_p[0], &_T[0], &_ke[0], &_a[0],
+                    &_M[0])
+            else:
+                assert 2 == _v.shape[1]
+                assert 2 == _w.shape[1]
+                sc_gas_process_physics_2d_float(
+                    self._msd, self._falg, _gasconst, &_v[0,0], &_w[0,0],
+                    &_wm[0], &_rho[0], &_p[0], &_T[0], &_ke[0], &_a[0],
+                    &_M[0])
+        elif self._msd.ndim == 3:
             assert 3 == _v.shape[1]
             assert 3 == _w.shape[1]
             sc_gas_process_physics_3d(
@@ -223,7 +388,14 @@ cdef class GasAlgorithm(Mesh):
         # FIXME: Refactor this error-prone array address manipulation.
         cdef cnp.ndarray[double, ndim=1, mode="c"] _sch = sch
         assert self._msd.ncell + self._msd.ngstcell == _sch.shape[0]
-        if self._msd.ndim == 3:
+        if self._single:
+            if self._msd.ndim == 3:
+                sc_gas_process_schlieren_rhog_3d_float(
+                    self._msd, self._falg, &_sch[0])
+            else:
+                sc_gas_process_schlieren_rhog_2d_float(
+                    self._msd, self._falg, &_sch[0])
+        elif self._msd.ndim == 3:
             sc_gas_process_schlieren_rhog_3d(self._msd, self._alg, &_sch[0])
         else:
             sc_gas_process_schlieren_rhog_2d(self._msd, self._alg, &_sch[0])
@@ -236,7 +408,14 @@ cdef class GasAlgorithm(Mesh):
         cdef double _schk0 = schk0
         cdef double _schk1 = schk1
         cdef double rhogmax = _sch[self._msd.ngstcell:].max()
-        if self._msd.ndim == 3:
+        if self._single:
+            if self._msd.ndim == 3:
+                sc_gas_process_schlieren_sch_3d_float(self._msd, self._falg,
+                    _schk, _schk0, _schk1, rhogmax, &_sch[0])
+            else:
+                sc_gas_process_schlieren_sch_2d_float(self._msd, self._falg,
+                    _schk, _schk0, _schk1, rhogmax, &_sch[0])
+        elif self._msd.ndim == 3:
             sc_gas_process_schlieren_sch_3d(self._msd, self._alg,
                 _schk, _schk0, _schk1, rhogmax, &_sch[0])
         else:
@@ -244,83 +423,162 @@ cdef class GasAlgorithm(Mesh):
                 _schk, _schk0, _schk1, rhogmax, &_sch[0])
 
     def prepare_ce(self):
-        if self._msd.ndim == 3:
+        if self._single:
+            if self._msd.ndim == 3:
+                sc_gas_prepare_ce_3d_float(self._msd, self._falg)
+            else:
+                sc_gas_prepare_ce_2d_float(self._msd, self._falg)
+        elif self._msd.ndim == 3:
             sc_gas_prepare_ce_3d(self._msd, self._alg)
         else:
             sc_gas_prepare_ce_2d(self._msd, self._alg)
 
     def prepare_sf(self):
-        if self._msd.ndim == 3:
+        if self._single:
+            if self._msd.ndim == 3:
+                sc_gas_prepare_sf_3d_float(self._msd, self._falg)
+            else:
+                sc_gas_prepare_sf_2d_float(self._msd, self._falg)
+        elif self._msd.ndim == 3:
             sc_gas_prepare_sf_3d(self._msd, self._alg)
         else:
             sc_gas_prepare_sf_2d(self._msd, self._alg)
 
     def update(self, time, time_increment):
-        self._alg.time = time
-        self._alg.time_increment = time_increment
+        self._alg.time = self._falg.time = time
+        self._alg.time_increment = self._falg.time_increment = time_increment
 
     def calc_cfl(self):
-        if self._msd.ndim == 3:
+        if self._single:
+            if self._msd.ndim == 3:
+                sc_gas_calc_cfl_3d_float(self._msd, self._falg)
+            else:
+                sc_gas_calc_cfl_2d_float(self._msd, self._falg)
+        elif self._msd.ndim == 3:
             sc_gas_calc_cfl_3d(self._msd, self._alg)
         else:
             sc_gas_calc_cfl_2d(self._msd, self._alg)
 
     def calc_solt(self):
-        if self._msd.ndim == 3:
+        if self._single:
+            if self._msd.ndim == 3:
+                sc_gas_calc_solt_3d_float(self._msd, self._falg)
+            else:
+                sc_gas_calc_solt_2d_float(self._msd, self._falg)
+        elif self._msd.ndim == 3:
             sc_gas_calc_solt_3d(self._msd, self._alg)
         else:
             sc_gas_calc_solt_2d(self._msd, self._alg)
 
     def calc_soln(self):
-        if self._msd.ndim == 3:
+        if self._single:
+            if self._msd.ndim == 3:
+                sc_gas_calc_soln_3d_float(self._msd, self._falg)
+            else:
+                sc_gas_calc_soln_2d_float(self._msd, self._falg)
+        elif self._msd.ndim == 3:
             sc_gas_calc_soln_3d(self._msd, self._alg)
         else:
             sc_gas_calc_soln_2d(self._msd, self._alg)
 
     def calc_dsoln(self):
-        if self._msd.ndim == 3:
+        if self._single:
+            if self._msd.ndim == 3:
+                sc_gas_calc_dsoln_3d_float(self._msd, self._falg)
+            else:
+                sc_gas_calc_dsoln_2d_float(self._msd, self._falg)
+        elif self._msd.ndim == 3:
             sc_gas_calc_dsoln_3d(self._msd, self._alg)
         else:
             sc_gas_calc_dsoln_2d(self._msd, self._alg)
 
     def ghostgeom_mirror(self, Bound bcd):
-        if self._msd.ndim == 3:
+        if self._single:
+            if self._msd.ndim == 3:
+                sc_gas_ghostgeom_mirror_3d_float(
+                    self._msd, bcd._bcd, self._falg)
+            else:
+                sc_gas_ghostgeom_mirror_2d_float(
+                    self._msd, bcd._bcd, self._falg)
+        elif self._msd.ndim == 3:
             sc_gas_ghostgeom_mirror_3d(self._msd, bcd._bcd, self._alg)
         else:
             sc_gas_ghostgeom_mirror_2d(self._msd, bcd._bcd, self._alg)
 
     def bound_nonrefl_soln(self, Bound bcd):
-        if self._msd.ndim == 3:
+        if self._single:
+            if self._msd.ndim == 3:
+                sc_gas_bound_nonrefl_soln_3d_float(
+                    self._msd, bcd._bcd, self._falg)
+            else:
+                sc_gas_bound_nonrefl_soln_2d_float(
+                    self._msd, bcd._bcd, self._falg)
+        elif self._msd.ndim == 3:
             sc_gas_bound_nonrefl_soln_3d(self._msd, bcd._bcd, self._alg)
         else:
             sc_gas_bound_nonrefl_soln_2d(self._msd, bcd._bcd, self._alg)
 
     def bound_nonrefl_dsoln(self, Bound bcd):
-        if self._msd.ndim == 3:
+        if self._single:
+            if self._msd.ndim == 3:
+                sc_gas_bound_nonrefl_dsoln_3d_float(
+                    self._msd, bcd._bcd, self._falg)
+            else:
+                sc_gas_bound_nonrefl_dsoln_2d_float(
+                    self._msd, bcd._bcd, self._falg)
+        elif self._msd.ndim == 3:
             sc_gas_bound_nonrefl_dsoln_3d(self._msd, bcd._bcd, self._alg)
         else:
             sc_gas_bound_nonrefl_dsoln_2d(self._msd, bcd._bcd, self._alg)
 
     def bound_wall_soln(self, Bound bcd):
-        if self._msd.ndim == 3:
+        if self._single:
+            if self._msd.ndim == 3:
+                sc_gas_bound_wall_soln_3d_float(
+                    self._msd, bcd._bcd, self._falg)
+            else:
+                sc_gas_bound_wall_soln_2d_float(
+                    self._msd, bcd._bcd, self._falg)
+        elif self._msd.ndim == 3:
             sc_gas_bound_wall_soln_3d(self._msd, bcd._bcd, self._alg)
         else:
             sc_gas_bound_wall_soln_2d(self._msd, bcd._bcd, self._alg)
 
     def bound_wall_dsoln(self, Bound bcd):
-        if self._msd.ndim == 3:
+        if self._single:
+            if self._msd.ndim == 3:
+                sc_gas_bound_wall_dsoln_3d_float(
+                    self._msd, bcd._bcd, self._falg)
+            else:
+                sc_gas_bound_wall_dsoln_2d_float(
+                    self._msd, bcd._bcd, self._falg)
+        elif self._msd.ndim == 3:
             sc_gas_bound_wall_dsoln_3d(self._msd, bcd._bcd, self._alg)
         else:
             sc_gas_bound_wall_dsoln_2d(self._msd, bcd._bcd, self._alg)
 
     def bound_inlet_soln(self, Bound bcd):
-        if self._msd.ndim == 3:
+        if self._single:
+            if self._msd.ndim == 3:
+                sc_gas_bound_inlet_soln_3d_float(
+                    self._msd, bcd._bcd, self._falg)
+            else:
+                sc_gas_bound_inlet_soln_2d_float(
+                    self._msd, bcd._bcd, self._falg)
+        elif self._msd.ndim == 3:
             sc_gas_bound_inlet_soln_3d(self._msd, bcd._bcd, self._alg)
         else:
             sc_gas_bound_inlet_soln_2d(self._msd, bcd._bcd, self._alg)
 
     def bound_inlet_dsoln(self, Bound bcd):
-        if self._msd.ndim == 3:
+        if self._single:
+            if self._msd.ndim == 3:
+                sc_gas_bound_inlet_dsoln_3d_float(
+                    self._msd, bcd._bcd, self._falg)
+            else:
+                sc_gas_bound_inlet_dsoln_2d_float(
+                    self._msd, bcd._bcd, self._falg)
+        elif self._msd.ndim == 3:
             sc_gas_bound_inlet_dsoln_3d(self._msd, bcd._bcd, self._alg)
         else:
             sc_gas_bound_inlet_dsoln_2d(self._msd, bcd._bcd, self._alg)
@@ -38,18 +38,45 @@
 
 #define ALMOST_ZERO 1.e-200
 
+#endif // __SC_GAS__ALGORITHM_SRC_H__
+
+/*
+ * The rest of this file is read again whenever SC_GAS_FLOAT changes.  FPTYPE
+ * is the element type of the arrays in the algorithm object, and SC_GAS_ALG_T
+ * the type of the object.  Without SC_GAS_FLOAT they are double and
+ * sc_gas_algorithm_t.  With SC_GAS_FLOAT defined, they become float and
+ * sc_gas_algorithm_float_t, and SC_GAS_KERNEL() suffixes the kernel names by
+ * _float, so that the same kernel bodies are instantiated for
+ * single-precision arrays.  The arithmetic in the kernels stays in double.
+ */
+#undef FPTYPE
+#undef SC_GAS_ALG_T
+#undef SC_GAS_KERNEL
+#ifdef SC_GAS_FLOAT
+#define FPTYPE float
+#define SC_GAS_ALG_T sc_gas_algorithm_float_t
+#define SC_GAS_KERNEL(name) name ## _float
+#else
+#define FPTYPE double
+#define SC_GAS_ALG_T sc_gas_algorithm_t
+#define SC_GAS_KERNEL(name) name
+#endif
+
 #undef NDIM
 #define NDIM 2
-void sc_gas_calc_jaco_2d(sc_mesh_t *msd, sc_gas_algorithm_t *alg,
+void SC_GAS_KERNEL(sc_gas_calc_jaco_2d)(sc_mesh_t *msd, SC_GAS_ALG_T *alg,
     int icl, double fcn[NEQ][NDIM], double jacos[NEQ][NEQ][NDIM]);
-void sc_gas_calc_dif_2d(sc_mesh_t *msd, sc_gas_algorithm_t *alg,
+void SC_GAS_KERNEL(sc_gas_calc_dif_2d)(sc_mesh_t *msd, SC_GAS_ALG_T *alg,
     int icl, double difs[NEQ][NDIM]);
+void SC_GAS_KERNEL(sc_gas_calc_sfmrc_2d)(sc_mesh_t *msd, SC_GAS_ALG_T *alg,
+    int icl, int ifl, FPTYPE sfmrc[FCMND][2][NDIM]);
 #undef NDIM
 #define NDIM 3
-void sc_gas_calc_jaco_3d(sc_mesh_t *msd, sc_gas_algorithm_t *alg,
+void SC_GAS_KERNEL(sc_gas_calc_jaco_3d)(sc_mesh_t *msd, SC_GAS_ALG_T *alg,
     int icl, double fcn[NEQ][NDIM], double jacos[NEQ][NEQ][NDIM]);
-void sc_gas_calc_dif_3d(sc_mesh_t *msd, sc_gas_algorithm_t *alg,
+void SC_GAS_KERNEL(sc_gas_calc_dif_3d)(sc_mesh_t *msd, SC_GAS_ALG_T *alg,
     int icl, double difs[NEQ][NDIM]);
+void SC_GAS_KERNEL(sc_gas_calc_sfmrc_3d)(sc_mesh_t *msd, SC_GAS_ALG_T *alg,
+    int icl, int ifl, FPTYPE sfmrc[FCMND][2][NDIM]);
 
 // vim: set ft=c ts=4 et:
-#endif // __SC_GAS__ALGORITHM_SRC_H__
@@ -54,6 +54,10 @@ class GasCase(sc.MeshCase):
         'solver.taumin': None,
         'solver.tauscale': None,
         # End of c-taw parameters.
+        # Floating-point type of the solver arrays; 'float32' runs the
+        # single-precision kernels.  Independent of execution.fpdtype,
+        # which is the type of the output.
+        'solver.arrdtype': 'float64',
         'io.rootdir': sc.env.projdir, # Different default to MeshCase.
     }
 
@@ -64,6 +68,7 @@ class GasCase(sc.MeshCase):
         kw['neq'] = self.execution.neq = neq
         kw['time'] = self.execution.time
         kw['time_increment'] = self.execution.time_increment
+        kw['fpdtype'] = str(self.solver.arrdtype)
         # c-tau scheme parameters.
         kw['alpha'] = int(self.solver.alpha)
         for key in ('sigma0', 'taylor', 'cnbfac', 'sftfac',
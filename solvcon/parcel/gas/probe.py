@@ -53,8 +53,7 @@ class Probe(object):
         return 'Pt/%s#%d(%s)%d' % (self.name, self.pcl, crds, len(self.vals))
 
     def locate_cell(self, svr):
-        icl, ifl, jcl, jfl = svr.alg.locate_point(self.crd)
-        self.pcl = icl
+        self.pcl = int(svr.blk.locate_points(self.crd)[0])
 
     def __call__(self, svr, time):
         ngstcell = svr.ngstcell
@@ -89,7 +88,11 @@ class ProbeAnchor(sc.MeshAnchor):
         super(ProbeAnchor, self).__init__(svr, **kw)
 
     def preloop(self):
-        for point in self.points: point.locate_cell(self.svr)
+        # locate all the points at once with the spatial index of the block.
+        if self.points:
+            icls = self.svr.blk.locate_points(
+                [point.crd for point in self.points])
+            for point, icl in zip(self.points, icls): point.pcl = int(icl)
         for point in self.points: point(self.svr, self.svr.time)
 
     def postfull(self):
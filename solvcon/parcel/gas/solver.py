@@ -46,7 +46,7 @@ class GasSolver(sc.MeshSolver):
     Spatial loops for the gas-dynamics solver.
     """
 
-    _interface_init_ = ('cecnd', 'cevol', 'sfmrc')
+    _interface_init_ = ('cecnd', 'cevol')
     _solution_array_ = ('solt', 'sol', 'soln', 'dsol', 'dsoln')
 
     def __init__(self, blk, **kw):
@@ -74,7 +74,9 @@ class GasSolver(sc.MeshSolver):
         ndim = blk.ndim
         ncell = blk.ncell
         ngstcell = blk.ngstcell
-        fpdtype = 'float64'
+        # floating-point type of the arrays: float64, or float32 to halve the
+        # memory and bandwidth at the cost of precision.
+        self.fpdtype = fpdtype = np.dtype(kw.pop('fpdtype', 'float64'))
         # scheme parameters.
         self.alpha = int(kw.pop('alpha', 0))
         self.sigma0 = int(kw.pop('sigma0', 3.0))
@@ -83,12 +85,18 @@ class GasSolver(sc.MeshSolver):
         self.sftfac = float(kw.pop('sftfac', 1.0))  # dirty hack.
         self.taumin = float(kw.pop('taumin', 0.0))
         self.tauscale = float(kw.pop('tauscale', 1.0))
+        # store sub-face metrics, or calculate them on the fly in calc_soln.
+        self.storesf = bool(kw.pop('storesf', True))
         # dual mesh.
         self.tbcecnd = sc.Table(ngstcell, ncell, blk.CLMFC+1, ndim,
                                 dtype=fpdtype)
         self.tbcevol = sc.Table(ngstcell, ncell, blk.CLMFC+1, dtype=fpdtype)
-        self.tbsfmrc = sc.Table(0, ncell, blk.CLMFC, blk.FCMND, 2, ndim,
-                                dtype=fpdtype)
+        if self.storesf:
+            self.tbsfmrc = sc.Table(0, ncell, blk.CLMFC, blk.FCMND, 2, ndim,
+                                    dtype=fpdtype)
+            self.sfmrc = self.tbsfmrc.F
+        else:
+            self.tbsfmrc = self.sfmrc = None
         # parameters.
         self.grpda = np.empty((self.ngroup, 1), dtype=fpdtype)
         nsca = kw.pop('nsca', 1)
@@ -128,9 +136,10 @@ class GasSolver(sc.MeshSolver):
         super(GasSolver, self).init(**kw)
         self._debug_check_array('soln', 'dsoln')
         # prepare sub-face metric data.
-        self.sfmrc.fill(0.0)
-        self.alg.prepare_sf()
-        self._debug_check_array('sfmrc')
+        if self.storesf:
+            self.sfmrc.fill(0.0)
+            self.alg.prepare_sf()
+            self._debug_check_array('sfmrc')
 
     def provide(self):
         # super method.
@@ -154,8 +163,8 @@ class GasSolver(sc.MeshSolver):
     def update(self, worker=None):
         self._debug_check_array('soln', 'dsoln')
         self.alg.update(self.time, self.time_increment)
-        self.sol[:,:] = self.soln[:,:]
-        self.dsol[:,:,:] = self.dsoln[:,:,:]
+        if self.update_solutions():
+            self.alg._setup_solutions(self)
         self._debug_check_array('sol', 'dsol')
 
     @_MMNAMES.register
@@ -174,7 +183,8 @@ class GasSolver(sc.MeshSolver):
 
     @_MMNAMES.register
     def ibcsoln(self, worker=None):
-        if worker: self.exchangeibc('soln', worker=worker)
+        # overlap with bcsoln and calccfl, which use no interface ghost cell.
+        if worker: self.exchangeibc('soln', worker=worker, wait=False)
 
     @_MMNAMES.register
     def bcsoln(self, worker=None):
@@ -192,13 +202,15 @@ class GasSolver(sc.MeshSolver):
 
     @_MMNAMES.register
     def calcdsoln(self, worker=None):
+        self.waitibc('soln')
         self._debug_check_array('sol', 'dsol')
         self.alg.calc_dsoln()
         self._debug_check_array('soln', 'dsoln')
 
     @_MMNAMES.register
     def ibcdsoln(self, worker=None):
-        if worker: self.exchangeibc('dsoln', worker=worker)
+        # completed at the end of the sub-step by MeshSolver.march.
+        if worker: self.exchangeibc('dsoln', worker=worker, wait=False)
 
     @_MMNAMES.register
     def bcdsoln(self, worker=None):
@@ -67,4 +67,15 @@ const int ggerng[8][2] = {
 #define NDIM 3
 #include "sc_gas_calc_dsoln.c_body"
 
+// single-precision instances.
+#define SC_GAS_FLOAT
+#include "_algorithm_src.h"
+#undef NDIM
+#define NDIM 2
+#include "sc_gas_calc_dsoln.c_body"
+#undef NDIM
+#define NDIM 3
+#include "sc_gas_calc_dsoln.c_body"
+#undef SC_GAS_FLOAT
+
 // vim: set ts=4 et:
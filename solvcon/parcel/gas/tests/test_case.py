@@ -13,4 +13,12 @@ class TestGasCase(unittest.TestCase):
             return blk
         cse = case.GasCase(mesher=mesher)
 
+    def test_arrdtype(self):
+        cse = case.GasCase(arrdtype='float32')
+        self.assertEqual('float64', cse.execution.fpdtype)
+        self.assertEqual('float32', cse.solver.arrdtype)
+        cse = case.GasCase(fpdtype='float32')
+        self.assertEqual('float32', cse.execution.fpdtype)
+        self.assertEqual('float64', cse.solver.arrdtype)
+
 # vim: set ff=unix fenc=utf8 nobomb et sw=4 ts=4 tw=79:
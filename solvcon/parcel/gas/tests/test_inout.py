@@ -0,0 +1,72 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from solvcon import testing
+
+from .. import solver
+from .. import inout
+
+class TestMarchArchiveAnchor(unittest.TestCase):
+    @staticmethod
+    def _create_solver():
+        blk = testing.create_trivial_2d_blk()
+        blk.clgrp.fill(0)
+        blk.grpnames.append('blank')
+        return solver.GasSolver(blk)
+
+    @staticmethod
+    def _march(svr, arcfn, begin, end, **kw):
+        ank = inout.MarchArchiveAnchor(svr, anames=dict(soln=False),
+            psteps=2, arcfn_tmpl=arcfn, **kw)
+        svr.step_global = begin
+        svr.time = begin * 0.5
+        svr.soln.fill(begin)
+        ank.preloop()
+        for istep in range(begin+1, end+1):
+            svr.step_global = istep
+            svr.time = istep * 0.5
+            svr.soln.fill(istep)
+            ank.postmarch()
+        ank.postloop()
+
+    def test_archive(self):
+        from solvcon.io.series import SeriesReader
+        svr = self._create_solver()
+        tdir = tempfile.mkdtemp()
+        try:
+            arcfn = os.path.join(tdir, 'trivial.scs')
+            self._march(svr, arcfn, 0, 5)
+            with SeriesReader(arcfn) as rdr:
+                self.assertEqual([0, 2, 4, 5], rdr.steps)
+                self.assertEqual(2.5, rdr.time(5))
+                soln = rdr.read(4, 'soln')
+                self.assertEqual(svr.soln[svr.ngstcell:].shape, soln.shape)
+                self.assertTrue((soln == 4).all())
+                self.assertEqual(svr.blk.ncell, rdr.load_block().ncell)
+        finally:
+            shutil.rmtree(tdir)
+
+    def test_restart(self):
+        from solvcon.io.series import SeriesReader
+        svr = self._create_solver()
+        tdir = tempfile.mkdtemp()
+        try:
+            arcfn = os.path.join(tdir, 'trivial.scs')
+            self._march(svr, arcfn, 0, 3)
+            # restart from the last step in the archive.
+            self._march(svr, arcfn, 3, 6, append=True)
+            with SeriesReader(arcfn) as rdr:
+                self.assertEqual([0, 2, 3, 4, 6], rdr.steps)
+                self.assertEqual(1, len(rdr.names(3)))
+                self.assertTrue((rdr.read(3, 'soln') == 3).all())
+                self.assertTrue((rdr.read(6, 'soln') == 6).all())
+            # a new run overwrites the archive.
+            self._march(svr, arcfn, 0, 1)
+            with SeriesReader(arcfn) as rdr:
+                self.assertEqual([0, 1], rdr.steps)
+        finally:
+            shutil.rmtree(tdir)
@@ -0,0 +1,55 @@
+import unittest
+
+import numpy as np
+
+from solvcon.block import Block
+
+from .. import solver
+from .. import probe
+
+class TestLocate(unittest.TestCase):
+    @staticmethod
+    def _create_cube(nx, warp):
+        """
+        Create a hexahedral mesh of the unit cube, whose interior nodes are
+        randomly displaced by warp times the cell width.
+        """
+        n1 = nx + 1
+        crd = np.linspace(0, 1, n1)
+        crd = np.array(np.meshgrid(crd, crd, crd, indexing='ij'))
+        crd = crd.reshape((3, -1)).T.copy()
+        inner = ((crd > 0) & (crd < 1)).all(axis=1)
+        rng = np.random.RandomState(0)
+        crd[inner] += warp/nx * rng.uniform(-1, 1, (inner.sum(), 3))
+        ind = np.arange(n1**3).reshape((n1, n1, n1))
+        i, j, k = [it.ravel() for it in
+                   np.meshgrid(*[np.arange(nx)]*3, indexing='ij')]
+        blk = Block(ndim=3, nnode=n1**3, nface=3*nx*nx*n1, ncell=nx**3,
+                    nbound=6*nx*nx)
+        blk.ndcrd[:] = crd
+        blk.cltpn[:] = 4
+        blk.clnds[:,0] = 8
+        blk.clnds[:,1:9] = np.array([
+            ind[i,j,k], ind[i+1,j,k], ind[i+1,j+1,k], ind[i,j+1,k],
+            ind[i,j,k+1], ind[i+1,j,k+1], ind[i+1,j+1,k+1], ind[i,j+1,k+1],
+        ]).T
+        blk.build_interior()
+        blk.build_boundary()
+        blk.build_ghost()
+        blk.clgrp.fill(0)
+        blk.grpnames.append('blank')
+        return blk
+
+    def test_warped(self):
+        crds = np.random.RandomState(1).uniform(-0.05, 1.05, (1000, 3))
+        for warp in (0.05, 0.1, 0.3):
+            svr = solver.GasSolver(self._create_cube(6, warp))
+            # the spatial index gives the same cells as the linear scan.
+            expected = [svr.alg.locate_point(crd)[0] for crd in crds]
+            self.assertEqual(expected, svr.blk.locate_points(crds).tolist())
+            # so does a probe.
+            point = probe.Probe(*crds[0], speclst=[])
+            point.locate_cell(svr)
+            self.assertEqual(expected[0], point.pcl)
+
+# vim: set ff=unix fenc=utf8 nobomb et sw=4 ts=4 tw=79:
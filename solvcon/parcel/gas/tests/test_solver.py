@@ -18,4 +18,51 @@ class TestGasSolver(unittest.TestCase):
         svr = solver.GasSolver(blk)
         self.assertEqual(4, svr.neq)
 
+    @staticmethod
+    def _march(swapsol, storesf=True, fpdtype='float64'):
+        from .. import boundcond
+        def create(blk):
+            return solver.GasSolver(blk, swapsol=swapsol, storesf=storesf,
+                                    fpdtype=fpdtype)
+        def perturb(svr, rng):
+            nall = svr.ngstcell + svr.ncell
+            svr.soln[:,0] = 1.0 + 0.1*rng.rand(nall)
+            svr.soln[:,1:3] = 0.1*rng.rand(nall, 2)
+            svr.soln[:,3] = 2.5 + 0.1*rng.rand(nall)
+            svr.dsoln.fill(0.0)
+            svr.amsca.fill(1.4)
+        return testing.march_oblique_neu(boundcond.GasWall, create, perturb,
+                                         0.001)
+
+    def test_swapsol(self):
+        import numpy as np
+        csvr = self._march(False)
+        ssvr = self._march(True)
+        for name in ('sol', 'soln', 'dsol', 'dsoln'):
+            self.assertTrue(np.isfinite(getattr(csvr, name)).all())
+            self.assertTrue((getattr(csvr, name) == getattr(ssvr, name)).all())
+        # the arrays and the tables stay paired after swapping.
+        self.assertEqual(ssvr.sol.ctypes.data, ssvr.tbsol.F.ctypes.data)
+        self.assertEqual(ssvr.dsoln.ctypes.data, ssvr.tbdsoln.F.ctypes.data)
+
+    def test_storesf(self):
+        svr = self._march(False)
+        osvr = self._march(False, storesf=False)
+        self.assertEqual(None, osvr.sfmrc)
+        self.assertEqual(None, osvr.tbsfmrc)
+        for name in ('sol', 'soln', 'dsol', 'dsoln'):
+            self.assertTrue((getattr(svr, name) == getattr(osvr, name)).all())
+
+    def test_float32(self):
+        import numpy as np
+        dsvr = self._march(False)
+        fsvr = self._march(False, fpdtype='float32')
+        self.assertEqual(np.float32, fsvr.alg.fpdtype)
+        for name in ('cecnd', 'sfmrc', 'amsca', 'sol', 'soln', 'dsoln'):
+            self.assertEqual(np.float32, getattr(fsvr, name).dtype)
+        # the solution only loses the precision of float32.
+        for name in ('sol', 'soln'):
+            self.assertTrue(np.allclose(getattr(fsvr, name),
+                                        getattr(dsvr, name), atol=1.e-5))
+
 # vim: set ff=unix fenc=utf8 nobomb et sw=4 ts=4 tw=79:
@@ -38,6 +38,7 @@ from .case import LinearCase
 from .solver import LinearSolver, LinearPeriodic
 from .planewave import PlaneWaveSolution, PlaneWaveAnchor, PlaneWaveHook
 from .inout import (MeshInfoHook, ProgressHook, FillAnchor, CflAnchor, CflHook,
-                    MarchSaveAnchor, PMarchSave)
+                    MarchSaveAnchor, PMarchSave, MarchArchiveAnchor,
+                    PMarchArchive)
 
 # vim: set ff=unix fenc=utf8 ft=python ai et sw=4 ts=4 tw=79:
@@ -49,6 +49,9 @@ cdef public:
         ## vector parameters.
         int nvec
         double *amvec
+        ## precomputed Jacobians; NULL to calculate them on the fly.
+        double *jacos
+        int *jacoidx
         # solution array.
         double *sol
         double *dsol
@@ -62,5 +65,6 @@ cdef public:
 from solvcon.mesh cimport Mesh
 cdef class LinearAlgorithm(Mesh):
     cdef sc_linear_algorithm_t *_alg
+    cdef public bint specialized
 
 # vim: set fenc=utf8 ft=pyrex ff=unix ai et sw=4 ts=4 tw=79:
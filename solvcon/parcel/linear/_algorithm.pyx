@@ -58,6 +58,19 @@ cdef extern:
     void sc_linear_calc_soln_3d(sc_mesh_t *msd, sc_linear_algorithm_t *alg)
     void sc_linear_calc_dsoln_2d(sc_mesh_t *msd, sc_linear_algorithm_t *alg)
     void sc_linear_calc_dsoln_3d(sc_mesh_t *msd, sc_linear_algorithm_t *alg)
+    # algorithm calculators for 9 equations.
+    void sc_linear_calc_solt_2d_neq9(
+        sc_mesh_t *msd, sc_linear_algorithm_t *alg)
+    void sc_linear_calc_solt_3d_neq9(
+        sc_mesh_t *msd, sc_linear_algorithm_t *alg)
+    void sc_linear_calc_soln_2d_neq9(
+        sc_mesh_t *msd, sc_linear_algorithm_t *alg)
+    void sc_linear_calc_soln_3d_neq9(
+        sc_mesh_t *msd, sc_linear_algorithm_t *alg)
+    void sc_linear_calc_dsoln_2d_neq9(
+        sc_mesh_t *msd, sc_linear_algorithm_t *alg)
+    void sc_linear_calc_dsoln_3d_neq9(
+        sc_mesh_t *msd, sc_linear_algorithm_t *alg)
 
 cdef extern from "stdlib.h":
     void* malloc(size_t size)
@@ -65,9 +78,15 @@ cdef extern from "stdlib.h":
 cdef class LinearAlgorithm(Mesh):
     """
     An algorithm class that does trivial calculation.
+
+    The calculators dispatch to the kernels compiled for a fixed number of
+    equations (9, the velocity-stress equations) when :py:attr:`specialized`
+    is True (default) and the number matches.  Other numbers of equations use
+    the generic kernels.
     """
     def __cinit__(self):
         self._alg = <sc_linear_algorithm_t *>malloc(sizeof(sc_linear_algorithm_t))
+        self.specialized = True
 
     def set_alg_double_array_2d(self,
             cnp.ndarray[double, ndim=2, mode="c"] nda, name, int shift):
@@ -99,7 +118,10 @@ cdef class LinearAlgorithm(Mesh):
         cdef cnp.ndarray[double, ndim=2, mode="c"] cevol = svr.cevol
         self._alg.cevol = &cevol[self._msd.ngstcell,0]
         cdef cnp.ndarray[double, ndim=5, mode="c"] sfmrc = svr.sfmrc
-        self._alg.sfmrc = &sfmrc[0,0,0,0,0]
+        if svr.sfmrc is not None:
+            self._alg.sfmrc = &sfmrc[0,0,0,0,0]
+        else:
+            self._alg.sfmrc = NULL
 
     def _setup_parameters(self, svr):
         # group data.
@@ -121,6 +143,18 @@ cdef class LinearAlgorithm(Mesh):
             self._alg.amvec = &amvec[self._msd.ngstcell,0,0]
         else:
             self._alg.amvec = NULL
+        # precomputed Jacobians.
+        cdef cnp.ndarray[double, ndim=4, mode="c"] jacos = svr.jacos
+        cdef cnp.ndarray[int, ndim=1, mode="c"] jacoidx = svr.jacoidx
+        if svr.jacos is not None:
+            assert jacos.shape[1] == jacos.shape[2] == svr.neq
+            assert jacos.shape[3] == self._msd.ndim
+            assert jacoidx.shape[0] == self._msd.ngstcell + self._msd.ncell
+            self._alg.jacos = &jacos[0,0,0,0]
+            self._alg.jacoidx = &jacoidx[self._msd.ngstcell]
+        else:
+            self._alg.jacos = NULL
+            self._alg.jacoidx = NULL
 
     def _setup_solutions(self, svr):
         cdef cnp.ndarray[double, ndim=2, mode="c"] sol = svr.sol
@@ -175,19 +209,34 @@ cdef class LinearAlgorithm(Mesh):
             sc_linear_calc_cfl_2d(self._msd, self._alg)
 
     def calc_solt(self):
-        if self._msd.ndim == 3:
+        if self.specialized and self._alg.neq == 9:
+            if self._msd.ndim == 3:
+                sc_linear_calc_solt_3d_neq9(self._msd, self._alg)
+            else:
+                sc_linear_calc_solt_2d_neq9(self._msd, self._alg)
+        elif self._msd.ndim == 3:
             sc_linear_calc_solt_3d(self._msd, self._alg)
         else:
             sc_linear_calc_solt_2d(self._msd, self._alg)
 
     def calc_soln(self):
-        if self._msd.ndim == 3:
+        if self.specialized and self._alg.neq == 9:
+            if self._msd.ndim == 3:
+                sc_linear_calc_soln_3d_neq9(self._msd, self._alg)
+            else:
+                sc_linear_calc_soln_2d_neq9(self._msd, self._alg)
+        elif self._msd.ndim == 3:
             sc_linear_calc_soln_3d(self._msd, self._alg)
         else:
             sc_linear_calc_soln_2d(self._msd, self._alg)
 
     def calc_dsoln(self):
-        if self._msd.ndim == 3:
+        if self.specialized and self._alg.neq == 9:
+            if self._msd.ndim == 3:
+                sc_linear_calc_dsoln_3d_neq9(self._msd, self._alg)
+            else:
+                sc_linear_calc_dsoln_2d_neq9(self._msd, self._alg)
+        elif self._msd.ndim == 3:
             sc_linear_calc_dsoln_3d(self._msd, self._alg)
         else:
             sc_linear_calc_dsoln_2d(self._msd, self._alg)
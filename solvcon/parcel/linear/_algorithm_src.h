@@ -33,20 +33,48 @@
 #include "mesh.h"
 #include "_algorithm.h"
 
+#define SC_LINEAR_PASTE_(name, neq) name ## _neq ## neq
+#define SC_LINEAR_PASTE(name, neq) SC_LINEAR_PASTE_(name, neq)
+
+#endif // __SC_LINEAR__ALGORITHM_SRC_H__
+
+/*
+ * The rest of this file is read again whenever SC_LINEAR_NEQ changes.  Without
+ * SC_LINEAR_NEQ, NEQ is the run-time alg->neq and the arrays it sizes are
+ * variable-length.  With SC_LINEAR_NEQ defined, NEQ becomes a compile-time
+ * constant and SC_LINEAR_KERNEL() suffixes the kernel names by _neq<NEQ>, so
+ * that the same kernel bodies are instantiated for a fixed number of
+ * equations.
+ */
+#undef NEQ
+#undef SC_LINEAR_KERNEL
+#ifdef SC_LINEAR_NEQ
+#define NEQ SC_LINEAR_NEQ
+#define SC_LINEAR_KERNEL(name) SC_LINEAR_PASTE(name, SC_LINEAR_NEQ)
+#else
 #define NEQ alg->neq
+#define SC_LINEAR_KERNEL(name) name
+#endif
 
 #undef NDIM
 #define NDIM 2
-void sc_linear_calc_jaco_2d(sc_mesh_t *msd, sc_linear_algorithm_t *alg,
+void SC_LINEAR_KERNEL(sc_linear_calc_jaco_2d)(
+    sc_mesh_t *msd, sc_linear_algorithm_t *alg,
     int icl, double fcn[NEQ][NDIM], double jacos[NEQ][NEQ][NDIM]);
-void sc_linear_calc_dif_2d(sc_mesh_t *msd, sc_linear_algorithm_t *alg,
+void SC_LINEAR_KERNEL(sc_linear_calc_dif_2d)(
+    sc_mesh_t *msd, sc_linear_algorithm_t *alg,
     int icl, double difs[NEQ][NDIM]);
+void sc_linear_calc_sfmrc_2d(sc_mesh_t *msd, sc_linear_algorithm_t *alg,
+    int icl, int ifl, double sfmrc[FCMND][2][NDIM]);
 #undef NDIM
 #define NDIM 3
-void sc_linear_calc_jaco_3d(sc_mesh_t *msd, sc_linear_algorithm_t *alg,
+void SC_LINEAR_KERNEL(sc_linear_calc_jaco_3d)(
+    sc_mesh_t *msd, sc_linear_algorithm_t *alg,
     int icl, double fcn[NEQ][NDIM], double jacos[NEQ][NEQ][NDIM]);
-void sc_linear_calc_dif_3d(sc_mesh_t *msd, sc_linear_algorithm_t *alg,
+void SC_LINEAR_KERNEL(sc_linear_calc_dif_3d)(
+    sc_mesh_t *msd, sc_linear_algorithm_t *alg,
     int icl, double difs[NEQ][NDIM]);
+void sc_linear_calc_sfmrc_3d(sc_mesh_t *msd, sc_linear_algorithm_t *alg,
+    int icl, int ifl, double sfmrc[FCMND][2][NDIM]);
 
 // vim: set ft=c ts=4 et:
-#endif // __SC_LINEAR__ALGORITHM_SRC_H__
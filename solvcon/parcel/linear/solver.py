@@ -52,7 +52,7 @@ class LinearSolver(solver.MeshSolver):
     <._algorithm.LinearAlgorithm>`.
     """
 
-    _interface_init_ = ['cecnd', 'cevol', 'sfmrc']
+    _interface_init_ = ['cecnd', 'cevol']
     _solution_array_ = ['solt', 'sol', 'soln', 'dsol', 'dsoln']
 
     def __init__(self, blk, **kw):
@@ -97,13 +97,28 @@ class LinearSolver(solver.MeshSolver):
         self.sftfac = float(kw.pop('sftfac', 1.0))  # dirty hack.
         self.taumin = float(kw.pop('taumin', 0.0))
         self.tauscale = float(kw.pop('tauscale', 1.0))
+        #: Store the sub-face metrics in :py:attr:`sfmrc` (``True``) or let
+        #: the kernels calculate them on the fly (``False``), which saves the
+        #: ``CLMFC*FCMND*2*ndim`` doubles per cell at the cost of computing
+        #: the metrics of every face in each ``calc_soln``.
+        self.storesf = bool(kw.pop('storesf', True))
+        #: How the kernels obtain the Jacobian matrices.  ``None`` calculates
+        #: them from :py:attr:`grpda` for every cell and face on the fly.
+        #: ``'group'`` lets the kernels index :py:attr:`grpda` by the group of
+        #: the cell directly, and ``'cell'`` allocates a matrix for each cell,
+        #: which :py:meth:`_make_jacos` may set for heterogeneous media.  Both
+        #: precomputed modes require :py:attr:`gdlen` to be
+        #: ``neq*neq*ndim``.
+        self.jacomode = kw.pop('jacomode', None)
+        if self.jacomode not in (None, 'group', 'cell'):
+            raise ValueError('invalid jacomode %s' % self.jacomode)
         # dual mesh.
         self.cecnd = np.empty(
             (ngstcell+ncell, blk.CLMFC+1, ndim), dtype=fpdtype)
         self.cevol = np.empty(
             (ngstcell+ncell, blk.CLMFC+1), dtype=fpdtype)
         self.sfmrc = np.empty((ncell, blk.CLMFC, blk.FCMND, 2, ndim),
-            dtype=fpdtype)
+            dtype=fpdtype) if self.storesf else None
         # parameters.
         self.grpda = np.empty((self.ngroup, self.gdlen), dtype=fpdtype)
         nsca = kw.pop('nsca', 0)
@@ -120,6 +135,12 @@ class LinearSolver(solver.MeshSolver):
         self.stm = np.empty((ngstcell+ncell, neq), dtype=fpdtype)
         self.cfl = np.empty(ngstcell+ncell, dtype=fpdtype)
         self.ocfl = np.empty(ngstcell+ncell, dtype=fpdtype)
+        # precomputed Jacobians.
+        #: The table of Jacobian matrices of shape ``(n, neq, neq, ndim)``,
+        #: or ``None`` when :py:attr:`jacomode` is ``None``.
+        self.jacos = None
+        #: The row in :py:attr:`jacos` for each (ghost and body) cell.
+        self.jacoidx = None
 
     @property
     def gdlen(self):
@@ -152,11 +173,13 @@ class LinearSolver(solver.MeshSolver):
     def init(self, **kw):
         self.create_alg().prepare_ce()
         super(LinearSolver, self).init(**kw)
-        self.create_alg().prepare_sf()
+        if self.storesf:
+            self.create_alg().prepare_sf()
 
     def provide(self):
         # fill group data array.
         self._make_grpda()
+        self._make_jacos()
         # pre-calculate CFL.
         self.create_alg().calc_cfl()
         self.ocfl[:] = self.cfl[:]
@@ -171,14 +194,36 @@ class LinearSolver(solver.MeshSolver):
     def _make_grpda(self):
         raise NotImplementedError
 
+    def _make_jacos(self):
+        """
+        Set :py:attr:`jacos` and :py:attr:`jacoidx` according to
+        :py:attr:`jacomode`.  In the ``'cell'`` mode, the matrices are
+        initialized from the groups and subclasses may override this method
+        to vary them cell by cell.
+        """
+        if self.jacomode is None:
+            self.jacos = self.jacoidx = None
+            return
+        if self.gdlen != self.neq * self.neq * self.ndim:
+            raise ValueError('gdlen %d does not hold the Jacobians' %
+                             self.gdlen)
+        grpjacos = self.grpda.reshape(
+            (self.ngroup, self.neq, self.neq, self.ndim))
+        clgrp = self.blk.shclgrp
+        if self.jacomode == 'group':
+            self.jacos = grpjacos
+            self.jacoidx = clgrp
+        else:
+            self.jacos = grpjacos[clgrp]
+            self.jacoidx = np.arange(clgrp.shape[0], dtype='int32')
+
     ###########################################################################
     # Begin marching algorithm.
     _MMNAMES = solver.MeshSolver.new_method_list()
 
     @_MMNAMES.register
     def update(self, worker=None):
-        self.sol[:,:] = self.soln[:,:]
-        self.dsol[:,:,:] = self.dsoln[:,:,:]
+        self.update_solutions()
 
     @_MMNAMES.register
     def calcsolt(self, worker=None):
@@ -41,4 +41,15 @@
 #define NDIM 3
 #include "sc_linear_calc_soln.c_body"
 
+// instances for the velocity-stress equations.
+#define SC_LINEAR_NEQ 9
+#include "_algorithm_src.h"
+#undef NDIM
+#define NDIM 2
+#include "sc_linear_calc_soln.c_body"
+#undef NDIM
+#define NDIM 3
+#include "sc_linear_calc_soln.c_body"
+#undef SC_LINEAR_NEQ
+
 // vim: set ts=4 et:
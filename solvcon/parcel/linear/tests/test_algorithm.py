@@ -0,0 +1,111 @@
+import unittest
+
+import numpy as np
+
+from solvcon import testing
+
+from .. import solver
+
+
+class NineSolver(solver.LinearSolver):
+    @property
+    def gdlen(self):
+        return 9 * 9 * self.ndim
+
+
+class TestKernels(unittest.TestCase):
+    __test__ = False
+
+    def _get_block(self):
+        raise NotImplementedError
+
+    def setUp(self):
+        blk = self._get_block()
+        # three material groups.
+        blk.grpnames[:] = ['a', 'b', 'c']
+        blk.shclgrp[:] = np.arange(blk.shclgrp.shape[0]) % 3
+        self.svr = svr = NineSolver(blk, neq=9, time_increment=1.e-3)
+        svr.init()
+        # no BC sets the ghost geometry.
+        svr.cecnd[:svr.ngstcell] = svr.blk.shclcnd[:svr.ngstcell,None,:]
+        rng = np.random.RandomState(0)
+        svr.grpda[...] = rng.rand(*svr.grpda.shape) - 0.5
+        for name in ('sol', 'solt', 'dsol'):
+            arr = getattr(svr, name)
+            arr[...] = rng.rand(*arr.shape)
+        svr.cfl.fill(0.5)
+
+    def _calc(self, calcname, arrname, specialized=True, jacomode=None):
+        svr = self.svr
+        svr.jacomode = jacomode
+        svr._make_jacos()
+        alg = svr.create_alg()
+        alg.specialized = specialized
+        getattr(svr, arrname).fill(0.0)
+        getattr(alg, calcname)()
+        return getattr(svr, arrname)[svr.ngstcell:].copy()
+
+    def _compare(self, calcname, arrname, **kw):
+        result = self._calc(calcname, arrname)
+        self.assertTrue(np.isfinite(result).all())
+        other = self._calc(calcname, arrname, **kw)
+        self.assertTrue(np.allclose(result, other, rtol=1.e-12, atol=1.e-14))
+
+    def test_solt(self):
+        self._compare('calc_solt', 'solt', specialized=False)
+        self._compare('calc_solt', 'solt', jacomode='group')
+        self._compare('calc_solt', 'solt', jacomode='cell')
+
+    def test_soln(self):
+        self._compare('calc_soln', 'soln', specialized=False)
+        self._compare('calc_soln', 'soln', jacomode='group')
+        self._compare('calc_soln', 'soln', jacomode='cell')
+        self._compare('calc_soln', 'soln', specialized=False,
+                      jacomode='group')
+
+    def test_dsoln(self):
+        self._compare('calc_dsoln', 'dsoln', specialized=False)
+
+    def test_sfmrc_on_the_fly(self):
+        svr = self.svr
+        for specialized in (True, False):
+            stored = self._calc('calc_soln', 'soln', specialized=specialized)
+            sfmrc, svr.sfmrc = svr.sfmrc, None
+            onthefly = self._calc('calc_soln', 'soln',
+                                  specialized=specialized)
+            svr.sfmrc = sfmrc
+            self.assertTrue((stored == onthefly).all())
+
+    def test_jacos(self):
+        svr = self.svr
+        svr.jacomode = 'group'
+        svr._make_jacos()
+        self.assertEqual((3, 9, 9, svr.ndim), svr.jacos.shape)
+        # a view of the group data.
+        svr.grpda[1,0] = 7.0
+        self.assertEqual(7.0, svr.jacos[1,0,0,0])
+        svr.jacomode = 'cell'
+        svr._make_jacos()
+        self.assertEqual((svr.ngstcell+svr.ncell, 9, 9, svr.ndim),
+                         svr.jacos.shape)
+        self.assertEqual(7.0, svr.jacos[1,0,0,0])
+        self.assertEqual(svr.grpda[2,0], svr.jacos[2,0,0,0])
+        svr.jacomode = None
+        svr._make_jacos()
+        self.assertEqual(None, svr.jacos)
+
+
+class TestKernels2D(TestKernels):
+    __test__ = True
+
+    def _get_block(self):
+        return testing.get_blk_from_oblique_neu()
+
+
+class TestKernels3D(TestKernels):
+    __test__ = True
+
+    def _get_block(self):
+        return testing.get_blk_from_sample_neu()
+
+# vim: set ff=unix fenc=utf8 nobomb et sw=4 ts=4 tw=79:
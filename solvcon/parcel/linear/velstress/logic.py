@@ -64,6 +64,8 @@ class VslinSolver(linear.LinearSolver):
 
     def __init__(self, blk, mtrldict=None, **kw):
         kw['neq'] = 9
+        # the Jacobians are constant in each material group.
+        kw.setdefault('jacomode', 'group')
         #: A :py:class:`dict` that maps names to :py:class:`Material
         #: <.material.Material>` object.
         self.mtrldict = mtrldict if mtrldict else {}
@@ -43,7 +43,8 @@ __all__ = [
     'PlaneWaveSolution', 'PlaneWaveAnchor', 'PlaneWaveHook',
     # inout.
     'AmscaAnchor', 'MeshInfoHook', 'ProgressHook', 'FillAnchor', 'CflAnchor',
-    'CflHook', 'MarchSaveAnchor', 'PMarchSave',
+    'CflHook', 'MarchSaveAnchor', 'PMarchSave', 'MarchArchiveAnchor',
+    'PMarchArchive',
     # material.
     'mltregy', 'Material',
 ]
@@ -55,7 +56,8 @@ from .solver import (VewaveSolver, VewavePeriodic, VewaveBC, VewaveNonRefl,
                      VewaveLongSineX)
 from .planewave import PlaneWaveSolution, PlaneWaveAnchor, PlaneWaveHook
 from .inout import (AmscaAnchor, MeshInfoHook, ProgressHook, FillAnchor, 
-                    CflAnchor, CflHook, MarchSaveAnchor, PMarchSave)
+                    CflAnchor, CflHook, MarchSaveAnchor, PMarchSave,
+                    MarchArchiveAnchor, PMarchArchive)
 from .material import mltregy, Material
 
 # vim: set ff=unix fenc=utf8 ft=python ai et sw=4 ts=4 tw=79:
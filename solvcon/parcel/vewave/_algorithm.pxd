@@ -62,5 +62,6 @@ cdef public:
 from solvcon.mesh cimport Mesh
 cdef class VewaveAlgorithm(Mesh):
     cdef sc_vewave_algorithm_t *_alg
+    cdef public bint specialized
 
 # vim: set fenc=utf8 ft=pyrex ff=unix ai et sw=4 ts=4 tw=79:
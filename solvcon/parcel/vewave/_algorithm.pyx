@@ -61,6 +61,19 @@ cdef extern:
     void sc_vewave_calc_soln_3d(sc_mesh_t *msd, sc_vewave_algorithm_t *alg)
     void sc_vewave_calc_dsoln_2d(sc_mesh_t *msd, sc_vewave_algorithm_t *alg)
     void sc_vewave_calc_dsoln_3d(sc_mesh_t *msd, sc_vewave_algorithm_t *alg)
+    # algorithm calculators for 45 equations.
+    void sc_vewave_calc_solt_2d_neq45(
+        sc_mesh_t *msd, sc_vewave_algorithm_t *alg)
+    void sc_vewave_calc_solt_3d_neq45(
+        sc_mesh_t *msd, sc_vewave_algorithm_t *alg)
+    void sc_vewave_calc_soln_2d_neq45(
+        sc_mesh_t *msd, sc_vewave_algorithm_t *alg)
+    void sc_vewave_calc_soln_3d_neq45(
+        sc_mesh_t *msd, sc_vewave_algorithm_t *alg)
+    void sc_vewave_calc_dsoln_2d_neq45(
+        sc_mesh_t *msd, sc_vewave_algorithm_t *alg)
+    void sc_vewave_calc_dsoln_3d_neq45(
+        sc_mesh_t *msd, sc_vewave_algorithm_t *alg)
     # ghost information calculators.
     void sc_vewave_ghostgeom_mirror_2d(
         sc_mesh_t *msd, sc_vewave_algorithm_t *alg, int nbnd, int *facn)
@@ -93,9 +106,15 @@ cdef extern from "stdlib.h":
 cdef class VewaveAlgorithm(Mesh):
     """
     An algorithm class that does trivial calculation.
+
+    The calculators dispatch to the kernels compiled for 45 equations, the
+    number :py:meth:`VewaveSolver.determine_neq
+    <solvcon.parcel.vewave.solver.VewaveSolver.determine_neq>` returns, when
+    :py:attr:`specialized` is True (default) and the number matches.
     """
     def __cinit__(self):
         self._alg = <sc_vewave_algorithm_t *>malloc(sizeof(sc_vewave_algorithm_t))
+        self.specialized = True
 
     def __dealloc__(self):
         if NULL != self._alg:
@@ -127,7 +146,10 @@ cdef class VewaveAlgorithm(Mesh):
         cdef cnp.ndarray[double, ndim=2, mode="c"] cevol = svr.cevol
         self._alg.cevol = &cevol[self._msd.ngstcell,0]
         cdef cnp.ndarray[double, ndim=5, mode="c"] sfmrc = svr.sfmrc
-        self._alg.sfmrc = &sfmrc[0,0,0,0,0]
+        if svr.sfmrc is not None:
+            self._alg.sfmrc = &sfmrc[0,0,0,0,0]
+        else:
+            self._alg.sfmrc = NULL
 
     def _setup_parameters(self, svr):
         # group data.
@@ -221,19 +243,34 @@ cdef class VewaveAlgorithm(Mesh):
             sc_vewave_calc_cfl_2d(self._msd, self._alg)
 
     def calc_solt(self):
-        if self._msd.ndim == 3:
+        if self.specialized and self._alg.neq == 45:
+            if self._msd.ndim == 3:
+                sc_vewave_calc_solt_3d_neq45(self._msd, self._alg)
+            else:
+                sc_vewave_calc_solt_2d_neq45(self._msd, self._alg)
+        elif self._msd.ndim == 3:
             sc_vewave_calc_solt_3d(self._msd, self._alg)
         else:
             sc_vewave_calc_solt_2d(self._msd, self._alg)
 
     def calc_soln(self):
-        if self._msd.ndim == 3:
+        if self.specialized and self._alg.neq == 45:
+            if self._msd.ndim == 3:
+                sc_vewave_calc_soln_3d_neq45(self._msd, self._alg)
+            else:
+                sc_vewave_calc_soln_2d_neq45(self._msd, self._alg)
+        elif self._msd.ndim == 3:
             sc_vewave_calc_soln_3d(self._msd, self._alg)
         else:
             sc_vewave_calc_soln_2d(self._msd, self._alg)
 
     def calc_dsoln(self):
-        if self._msd.ndim == 3:
+        if self.specialized and self._alg.neq == 45:
+            if self._msd.ndim == 3:
+                sc_vewave_calc_dsoln_3d_neq45(self._msd, self._alg)
+            else:
+                sc_vewave_calc_dsoln_2d_neq45(self._msd, self._alg)
+        elif self._msd.ndim == 3:
             sc_vewave_calc_dsoln_3d(self._msd, self._alg)
         else:
             sc_vewave_calc_dsoln_2d(self._msd, self._alg)
@@ -33,22 +33,46 @@
 #include "mesh.h"
 #include "_algorithm.h"
 
+#define SC_VEWAVE_PASTE_(name, neq) name ## _neq ## neq
+#define SC_VEWAVE_PASTE(name, neq) SC_VEWAVE_PASTE_(name, neq)
+
+#endif // __SC_VEWAVE__ALGORITHM_SRC_H__
+
+/*
+ * The rest of this file is read again whenever SC_VEWAVE_NEQ changes.  Without
+ * SC_VEWAVE_NEQ, NEQ is the run-time alg->neq.  With SC_VEWAVE_NEQ defined,
+ * NEQ becomes a compile-time constant and SC_VEWAVE_KERNEL() suffixes the
+ * kernel names by _neq<NEQ>.
+ */
+#undef NEQ
+#undef SC_VEWAVE_KERNEL
+#ifdef SC_VEWAVE_NEQ
+#define NEQ SC_VEWAVE_NEQ
+#define SC_VEWAVE_KERNEL(name) SC_VEWAVE_PASTE(name, SC_VEWAVE_NEQ)
+#else
+#define NEQ alg->neq
+#define SC_VEWAVE_KERNEL(name) name
+#endif
+
 #undef NDIM
 #define NDIM 2
-#undef NEQ
-#define NEQ 45
-void sc_vewave_calc_jaco_2d(sc_mesh_t *msd, sc_vewave_algorithm_t *alg,
+void SC_VEWAVE_KERNEL(sc_vewave_calc_jaco_2d)(
+    sc_mesh_t *msd, sc_vewave_algorithm_t *alg,
     int icl, double fcn[NEQ][NDIM], double jacos[NEQ][NEQ][NDIM]);
-void sc_vewave_calc_dif_2d(sc_mesh_t *msd, sc_vewave_algorithm_t *alg,
+void SC_VEWAVE_KERNEL(sc_vewave_calc_dif_2d)(
+    sc_mesh_t *msd, sc_vewave_algorithm_t *alg,
     int icl, double difs[NEQ][NDIM]);
+void sc_vewave_calc_sfmrc_2d(sc_mesh_t *msd, sc_vewave_algorithm_t *alg,
+    int icl, int ifl, double sfmrc[FCMND][2][NDIM]);
 #undef NDIM
 #define NDIM 3
-#undef NEQ
-#define NEQ 45
-void sc_vewave_calc_jaco_3d(sc_mesh_t *msd, sc_vewave_algorithm_t *alg,
+void SC_VEWAVE_KERNEL(sc_vewave_calc_jaco_3d)(
+    sc_mesh_t *msd, sc_vewave_algorithm_t *alg,
     int icl, double fcn[NEQ][NDIM], double jacos[NEQ][NEQ][NDIM]);
-void sc_vewave_calc_dif_3d(sc_mesh_t *msd, sc_vewave_algorithm_t *alg,
+void SC_VEWAVE_KERNEL(sc_vewave_calc_dif_3d)(
+    sc_mesh_t *msd, sc_vewave_algorithm_t *alg,
     int icl, double difs[NEQ][NDIM]);
+void sc_vewave_calc_sfmrc_3d(sc_mesh_t *msd, sc_vewave_algorithm_t *alg,
+    int icl, int ifl, double sfmrc[FCMND][2][NDIM]);
 
 // vim: set ft=c ts=4 et:
-#endif // __SC_VEWAVE__ALGORITHM_SRC_H__
@@ -327,7 +327,7 @@ class MarchSaveAnchor(anchor.MeshAnchor):
     """
 
     def __init__(self, svr, anames=None, compressor=None, fpdtype=None,
-                 psteps=None, vtkfn_tmpl=None, **kw): 
+                 psteps=None, vtkfn_tmpl=None, maxpending=0, **kw): 
         assert None is not compressor
         assert None is not fpdtype
         assert None is not psteps
@@ -344,6 +344,12 @@ class MarchSaveAnchor(anchor.MeshAnchor):
         self.psteps = psteps
         #: The template string for the VTK file.
         self.vtkfn_tmpl = vtkfn_tmpl
+        #: The maximum number of snapshots waiting to be written by a
+        #: background thread.  ``0`` writes in the marching thread.
+        self.maxpending = maxpending
+        #: The writer reused for every output step, so that the grid is
+        #: converted and encoded only once.
+        self.wtr = None
         super(MarchSaveAnchor, self).__init__(svr, **kw)
 
     @property
@@ -387,8 +393,15 @@ class MarchSaveAnchor(anchor.MeshAnchor):
                 for it in range(arr.shape[1]):
                     sarrs['%s[%d]' % (key, it)] = arr[:,it]
         # write.
-        wtr = vtkxml.VtkXmlUstGridWriter(self.svr.blk, fpdtype=self.fpdtype,
-            compressor=self.compressor, scalars=sarrs, vectors=varrs)
+        if self.wtr is None:
+            self.wtr = vtkxml.VtkXmlUstGridWriter(self.svr.blk,
+                fpdtype=self.fpdtype, compressor=self.compressor)
+            if self.maxpending:
+                self.wtr = vtkxml.VtkXmlAsyncWriter(self.wtr,
+                    maxpending=self.maxpending)
+        wtr = self.wtr
+        wtr.scalars = sarrs
+        wtr.vectors = varrs
         svrn = self.svr.svrn
         wtr.write(self.vtkfn_tmpl % (istep if svrn is None else (istep, svrn)))
 
@@ -409,6 +422,9 @@ class MarchSaveAnchor(anchor.MeshAnchor):
         if istep%psteps != 0:
             self._calc_physics()
             self._write(istep)
+        if self.maxpending and self.wtr is not None:
+            self.wtr.close()
+            self.wtr = None
 
 
 class PMarchSave(hook.MeshHook):
@@ -417,7 +433,7 @@ class PMarchSave(hook.MeshHook):
     """
 
     def __init__(self, cse, anames=None, compressor='gz', fpdtype=None,
-                 altdir='', altsym='', vtkfn_tmpl=None, **kw):
+                 altdir='', altsym='', vtkfn_tmpl=None, maxpending=0, **kw):
         #: The arrays in :py:class:`VewaveSolver <.solver.VewaveSolver>` or
         #: :py:attr:`MeshSolver.der <solvcon.solver.MeshSolver.der>` to be
         #: saved.  Format is (name, inder, ndim), (name, inder, ndim) ...  For
@@ -433,6 +449,10 @@ class PMarchSave(hook.MeshHook):
         #: The symbolic link in basedir pointing to the alternate directory to
         #: save the VTK files.
         self.altsym = altsym
+        #: The maximum number of snapshots waiting to be written by the
+        #: background thread of each solver.  ``0`` writes in the marching
+        #: thread.
+        self.maxpending = maxpending
         super(PMarchSave, self).__init__(cse, **kw)
         # override vtkfn_tmpl.
         nsteps = cse.execution.steps_run
@@ -466,7 +486,7 @@ class PMarchSave(hook.MeshHook):
         anames = dict([(ent[0], ent[1]) for ent in self.anames])
         ankkw = dict(anames=anames, compressor=self.compressor,
             fpdtype=self.fpdtype, psteps=self.psteps,
-            vtkfn_tmpl=basefn+self.pextmpl)
+            vtkfn_tmpl=basefn+self.pextmpl, maxpending=self.maxpending)
         self._deliver_anchor(svr, MarchSaveAnchor, ankkw)
 
     def _write(self, istep):
@@ -506,6 +526,130 @@ class PMarchSave(hook.MeshHook):
         istep = self.cse.execution.step_current
         if istep%psteps != 0:
             self._write(istep)
+
+
+class MarchArchiveAnchor(anchor.MeshAnchor):
+    """
+    Append solution data of a solver to a :py:mod:`series
+    <solvcon.io.series>` archive file.
+    """
+
+    def __init__(self, svr, anames=None, compressor='', psteps=None,
+                 arcfn_tmpl=None, append=False, **kw):
+        assert None is not psteps
+        assert None is not arcfn_tmpl
+        #: The arrays in :py:class:`VewaveSolver <.solver.VewaveSolver>` or
+        #: :py:attr:`MeshSolver.der <solvcon.solver.MeshSolver.der>` to be
+        #: saved.
+        self.anames = anames if anames else dict()
+        #: Compressor for the arrays.  See :py:mod:`solvcon.io.core`.
+        self.compressor = compressor
+        #: The interval in step to save data.
+        self.psteps = psteps
+        #: The template string for the archive file.
+        self.arcfn_tmpl = arcfn_tmpl
+        #: Append to an existing archive, e.g., for a restarted run, instead
+        #: of overwriting it.
+        self.append = append
+        #: The :py:class:`SeriesWriter <solvcon.io.series.SeriesWriter>`
+        #: opened in :py:meth:`preloop`.
+        self.wtr = None
+        super(MarchArchiveAnchor, self).__init__(svr, **kw)
+
+    @property
+    def alg(self):
+        return self.svr.alg
+
+    def provide(self):
+        # the stresses may also be provided by MarchSaveAnchor.
+        from numpy import empty
+        svr = self.svr
+        der = svr.der
+        nelm = svr.ngstcell + svr.ncell
+        for key in ('s11', 's22', 's33', 's23', 's13', 's12'):
+            if key not in der:
+                der[key] = empty(nelm, dtype=svr.sol.dtype)
+
+    def _calc_physics(self):
+        der = self.svr.der
+        self.alg.calc_physics(der['s11'], der['s22'], der['s33'],
+                              der['s23'], der['s13'], der['s12'])
+
+    def _write(self, istep):
+        self._calc_physics()
+        ngstcell = self.svr.ngstcell
+        arrs = dict()
+        for key in self.anames:
+            if self.anames[key]:
+                arrs[key] = self.svr.der[key][ngstcell:]
+            else:
+                arrs[key] = getattr(self.svr, key)[ngstcell:]
+        self.wtr.write_step(istep, self.svr.time, arrs)
+
+    def preloop(self):
+        from solvcon.io.series import SeriesWriter
+        svrn = self.svr.svrn
+        arcfn = self.arcfn_tmpl if svrn is None else self.arcfn_tmpl % svrn
+        self.wtr = SeriesWriter(arcfn, blk=self.svr.blk,
+                                compressor=self.compressor,
+                                append=self.append)
+        # a restarted run doesn't write the step already in the archive.
+        istep = self.svr.step_global
+        if all(ent.step != istep for ent in self.wtr.entries):
+            self._write(istep)
+
+    def postmarch(self):
+        psteps = self.psteps
+        istep = self.svr.step_global
+        if istep%psteps == 0:
+            self._write(istep)
+
+    def postloop(self):
+        psteps = self.psteps
+        istep = self.svr.step_global
+        if istep%psteps != 0:
+            self._write(istep)
+        self.wtr.close()
+
+
+class PMarchArchive(hook.MeshHook):
+    """
+    Save the variables of each solver when time marching into a single
+    :py:mod:`series <solvcon.io.series>` archive file, instead of a VTK file
+    for each output step.  Use :py:func:`solvcon.io.series.export_vtk` to
+    convert a time step to VTK files.
+    """
+
+    def __init__(self, cse, anames=None, compressor='', altdir='',
+                 append=False, **kw):
+        #: The arrays in :py:class:`VewaveSolver <.solver.VewaveSolver>` or
+        #: :py:attr:`MeshSolver.der <solvcon.solver.MeshSolver.der>` to be
+        #: saved.  Format is (name, inder), (name, inder) ...
+        self.anames = anames if anames else list()
+        #: Compressor for the arrays.  See :py:mod:`solvcon.io.core`.
+        self.compressor = compressor
+        #: The alternate directory to save the archive files.
+        self.altdir = altdir
+        #: Append to the existing archive files, for a restarted run.  They
+        #: are overwritten otherwise.
+        self.append = append
+        super(PMarchArchive, self).__init__(cse, **kw)
+        vdir = self.altdir if self.altdir else cse.io.basedir
+        if not os.path.exists(vdir):
+            os.makedirs(vdir)
+        arcfn_tmpl = cse.io.basefn
+        npart = cse.execution.npart
+        if npart:
+            arcfn_tmpl += '.p%%0%dd'%int(math.ceil(math.log10(npart))+1)
+        #: The template string for the archive files.
+        self.arcfn_tmpl = os.path.join(vdir, arcfn_tmpl + '.scs')
+
+    def drop_anchor(self, svr):
+        anames = dict([(ent[0], ent[1]) for ent in self.anames])
+        ankkw = dict(anames=anames, compressor=self.compressor,
+            psteps=self.psteps, arcfn_tmpl=self.arcfn_tmpl,
+            append=self.append)
+        self._deliver_anchor(svr, MarchArchiveAnchor, ankkw)
 # End solution output.
 ################################################################################
 
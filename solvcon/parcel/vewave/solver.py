@@ -95,13 +95,15 @@ class VewaveSolver(solver.MeshSolver):
         self.sftfac = float(kw.pop('sftfac', 1.0))  # dirty hack.
         self.taumin = float(kw.pop('taumin', 0.0))
         self.tauscale = float(kw.pop('tauscale', 1.0))
+        # store sub-face metrics, or calculate them on the fly in calc_soln.
+        self.storesf = bool(kw.pop('storesf', True))
         # dual mesh.
         self.cecnd = np.empty(
             (ngstcell+ncell, blk.CLMFC+1, ndim), dtype=fpdtype)
         self.cevol = np.empty(
             (ngstcell+ncell, blk.CLMFC+1), dtype=fpdtype)
         self.sfmrc = np.empty((ncell, blk.CLMFC, blk.FCMND, 2, ndim),
-            dtype=fpdtype)
+            dtype=fpdtype) if self.storesf else None
         # parameters.
         self.grpda = np.empty((self.ngroup, self.gdlen), dtype=fpdtype)
         nsca = kw.pop('nsca', 4)
@@ -136,9 +138,10 @@ class VewaveSolver(solver.MeshSolver):
         self.cecnd.fill(0.0)
         self.alg.prepare_ce()
         super(VewaveSolver, self).init(**kw)
-        self.sfmrc.fill(0.0)
-        self.alg.prepare_sf()
-        self._debug_check_array('sfmrc')
+        if self.storesf:
+            self.sfmrc.fill(0.0)
+            self.alg.prepare_sf()
+            self._debug_check_array('sfmrc')
 
     def provide(self):
         super(VewaveSolver, self).provide()
@@ -195,8 +198,8 @@ class VewaveSolver(solver.MeshSolver):
     @_MMNAMES.register
     def update(self, worker=None):
         self.alg.update(self.time, self.time_increment)
-        self.sol[:,:] = self.soln[:,:]
-        self.dsol[:,:,:] = self.dsoln[:,:,:]
+        if self.update_solutions():
+            self.alg._setup_solutions(self)
 
     @_MMNAMES.register
     def calcsolt(self, worker=None):
@@ -33,7 +33,7 @@
 #include "mesh.h"
 #include "_algorithm.h"
 
-#define NEQ alg->neq
+#include "_algorithm_src.h"
 #define MFGE 8
 #define ALMOST_ZERO 1.e-200
 
@@ -68,4 +68,15 @@ const int ggerng[8][2] = {
 #define NDIM 3
 #include "sc_vewave_calc_dsoln.c_body"
 
+// instances for the number of equations of VewaveSolver.
+#define SC_VEWAVE_NEQ 45
+#include "_algorithm_src.h"
+#undef NDIM
+#define NDIM 2
+#include "sc_vewave_calc_dsoln.c_body"
+#undef NDIM
+#define NDIM 3
+#include "sc_vewave_calc_dsoln.c_body"
+#undef SC_VEWAVE_NEQ
+
 // vim: set ts=4 et:
@@ -41,4 +41,15 @@
 #define NDIM 3
 #include "sc_vewave_calc_solt.c_body"
 
+// instances for the number of equations of VewaveSolver.
+#define SC_VEWAVE_NEQ 45
+#include "_algorithm_src.h"
+#undef NDIM
+#define NDIM 2
+#include "sc_vewave_calc_solt.c_body"
+#undef NDIM
+#define NDIM 3
+#include "sc_vewave_calc_solt.c_body"
+#undef SC_VEWAVE_NEQ
+
 // vim: set ts=4 et:
@@ -0,0 +1,75 @@
+import unittest
+
+import numpy as np
+
+from solvcon import testing
+
+from .. import solver
+
+
+class TestSpecialized(unittest.TestCase):
+    __test__ = False
+
+    def _get_block(self):
+        raise NotImplementedError
+
+    def setUp(self):
+        blk = self._get_block()
+        self.svr = svr = solver.VewaveSolver(blk, {}, time_increment=1.e-3)
+        svr.init()
+        # no BC sets the ghost geometry.
+        svr.cecnd[:svr.ngstcell] = svr.blk.shclcnd[:svr.ngstcell,None,:]
+        rng = np.random.RandomState(0)
+        svr.grpda[...] = rng.rand(*svr.grpda.shape) - 0.5
+        for name in ('sol', 'solt', 'dsol', 'amsca'):
+            arr = getattr(svr, name)
+            arr[...] = rng.rand(*arr.shape)
+        svr.cfl.fill(0.5)
+
+    def _compare(self, calcname, arrname):
+        svr = self.svr
+        results = []
+        for specialized in (False, True):
+            svr.alg.specialized = specialized
+            getattr(svr, arrname).fill(0.0)
+            getattr(svr.alg, calcname)()
+            results.append(getattr(svr, arrname)[svr.ngstcell:].copy())
+        self.assertTrue(np.isfinite(results[0]).all())
+        self.assertTrue(np.allclose(results[0], results[1],
+                                    rtol=1.e-12, atol=1.e-14))
+
+    def test_solt(self):
+        self._compare('calc_solt', 'solt')
+
+    def test_soln(self):
+        self._compare('calc_soln', 'soln')
+
+    def test_dsoln(self):
+        self._compare('calc_dsoln', 'dsoln')
+
+    def test_sfmrc_on_the_fly(self):
+        svr = self.svr
+        results = []
+        for sfmrc in (svr.sfmrc, None):
+            svr.sfmrc = sfmrc
+            svr.alg.setup_algorithm(svr)
+            svr.soln.fill(0.0)
+            svr.alg.calc_soln()
+            results.append(svr.soln[svr.ngstcell:].copy())
+        self.assertTrue((results[0] == results[1]).all())
+
+
+class TestSpecialized2D(TestSpecialized):
+    __test__ = True
+
+    def _get_block(self):
+        return testing.get_blk_from_oblique_neu()
+
+
+class TestSpecialized3D(TestSpecialized):
+    __test__ = True
+
+    def _get_block(self):
+        return testing.get_blk_from_sample_neu()
+
+# vim: set ff=unix fenc=utf8 nobomb et sw=4 ts=4 tw=79:
@@ -332,7 +332,7 @@ class Worker(object):
         raise Terminate
 
     def create_solver(self, bcmap, dirname, blkfn, iblk, nblk, solvertype,
-            svrkw):
+            svrkw, mmap=False):
         """
         Load a block and create a solver object with the given information, and
         set it to muscle.
@@ -351,10 +351,12 @@ class Worker(object):
         @type solvertype: type
         @param svrkw: keywords passed to the constructor of solver.
         @type svrkw: dict
+        @keyword mmap: map the uncompressed block file instead of reading it.
+        @type mmap: bool
         @return: nothing
         """
         from .io.domain import DomainIO
-        dio = DomainIO(dirname=dirname)
+        dio = DomainIO(dirname=dirname, mmap=mmap)
         blk = dio.load_block(blkid=iblk, bcmapper=bcmap, blkfn=blkfn)
         svr = solvertype(blk, **svrkw)
         svr.svrn = iblk
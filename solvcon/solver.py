@@ -42,6 +42,7 @@ from . import anchor
 from . import gendata
 from . import helper
 from . import boundcond
+from . import mesh
 
 from . import solver_core
 
@@ -70,6 +71,158 @@ class _MethodList(list):
         self.append(func.__name__)
         return func
 
+class HaloPlan(object):
+    """
+    Plan of exchanging the ghost cells over the interfaces of a
+    :py:class:`MeshSolver`.  For each interface, it keeps the indices to
+    gather the sending rows and to scatter the received rows, and a pair of
+    contiguous sending and receiving buffers for each exchanged array.  The
+    gathering and the scattering are done by
+    :py:func:`solvcon.mesh.gather_rows` and
+    :py:func:`solvcon.mesh.scatter_rows`, so that exchanging allocates no
+    memory after the buffers are created.
+
+    A tuple of array names is exchanged as a group: the rows of all the
+    arrays are packed into one byte buffer, so that the group takes a single
+    message for each interface.
+
+    >>> from . import testing
+    >>> svr = MeshSolver(testing.create_trivial_2d_blk())
+    >>> plan = HaloPlan(svr)
+    >>> len(plan.interfaces)
+    0
+    """
+
+    #: Alignment (in bytes) of each array packed in a group buffer.
+    ALIGNMENT = 16
+
+    def __init__(self, svr, arrnames=()):
+        """
+        :param svr: The solver to exchange for.
+        :type svr: MeshSolver
+        :keyword arrnames: Names (or tuples of names for groups) of the arrays
+            to allocate the buffers for up front.  Buffers of other arrays are
+            allocated at the first use.
+        :type arrnames: sequence
+        """
+        #: The solver to exchange for.
+        self.svr = svr
+        #: The interface BC objects, ordered by the serial numbers of the
+        #: related blocks.
+        self.interfaces = sorted(
+            (bc for bc in svr.bclist if isinstance(bc, boundcond.interface)),
+            key=lambda bc: bc.rblkn)
+        #: Indices of the rows to send, keyed by the serial number of the
+        #: related block.
+        self.sendidx = dict()
+        #: Indices of the ghost rows to be received, keyed by the serial
+        #: number of the related block.
+        self.recvidx = dict()
+        ngstcell = svr.ngstcell
+        for bc in self.interfaces:
+            self.sendidx[bc.rblkn] = (bc.rclp[:,2] + ngstcell).astype('int32')
+            self.recvidx[bc.rblkn] = (bc.rclp[:,0] + ngstcell).astype('int32')
+        self._buffers = dict()
+        self._segments = dict()
+        for arrname in arrnames:
+            names = arrname if isinstance(arrname, tuple) else (arrname,)
+            if not names or any(getattr(svr, name, None) is None
+                                for name in names):
+                continue
+            for bc in self.interfaces:
+                self.get_buffers(arrname, bc.rblkn)
+
+    def get_buffers(self, arrname, rblkn, arr=None):
+        """
+        :param arrname: The name of the array to exchange, or a tuple of names
+            for a group.
+        :type arrname: str or tuple
+        :param rblkn: The serial number of the related block.
+        :type rblkn: int
+        :keyword arr: The array; taken from the solver if not given.  Not used
+            for a group.
+        :type arr: numpy.ndarray
+        :return: The sending and receiving buffers.
+        :rtype: tuple of numpy.ndarray
+
+        The cached buffers are reallocated if the shape or the dtype of the
+        array changed since they were created.
+        """
+        bufs = self._buffers.get((arrname, rblkn))
+        if isinstance(arrname, tuple):
+            if bufs is None or not self._match_group(arrname, rblkn):
+                bufs = self._make_group(arrname, rblkn)
+        else:
+            arr = getattr(self.svr, arrname) if arr is None else arr
+            shape = (len(self.sendidx[rblkn]),) + arr.shape[1:]
+            if (bufs is None or bufs[0].shape != shape
+                    or bufs[0].dtype != arr.dtype):
+                bufs = (np.empty(shape, dtype=arr.dtype),
+                        np.empty(shape, dtype=arr.dtype))
+        self._buffers[arrname, rblkn] = bufs
+        return bufs
+
+    def _match_group(self, arrnames, rblkn):
+        """
+        Tell whether the views of a group still fit the arrays.
+        """
+        for name, sarr, rarr in self._segments[arrnames, rblkn]:
+            arr = getattr(self.svr, name)
+            if sarr.shape[1:] != arr.shape[1:] or sarr.dtype != arr.dtype:
+                return False
+        return True
+
+    def _make_group(self, arrnames, rblkn):
+        """
+        Allocate the byte buffers of a group and the views of each array in
+        them.
+        """
+        nrow = len(self.sendidx[rblkn])
+        layout = list()
+        nbyte = 0
+        for name in arrnames:
+            arr = getattr(self.svr, name)
+            shape = (nrow,) + arr.shape[1:]
+            size = int(np.prod(shape)) * arr.itemsize
+            layout.append((name, nbyte, size, shape, arr.dtype))
+            nbyte += -(-size // self.ALIGNMENT) * self.ALIGNMENT
+        sbuf = np.empty(nbyte, dtype='uint8')
+        rbuf = np.empty(nbyte, dtype='uint8')
+        self._segments[arrnames, rblkn] = [(name,
+            sbuf[start:start+size].view(dtype).reshape(shape),
+            rbuf[start:start+size].view(dtype).reshape(shape),
+        ) for name, start, size, shape, dtype in layout]
+        return sbuf, rbuf
+
+    def gather(self, arrname, rblkn):
+        """
+        :return: The sending buffer filled with the rows to send.
+        :rtype: numpy.ndarray
+        """
+        sendidx = self.sendidx[rblkn]
+        if isinstance(arrname, tuple):
+            sbuf, rbuf = self.get_buffers(arrname, rblkn)
+            for name, sarr, rarr in self._segments[arrname, rblkn]:
+                mesh.gather_rows(getattr(self.svr, name), sendidx, sarr)
+        else:
+            arr = getattr(self.svr, arrname)
+            sbuf, rbuf = self.get_buffers(arrname, rblkn, arr)
+            mesh.gather_rows(arr, sendidx, sbuf)
+        return sbuf
+
+    def scatter(self, arrname, rblkn):
+        """
+        Copy the receiving buffer into the ghost rows.
+        """
+        recvidx = self.recvidx[rblkn]
+        if isinstance(arrname, tuple):
+            for name, sarr, rarr in self._segments[arrname, rblkn]:
+                mesh.scatter_rows(rarr, recvidx, getattr(self.svr, name))
+        else:
+            arr = getattr(self.svr, arrname)
+            sbuf, rbuf = self.get_buffers(arrname, rblkn, arr)
+            mesh.scatter_rows(rbuf, recvidx, arr)
+
 class MeshSolver(object):
     """
     Base class for all solving code that take :py:class:`Mesh
@@ -176,6 +329,20 @@ class MeshSolver(object):
         self._mesg = None
         #: Debugging flag.
         self.debug = debug
+        # interface exchange.
+        #: Post the sending and receiving for all the interfaces at once
+        #: instead of exchanging them phase by phase.
+        self.ibcasync = kw.pop('ibcasync', False)
+        self.ibclist = None
+        #: The :py:class:`HaloPlan` built by :py:meth:`init_exchange`.
+        self.haloplan = None
+        self._ibcpending = dict()
+        # solution buffers.
+        #: Swap the roles of the old and new solution arrays in
+        #: :py:meth:`update_solutions` instead of copying the new solutions
+        #: over the old ones.
+        self.swapsol = kw.pop('swapsol', False)
+        self._solsynced = False
 
     ############################################################################
     # Meta data.
@@ -375,6 +542,9 @@ class MeshSolver(object):
                     self.timer.increase(mmname, time.time() - t2)
                     self.runanchors('post'+mmname)
                     self.timer.increase(mmname+'_a', time.time() - t1)
+                # complete the exchanges left in flight.
+                if self._ibcpending:
+                    self.waitibc()
                 # increment time.
                 time_current += self.time_increment/self.substep_run
                 self.time = time_current
@@ -430,6 +600,49 @@ class MeshSolver(object):
                 e.args = tuple([str(bc), name] + list(e.args))
                 raise
 
+    def update_solutions(self, pairs=(('sol', 'soln'), ('dsol', 'dsoln'))):
+        """
+        :param pairs: Names of the old and the new solution arrays.
+        :type pairs: sequence of tuple
+        :return: True if the arrays are swapped, otherwise False.
+        :rtype: bool
+
+        Make the new solutions the old ones for the next sub-step.  The new
+        arrays are copied over the old ones unless :py:attr:`swapsol` is set,
+        in which case the two buffers of each pair exchange their names.  The
+        :py:class:`solvcon.Table` objects named with the ``tb`` prefix, if
+        any, are exchanged as well.  The arrays are always copied on the first
+        call, so that the ghost cells that no BC writes hold the same values
+        in both buffers.  When True is returned, the pointers held by an
+        algorithm object must be set again.
+
+        >>> from . import testing
+        >>> svr = MeshSolver(testing.create_trivial_2d_blk(), swapsol=True)
+        >>> svr.sol = np.zeros(3)
+        >>> svr.soln = np.arange(3.0)
+        >>> svr.update_solutions([('sol', 'soln')])
+        False
+        >>> svr.sol.tolist(), svr.sol is svr.soln
+        ([0.0, 1.0, 2.0], False)
+        >>> sol, soln = svr.sol, svr.soln
+        >>> svr.update_solutions([('sol', 'soln')])
+        True
+        >>> svr.sol is soln and svr.soln is sol
+        True
+        """
+        if not (self.swapsol and self._solsynced):
+            for oname, nname in pairs:
+                getattr(self, oname)[...] = getattr(self, nname)
+            self._solsynced = True
+            return False
+        for oname, nname in pairs:
+            for prefix in ('tb', ''):
+                if hasattr(self, prefix+oname):
+                    old = getattr(self, prefix+oname)
+                    setattr(self, prefix+oname, getattr(self, prefix+nname))
+                    setattr(self, prefix+nname, old)
+        return True
+
     ##################################################
     # parallelization.
     ##################################################
@@ -498,7 +711,7 @@ class MeshSolver(object):
         # grab peer index.
         ibclist = list()
         for pair in ifacelist:
-            if pair < 0:
+            if not isinstance(pair, (list, tuple)):    # sleeping stage.
                 ibclist.append(pair)
             else:
                 assert len(pair) == 2
@@ -512,12 +725,41 @@ class MeshSolver(object):
             sendn, recvn = ifacelist[it]
             ibclist[it] = bc, sendn, recvn
         self.ibclist = ibclist
+        self.haloplan = HaloPlan(self, (tuple(self._interface_init_),)
+                                       + tuple(self._solution_array_))
+        self._ibcpending.clear()
 
-    def exchangeibc(self, arrname, worker=None):
-        threads = list()
+    def exchangeibc(self, arrname, worker=None, wait=True):
+        """
+        :param arrname: The name of the array in the object to exchange, or a
+            sequence of names to be exchanged together in one message for
+            each interface.
+        :type arrname: str or sequence of str
+        :keyword worker: The wrapping worker object for parallel processing.
+        :type worker: solvcon.rpc.Worker
+        :keyword wait: Wait for the exchange to complete.  Only takes effect
+            with :py:attr:`ibcasync`; otherwise the exchange always completes
+            before returning.
+        :type wait: bool
+
+        Exchange the array over all the interfaces.  By default the interfaces
+        are walked phase by phase with blocking calls.  With
+        :py:attr:`ibcasync` set, the sending and receiving for all the
+        interfaces are posted at once; when *wait* is False, the exchange is
+        left in flight to overlap with the computation that doesn't need the
+        ghost cells of the interfaces, and has to be completed by
+        :py:meth:`waitibc`.
+        """
+        if isinstance(arrname, list):
+            arrname = tuple(arrname)
+        if self.ibcasync:
+            self.postibc(arrname, worker=worker)
+            if wait:
+                self.waitibc(arrname)
+            return
         for ibc in self.ibclist:
             # check if sleep or not.
-            if ibc < 0:
+            if not isinstance(ibc, tuple):
                 continue 
             bc, sendn, recvn = ibc
             # determine callable and arguments.
@@ -534,10 +776,60 @@ class MeshSolver(object):
             # call to data transfer.
             target(*args, **kwargs)
 
+    def postibc(self, arrname, worker=None):
+        """
+        :param arrname: The name of the array in the object to exchange, or a
+            tuple of names for a group.
+        :type arrname: str or tuple
+        :keyword worker: The wrapping worker object for parallel processing.
+        :type worker: solvcon.rpc.Worker
+
+        Post the non-blocking sending and receiving of the array for all the
+        interfaces.  Both ends of an interface post in the same order, so that
+        the messages match without a phase order.
+        """
+        self.waitibc(arrname)
+        plan = self.haloplan
+        pending = list()
+        for ibc in self.ibclist:
+            if not isinstance(ibc, tuple):
+                continue
+            rblkn = ibc[0].rblkn
+            conn = worker.pconns[rblkn]
+            rreq = conn.irecvarr(plan.get_buffers(arrname, rblkn)[1]) # comm.
+            sreq = conn.isendarr(plan.gather(arrname, rblkn))   # comm.
+            pending.append((rblkn, rreq, sreq))
+        self._ibcpending[arrname] = pending
+
+    def waitibc(self, arrname=None):
+        """
+        :keyword arrname: The name of the array to wait for, or a tuple of
+            names.  The exchanges in flight involving any of the arrays are
+            waited for.  None waits for all the arrays in flight.
+        :type arrname: str or tuple
+        :return: Nothing.
+
+        Complete the exchange posted by :py:meth:`postibc` and fill the ghost
+        cells of the interfaces.
+        """
+        if arrname is None:
+            arrnames = list(self._ibcpending)
+        else:
+            names = set(arrname if isinstance(arrname, tuple) else (arrname,))
+            arrnames = [key for key in self._ibcpending if names.intersection(
+                key if isinstance(key, tuple) else (key,))]
+        plan = self.haloplan
+        for arrname in arrnames:
+            for rblkn, rreq, sreq in self._ibcpending.pop(arrname):
+                rreq.wait()
+                plan.scatter(arrname, rblkn)
+                sreq.wait()
+
     def pushibc(self, arrname, bc, recvn, worker=None):
         """
-        :param arrname: The name of the array in the object to exchange.
-        :type arrname: str
+        :param arrname: The name of the array in the object to exchange, or a
+            tuple of names for a group.
+        :type arrname: str or tuple
         :param bc: The interface BC to push.
         :type bc: solvcon.boundcond.interface
         :param recvn: Serial number of the peer to exchange data with.
@@ -550,23 +842,18 @@ class MeshSolver(object):
         serial number than myself.
         """
         conn = worker.pconns[bc.rblkn]
-        ngstcell = self.ngstcell
-        arr = getattr(self, arrname)
+        plan = self.haloplan
         # ask the receiver for data.
-        shape = list(arr.shape)
-        shape[0] = bc.rclp.shape[0]
-        rarr = np.empty(shape, dtype=arr.dtype)
-        conn.recvarr(rarr)  # comm.
-        slct = bc.rclp[:,0] + ngstcell
-        arr[slct] = rarr[:]
+        conn.recvarr(plan.get_buffers(arrname, bc.rblkn)[1])  # comm.
+        plan.scatter(arrname, bc.rblkn)
         # provide the receiver with data.
-        slct = bc.rclp[:,2] + ngstcell
-        conn.sendarr(arr[slct]) # comm.
+        conn.sendarr(plan.gather(arrname, bc.rblkn)) # comm.
 
     def pullibc(self, arrname, bc, sendn, worker=None):
         """
-        :param arrname: The name of the array in the object to exchange.
-        :type arrname: str
+        :param arrname: The name of the array in the object to exchange, or a
+            tuple of names for a group.
+        :type arrname: str or tuple
         :param bc: The interface BC to pull.
         :type bc: solvcon.boundcond.interface
         :param sendn: Serial number of the peer to exchange data with.
@@ -578,18 +865,12 @@ class MeshSolver(object):
         Pull data from the interface determined by the serial of peer.
         """
         conn = worker.pconns[bc.rblkn]
-        ngstcell = self.ngstcell
-        arr = getattr(self, arrname)
+        plan = self.haloplan
         # provide sender the data.
-        slct = bc.rclp[:,2] + ngstcell
-        conn.sendarr(arr[slct]) # comm.
+        conn.sendarr(plan.gather(arrname, bc.rblkn)) # comm.
         # ask data from sender.
-        shape = list(arr.shape)
-        shape[0] = bc.rclp.shape[0]
-        rarr = np.empty(shape, dtype=arr.dtype)
-        conn.recvarr(rarr)  # comm.
-        slct = bc.rclp[:,0] + ngstcell
-        arr[slct] = rarr[:]
+        conn.recvarr(plan.get_buffers(arrname, bc.rblkn)[1])  # comm.
+        plan.scatter(arrname, bc.rblkn)
 
     def _debug_check_array(self, *arrnames, **kw):
         """
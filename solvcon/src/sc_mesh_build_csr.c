@@ -32,25 +32,24 @@
 
 #include "mesh.h"
 
-int sc_mesh_build_csr(sc_mesh_t *msd, int *rcells, int *adjncy) {
+int sc_mesh_build_csr(sc_mesh_t *msd, int *rcells, int *xadj, int *adjncy) {
     // pointers.
     int *prcells, *padjncy;
     // iterators.
-    int icl, ifl, ieg;
+    int icl, ifl;
 
-    // fill.
-    prcells = rcells;
-    padjncy = adjncy;
-    ieg = 0;
+    // fill; the related cells of each cell start at its offset in xadj.
+    #pragma omp parallel for default(shared) private(icl, ifl, \
+    prcells, padjncy)
     for (icl=0; icl<msd->ncell; icl++) {
+        prcells = rcells + icl*CLMFC;
+        padjncy = adjncy + xadj[icl];
         for (ifl=0; ifl<CLMFC; ifl++) {
             if (prcells[ifl] != -1) {
-                padjncy[ieg] = prcells[ifl];
-                ieg += 1;
+                padjncy[0] = prcells[ifl];
+                padjncy += 1;
             };
         };
-        // advance pointers.
-        prcells += CLMFC;
     };
 
     return 0;
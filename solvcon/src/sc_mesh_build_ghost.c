@@ -63,39 +63,82 @@ void sc_mesh_build_ghost(sc_mesh_t *msd, int *bndfcs) {
     double *pndcrd, *p2ndcrd, *pgndcrd;
     double *pfccnd, *pfcnml, *pfcara, *pclcnd, *pclvol;
     // buffers.
-    int *gstndmap;
+    int *gstndoff, *gstfcoff;
     // scalars.
     int mk_found;
     double vol, vob, voc;
     double du0, du1, du2, dv0, dv1, dv2, dw0, dw1, dw2;
     // arrays.
-    double cfd[FCMND+2][msd->ndim];
-    double crd[msd->ndim];
-    double radvec[FCMND][msd->ndim];
+    double cfd[FCMND+2][3];
+    double crd[3];
+    double radvec[FCMND][3];
     // iterators.
     int ind, ibfc, icl, inl, inf, idm, ifl, ifc;
-    int ignd, igfc, igcl;
+    int ignd, igfc, igcl, jgcl;
     int it;
 
-    gstndmap = (int *)malloc((size_t)msd->nnode*sizeof(int));
-    for (ind=0; ind<msd->nnode; ind++) {
-        gstndmap[ind] = msd->nnode; // initialize to the least possible value.
+    // count the ghost nodes and faces to be created for each ghost cell, and
+    // turn the counts into offsets, so that the ghost cells can be created
+    // independently.
+    gstndoff = (int *)malloc(((size_t)msd->ngstcell+1)*sizeof(int));
+    gstfcoff = (int *)malloc(((size_t)msd->ngstcell+1)*sizeof(int));
+    gstndoff[0] = gstfcoff[0] = 0;
+    #pragma omp parallel for default(shared) private(jgcl, ibfc, icl, \
+    inl, inf, ind, mk_found, pfcnds, pclnds, pclfcs)
+    for (jgcl=0; jgcl<msd->ngstcell; jgcl++) {
+        ibfc = bndfcs[jgcl*2];
+        pfcnds = msd->fcnds + ibfc*(FCMND+1);
+        icl = msd->fccls[ibfc*FCREL];
+        pclnds = msd->clnds + icl*(CLMND+1);
+        pclfcs = msd->clfcs + icl*(CLMFC+1);
+        // nodes not in the boundary face.
+        gstndoff[jgcl+1] = 0;
+        for (inl=1; inl<=pclnds[0]; inl++) {
+            ind = pclnds[inl];
+            mk_found = 0;
+            for (inf=1; inf<=pfcnds[0]; inf++) {
+                if (ind == pfcnds[inf]) {
+                    mk_found = 1;
+                    break;
+                };
+            };
+            if (mk_found == 0) {
+                gstndoff[jgcl+1] += 1;
+            };
+        };
+        // faces other than the boundary face.
+        gstfcoff[jgcl+1] = 0;
+        for (ifl=1; ifl<=pclfcs[0]; ifl++) {
+            if (pclfcs[ifl] != ibfc) {
+                gstfcoff[jgcl+1] += 1;
+            };
+        };
+    };
+    for (jgcl=0; jgcl<msd->ngstcell; jgcl++) {
+        gstndoff[jgcl+1] += gstndoff[jgcl];
+        gstfcoff[jgcl+1] += gstfcoff[jgcl];
     };
 
     // create ghost entities and buil connectivities and by the way mirror node
     // coordinate.
-    ignd = -1;
-    igfc = -1;
-    pbndfcs = bndfcs;
-    pgndcrd = msd->ndcrd - msd->ndim;
-    pgfctpn = msd->fctpn - 1;
-    pgfcnds = msd->fcnds - (FCMND+1);
-    pgfccls = msd->fccls - FCREL;
-    pgcltpn = msd->cltpn - 1;
-    pgclgrp = msd->clgrp - 1;
-    pgclnds = msd->clnds - (CLMND+1);
-    pgclfcs = msd->clfcs - (CLMFC+1);
-    for (igcl=-1; igcl>=-msd->ngstcell; igcl--) {
+    #pragma omp parallel for default(shared) private(jgcl, igcl, ignd, igfc, \
+    ibfc, icl, ind, inl, inf, ifl, ifc, idm, mk_found, vol, \
+    pbndfcs, pfctpn, pfcnds, pfccls, pfccnd, pfcnml, pcltpn, pclgrp, pclnds, \
+    pclfcs, pndcrd, pgndcrd, pgfctpn, pgfcnds, pgfccls, pgcltpn, pgclgrp, \
+    pgclnds, pgclfcs)
+    for (jgcl=0; jgcl<msd->ngstcell; jgcl++) {
+        igcl = -jgcl-1;
+        ignd = -gstndoff[jgcl]-1;
+        igfc = -gstfcoff[jgcl]-1;
+        pbndfcs = bndfcs + jgcl*2;
+        pgndcrd = msd->ndcrd + ignd*msd->ndim;
+        pgfctpn = msd->fctpn + igfc;
+        pgfcnds = msd->fcnds + igfc*(FCMND+1);
+        pgfccls = msd->fccls + igfc*FCREL;
+        pgcltpn = msd->cltpn + igcl;
+        pgclgrp = msd->clgrp + igcl;
+        pgclnds = msd->clnds + igcl*(CLMND+1);
+        pgclfcs = msd->clfcs + igcl*(CLMFC+1);
         ibfc = pbndfcs[0];
         pfctpn = msd->fctpn + ibfc;
         pfcnds = msd->fcnds + ibfc*(FCMND+1);
@@ -127,7 +170,6 @@ void sc_mesh_build_ghost(sc_mesh_t *msd, int *bndfcs) {
             };
             // if not found, it should be a ghost node.
             if (mk_found == 0) {
-                gstndmap[ind] = ignd;   // record map for face processing.
                 pgclnds[inl] = ignd;    // save to clnds.
                 // mirror coordinate of ghost cell.
                 // NOTE: fcnml always points outward.
@@ -157,14 +199,18 @@ void sc_mesh_build_ghost(sc_mesh_t *msd, int *bndfcs) {
             pgfctpn[0] = pfctpn[0]; // copy face type.
             pgfccls[0] = igcl;  // save to ghost fccls.
             pgclfcs[ifl] = igfc;    // save to ghost clfcs.
-            // face-to-node connectivity.
+            // face-to-node connectivity; the nodes mirrored in the ghost cell
+            // are mapped to the ghost nodes.
             for (inf=0; inf<=FCMND; inf++) {
                 pgfcnds[inf] = pfcnds[inf];
             };
             for (inf=1; inf<=pgfcnds[0]; inf++) {
                 ind = pgfcnds[inf];
-                if (gstndmap[ind] != msd->nnode) {
-                    pgfcnds[inf] = gstndmap[ind];   // save gstnode to fcnds.
+                for (inl=1; inl<=pclnds[0]; inl++) {
+                    if (ind == pclnds[inl]) {
+                        pgfcnds[inf] = pgclnds[inl];
+                        break;
+                    };
                 };
             };
             // decrement ghost face counter.
@@ -173,25 +219,18 @@ void sc_mesh_build_ghost(sc_mesh_t *msd, int *bndfcs) {
             pgfcnds -= FCMND+1;
             pgfccls -= FCREL;
         };
-        // erase node map record.
-        for (inl=1; inl<=pclnds[0]; inl++) {
-                gstndmap[pclnds[inl]] = msd->nnode;
-        };
-        // advance pointers.
-        pbndfcs += 2;
-        pgcltpn -= 1;
-        pgclgrp -= 1;
-        pgclnds -= CLMND+1;
-        pgclfcs -= CLMFC+1;
     };
-    free(gstndmap);
+    free(gstndoff);
+    free(gstfcoff);
 
     // compute ghost face centroids.
-    pfcnds = msd->fcnds - (FCMND+1);
-    pfccnd = msd->fccnd - msd->ndim;
     if (msd->ndim == 2) {
         // 2D faces must be edge.
+        #pragma omp parallel for default(shared) private(ifc, ind, \
+        pfcnds, pfccnd, pndcrd)
         for (ifc=-1; ifc>=-msd->ngstface; ifc--) {
+            pfcnds = msd->fcnds + ifc*(FCMND+1);
+            pfccnd = msd->fccnd + ifc*msd->ndim;
             // point 1.
             ind = pfcnds[1];
             pndcrd = msd->ndcrd + ind*msd->ndim;
@@ -205,12 +244,14 @@ void sc_mesh_build_ghost(sc_mesh_t *msd, int *bndfcs) {
             // average.
             pfccnd[0] /= 2;
             pfccnd[1] /= 2;
-            // advance pointers.
-            pfcnds -= FCMND+1;
-            pfccnd -= msd->ndim;
         };
     } else if (msd->ndim == 3) {
+        #pragma omp parallel for default(shared) private(ifc, inf, ind, nnd, \
+        pfcnds, pfccnd, pndcrd, cfd, crd, voc, vob, \
+        du0, du1, du2, dv0, dv1, dv2, dw0, dw1, dw2)
         for (ifc=-1; ifc>=-msd->ngstface; ifc--) {
+            pfcnds = msd->fcnds + ifc*(FCMND+1);
+            pfccnd = msd->fccnd + ifc*msd->ndim;
             // find averaged point.
             cfd[0][0] = cfd[0][1] = cfd[0][2] = 0.0;
             nnd = pfcnds[0];
@@ -254,19 +295,17 @@ void sc_mesh_build_ghost(sc_mesh_t *msd, int *bndfcs) {
             pfccnd[0] /= voc;
             pfccnd[1] /= voc;
             pfccnd[2] /= voc;
-            // advance pointers.
-            pfcnds -= FCMND+1;
-            pfccnd -= msd->ndim;
         };
     };
 
     // compute ghost face normal vector and area.
-    pfcnds = msd->fcnds - (FCMND+1);
-    pfccnd = msd->fccnd - msd->ndim;
-    pfcnml = msd->fcnml - msd->ndim;
-    pfcara = msd->fcara - 1;
     if (msd->ndim == 2) {
+        #pragma omp parallel for default(shared) private(ifc, \
+        pfcnds, pfcnml, pfcara, pndcrd, p2ndcrd)
         for (ifc=-1; ifc>=-msd->ngstface; ifc--) {
+            pfcnds = msd->fcnds + ifc*(FCMND+1);
+            pfcnml = msd->fcnml + ifc*msd->ndim;
+            pfcara = msd->fcara + ifc;
             // 2D faces are always lines.
             pndcrd = msd->ndcrd + pfcnds[1]*msd->ndim;
             p2ndcrd = msd->ndcrd + pfcnds[2]*msd->ndim;
@@ -278,13 +317,15 @@ void sc_mesh_build_ghost(sc_mesh_t *msd, int *bndfcs) {
             // normalize face normal.
             pfcnml[0] /= pfcara[0];
             pfcnml[1] /= pfcara[0];
-            // advance pointers.
-            pfcnds -= FCMND+1;
-            pfcnml -= msd->ndim;
-            pfcara -= 1;
         };
     } else if (msd->ndim == 3) {
+        #pragma omp parallel for default(shared) private(ifc, inf, ind, nnd, \
+        pfcnds, pfccnd, pfcnml, pfcara, pndcrd, radvec)
         for (ifc=-1; ifc>=-msd->ngstface; ifc--) {
+            pfcnds = msd->fcnds + ifc*(FCMND+1);
+            pfccnd = msd->fccnd + ifc*msd->ndim;
+            pfcnml = msd->fcnml + ifc*msd->ndim;
+            pfcara = msd->fcara + ifc;
             // compute radial vector.
             nnd = pfcnds[0];
             for (inf=0; inf<nnd; inf++) {
@@ -318,20 +359,18 @@ void sc_mesh_build_ghost(sc_mesh_t *msd, int *bndfcs) {
             pfcnml[2] /= pfcara[0];
             // get real face area.
             pfcara[0] /= 2.0;
-            // advance pointers.
-            pfcnds -= FCMND+1;
-            pfccnd -= msd->ndim;
-            pfcnml -= msd->ndim;
-            pfcara -= 1;
         };
     };
 
     // compute cell centroids.
-    pclnds = msd->clnds - (CLMND+1);
-    pclfcs = msd->clfcs - (CLMFC+1);
-    pclcnd = msd->clcnd - msd->ndim;
     if (msd->ndim == 2) {
+        #pragma omp parallel for default(shared) private(icl, inl, ind, ifl, \
+        ifc, nnd, nfc, pclnds, pclfcs, pclcnd, pndcrd, pfccnd, pfcnml, pfcara, \
+        crd, vob, voc, du0, du1, dv0, dv1)
         for (icl=-1; icl>=-msd->ngstcell; icl--) {
+            pclnds = msd->clnds + icl*(CLMND+1);
+            pclfcs = msd->clfcs + icl*(CLMFC+1);
+            pclcnd = msd->clcnd + icl*msd->ndim;
             // averaged point.
             crd[0] = crd[1] = 0.0;
             nnd = pclnds[0];
@@ -362,13 +401,15 @@ void sc_mesh_build_ghost(sc_mesh_t *msd, int *bndfcs) {
             };
             pclcnd[0] /= voc;
             pclcnd[1] /= voc;
-            // advance pointers.
-            pclnds -= CLMND+1;
-            pclfcs -= CLMFC+1;
-            pclcnd -= msd->ndim;
         };
     } else if (msd->ndim == 3) {
+        #pragma omp parallel for default(shared) private(icl, inl, ind, ifl, \
+        ifc, nnd, nfc, pclnds, pclfcs, pclcnd, pndcrd, pfccnd, pfcnml, pfcara, \
+        crd, vob, voc, du0, du1, du2, dv0, dv1, dv2)
         for (icl=-1; icl>=-msd->ngstcell; icl--) {
+            pclnds = msd->clnds + icl*(CLMND+1);
+            pclfcs = msd->clfcs + icl*(CLMFC+1);
+            pclcnd = msd->clcnd + icl*msd->ndim;
             // averaged point.
             crd[0] = crd[1] = crd[2] = 0.0;
             nnd = pclnds[0];
@@ -406,18 +447,17 @@ void sc_mesh_build_ghost(sc_mesh_t *msd, int *bndfcs) {
             pclcnd[0] /= voc;
             pclcnd[1] /= voc;
             pclcnd[2] /= voc;
-            // advance pointers.
-            pclnds -= CLMND+1;
-            pclfcs -= CLMFC+1;
-            pclcnd -= msd->ndim;
         };
     };
 
-    // compute volume for each ghost cell.
-    pclfcs = msd->clfcs - (CLMFC+1);
-    pclcnd = msd->clcnd - msd->ndim;
-    pclvol = msd->clvol - 1;
+    // compute volume for each ghost cell.  The faces to be flipped belong
+    // only to the ghost cell being processed.
+    #pragma omp parallel for default(shared) private(icl, it, ifc, idm, \
+    pclfcs, pclcnd, pclvol, pfccls, pfcnds, pfccnd, pfcnml, pfcara, vol)
     for (icl=-1; icl>=-msd->ngstcell; icl--) {
+        pclfcs = msd->clfcs + icl*(CLMFC+1);
+        pclcnd = msd->clcnd + icl*msd->ndim;
+        pclvol = msd->clvol + icl;
         pclvol[0] = 0.0;
         for (it=1; it<=pclfcs[0]; it++) {
             ifc = pclfcs[it];
@@ -447,10 +487,6 @@ void sc_mesh_build_ghost(sc_mesh_t *msd, int *bndfcs) {
         };
         // calculate the real volume.
         pclvol[0] /= msd->ndim;
-        // advance pointers.
-        pclfcs -= CLMFC+1;
-        pclcnd -= msd->ndim;
-        pclvol -= 1;
     };
 };
 
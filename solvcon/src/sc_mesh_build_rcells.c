@@ -40,20 +40,21 @@ int sc_mesh_build_rcells(sc_mesh_t *msd, int *rcells, int *rcellno) {
     int icl, ifl, ifl1, ifc;
 
     // initialize.
-    prcells = rcells;
+    #pragma omp parallel for default(shared) private(icl, ifl, prcells)
     for (icl=0; icl<msd->ncell; icl++) {
+        prcells = rcells + icl*CLMFC;
         for (ifl=0; ifl<CLMFC; ifl++) {
             prcells[ifl] = -1;
         };
         rcellno[icl] = 0;
-        // advance pointers.
-        prcells += CLMFC;
     };
     
     // count.
-    pclfcs = msd->clfcs;
-    prcells = rcells;
+    #pragma omp parallel for default(shared) private(icl, ifl, ifl1, ifc, \
+    pclfcs, pfccls, prcells)
     for (icl=0; icl<msd->ncell; icl++) {
+        pclfcs = msd->clfcs + icl*(CLMFC+1);
+        prcells = rcells + icl*CLMFC;
         for (ifl=1; ifl<=pclfcs[0]; ifl++) {
             ifl1 = ifl-1;
             ifc = pclfcs[ifl];
@@ -77,9 +78,6 @@ int sc_mesh_build_rcells(sc_mesh_t *msd, int *rcells, int *rcellno) {
                 prcells[ifl1] = -1;
             };
         };
-        // advance pointers.
-        pclfcs += CLMFC+1;
-        prcells += CLMFC;
     };
 
     return 0;
@@ -54,19 +54,21 @@ int sc_mesh_calc_metric(sc_mesh_t *msd, int use_incenter) {
     double du0, du1, du2, dv0, dv1, dv2, dw0, dw1, dw2;
     // arrays.
     int ndstf[FCMND];
-    double cfd[FCMND+2][msd->ndim];
-    double crd[msd->ndim];
-    double radvec[FCMND][msd->ndim];
+    double cfd[FCMND+2][3];
+    double crd[3];
+    double radvec[FCMND][3];
     // iterators.
     int ifc, inf, ind, icl, inc, ifl;
     int idm, it, jt;
 
     // compute face centroids.
-    pfcnds = msd->fcnds;
-    pfccnd = msd->fccnd;
     if (msd->ndim == 2) {
         // 2D faces must be edge.
+        #pragma omp parallel for default(shared) private(ifc, ind, \
+        pfcnds, pfccnd, pndcrd)
         for (ifc=0; ifc<msd->nface; ifc++) {
+            pfcnds = msd->fcnds + ifc*(FCMND+1);
+            pfccnd = msd->fccnd + ifc*msd->ndim;
             // point 1.
             ind = pfcnds[1];
             pndcrd = msd->ndcrd + ind*msd->ndim;
@@ -80,12 +82,14 @@ int sc_mesh_calc_metric(sc_mesh_t *msd, int use_incenter) {
             // average.
             pfccnd[0] /= 2;
             pfccnd[1] /= 2;
-            // advance pointers.
-            pfcnds += FCMND+1;
-            pfccnd += msd->ndim;
         };
     } else if (msd->ndim == 3) {
+        #pragma omp parallel for default(shared) private(ifc, inf, ind, nnd, \
+        pfcnds, pfccnd, pndcrd, cfd, crd, voc, vob, \
+        du0, du1, du2, dv0, dv1, dv2, dw0, dw1, dw2)
         for (ifc=0; ifc<msd->nface; ifc++) {
+            pfcnds = msd->fcnds + ifc*(FCMND+1);
+            pfccnd = msd->fccnd + ifc*msd->ndim;
             // find averaged point.
             cfd[0][0] = cfd[0][1] = cfd[0][2] = 0.0;
             nnd = pfcnds[0];
@@ -129,19 +133,17 @@ int sc_mesh_calc_metric(sc_mesh_t *msd, int use_incenter) {
             pfccnd[0] /= voc;
             pfccnd[1] /= voc;
             pfccnd[2] /= voc;
-            // advance pointers.
-            pfcnds += FCMND+1;
-            pfccnd += msd->ndim;
         };
     };
 
     // compute face normal vector and area.
-    pfcnds = msd->fcnds;
-    pfccnd = msd->fccnd;
-    pfcnml = msd->fcnml;
-    pfcara = msd->fcara;
     if (msd->ndim == 2) {
+        #pragma omp parallel for default(shared) private(ifc, \
+        pfcnds, pfcnml, pfcara, pndcrd, p2ndcrd)
         for (ifc=0; ifc<msd->nface; ifc++) {
+            pfcnds = msd->fcnds + ifc*(FCMND+1);
+            pfcnml = msd->fcnml + ifc*msd->ndim;
+            pfcara = msd->fcara + ifc;
             // 2D faces are always lines.
             pndcrd = msd->ndcrd + pfcnds[1]*msd->ndim;
             p2ndcrd = msd->ndcrd + pfcnds[2]*msd->ndim;
@@ -153,13 +155,15 @@ int sc_mesh_calc_metric(sc_mesh_t *msd, int use_incenter) {
             // normalize face normal.
             pfcnml[0] /= pfcara[0];
             pfcnml[1] /= pfcara[0];
-            // advance pointers.
-            pfcnds += FCMND+1;
-            pfcnml += msd->ndim;
-            pfcara += 1;
         };
     } else if (msd->ndim == 3) {
+        #pragma omp parallel for default(shared) private(ifc, inf, ind, nnd, \
+        pfcnds, pfccnd, pfcnml, pfcara, pndcrd, radvec)
         for (ifc=0; ifc<msd->nface; ifc++) {
+            pfcnds = msd->fcnds + ifc*(FCMND+1);
+            pfccnd = msd->fccnd + ifc*msd->ndim;
+            pfcnml = msd->fcnml + ifc*msd->ndim;
+            pfcara = msd->fcara + ifc;
             // compute radial vector.
             nnd = pfcnds[0];
             for (inf=0; inf<nnd; inf++) {
@@ -193,20 +197,18 @@ int sc_mesh_calc_metric(sc_mesh_t *msd, int use_incenter) {
             pfcnml[2] /= pfcara[0];
             // get real face area.
             pfcara[0] /= 2.0;
-            // advance pointers.
-            pfcnds += FCMND+1;
-            pfccnd += msd->ndim;
-            pfcnml += msd->ndim;
-            pfcara += 1;
         };
     };
 
     // compute cell centroids.
-    pclnds = msd->clnds;
-    pclfcs = msd->clfcs;
-    pclcnd = msd->clcnd;
     if (msd->ndim == 2) {
+        #pragma omp parallel for default(shared) private(icl, inc, ind, ifl, \
+        ifc, nnd, nfc, pclnds, pclfcs, pclcnd, pndcrd, pfccnd, pfcnml, pfcara, \
+        crd, vob, voc, du0, du1, dv0, dv1)
         for (icl=0; icl<msd->ncell; icl++) {
+            pclnds = msd->clnds + icl*(CLMND+1);
+            pclfcs = msd->clfcs + icl*(CLMFC+1);
+            pclcnd = msd->clcnd + icl*msd->ndim;
             if ((use_incenter == 1) && (msd->cltpn[icl] == 3)) {
                 pndcrd = msd->ndcrd + pclnds[1]*msd->ndim;
                 vob = msd->fcara[pclfcs[2]];
@@ -257,13 +259,15 @@ int sc_mesh_calc_metric(sc_mesh_t *msd, int use_incenter) {
                 pclcnd[0] /= voc;
                 pclcnd[1] /= voc;
             };
-            // advance pointers.
-            pclnds += CLMND+1;
-            pclfcs += CLMFC+1;
-            pclcnd += msd->ndim;
         };
     } else if (msd->ndim == 3) {
+        #pragma omp parallel for default(shared) private(icl, inc, ind, ifl, \
+        ifc, nnd, nfc, pclnds, pclfcs, pclcnd, pndcrd, pfccnd, pfcnml, pfcara, \
+        crd, vob, voc, du0, du1, du2, dv0, dv1, dv2)
         for (icl=0; icl<msd->ncell; icl++) {
+            pclnds = msd->clnds + icl*(CLMND+1);
+            pclfcs = msd->clfcs + icl*(CLMFC+1);
+            pclcnd = msd->clcnd + icl*msd->ndim;
             if ((use_incenter == 1) && (msd->cltpn[icl] == 5)) {
                 pndcrd = msd->ndcrd + pclnds[1]*msd->ndim;
                 vob = msd->fcara[pclfcs[4]];
@@ -331,24 +335,52 @@ int sc_mesh_calc_metric(sc_mesh_t *msd, int use_incenter) {
                 pclcnd[1] /= voc;
                 pclcnd[2] /= voc;
             };
-            // advance pointers.
-            pclnds += CLMND+1;
-            pclfcs += CLMFC+1;
-            pclcnd += msd->ndim;
+        };
+    };
+
+    // orient the faces to point outward from the first connecting cell,
+    // i.e., reorder node definition and flip normal vector when needed.  A
+    // face is shared by two cells, so that the orientation is done face by
+    // face before the volume is accumulated cell by cell.
+    #pragma omp parallel for default(shared) private(ifc, icl, idm, jt, nnd, \
+    pfccls, pfcnds, pfccnd, pfcnml, pclcnd, vol, ndstf)
+    for (ifc=0; ifc<msd->nface; ifc++) {
+        pfccls = msd->fccls + ifc*FCREL;
+        icl = pfccls[0];
+        if (icl < 0) continue;
+        pfcnds = msd->fcnds + ifc*(FCMND+1);
+        pfccnd = msd->fccnd + ifc*msd->ndim;
+        pfcnml = msd->fcnml + ifc*msd->ndim;
+        pclcnd = msd->clcnd + icl*msd->ndim;
+        vol = 0.0;
+        for (idm=0; idm<msd->ndim; idm++) {
+            vol += (pfccnd[idm] - pclcnd[idm]) * pfcnml[idm];
+        };
+        if (vol < 0.0) {
+            nnd = pfcnds[0];
+            for (jt=0; jt<nnd; jt++) {
+                ndstf[jt] = pfcnds[nnd-jt];
+            };
+            for (jt=0; jt<nnd; jt++) {
+                pfcnds[jt+1] = ndstf[jt];
+            };
+            for (idm=0; idm<msd->ndim; idm++) {
+                pfcnml[idm] = -pfcnml[idm];
+            };
         };
     };
 
     // compute volume for each cell.
-    pclfcs = msd->clfcs;
-    pclcnd = msd->clcnd;
-    pclvol = msd->clvol;
+    #pragma omp parallel for default(shared) private(icl, it, ifc, idm, nfc, \
+    pclfcs, pclcnd, pclvol, pfccnd, pfcnml, pfcara, vol)
     for (icl=0; icl<msd->ncell; icl++) {
+        pclfcs = msd->clfcs + icl*(CLMFC+1);
+        pclcnd = msd->clcnd + icl*msd->ndim;
+        pclvol = msd->clvol + icl;
         pclvol[0] = 0.0;
         nfc = pclfcs[0];
         for (it=1; it<=nfc; it++) {
             ifc = pclfcs[it];
-            pfccls = msd->fccls + ifc*FCREL;
-            pfcnds = msd->fcnds + ifc*(FCMND+1);
             pfccnd = msd->fccnd + ifc*msd->ndim;
             pfcnml = msd->fcnml + ifc*msd->ndim;
             pfcara = msd->fcara + ifc;
@@ -357,46 +389,11 @@ int sc_mesh_calc_metric(sc_mesh_t *msd, int use_incenter) {
             for (idm=0; idm<msd->ndim; idm++) {
                 vol += (pfccnd[idm] - pclcnd[idm]) * pfcnml[idm];
             };
-            vol *= pfcara[0];
-            // check if need to reorder node definition and connecting cell
-            // list for the face.
-            if (vol < 0.0) {
-                if (pfccls[0] == icl) {
-                    nnd = pfcnds[0];
-                    for (jt=0; jt<nnd; jt++) {
-                        ndstf[jt] = pfcnds[nnd-jt];
-                    };
-                    for (jt=0; jt<nnd; jt++) {
-                        pfcnds[jt+1] = ndstf[jt];
-                    };
-                    for (idm=0; idm<msd->ndim; idm++) {
-                        pfcnml[idm] = -pfcnml[idm];
-                    };
-                };
-                vol = -vol;
-            } else {
-                if (pfccls[0] != icl) {
-                    nnd = pfcnds[0];
-                    for (jt=0; jt<nnd; jt++) {
-                        ndstf[jt] = pfcnds[nnd-jt];
-                    };
-                    for (jt=0; jt<nnd; jt++) {
-                        pfcnds[jt+1] = ndstf[jt];
-                    };
-                    for (idm=0; idm<msd->ndim; idm++) {
-                        pfcnml[idm] = -pfcnml[idm];
-                    };
-                };
-            };
             // accumulate the volume for the cell.
-            pclvol[0] += vol;
+            pclvol[0] += fabs(vol) * pfcara[0];
         };
         // calculate the real volume.
         pclvol[0] /= msd->ndim;
-        // advance pointers.
-        pclfcs += CLMFC+1;
-        pclcnd += msd->ndim;
-        pclvol += 1;
     };
 
     return 0;
@@ -33,9 +33,67 @@
 
 #include "mesh.h"
 
+/*
+ * Key to detect duplicated faces: the nodes of a face in ascending order
+ * (padded by -1), the face type, and the face index.
+ */
+typedef struct {
+    int nds[FCMND];
+    int tpn;
+    int ifc;
+} sc_face_key_t;
+
+static void make_face_key(int *pfcnds, int tpn, int ifc, sc_face_key_t *key) {
+    int inf, jnf, nd;
+    for (inf=0; inf<FCMND; inf++) {
+        key->nds[inf] = -1;
+    };
+    // insertion sort for the few nodes.
+    for (inf=0; inf<pfcnds[0]; inf++) {
+        nd = pfcnds[inf+1];
+        for (jnf=inf; jnf>0 && key->nds[jnf-1]>nd; jnf--) {
+            key->nds[jnf] = key->nds[jnf-1];
+        };
+        key->nds[jnf] = nd;
+    };
+    key->tpn = tpn;
+    key->ifc = ifc;
+};
+
+static int same_face_key(const sc_face_key_t *key1,
+        const sc_face_key_t *key2) {
+    int inf;
+    if (key1->tpn != key2->tpn) {
+        return 0;
+    };
+    for (inf=0; inf<FCMND; inf++) {
+        if (key1->nds[inf] != key2->nds[inf]) {
+            return 0;
+        };
+    };
+    return 1;
+};
+
+static int compare_face_key(const void *ptr1, const void *ptr2) {
+    const sc_face_key_t *key1 = (const sc_face_key_t *)ptr1;
+    const sc_face_key_t *key2 = (const sc_face_key_t *)ptr2;
+    int inf;
+    if (key1->tpn != key2->tpn) {
+        return key1->tpn < key2->tpn ? -1 : 1;
+    };
+    for (inf=0; inf<FCMND; inf++) {
+        if (key1->nds[inf] != key2->nds[inf]) {
+            return key1->nds[inf] < key2->nds[inf] ? -1 : 1;
+        };
+    };
+    return key1->ifc < key2->ifc ? -1 : (key1->ifc > key2->ifc);
+};
+
 /*
  * Extract interier faces from node list of cells.  Subroutine is designed to
  * handle all types of cell.  See block.py for the types to be supported.
+ *
+ * Return 0 on success and -1 when memory allocation fails.
  */
 
 int sc_mesh_extract_faces_from_cells(sc_mesh_t *msd, int mface,
@@ -43,13 +101,13 @@ int sc_mesh_extract_faces_from_cells(sc_mesh_t *msd, int mface,
     // pointers.
     int *pcltpn, *pclnds, *pclfcs, *pfctpn, *pfcnds, *pfccls;
     int *pifctpn, *pjfctpn, *pifcnds, *pjfcnds;
-    int *pndfcs;
     // buffers.
-    int *ndnfc, *ndfcs, *map, *map2;
+    int *ndoff, *ndpos, *ndfcs, *map, *map2;
+    sc_face_key_t *keys;
     // scalars.
-    int tpnicl, ndmfc, cond;
+    int tpnicl, ndmfc, err;
     // iterator.
-    int icl, ifc, jfc, inf, jnf, ind, nd1, ifl;
+    int icl, ifc, jfc, inf, ind, nd1, ifl;
     int it;
 
     // extract face definition from the node list of cells.
@@ -335,87 +393,122 @@ int sc_mesh_extract_faces_from_cells(sc_mesh_t *msd, int mface,
         pclnds += CLMND+1;
         pclfcs += CLMFC+1;
     };
+    // only the extracted faces take part in the deduplication.
+    mface = ifc;
 
-    // build the hash table, to know what faces connect to each node.
-    /// first pass: get the maximum number of faces.
-    ndnfc = (int *)malloc((size_t)msd->nnode*sizeof(int));
-    for (ind=0; ind<msd->nnode; ind++) {    // initialize.
-        ndnfc[ind] = 0;
+    // build the CSR index from each node to the faces having it as the
+    // smallest node.  Duplicated faces share the same smallest node, so only
+    // the faces in the same bucket need to be compared, and each face is
+    // indexed only once regardless of the valence of the nodes.
+    /// first pass: find the smallest node of each face.  map is borrowed to
+    /// hold them until the duplication map is built.
+    map = (int *)malloc((size_t)mface*sizeof(int));
+    ndoff = (int *)malloc(((size_t)msd->nnode+1)*sizeof(int));
+    if (NULL == map || NULL == ndoff) {
+        free(map);
+        free(ndoff);
+        return -1;
     };
-    pfcnds = fcnds; // count.
+    #pragma omp parallel for default(shared) private(ifc, inf, nd1, pifcnds)
     for (ifc=0; ifc<mface; ifc++) {
-        for (inf=1; inf<=pfcnds[0]; inf++) {
-            ind = pfcnds[inf];  // node of interest.
-            ndnfc[ind] += 1;    // increment counting.
+        pifcnds = fcnds + ifc*(FCMND+1);
+        nd1 = pifcnds[1];
+        for (inf=2; inf<=pifcnds[0]; inf++) {
+            if (pifcnds[inf] < nd1) {
+                nd1 = pifcnds[inf];
+            };
         };
-        // advance pointers.
-        pfcnds += FCMND+1;
+        map[ifc] = nd1;
     };
-    ndmfc = 0;  // get maximum.
+    /// second pass: count the faces in each bucket and make the offsets.
+    for (ind=0; ind<=msd->nnode; ind++) {
+        ndoff[ind] = 0;
+    };
+    for (ifc=0; ifc<mface; ifc++) {
+        ndoff[map[ifc]+1] += 1;
+    };
+    ndmfc = 0;
     for (ind=0; ind<msd->nnode; ind++) {
-        if (ndnfc[ind] > ndmfc) {
-            ndmfc = ndnfc[ind];
+        if (ndoff[ind+1] > ndmfc) {
+            ndmfc = ndoff[ind+1];
         };
+        ndoff[ind+1] += ndoff[ind];
+    };
+    /// third pass: fill the faces into the buckets in ascending order.
+    ndfcs = (int *)malloc((size_t)mface*sizeof(int));
+    ndpos = (int *)malloc((size_t)msd->nnode*sizeof(int));
+    if (NULL == ndfcs || NULL == ndpos) {
+        free(ndfcs);
+        free(ndpos);
+        free(ndoff);
+        free(map);
+        return -1;
     };
-    free(ndnfc);
-    /// second pass: scan again to build hash table.
-    ndfcs = (int *)malloc((size_t)msd->nnode*(ndmfc+1)*sizeof(int));
-    pndfcs = ndfcs; // initialize.
     for (ind=0; ind<msd->nnode; ind++) {
-        pndfcs[0] = 0;
-        for (it=1; it<ndmfc; it++) {
-            pndfcs[it] = -1;
-        };
-        // advance pointers;
-        pndfcs += ndmfc+1;
+        ndpos[ind] = ndoff[ind];
     };
-    pfcnds = fcnds; // build hash table mapping from node to face.
     for (ifc=0; ifc<mface; ifc++) {
-        for (inf=1; inf<=pfcnds[0]; inf++) {
-            ind = pfcnds[inf];  // node of interest.
-            pndfcs = ndfcs + ind*(ndmfc+1);
-            pndfcs[0] += 1; // increment face count for the node.
-            pndfcs[pndfcs[0]] = ifc;
-        };
-        // advance pointers.
-        pfcnds += FCMND+1;
+        ndfcs[ndpos[map[ifc]]++] = ifc;
     };
+    free(ndpos);
 
-    // scan for duplicated faces and build duplication map.
-    map = (int *)malloc((size_t)mface*sizeof(int));
-    for (ifc=0; ifc<mface; ifc++) { // initialize.
-        map[ifc] = ifc;
-    };
-    for (ifc=0; ifc<mface; ifc++) {
-        if (map[ifc] == ifc) {
-            pifcnds = fcnds + ifc*(FCMND+1);
-            nd1 = pifcnds[1];    // take only the FIRST node of a face.
-            pndfcs = ndfcs + nd1*(ndmfc+1);
-            for (it=1; it<=pndfcs[0]; it++) {
-                jfc = pndfcs[it];
-                // test for duplication.
-                if ((jfc != ifc) && (fctpn[jfc] == fctpn[ifc])) {
-                    pjfcnds = fcnds + jfc*(FCMND+1);
-                    cond = pjfcnds[0];
-                    // scan all nodes in ifc and jfc to see if all the same.
-                    for (jnf=1; jnf<=pjfcnds[0]; jnf++) {
-                        for (inf=1; inf<=pifcnds[0]; inf++) {
-                            if (pjfcnds[jnf] == pifcnds[inf]) {
-                                cond -= 1;
-                                break;
-                            };
-                        };
-                    };
-                    if (cond == 0) {
-                        map[jfc] = ifc;  // record duplication.
-                    };
+    // scan for duplicated faces and build duplication map.  The faces in a
+    // bucket are sorted by their sorted nodes and type, so that duplicated
+    // faces become adjacent, and the one with the smallest index is kept.
+    // The buckets are independent to each other.
+    err = 0;
+    #pragma omp parallel default(shared) private(ind, it, keys)
+    {
+        keys = (sc_face_key_t *)malloc((size_t)ndmfc*sizeof(sc_face_key_t));
+        if (NULL == keys) {
+            #pragma omp atomic
+            err += 1;
+        };
+        // every thread has to reach the worksharing loop; a thread failing
+        // to allocate skips its iterations.
+        #pragma omp for schedule(dynamic, 1024)
+        for (ind=0; ind<msd->nnode; ind++) {
+            int nkey = ndoff[ind+1] - ndoff[ind];
+            int *pfcs = ndfcs + ndoff[ind];
+            if (NULL == keys) {
+                continue;
+            };
+            if (nkey <= 1) {
+                if (nkey) {
+                    map[pfcs[0]] = pfcs[0];
+                };
+                continue;
+            };
+            for (it=0; it<nkey; it++) {
+                make_face_key(fcnds + pfcs[it]*(FCMND+1),
+                    fctpn[pfcs[it]], pfcs[it], keys + it);
+            };
+            qsort(keys, (size_t)nkey, sizeof(sc_face_key_t),
+                  compare_face_key);
+            map[keys[0].ifc] = keys[0].ifc;
+            for (it=1; it<nkey; it++) {
+                if (same_face_key(keys + it - 1, keys + it)) {
+                    map[keys[it].ifc] = map[keys[it-1].ifc];
+                } else {
+                    map[keys[it].ifc] = keys[it].ifc;
                 };
             };
         };
+        free(keys);
+    };
+    free(ndfcs);
+    free(ndoff);
+    if (err) {
+        free(map);
+        return -1;
     };
 
     // use the duplication map to remap nodes in faces, and build renewed map.
     map2 = (int *)malloc((size_t)mface*sizeof(int));
+    if (NULL == map2) {
+        free(map);
+        return -1;
+    };
     pifcnds = fcnds;
     pjfcnds = fcnds;
     pifctpn = fctpn;
@@ -472,7 +565,6 @@ int sc_mesh_extract_faces_from_cells(sc_mesh_t *msd, int mface,
 
     free(map2);
     free(map);
-    free(ndfcs);
 
     return 0;
 };
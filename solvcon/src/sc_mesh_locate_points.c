@@ -0,0 +1,293 @@
+/*
+ * Copyright (c) 2011, Yung-Yu Chen <yyc@solvcon.net>
+ *
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are met:
+ *
+ * - Redistributions of source code must retain the above copyright notice,
+ *   this list of conditions and the following disclaimer.
+ * - Redistributions in binary form must reproduce the above copyright notice,
+ *   this list of conditions and the following disclaimer in the documentation
+ *   and/or other materials provided with the distribution.
+ * - Neither the name of the SOLVCON nor the names of its contributors may be
+ *   used to endorse or promote products derived from this software without
+ *   specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+ * AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+ * IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ * ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+ * LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+ * CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+ * SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+ * INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+ * CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ * ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ * POSSIBILITY OF SUCH DAMAGE.
+ */
+
+#include <Python.h>
+#include <math.h>
+
+#include "mesh.h"
+
+/*
+ * Spatial index of cells for locating points.  The bounding box of the mesh
+ * is divided into a uniform grid of nbin[0] x nbin[1] (x nbin[2]) bins of the
+ * width binwid starting from bbmin.  Each cell is registered to all the bins
+ * overlapped by its bounding box, stored in the CSR format: the cells in the
+ * bin ibin are bincls[binoff[ibin]:binoff[ibin+1]], in ascending order.
+ */
+
+/*
+ * Sub-face decomposition of each face type (see the table in block.py), the
+ * same as that of the CESE solvers: a face is split into the simplices
+ * sfcs[sfng[fctpn][0]:sfng[fctpn][1]], whose nodes are indexed into fcnds.
+ */
+static const int sfcs[4][3] = {
+    // edges.
+    {1, 2, -1},
+    // quadrilaterals.
+    {1, 2, 3}, {1, 4, 3},
+    // triangles.
+    {1, 2, 3},
+};
+static const int sfng[4][2] = {
+    {-1, -1}, {0, 1}, {1, 3}, {3, 4},
+};
+
+/*
+ * Get the range of bins overlapped by the bounding box of a cell and its
+ * centroid.
+ */
+static void cell_bin_range(sc_mesh_t *msd, int icl, int *nbin, double *bbmin,
+        double *binwid, int *lo, int *hi) {
+    int *pclnds;
+    double *pndcrd;
+    double crdmin[3], crdmax[3];
+    int inl, idm, ibin;
+    pclnds = msd->clnds + icl*(CLMND+1);
+    for (idm=0; idm<msd->ndim; idm++) {
+        crdmin[idm] = HUGE_VAL;
+        crdmax[idm] = -HUGE_VAL;
+    };
+    for (inl=0; inl<=pclnds[0]; inl++) {
+        // the centroid is included for the sub-simplices of a warped cell.
+        pndcrd = inl ? msd->ndcrd + pclnds[inl]*msd->ndim
+                     : msd->clcnd + icl*msd->ndim;
+        for (idm=0; idm<msd->ndim; idm++) {
+            crdmin[idm] = fmin(crdmin[idm], pndcrd[idm]);
+            crdmax[idm] = fmax(crdmax[idm], pndcrd[idm]);
+        };
+    };
+    for (idm=0; idm<msd->ndim; idm++) {
+        ibin = (int)floor((crdmin[idm] - bbmin[idm]) / binwid[idm]);
+        lo[idm] = ibin < 0 ? 0 : (ibin >= nbin[idm] ? nbin[idm]-1 : ibin);
+        ibin = (int)floor((crdmax[idm] - bbmin[idm]) / binwid[idm]);
+        hi[idm] = ibin < 0 ? 0 : (ibin >= nbin[idm] ? nbin[idm]-1 : ibin);
+    };
+    for (idm=msd->ndim; idm<3; idm++) {
+        lo[idm] = hi[idm] = 0;
+    };
+};
+
+/*
+ * Count the cells in each bin and turn the counts into the offsets.  binoff
+ * has nbin[0]*nbin[1](*nbin[2])+1 elements.
+ */
+int sc_mesh_count_bins(sc_mesh_t *msd, int *nbin, double *bbmin,
+        double *binwid, int *binoff) {
+    int lo[3], hi[3];
+    int nbintot, nbin1, nbin2;
+    int icl, ibin, i0, i1, i2;
+    nbin1 = nbin[1];
+    nbin2 = msd->ndim == 3 ? nbin[2] : 1;
+    nbintot = nbin[0] * nbin1 * nbin2;
+    for (ibin=0; ibin<=nbintot; ibin++) {
+        binoff[ibin] = 0;
+    };
+    for (icl=0; icl<msd->ncell; icl++) {
+        cell_bin_range(msd, icl, nbin, bbmin, binwid, lo, hi);
+        for (i0=lo[0]; i0<=hi[0]; i0++) {
+            for (i1=lo[1]; i1<=hi[1]; i1++) {
+                for (i2=lo[2]; i2<=hi[2]; i2++) {
+                    binoff[(i0*nbin1 + i1)*nbin2 + i2 + 1] += 1;
+                };
+            };
+        };
+    };
+    for (ibin=0; ibin<nbintot; ibin++) {
+        binoff[ibin+1] += binoff[ibin];
+    };
+    return 0;
+};
+
+/*
+ * Fill the cells into the bins counted by sc_mesh_count_bins().  binpos is a
+ * work array of nbin[0]*nbin[1](*nbin[2]) elements.
+ */
+int sc_mesh_fill_bins(sc_mesh_t *msd, int *nbin, double *bbmin,
+        double *binwid, int *binoff, int *binpos, int *bincls) {
+    int lo[3], hi[3];
+    int nbintot, nbin1, nbin2;
+    int icl, ibin, i0, i1, i2;
+    nbin1 = nbin[1];
+    nbin2 = msd->ndim == 3 ? nbin[2] : 1;
+    nbintot = nbin[0] * nbin1 * nbin2;
+    for (ibin=0; ibin<nbintot; ibin++) {
+        binpos[ibin] = binoff[ibin];
+    };
+    for (icl=0; icl<msd->ncell; icl++) {
+        cell_bin_range(msd, icl, nbin, bbmin, binwid, lo, hi);
+        for (i0=lo[0]; i0<=hi[0]; i0++) {
+            for (i1=lo[1]; i1<=hi[1]; i1++) {
+                for (i2=lo[2]; i2<=hi[2]; i2++) {
+                    ibin = (i0*nbin1 + i1)*nbin2 + i2;
+                    bincls[binpos[ibin]++] = icl;
+                };
+            };
+        };
+    };
+    return 0;
+};
+
+/*
+ * Test whether a point is in the simplex of the centroid pclcnd and the face
+ * nodes pnds[0:ndim] by its barycentric coordinates.  The arithmetic is the
+ * same as that of sc_gas_locate_point_{2,3}d() so that the results agree.
+ */
+static int simplex_contains(int ndim, double *pclcnd, double **pnds,
+        double *crd) {
+    double v0[3], v1[3], v2[3], v3[3], bcc[3];
+    double rhs[3];
+    double mat00, mat01, mat02, mat10, mat11, mat12, mat20, mat21, mat22;
+    double mai00, mai01, mai02, mai10, mai11, mai12, mai20, mai21, mai22;
+    double vol;
+    double v1s, v2s, v01, v02, v12;
+    double bca;
+    int idm;
+    for (idm=0; idm<ndim; idm++) {
+        v0[idm] = crd[idm] - pclcnd[idm];       // line AP.
+        v1[idm] = pnds[0][idm] - pclcnd[idm];   // line AB.
+        v2[idm] = pnds[1][idm] - pclcnd[idm];   // line AC.
+    };
+    if (ndim == 3) {
+        for (idm=0; idm<3; idm++) {
+            v3[idm] = pnds[2][idm] - pclcnd[idm];   // line AD.
+        };
+        rhs[0] = v0[0]*v1[0] + v0[1]*v1[1] + v0[2]*v1[2];
+        rhs[1] = v0[0]*v2[0] + v0[1]*v2[1] + v0[2]*v2[2];
+        rhs[2] = v0[0]*v3[0] + v0[1]*v3[1] + v0[2]*v3[2];
+        mat00 = v1[0]*v1[0] + v1[1]*v1[1] + v1[2]*v1[2];
+        mat01 = mat10 = v1[0]*v2[0] + v1[1]*v2[1] + v1[2]*v2[2];
+        mat02 = mat20 = v1[0]*v3[0] + v1[1]*v3[1] + v1[2]*v3[2];
+        mat11 = v2[0]*v2[0] + v2[1]*v2[1] + v2[2]*v2[2];
+        mat12 = mat21 = v2[0]*v3[0] + v2[1]*v3[1] + v2[2]*v3[2];
+        mat22 = v3[0]*v3[0] + v3[1]*v3[1] + v3[2]*v3[2];
+        mai00 = mat11*mat22 - mat12*mat21;
+        mai01 = mat02*mat21 - mat01*mat22;
+        mai02 = mat01*mat12 - mat02*mat11;
+        mai10 = mat12*mat20 - mat10*mat22;
+        mai11 = mat00*mat22 - mat02*mat20;
+        mai12 = mat02*mat10 - mat00*mat12;
+        mai20 = mat10*mat21 - mat11*mat20;
+        mai21 = mat01*mat20 - mat00*mat21;
+        mai22 = mat00*mat11 - mat01*mat10;
+        vol = mat00*mai00 + mat01*mai10 + mat02*mai20;
+        mai00 /= vol; mai01 /= vol; mai02 /= vol;
+        mai10 /= vol; mai11 /= vol; mai12 /= vol;
+        mai20 /= vol; mai21 /= vol; mai22 /= vol;
+        bcc[0] = mai00*rhs[0] + mai01*rhs[1] + mai02*rhs[2];
+        bcc[1] = mai10*rhs[0] + mai11*rhs[1] + mai12*rhs[2];
+        bcc[2] = mai20*rhs[0] + mai21*rhs[1] + mai22*rhs[2];
+        bca = bcc[0] + bcc[1] + bcc[2];
+        return (bcc[0]>=0.0) && (bcc[1]>=0.0) && (bcc[2]>=0.0) && (bca<=1.0);
+    } else {
+        v1s = v1[0]*v1[0] + v1[1]*v1[1];
+        v2s = v2[0]*v2[0] + v2[1]*v2[1];
+        v01 = v0[0]*v1[0] + v0[1]*v1[1];
+        v02 = v0[0]*v2[0] + v0[1]*v2[1];
+        v12 = v1[0]*v2[0] + v1[1]*v2[1];
+        bcc[0] = (v01*v2s - v02*v12)/(v1s*v2s - v12*v12);
+        bcc[1] = (v02*v1s - v01*v12)/(v1s*v2s - v12*v12);
+        bca = bcc[0] + bcc[1];
+        return (bcc[0]>=0.0) && (bcc[1]>=0.0) && (bca<=1.0);
+    };
+};
+
+/*
+ * Test whether a point is in a cell.  The cell is decomposed into the
+ * simplices of its centroid and the sub-faces, so that a cell of non-planar
+ * faces or of a non-convex shape is located like a convex one.  Points on
+ * the boundary of the cell are taken as in the cell.
+ */
+static int cell_contains(sc_mesh_t *msd, int icl, double *crd) {
+    int *pclfcs, *pfcnds;
+    double *pclcnd;
+    double *pnds[3];
+    int ifl, ifc, fpn, it, inl;
+    pclcnd = msd->clcnd + icl*msd->ndim;
+    pclfcs = msd->clfcs + icl*(CLMFC+1);
+    for (ifl=1; ifl<=pclfcs[0]; ifl++) {
+        ifc = pclfcs[ifl];
+        fpn = msd->fctpn[ifc];
+        pfcnds = msd->fcnds + ifc*(FCMND+1);
+        for (it=sfng[fpn][0]; it<sfng[fpn][1]; it++) {
+            for (inl=0; inl<msd->ndim; inl++) {
+                pnds[inl] = msd->ndcrd + pfcnds[sfcs[it][inl]]*msd->ndim;
+            };
+            if (simplex_contains(msd->ndim, pclcnd, pnds, crd)) {
+                return 1;
+            };
+        };
+    };
+    return 0;
+};
+
+/*
+ * Locate the cells containing the points.  For each point, the first cell
+ * (with the smallest index) containing it is set in icls, or -1 for not
+ * found.
+ */
+int sc_mesh_locate_points(sc_mesh_t *msd, int *nbin, double *bbmin,
+        double *binwid, int *binoff, int *bincls,
+        int npoint, double *crds, int *icls) {
+    double *pcrd;
+    int nbin1, nbin2;
+    int ipt, ibin, idm, it, inside;
+    int ibd[3];
+    nbin1 = nbin[1];
+    nbin2 = msd->ndim == 3 ? nbin[2] : 1;
+    #pragma omp parallel for default(shared) private(ipt, ibin, idm, it, \
+    inside, ibd, pcrd)
+    for (ipt=0; ipt<npoint; ipt++) {
+        pcrd = crds + ipt*msd->ndim;
+        icls[ipt] = -1;
+        // find the bin; a point on the upper bound goes to the last bin.
+        inside = 1;
+        ibd[2] = 0;
+        for (idm=0; idm<msd->ndim; idm++) {
+            ibd[idm] = (int)floor((pcrd[idm] - bbmin[idm]) / binwid[idm]);
+            if (ibd[idm] == nbin[idm]) {
+                ibd[idm] -= 1;
+            };
+            if (ibd[idm] < 0 || ibd[idm] >= nbin[idm]) {
+                inside = 0;
+            };
+        };
+        if (!inside) continue;
+        ibin = (ibd[0]*nbin1 + ibd[1])*nbin2 + ibd[2];
+        // test the candidate cells.
+        for (it=binoff[ibin]; it<binoff[ibin+1]; it++) {
+            if (cell_contains(msd, bincls[it], pcrd)) {
+                icls[ipt] = bincls[it];
+                break;
+            };
+        };
+    };
+    return 0;
+};
+
+// vim: fenc=utf8 ff=unix ft=c ai et sw=4 ts=4 tw=79:
@@ -112,3 +112,34 @@ def get_blk_from_oblique_neu(fpdtype=None, use_incenter=None):
     if use_incenter is not None:
         kw['use_incenter'] = use_incenter
     return GambitNeutral(loadfile('oblique.neu')).toblock(**kw)
+
+def march_oblique_neu(bctype, create, perturb, time_increment, steps=3):
+    """
+    Build a solver on the mesh of oblique.neu, perturb its initial solution
+    with a seeded random number generator, and march it.  The parcels use it
+    to compare the runs of different solver options.
+
+    @param bctype: type of the boundary conditions for all boundaries.
+    @type bctype: type
+    @param create: callable creating the solver from the block.
+    @type create: callable
+    @param perturb: callable setting the solution of the initialized solver
+        with a numpy.random.RandomState.
+    @type perturb: callable
+    @param time_increment: time increment of marching.
+    @type time_increment: float
+    @keyword steps: number of steps to march.
+    @type steps: int
+    @return: the marched solver.
+    @rtype: solvcon.solver.MeshSolver
+    """
+    import numpy as np
+    from .io.gambit import GambitNeutral
+    bcmap = dict((name, (bctype, {})) for name in
+                 ('inlet', 'outlet', 'wall', 'farfield'))
+    blk = GambitNeutral(loadfile('oblique.neu')).toblock(bcname_mapper=bcmap)
+    svr = create(blk)
+    svr.init()
+    perturb(svr, np.random.RandomState(0))
+    svr.march(0.0, time_increment, steps)
+    return svr
@@ -137,6 +137,25 @@ class TestCreation(TestCase):
         self.assertEqual(blk.clvol[2], .5)
         self.assertEqual(blk.clvol.sum(), 2)
 
+    def test_unused_node(self):
+        from ..block import Block
+        from ..testing import create_trivial_2d_blk
+        # the same triangles as create_trivial_2d_blk(), with an unused node 0
+        # that leaves an empty bucket in the deduplication of faces.
+        blk = Block(ndim=2, nnode=5, nface=6, ncell=3, nbound=3)
+        blk.ndcrd[0,:] = (9,9)
+        blk.ndcrd[1:,:] = (0,0), (-1,-1), (1,-1), (0,1)
+        blk.cltpn[:] = 3
+        blk.clnds[:,:4] = (3, 1,2,3), (3, 1,3,4), (3, 1,4,2)
+        blk.build_interior()
+        tblk = create_trivial_2d_blk()
+        self.assertEqual(tblk.nface, blk.nface)
+        self.assertEqual(tblk.fcnds[:,0].tolist(), blk.fcnds[:,0].tolist())
+        self.assertEqual((tblk.fcnds[:,1:3]+1).tolist(),
+                         blk.fcnds[:,1:3].tolist())
+        self.assertEqual(tblk.clfcs.tolist(), blk.clfcs.tolist())
+        self.assertEqual(tblk.clvol.tolist(), blk.clvol.tolist())
+
     def test_insanity(self):
         from ..block import Block
         # build a simple 2D triangle with 4 subtriangles.
@@ -215,6 +234,63 @@ class TestMetric3D(MetricTest):
     __test__ = True
     testblock = get_blk_from_sample_neu()
 
+class LocateTest(TestCase):
+    __test__ = False
+    testblock = None
+
+    @staticmethod
+    def _brute_force(blk, crd):
+        for icl in range(blk.ncell):
+            fcs = blk.clfcs[icl,1:blk.clfcs[icl,0]+1]
+            sign = np.where(blk.fccls[fcs,0] == icl, 1.0, -1.0)
+            dist = ((crd - blk.fccnd[fcs]) * blk.fcnml[fcs]).sum(axis=1)
+            if (dist * sign <= 0).all():
+                return icl
+        return -1
+
+    def test_centroid(self):
+        blk = self.testblock
+        self.assertEqual(list(range(blk.ncell)),
+                         blk.locate_points(blk.clcnd).tolist())
+
+    def test_random(self):
+        blk = self.testblock
+        lower = blk.ndcrd.min(axis=0)
+        upper = blk.ndcrd.max(axis=0)
+        crds = np.random.RandomState(0).uniform(
+            lower-0.1*(upper-lower), upper, (50, blk.ndim))
+        icls = blk.locate_points(crds)
+        self.assertTrue((icls == -1).any())
+        self.assertTrue((icls >= 0).any())
+        self.assertEqual([self._brute_force(blk, crd) for crd in crds],
+                         icls.tolist())
+
+    def test_bins(self):
+        blk = self.testblock
+        msh = blk.create_msh()
+        expected = blk.locate_points(blk.clcnd)
+        # the index is reused.
+        bins = blk._cellbins
+        blk.locate_points(blk.clcnd)
+        self.assertTrue(bins is blk._cellbins)
+        # a single bin holds all the cells.
+        bins = msh.build_bins([1]*blk.ndim)
+        self.assertEqual(list(range(blk.ncell)), bins[4].tolist())
+        # the result doesn't depend on the bins.
+        for nbin in (1, 3):
+            bins = msh.build_bins([nbin]*blk.ndim)
+            self.assertEqual(bins[3].shape[0], nbin**blk.ndim+1)
+            self.assertEqual(expected.tolist(),
+                msh.locate_points(blk.clcnd, bins).tolist())
+
+class TestLocate2D(LocateTest):
+    __test__ = True
+    testblock = get_blk_from_oblique_neu()
+
+class TestLocate3D(LocateTest):
+    __test__ = True
+    testblock = get_blk_from_sample_neu()
+
 class GhostTest(TestCase):
     __test__ = False
     testblock = None
@@ -24,3 +24,86 @@ class TestSpanningTree(TestCase):
         head.traverse(graph, visited)
         # test results.
         self.assertEqual(len(visited), len(graph))
+
+def make_socket_pair():
+    import os, socket
+    from ..connection import SocketConnection
+    skts = socket.socketpair()
+    conns = [SocketConnection(os.dup(skt.fileno())) for skt in skts]
+    for skt in skts:
+        skt.close()
+    return conns
+
+class TestSocketConnection(TestCase):
+    def test_nonblocking(self):
+        import numpy as np
+        conn0, conn1 = make_socket_pair()
+        arrs = [np.arange(100000, dtype='float64')*it for it in range(3)]
+        # post everything on both ends before waiting.
+        bufs0 = [np.empty_like(arr) for arr in arrs]
+        bufs1 = [np.empty_like(arr) for arr in arrs]
+        reqs = [conn0.irecvarr(buf) for buf in bufs0]
+        reqs += [conn1.irecvarr(buf) for buf in bufs1]
+        reqs += [conn0.isendarr(arr) for arr in arrs]
+        reqs += [conn1.isendarr(-arr) for arr in arrs]
+        for req in reqs:
+            req.wait()
+        for arr, buf0, buf1 in zip(arrs, bufs0, bufs1):
+            self.assertTrue((buf0 == -arr).all())
+            self.assertTrue((buf1 == arr).all())
+        conn0.close()
+        conn1.close()
+
+    def test_raw_array(self):
+        import numpy as np
+        conn0, conn1 = make_socket_pair()
+        arr = np.arange(24, dtype='float64').reshape((4, 3, 2))
+        buf = np.empty_like(arr)
+        req = conn1.irecvarr(buf)
+        conn0.sendarr(arr[::-1])    # non-contiguous.
+        req.wait()
+        self.assertTrue((buf == arr[::-1]).all())
+        # arrays and pickled objects share the stream.
+        conn0.send('object')
+        conn0.sendarr(arr[:,0,:])
+        self.assertEqual(conn1.recv(), 'object')
+        buf = np.empty((4, 2), dtype='float64')
+        conn1.recvarr(buf)
+        self.assertTrue((buf == arr[:,0,:]).all())
+        conn0.close()
+        conn1.close()
+
+    def test_raw_array_noncontiguous(self):
+        import numpy as np
+        conn0, conn1 = make_socket_pair()
+        arr = np.arange(24, dtype='float64').reshape((4, 6))
+        # Fortran-ordered and strided receiving arrays.
+        fbuf = np.zeros((4, 6), dtype='float64', order='F')
+        sbuf = np.zeros((4, 12), dtype='float64')
+        for buf in (fbuf, sbuf[:,::2]):
+            self.assertFalse(buf.flags.c_contiguous)
+            req = conn0.isendarr(arr)
+            conn1.recvarr(buf)
+            req.wait()
+            self.assertTrue((buf == arr).all())
+        self.assertTrue((sbuf[:,1::2] == 0).all())
+        conn0.close()
+        conn1.close()
+
+    def test_raw_array_mismatch(self):
+        import numpy as np
+        conn0, conn1 = make_socket_pair()
+        arr = np.arange(6, dtype='int32')
+        for buf in (np.empty(6, dtype='float64'), np.empty(5, dtype='int32'),
+                    np.empty((3, 2), dtype='int32')):
+            req = conn0.isendarr(arr)
+            self.assertRaises(ValueError, conn1.recvarr, buf)
+            req.wait()
+        # the stream is still in sync.
+        buf = np.empty(6, dtype='int32')
+        req = conn0.isendarr(arr)
+        conn1.recvarr(buf)
+        req.wait()
+        self.assertTrue((buf == arr).all())
+        conn0.close()
+        conn1.close()
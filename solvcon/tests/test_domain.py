@@ -136,6 +136,100 @@ class TestCollective(TestCase):
             writers[-1].write('test%d.vtk'%iblk)
             iblk += 1
 
+class TestThreadedSplit(TestCase):
+    nblk = 4
+
+    def test_same_as_serial(self):
+        from ..domain import Collective
+        doo = Collective(blk=get_sample_neu())
+        doo.split(self.nblk)
+        # reuse the partition since the partitioner is not deterministic.
+        blk = get_sample_neu()
+        blk.partition = lambda nblk, **kw: (doo.edgecut, doo.part.copy())
+        don = Collective(blk=blk)
+        don.split(self.nblk, nworker=3)
+        self.assertTrue((don.shapes == doo.shapes).all())
+        for bln, blo in zip(don, doo):
+            for name in blo.TABLE_NAMES:
+                self.assertTrue((getattr(bln, 'sh'+name) ==
+                    getattr(blo, 'sh'+name)).all(), name)
+            self.assertEqual([bc.name for bc in bln.bclist],
+                             [bc.name for bc in blo.bclist])
+            self.assertTrue((bln.bndfcs == blo.bndfcs).all())
+
+class TestCostModel(TestCase):
+    def test_costs(self):
+        import numpy as np
+        from ..block import elemtype
+        from ..domain import CostModel
+        from ..testing import get_blk_from_oblique_neu
+        # number of faces: edges of 2D cells and surfaces of 3D cells.
+        nfc = np.where(elemtype[:,1] == 3, elemtype[:,4], elemtype[:,3])
+        for blk in get_sample_neu(), get_blk_from_oblique_neu():
+            cost = CostModel(default_bc_cost=0.5).costs(blk)
+            # cell types.
+            self.assertTrue((cost >= nfc[blk.cltpn]).all())
+            # boundary faces.
+            slct = blk.fccls[:,1] < 0
+            extra = np.bincount(blk.fccls[slct,0], minlength=blk.ncell) * 0.5
+            self.assertTrue(np.allclose(cost, nfc[blk.cltpn] + extra))
+
+    def test_bc_cost(self):
+        from ..domain import CostModel
+        blk = get_sample_neu()
+        bc = blk.bclist[0]
+        cost = CostModel(bc_cost={bc.name: 10.0},
+                         default_bc_cost=0.0).costs(blk)
+        clnos = blk.fccls[bc.facn[:,0],0]
+        self.assertTrue((cost[clnos] >= 10.0).all())
+        self.assertEqual(cost.sum(),
+            CostModel(default_bc_cost=0.0).costs(blk).sum() + 10.0*len(bc))
+
+    def test_timings(self):
+        import numpy as np
+        from ..domain import CostModel
+        blk = get_sample_neu()
+        part = (np.arange(blk.ncell) % 3).astype('int32')
+        times = [2.0, 1.0, 0.5]
+        cost = CostModel(part=part, times=times).costs(blk)
+        self.assertTrue(np.allclose(np.bincount(part, weights=cost), times))
+
+    def test_edge_weights(self):
+        import numpy as np
+        from ..domain import CostModel
+        blk = get_sample_neu()
+        self.assertEqual(None, CostModel().edge_weights(blk))
+        # cutting a quadrilateral face costs twice a triangular one.
+        fccost = np.ones(8, dtype='float64')
+        fccost[2] = 2.0
+        adjwgt = CostModel(face_cost=fccost).edge_weights(blk)
+        xadj, adjncy = blk.create_msh().create_csr()
+        self.assertEqual(len(adjncy), len(adjwgt))
+        self.assertEqual([100, 200], sorted(set(adjwgt.tolist())))
+        # the weight of an edge is the same seen from both of its cells.
+        icl = np.repeat(np.arange(blk.ncell), np.diff(xadj))
+        wgts = dict(zip(zip(icl.tolist(), adjncy.tolist()), adjwgt.tolist()))
+        for (icl, jcl), wgt in wgts.items():
+            self.assertEqual(wgt, wgts[jcl, icl])
+
+    def test_edge_weighted_partition(self):
+        from ..domain import Collective, CostModel
+        dom = Collective(blk=get_sample_neu())
+        dom.partition(2, cost=CostModel(face_cost=1.0))
+        self.assertEqual(set([0, 1]), set(dom.part.tolist()))
+        self.assertTrue(dom.edgecut > 0)
+
+    def test_weighted_partition(self):
+        import numpy as np
+        from ..domain import Collective
+        blk = get_sample_neu()
+        clcnd = blk.clcnd[:,0]
+        wgt = np.where(clcnd < clcnd.mean(), 5, 1).astype('int32')
+        dom = Collective(blk=blk)
+        dom.partition(2, cost=wgt)
+        sums = np.bincount(dom.part, weights=wgt)
+        self.assertTrue(abs(sums[0]-sums[1]) <= 0.1*wgt.sum())
+
 class TestInterface(TestCase):
     def test_oblique2(self):
         from ..domain import Collective
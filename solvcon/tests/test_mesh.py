@@ -45,6 +45,17 @@ class TestTableCreation(unittest.TestCase):
         tbl = Table(0, 3, creation="zeros")
         self.assertEqual([0, 0, 0], list(tbl.F))
 
+    def test_buffer(self):
+        arr = np.arange(12, dtype='float64').reshape((3,4))
+        tbl = Table(1, 2, 4, buffer=arr)
+        self.assertTrue(tbl._nda is arr)
+        self.assertEqual(tbl._ghostaddr, arr.ctypes.data)
+        self.assertEqual(list(range(4,12)), list(tbl.B.ravel()))
+        with self.assertRaises(ValueError):
+            Table(2, 2, 4, buffer=arr)
+        with self.assertRaises(ValueError):
+            Table(1, 2, 4, dtype='int32', buffer=arr)
+
     def test_override(self):
         tbl = Table(1, 2, 4)
         # Make sure "nda" isn't writable.
@@ -118,4 +129,31 @@ class TestTableParts(unittest.TestCase):
         self.assertEqual(list(range(4*5,3*4*5)), list(tbl.B.ravel()))
         self.assertEqual(list(range(4*5,3*4*5)), list(tbl._bodypart.ravel()))
 
+
+class TestGatherScatter(unittest.TestCase):
+    def test_gather(self):
+        from ..mesh import gather_rows
+        full = np.arange(12, dtype='float64').reshape((6,2))
+        idx = np.array([4, 1], dtype='int32')
+        packed = np.empty((2,2), dtype='float64')
+        gather_rows(full, idx, packed)
+        self.assertEqual(packed.tolist(), [[8, 9], [2, 3]])
+
+    def test_scatter(self):
+        from ..mesh import scatter_rows
+        full = np.zeros((4,3), dtype='float64')
+        idx = np.array([3, 0], dtype='int32')
+        packed = np.arange(6, dtype='float64').reshape((2,3))
+        scatter_rows(packed, idx, full)
+        self.assertEqual(full[3].tolist(), [0, 1, 2])
+        self.assertEqual(full[0].tolist(), [3, 4, 5])
+        self.assertEqual(full[1:3].sum(), 0)
+
+    def test_out_of_range(self):
+        from ..mesh import gather_rows
+        full = np.zeros((3,2), dtype='float64')
+        packed = np.empty((1,2), dtype='float64')
+        with self.assertRaises(IndexError):
+            gather_rows(full, np.array([3], dtype='int32'), packed)
+
 # vim: set fenc=utf8 ff=unix nobomb ai et sw=4 ts=4 tw=79:
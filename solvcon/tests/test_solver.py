@@ -169,3 +169,136 @@ class TestBlock(TestCase):
     def test_blkn(self):
         svr = self._get_solver()
         self.assertEqual(svr.svrn, None)
+
+class TestMeshSolverExchange(TestCase):
+    nblk = 3
+
+    class Worker(object):
+        def __init__(self):
+            self.pconns = dict()
+
+    @classmethod
+    def _make_solvers(cls, **kw):
+        import numpy as np
+        from ..domain import Collective
+        from ..solver import MeshSolver
+        from .test_connection import make_socket_pair
+        dom = Collective(blk=get_blk_from_sample_neu())
+        dom.split(cls.nblk)
+        svrs = list()
+        for iblk, iflist in enumerate(dom.make_iflist_per_block()):
+            svr = MeshSolver(dom[iblk], **kw)
+            svr.svrn = iblk
+            svr.soln = np.empty((svr.ngstcell+svr.ncell, 2), dtype='float64')
+            svr.soln[:svr.ngstcell] = -1
+            svr.soln[svr.ngstcell:,0] = dom.idxinfo[iblk][2]
+            svr.soln[svr.ngstcell:,1] = iblk
+            # an array of different dtype and shape to be grouped with soln.
+            svr.dsoln = np.empty((svr.ngstcell+svr.ncell, 3), dtype='int32')
+            svr.dsoln[:svr.ngstcell] = -1
+            svr.dsoln[svr.ngstcell:,:2] = svr.soln[svr.ngstcell:]
+            svr.dsoln[svr.ngstcell:,2] = 7
+            svr.init_exchange(iflist)
+            svrs.append(svr)
+        workers = [cls.Worker() for svr in svrs]
+        for iblk, jblk in dom.ifparr:
+            conni, connj = make_socket_pair()
+            workers[iblk].pconns[jblk] = conni
+            workers[jblk].pconns[iblk] = connj
+        return dom, svrs, workers
+
+    def _check(self, dom, svrs, arrname='soln'):
+        from ..boundcond import interface
+        for svr in svrs:
+            for bc in svr.bclist:
+                if not isinstance(bc, interface):
+                    continue
+                ghost = getattr(svr, arrname)[bc.rclp[:,0]+svr.ngstcell]
+                clidx = dom.idxinfo[bc.rblkn][2]
+                self.assertTrue((ghost[:,0] == clidx[bc.rclp[:,1]]).all())
+                self.assertTrue((ghost[:,1] == bc.rblkn).all())
+
+    def _run(self, svrs, workers, func):
+        from concurrent.futures import ThreadPoolExecutor
+        # each solver runs in its own thread as if in its own process.
+        with ThreadPoolExecutor(len(svrs)) as executor:
+            futures = [executor.submit(func, svr, worker)
+                       for svr, worker in zip(svrs, workers)]
+            for future in futures:
+                future.result()
+
+    def test_phased(self):
+        dom, svrs, workers = self._make_solvers()
+        self._run(svrs, workers,
+                  lambda svr, worker: svr.exchangeibc('soln', worker=worker))
+        self._check(dom, svrs)
+
+    def test_async(self):
+        dom, svrs, workers = self._make_solvers(ibcasync=True)
+        def func(svr, worker):
+            svr.exchangeibc('soln', worker=worker, wait=False)
+            self.assertTrue(svr._ibcpending)
+            svr.waitibc()
+            self.assertFalse(svr._ibcpending)
+            # the buffers are reused.
+            bufs = dict((key, [id(buf) for buf in val])
+                        for key, val in svr.haloplan._buffers.items())
+            self.assertEqual(len(bufs), len(svr.haloplan.interfaces))
+            svr.exchangeibc('soln', worker=worker)
+            self.assertEqual(bufs, dict((key, [id(buf) for buf in val])
+                for key, val in svr.haloplan._buffers.items()))
+        self._run(svrs, workers, func)
+        self._check(dom, svrs)
+
+    def test_grouped(self):
+        dom, svrs, workers = self._make_solvers()
+        def func(svr, worker):
+            # count the messages sent.
+            nsent = [0]
+            for conn in worker.pconns.values():
+                def sendarr(arr, _sendarr=conn.sendarr):
+                    nsent[0] += 1
+                    _sendarr(arr)
+                conn.sendarr = sendarr
+            svr.exchangeibc(['soln', 'dsoln'], worker=worker)
+            self.assertEqual(len(worker.pconns), nsent[0])
+        self._run(svrs, workers, func)
+        self._check(dom, svrs, 'soln')
+        self._check(dom, svrs, 'dsoln')
+        for svr in svrs:
+            self.assertTrue((svr.dsoln[svr.ngstcell:,2] == 7).all())
+
+    def test_grouped_async(self):
+        dom, svrs, workers = self._make_solvers(ibcasync=True)
+        def func(svr, worker):
+            svr.exchangeibc(('soln', 'dsoln'), worker=worker, wait=False)
+            # waiting for a member completes the whole group.
+            svr.waitibc('dsoln')
+            self.assertFalse(svr._ibcpending)
+        self._run(svrs, workers, func)
+        self._check(dom, svrs, 'soln')
+        self._check(dom, svrs, 'dsoln')
+
+    def test_reshaped(self):
+        import numpy as np
+        dom, svrs, workers = self._make_solvers()
+        def func(svr, worker):
+            svr.exchangeibc('soln', worker=worker)
+            svr.exchangeibc(('soln', 'dsoln'), worker=worker)
+            # replace the arrays with ones of other dtype and shape.
+            soln = np.empty((svr.soln.shape[0], 4), dtype='float32')
+            soln[:,:2] = svr.soln
+            soln[:svr.ngstcell] = -1
+            soln[:,2:] = 5
+            svr.soln = soln
+            svr.dsoln = svr.dsoln[:,:2].astype('float64')
+            svr.dsoln[:svr.ngstcell] = -1
+            svr.exchangeibc('soln', worker=worker)
+            svr.exchangeibc(('dsoln', 'soln'), worker=worker)
+            svr.exchangeibc(('soln', 'dsoln'), worker=worker)
+        self._run(svrs, workers, func)
+        self._check(dom, svrs, 'soln')
+        self._check(dom, svrs, 'dsoln')
+        for svr in svrs:
+            self.assertEqual(np.float32, svr.soln.dtype)
+            self.assertTrue((svr.soln[:,2:] == 5).all())